@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Mergeable streaming quantile sketch for tool latencies.
+
+Values go into logarithmic buckets (bucket i covers (gamma^(i-1), gamma^i]),
+so every quantile estimate is within `relative_accuracy` of a value that was
+actually recorded, whatever the distribution. Memory depends on the spread of
+values rather than on how many were recorded: 1 ms to 1 hour at 1% accuracy
+is about 760 buckets. Past `max_buckets` the lowest buckets are folded
+together, which keeps the tail (p90/p99) exact and only blurs the fastest
+calls. Two sketches with the same accuracy merge by adding bucket counts, so
+per-session sketches roll up into per-tool ones and state saved by separate
+runs can be combined.
+"""
+
+import math
+from typing import Dict, Optional
+
+DEFAULT_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 1024
+MIN_VALUE = 1e-3  # Smaller values (including 0) are counted in the zero bucket
+
+
+class LatencySketch:
+    """Log-bucket quantile sketch (DDSketch-style) with count, sum, min and max."""
+
+    __slots__ = ("relative_accuracy", "max_buckets", "gamma", "_log_gamma", "buckets",
+                 "zero_count", "count", "total", "min", "max")
+
+    def __init__(self, relative_accuracy: float = DEFAULT_ACCURACY, max_buckets: int = DEFAULT_MAX_BUCKETS):
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, count: int = 1) -> None:
+        if value < 0 or count <= 0:
+            return
+        self.count += count
+        self.total += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value < MIN_VALUE:
+            self.zero_count += count
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self) -> None:
+        ordered = sorted(self.buckets)
+        excess = len(ordered) - self.max_buckets
+        keep = ordered[excess]
+        for index in ordered[:excess]:
+            self.buckets[keep] += self.buckets.pop(index)
+
+    def merge(self, other: "LatencySketch") -> None:
+        if other.count == 0:
+            return
+        if abs(other.gamma - self.gamma) > 1e-12:
+            raise ValueError("cannot merge sketches with different relative accuracy")
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def quantile(self, q: float) -> Optional[float]:
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return max(0.0, self.min)
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                # Midpoint of the bucket in the relative sense
+                estimate = 2.0 * self.gamma ** index / (self.gamma + 1.0)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def summary(self) -> dict:
+        """count, mean, min, p50, p90, p99 and max, rounded for display."""
+        def rounded(value):
+            return None if value is None else round(value, 3)
+        return {
+            "count": self.count,
+            "mean": rounded(self.mean),
+            "min": rounded(self.min) if self.count else None,
+            "p50": rounded(self.quantile(0.50)),
+            "p90": rounded(self.quantile(0.90)),
+            "p99": rounded(self.quantile(0.99)),
+            "max": rounded(self.max) if self.count else None,
+        }
+
+    def to_state(self) -> dict:
+        """JSON-safe state; from_state() restores it for merging later."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_buckets": self.max_buckets,
+            "buckets": {str(i): c for i, c in self.buckets.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "LatencySketch":
+        sketch = cls(state.get("relative_accuracy", DEFAULT_ACCURACY), state.get("max_buckets", DEFAULT_MAX_BUCKETS))
+        sketch.buckets = {int(i): int(c) for i, c in state.get("buckets", {}).items()}
+        sketch.zero_count = int(state.get("zero_count", 0))
+        sketch.count = int(state.get("count", 0))
+        sketch.total = float(state.get("total", 0.0))
+        if sketch.count:
+            sketch.min = float(state["min"])
+            sketch.max = float(state["max"])
+        return sketch
@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+"""
+Agent Office client - shared transport for talking to the office MCP server.
+
+One place for the HTTP/JSON-RPC plumbing used by watcher.py, smoke_test.py,
+test_context_stress.py and the other tools:
+
+- Sync (OfficeClient) and asyncio (AsyncOfficeClient) APIs
+- Persistent keep-alive connections (a small pool for the async client)
+- Loopback TCP or the office's Unix domain socket (mcp.socket_path)
+- JSON-RPC batches: many calls in one round trip
+- Request timeouts and typed helpers for post_event, get_office_state, resources
+
+Usage:
+    from office_client import OfficeClient
+
+    with OfficeClient() as office:
+        office.post_event({"event": "agent_spawn", "agent_id": "a1"})
+        state = office.get_office_state()
+
+    async with AsyncOfficeClient(socket_path="/run/user/1000/office.sock") as office:
+        await office.post_events([...])           # one batched request
+
+Set OFFICE_SOCKET to use the Unix domain socket by default.
+"""
+
+import asyncio
+import http.client
+import itertools
+import json
+import os
+import select
+import socket
+import threading
+from typing import Any, Callable, Iterable, List, Optional, Union
+
+HOST = "localhost"
+PORT = 9999
+TIMEOUT = 5.0
+ASYNC_MAX_CONNECTIONS = 8
+
+# Safe to send again after a connection drops mid-request: the office may
+# already have run the first copy, which only matters for calls that change it
+IDEMPOTENT_METHODS = frozenset({"initialize", "resources/list", "resources/read", "tools/list"})
+READ_ONLY_TOOLS = frozenset({"get_office_state", "list_agents", "get_agent_profile", "list_roster",
+                             "list_settings", "get_settings"})
+
+_rpc_ids = itertools.count(1)
+
+
+class OfficeError(Exception):
+    """The office could not be reached or returned something unusable."""
+
+
+class RpcError(OfficeError):
+    """JSON-RPC level error (unknown method, parse error, ...)."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(f"JSON-RPC error {code}: {message}")
+        self.code = code
+        self.message = message
+
+
+class ToolError(OfficeError):
+    """A tool call ran but reported isError."""
+
+
+def default_socket_path() -> str:
+    return os.environ.get("OFFICE_SOCKET", "")
+
+
+def open_socket(host: str = HOST, port: int = PORT, socket_path: str = "",
+                timeout: float = TIMEOUT) -> socket.socket:
+    """Open a connected stream socket to the office (Unix socket if given, else TCP)."""
+    if socket_path:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+    sock = socket.create_connection((host, port), timeout=timeout)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def build_request(method: str, params: Optional[dict] = None) -> dict:
+    request = {"jsonrpc": "2.0", "id": next(_rpc_ids), "method": method}
+    if params is not None:
+        request["params"] = params
+    return request
+
+
+def _tool_request(name: str, arguments: Optional[dict]) -> dict:
+    return build_request("tools/call", {"name": name, "arguments": arguments or {}})
+
+
+def _unwrap(response: Any) -> Any:
+    """Return the JSON-RPC result, raising RpcError for error replies."""
+    if not isinstance(response, dict):
+        raise OfficeError(f"unexpected JSON-RPC reply: {response!r}")
+    if "error" in response:
+        error = response["error"] or {}
+        raise RpcError(int(error.get("code", 0)), str(error.get("message", "")))
+    return response.get("result")
+
+
+def _idempotent(payload: Any) -> bool:
+    """True if every request in payload (one request or a batch) only reads."""
+    for request in payload if isinstance(payload, list) else [payload]:
+        method = request.get("method")
+        if method in ("tools/call", "call_tool"):
+            if (request.get("params") or {}).get("name") not in READ_ONLY_TOOLS:
+                return False
+        elif method not in IDEMPOTENT_METHODS:
+            return False
+    return True
+
+
+def _first_text(result: Any, key: str) -> str:
+    if not isinstance(result, dict):
+        raise OfficeError(f"unexpected result: {result!r}")
+    items = result.get(key) or [{}]
+    first = items[0] if isinstance(items, list) and items else {}
+    return str(first.get("text", "")) if isinstance(first, dict) else ""
+
+
+def parse_tool_result(result: dict) -> Union[dict, list, str]:
+    """Tool results carry text content; decode it as JSON when it is JSON."""
+    text = _first_text(result, "content")
+    if result.get("isError"):
+        raise ToolError(text)
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def _events_params(after_seq: Optional[int], limit: Optional[int]) -> dict:
+    params = {}
+    if after_seq is not None:
+        params["after_seq"] = after_seq
+    if limit is not None:
+        params["limit"] = limit
+    return params
+
+
+def parse_resource(result: dict) -> Union[dict, list, str]:
+    text = _first_text(result, "contents")
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+# =============================================================================
+# Sync client
+# =============================================================================
+
+def _dropped(sock: socket.socket) -> bool:
+    """True if an idle keep-alive socket was closed by the office (it is readable only at EOF)."""
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection that talks to the office over a Unix domain socket."""
+
+    def __init__(self, socket_path: str, timeout: float = TIMEOUT):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = open_socket(socket_path=self.socket_path, timeout=self.timeout)
+
+
+class _TCPConnection(http.client.HTTPConnection):
+    def connect(self):
+        self.sock = open_socket(self.host, self.port, timeout=self.timeout)
+
+
+class OfficeClient:
+    """Blocking client with one persistent connection. Thread-safe (calls serialize)."""
+
+    def __init__(self, host: str = HOST, port: int = PORT, socket_path: Optional[str] = None,
+                 timeout: float = TIMEOUT):
+        self.host = host
+        self.port = port
+        self.socket_path = default_socket_path() if socket_path is None else socket_path
+        self.timeout = timeout
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @property
+    def endpoint(self) -> str:
+        return f"unix://{self.socket_path}" if self.socket_path else f"http://{self.host}:{self.port}"
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._conn is None:
+            if self.socket_path:
+                self._conn = UnixHTTPConnection(self.socket_path, timeout=self.timeout)
+            else:
+                self._conn = _TCPConnection(self.host, self.port, timeout=self.timeout)
+        return self._conn
+
+    def _post(self, payload: Any) -> Any:
+        body = json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        with self._lock:
+            for attempt in (0, 1):
+                conn = self._connection()
+                if conn.sock is not None and _dropped(conn.sock):
+                    self._reset()  # Closed while idle; start on a fresh connection
+                    conn = self._connection()
+                reused = conn.sock is not None
+                sent = False
+                try:
+                    conn.request("POST", "/", body=body, headers=headers)
+                    sent = True
+                    response = conn.getresponse()
+                    raw = response.read()
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                    # A keep-alive connection closed under us. Retry once on a fresh
+                    # one, unless the request went out and could have been run already
+                    self._reset()
+                    if reused and attempt == 0 and (not sent or _idempotent(payload)):
+                        continue
+                    raise OfficeError(f"{self.endpoint}: {e}") from e
+                except (OSError, http.client.HTTPException) as e:
+                    self._reset()
+                    raise OfficeError(f"{self.endpoint}: {e}") from e
+                if response.will_close:
+                    self._reset()
+                if response.status != 200:
+                    raise OfficeError(f"HTTP {response.status}: {raw[:200]!r}")
+                try:
+                    return json.loads(raw)
+                except ValueError as e:
+                    raise OfficeError(f"invalid JSON reply: {e}") from e
+
+    def _reset(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def __enter__(self) -> "OfficeClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -- JSON-RPC -----------------------------------------------------------
+
+    def rpc(self, method: str, params: Optional[dict] = None) -> Any:
+        return _unwrap(self._post(build_request(method, params)))
+
+    def batch(self, requests: Iterable[dict]) -> List[Any]:
+        """Send pre-built requests (see build_request) in one round trip.
+
+        Returns results in request order; failed entries are RpcError instances.
+        """
+        requests = list(requests)
+        if not requests:
+            return []
+        replies = self._post(requests)
+        if isinstance(replies, dict):  # server-level error for the whole batch
+            _unwrap(replies)
+        by_id = {r.get("id"): r for r in replies if isinstance(r, dict)}
+        results = []
+        for request in requests:
+            try:
+                results.append(_unwrap(by_id.get(request["id"])))
+            except OfficeError as e:
+                results.append(e)
+        return results
+
+    # -- typed helpers ------------------------------------------------------
+
+    def initialize(self) -> dict:
+        return self.rpc("initialize", {"protocolVersion": "2024-11-05"})
+
+    def call_tool(self, name: str, arguments: Optional[dict] = None) -> Union[dict, list, str]:
+        return parse_tool_result(self.rpc("tools/call", {"name": name, "arguments": arguments or {}}))
+
+    def post_event(self, event: dict) -> str:
+        return self.call_tool("post_event", event)
+
+    def post_events(self, events: Iterable[dict]) -> List[Union[str, Exception]]:
+        """Post many events in a single batched request."""
+        results = []
+        for result in self.batch(_tool_request("post_event", e) for e in events):
+            if isinstance(result, Exception):
+                results.append(result)
+                continue
+            try:
+                results.append(parse_tool_result(result))
+            except ToolError as e:
+                results.append(e)
+        return results
+
+    def get_office_state(self, since_version: Optional[int] = None, epoch: str = "") -> dict:
+        args = {}
+        if since_version is not None:
+            args["since_version"] = since_version
+            if epoch:
+                args["epoch"] = epoch
+        return self.call_tool("get_office_state", args)
+
+    def list_agents(self) -> dict:
+        return self.call_tool("list_agents")
+
+    def list_tools(self) -> list:
+        return self.rpc("tools/list").get("tools", [])
+
+    def list_resources(self) -> list:
+        return self.rpc("resources/list").get("resources", [])
+
+    def read_resource(self, uri: str, **params) -> Union[dict, list, str]:
+        return parse_resource(self.rpc("resources/read", dict(params, uri=uri)))
+
+    def read_events(self, after_seq: Optional[int] = None, limit: Optional[int] = None) -> dict:
+        """office://events: {seq, oldest_seq, capacity, events}, only events after after_seq if given."""
+        return self.read_resource("office://events", **_events_params(after_seq, limit))
+
+
+# =============================================================================
+# Async client
+# =============================================================================
+
+class _AsyncConnection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.sent = False  # The current request was fully written
+
+    @property
+    def dropped(self) -> bool:
+        return self.reader.at_eof() or self.writer.is_closing()
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class AsyncOfficeClient:
+    """asyncio client with a pool of keep-alive connections for concurrent calls."""
+
+    def __init__(self, host: str = HOST, port: int = PORT, socket_path: Optional[str] = None,
+                 timeout: float = TIMEOUT, max_connections: int = ASYNC_MAX_CONNECTIONS):
+        self.host = host
+        self.port = port
+        self.socket_path = default_socket_path() if socket_path is None else socket_path
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._idle: List[_AsyncConnection] = []
+        self._slots = None  # asyncio.Semaphore, created on the running loop
+
+    @property
+    def endpoint(self) -> str:
+        return f"unix://{self.socket_path}" if self.socket_path else f"http://{self.host}:{self.port}"
+
+    async def _open(self) -> _AsyncConnection:
+        if self.socket_path:
+            reader, writer = await asyncio.open_unix_connection(self.socket_path)
+        else:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+            sock = writer.get_extra_info("socket")
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return _AsyncConnection(reader, writer)
+
+    async def _exchange(self, conn: _AsyncConnection, body: bytes,
+                        on_write: Optional[Callable[[], None]] = None) -> tuple:
+        """Send one request and read one response; returns (status, body, keep_alive)."""
+        conn.sent = False
+        if on_write:
+            on_write()
+        conn.writer.write(
+            f"POST / HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode("ascii") + body
+        )
+        await conn.writer.drain()
+        conn.sent = True
+        head = await conn.reader.readuntil(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        parts = lines[0].split(" ", 2)
+        if len(parts) < 2 or not parts[1].isdigit():
+            raise OfficeError(f"malformed status line: {lines[0]!r}")
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                key, _, value = line.partition(":")
+                headers[key.strip().lower()] = value.strip()
+        keep_alive = headers.get("connection", "").lower() != "close"
+        if "content-length" in headers:
+            payload = await conn.reader.readexactly(int(headers["content-length"]))
+        else:
+            payload = await conn.reader.read()
+            keep_alive = False
+        return int(parts[1]), payload, keep_alive
+
+    async def _post(self, payload: Any, on_write: Optional[Callable[[], None]] = None) -> Any:
+        """POST one JSON-RPC payload. on_write runs right before each write, once a connection is held."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_connections)
+        body = json.dumps(payload).encode("utf-8")
+        async with self._slots:
+            for attempt in (0, 1):
+                while self._idle and self._idle[-1].dropped:
+                    self._idle.pop().close()  # Closed while idle
+                reused = bool(self._idle)
+                try:
+                    conn = self._idle.pop() if self._idle else await asyncio.wait_for(self._open(), self.timeout)
+                except (OSError, asyncio.TimeoutError) as e:
+                    raise OfficeError(f"{self.endpoint}: {e or 'connect timed out'}") from e
+                try:
+                    status, raw, keep_alive = await asyncio.wait_for(self._exchange(conn, body, on_write), self.timeout)
+                except (asyncio.IncompleteReadError, ConnectionResetError, BrokenPipeError) as e:
+                    conn.close()
+                    if reused and attempt == 0 and (not conn.sent or _idempotent(payload)):
+                        continue  # Stale keep-alive connection; safe to send again
+                    raise OfficeError(f"{self.endpoint}: {e}") from e
+                except (OSError, asyncio.TimeoutError, asyncio.LimitOverrunError) as e:
+                    conn.close()
+                    raise OfficeError(f"{self.endpoint}: {e or 'request timed out'}") from e
+                if keep_alive:
+                    self._idle.append(conn)
+                else:
+                    conn.close()
+                if status != 200:
+                    raise OfficeError(f"HTTP {status}: {raw[:200]!r}")
+                try:
+                    return json.loads(raw)
+                except ValueError as e:
+                    raise OfficeError(f"invalid JSON reply: {e}") from e
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+        for conn in idle:
+            try:
+                await conn.writer.wait_closed()
+            except OSError:
+                pass
+
+    async def __aenter__(self) -> "AsyncOfficeClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    # -- JSON-RPC -----------------------------------------------------------
+
+    async def rpc(self, method: str, params: Optional[dict] = None) -> Any:
+        return _unwrap(await self._post(build_request(method, params)))
+
+    async def batch(self, requests: Iterable[dict], on_write: Optional[Callable[[], None]] = None) -> List[Any]:
+        requests = list(requests)
+        if not requests:
+            return []
+        replies = await self._post(requests, on_write)
+        if isinstance(replies, dict):
+            _unwrap(replies)
+        by_id = {r.get("id"): r for r in replies if isinstance(r, dict)}
+        results = []
+        for request in requests:
+            try:
+                results.append(_unwrap(by_id.get(request["id"])))
+            except OfficeError as e:
+                results.append(e)
+        return results
+
+    # -- typed helpers ------------------------------------------------------
+
+    async def initialize(self) -> dict:
+        return await self.rpc("initialize", {"protocolVersion": "2024-11-05"})
+
+    async def call_tool(self, name: str, arguments: Optional[dict] = None) -> Union[dict, list, str]:
+        return parse_tool_result(await self.rpc("tools/call", {"name": name, "arguments": arguments or {}}))
+
+    async def post_event(self, event: dict) -> str:
+        return await self.call_tool("post_event", event)
+
+    async def post_events(self, events: Iterable[dict],
+                          on_write: Optional[Callable[[], None]] = None) -> List[Union[str, Exception]]:
+        results = []
+        for result in await self.batch((_tool_request("post_event", e) for e in events), on_write):
+            if isinstance(result, Exception):
+                results.append(result)
+                continue
+            try:
+                results.append(parse_tool_result(result))
+            except ToolError as e:
+                results.append(e)
+        return results
+
+    async def get_office_state(self, since_version: Optional[int] = None, epoch: str = "") -> dict:
+        args = {}
+        if since_version is not None:
+            args["since_version"] = since_version
+            if epoch:
+                args["epoch"] = epoch
+        return await self.call_tool("get_office_state", args)
+
+    async def list_agents(self) -> dict:
+        return await self.call_tool("list_agents")
+
+    async def list_tools(self) -> list:
+        return (await self.rpc("tools/list")).get("tools", [])
+
+    async def list_resources(self) -> list:
+        return (await self.rpc("resources/list")).get("resources", [])
+
+    async def read_resource(self, uri: str, **params) -> Union[dict, list, str]:
+        return parse_resource(await self.rpc("resources/read", dict(params, uri=uri)))
+
+    async def read_events(self, after_seq: Optional[int] = None, limit: Optional[int] = None) -> dict:
+        return await self.read_resource("office://events", **_events_params(after_seq, limit))
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Agent Office event subscriber - streams office events pushed by the MCP server.
+
+The office exposes recorded events as Server-Sent Events on GET /events. Every
+event carries a sequence number ("seq"), so a subscriber that reconnects can
+resume exactly where it left off instead of re-reading office://events.
+
+Usage:
+    python3 office_events.py                 # Print new events as they arrive
+    python3 office_events.py --after 120     # Replay from seq 121, then follow
+    python3 office_events.py --socket PATH   # Use the office's Unix domain socket
+
+As a library:
+    sub = EventSubscriber()
+    sub.start()                              # Background thread, buffers events
+    event = sub.wait_for(lambda e: e.get("event") == "agent_spawn", timeout=2.0)
+
+EventPoller offers the same start()/wait_for()/close() over office://events
+with after_seq, for when the stream can't be opened.
+"""
+
+import collections
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from typing import Callable, Iterator, Optional
+
+from office_client import HOST, PORT, OfficeClient, OfficeError, open_socket
+
+STREAM_PATH = "/events"
+CONNECT_TIMEOUT = 5.0
+RECONNECT_DELAY = 1.0
+BUFFER_LIMIT = 1000  # Events kept for wait_for() when running in the background
+POLL_INTERVAL = 0.1  # EventPoller: seconds between office://events reads
+
+
+class StreamError(Exception):
+    """Raised when the event stream cannot be opened."""
+
+
+class EventSubscriber:
+    """Follows the office event stream, resuming by sequence number on reconnect."""
+
+    def __init__(self, host: str = HOST, port: int = PORT, socket_path: str = "",
+                 after_seq: Optional[int] = None, reconnect: bool = True):
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        # None = only events recorded after we connect
+        self.last_seq = after_seq
+        self.reconnect = reconnect
+        self.gaps = []  # (from_seq, to_seq) ranges that fell out of office history
+        self._sock = None
+        self._pending = b""
+        self._thread = None
+        self._stop = threading.Event()
+        self._buffer = collections.deque(maxlen=BUFFER_LIMIT)
+        self._cond = threading.Condition()
+
+    # -- connection ---------------------------------------------------------
+
+    def _open(self) -> None:
+        sock = open_socket(self.host, self.port, self.socket_path, timeout=CONNECT_TIMEOUT)
+
+        headers = [
+            f"GET {STREAM_PATH} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            "Accept: text/event-stream",
+        ]
+        if self.last_seq is not None:
+            headers.append(f"Last-Event-ID: {self.last_seq}")
+        sock.sendall(("\r\n".join(headers) + "\r\n\r\n").encode("utf-8"))
+
+        data = b""
+        while b"\r\n\r\n" not in data:
+            chunk = sock.recv(4096)
+            if not chunk:
+                sock.close()
+                raise StreamError("connection closed before response headers")
+            data += chunk
+        head, _, rest = data.partition(b"\r\n\r\n")
+        status_line = head.split(b"\r\n", 1)[0].decode("utf-8", errors="replace")
+        parts = status_line.split()
+        if len(parts) < 2 or parts[1] != "200":
+            sock.close()
+            raise StreamError(f"unexpected response: {status_line}")
+
+        sock.settimeout(None)
+        self._sock = sock
+        self._pending = rest
+
+    def close(self) -> None:
+        self._stop.set()
+        sock, self._sock = self._sock, None
+        if sock:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+
+    # -- parsing ------------------------------------------------------------
+
+    def _read_messages(self) -> Iterator[tuple]:
+        """Yield (event_name, data) for each SSE message until the connection drops."""
+        event_name = "message"
+        data_lines = []
+        while not self._stop.is_set():
+            while b"\n" not in self._pending:
+                try:
+                    chunk = self._sock.recv(65536)
+                except (OSError, AttributeError):
+                    return  # closed underneath us
+                if not chunk:
+                    return
+                self._pending += chunk
+            raw, _, self._pending = self._pending.partition(b"\n")
+            line = raw.decode("utf-8", errors="replace").rstrip("\r")
+            if not line:
+                if data_lines:
+                    yield event_name, "\n".join(data_lines)
+                event_name = "message"
+                data_lines = []
+            elif line.startswith(":"):
+                continue  # heartbeat comment
+            else:
+                field, _, value = line.partition(":")
+                value = value[1:] if value.startswith(" ") else value
+                if field == "event":
+                    event_name = value
+                elif field == "data":
+                    data_lines.append(value)
+
+    def _drain(self) -> Iterator[dict]:
+        """Yield office events from the open connection until it drops."""
+        for name, data in self._read_messages():
+            try:
+                payload = json.loads(data)
+            except json.JSONDecodeError:
+                continue
+            if name == "ready":
+                if self.last_seq is None:
+                    self.last_seq = int(payload.get("seq", 0))
+            elif name == "gap":
+                self.gaps.append((payload.get("from"), payload.get("to")))
+            elif name == "office_event":
+                seq = int(payload.get("seq", 0))
+                if self.last_seq is not None and seq <= self.last_seq:
+                    continue  # already delivered before a reconnect
+                self.last_seq = seq
+                yield payload
+
+    def events(self, already_open: bool = False) -> Iterator[dict]:
+        """Yield office events in sequence order, reconnecting and resuming as needed."""
+        while not self._stop.is_set():
+            if not already_open:
+                try:
+                    self._open()
+                except (OSError, StreamError) as e:
+                    if not self.reconnect or self._stop.is_set():
+                        raise
+                    print(f"  [!] Event stream unavailable: {e}", file=sys.stderr)
+                    time.sleep(RECONNECT_DELAY)
+                    continue
+            already_open = False
+
+            yield from self._drain()
+
+            sock, self._sock = self._sock, None
+            if sock:
+                sock.close()
+            if not self.reconnect:
+                return
+            time.sleep(RECONNECT_DELAY)
+
+    # -- background mode ----------------------------------------------------
+
+    def start(self) -> "EventSubscriber":
+        """Connect now, then collect events on a background thread for wait_for()."""
+        self._open()
+        self._thread = threading.Thread(target=self._collect, daemon=True)
+        self._thread.start()
+        return self
+
+    def _collect(self) -> None:
+        try:
+            for event in self.events(already_open=True):
+                with self._cond:
+                    self._buffer.append(event)
+                    self._cond.notify_all()
+        except (OSError, StreamError):
+            pass
+
+    def wait_for(self, predicate: Callable[[dict], bool], timeout: float = 5.0) -> Optional[dict]:
+        """Return the first buffered or future event matching predicate, or None on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                for event in self._buffer:
+                    if predicate(event):
+                        return event
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+
+
+class EventPoller:
+    """Polls office://events for entries after the last seen seq (no stream needed)."""
+
+    def __init__(self, host: str = HOST, port: int = PORT, socket_path: str = "",
+                 after_seq: Optional[int] = None, interval: float = POLL_INTERVAL):
+        self.client = OfficeClient(host=host, port=port, socket_path=socket_path)
+        self.last_seq = after_seq
+        self.interval = interval
+        self.gaps = []
+        self._buffer = collections.deque(maxlen=BUFFER_LIMIT)
+
+    def start(self) -> "EventPoller":
+        """Remember the current seq so only events recorded from now on are returned."""
+        if self.last_seq is None:
+            self.last_seq = int(self.client.read_events(limit=0).get("seq", 0))
+        return self
+
+    def poll(self) -> list:
+        """Fetch events recorded since the last poll."""
+        page = self.client.read_events(after_seq=self.last_seq or 0)
+        oldest = int(page.get("oldest_seq", 0))
+        if self.last_seq is not None and self.last_seq + 1 < oldest:
+            self.gaps.append((self.last_seq + 1, oldest - 1))
+        events = page.get("events", [])
+        if events:
+            self.last_seq = int(events[-1].get("seq", self.last_seq or 0))
+            self._buffer.extend(events)
+        return events
+
+    def wait_for(self, predicate: Callable[[dict], bool], timeout: float = 5.0) -> Optional[dict]:
+        deadline = time.monotonic() + timeout
+        while True:
+            for event in self._buffer:
+                if predicate(event):
+                    return event
+            if time.monotonic() >= deadline:
+                return None
+            try:
+                if self.poll():
+                    continue
+            except OfficeError:
+                pass
+            time.sleep(self.interval)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+def main():
+    args = sys.argv[1:]
+    socket_path = os.environ.get("OFFICE_SOCKET", "")
+    after_seq = None
+    if "--socket" in args:
+        idx = args.index("--socket")
+        if idx + 1 >= len(args):
+            print("Error: --socket requires a path")
+            sys.exit(1)
+        socket_path = args[idx + 1]
+    if "--after" in args:
+        idx = args.index("--after")
+        if idx + 1 >= len(args) or not args[idx + 1].lstrip("-").isdigit():
+            print("Error: --after requires a sequence number")
+            sys.exit(1)
+        after_seq = int(args[idx + 1])
+
+    subscriber = EventSubscriber(socket_path=socket_path, after_seq=after_seq)
+    where = f"unix://{socket_path}" if socket_path else f"{HOST}:{PORT}"
+    print(f"Subscribed to {where}{STREAM_PATH}", file=sys.stderr)
+    try:
+        for event in subscriber.events():
+            print(json.dumps(event), flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        subscriber.close()
+        if subscriber.gaps:
+            print(f"Missed ranges (outside office history): {subscriber.gaps}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Run a smoke or load scenario against a headless office.
+
+Starts Godot with --headless (dummy renderer and audio driver, full
+simulation), waits until the MCP server answers on port 9999, runs the
+scenario while sampling office://perf, then shuts the office down through
+quit_office. Works on CI machines with no GPU or display.
+
+By default the office gets a throwaway HOME/XDG_DATA_HOME, so it starts with
+an empty roster and doesn't pick up this machine's transcripts.
+
+Usage:
+    python3 office_launcher.py                               # Basic smoke tests
+    python3 office_launcher.py -- --burst 500                # Any smoke_test.py arguments after --
+    python3 office_launcher.py --script smoke_runner.py -- --junit results.xml
+    python3 office_launcher.py --out perf.json -- --scale --steps 8,32,128
+    python3 office_launcher.py --godot /opt/godot/godot      # Default: $GODOT, then godot/godot4 on PATH
+    python3 office_launcher.py --keep-home                   # Use the real user data and ~/.claude
+    python3 office_launcher.py --log office.log              # Keep the office's output
+    python3 office_launcher.py --startup 20                  # Launch-to-ready benchmark over 20 launches
+        [--roster-agents 10000] [--windowed] [--out startup.json]
+
+Exit status is the scenario's, or 1 if the office failed to start or exited uncleanly.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import office_paths
+import roster_gen
+from office_client import HOST, PORT, OfficeClient, OfficeError
+from smoke_test import PerfCollector
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+READY_TIMEOUT = 60.0
+IMPORT_TIMEOUT = 300.0
+SCENARIO_TIMEOUT = 3600.0
+QUIT_TIMEOUT = 15.0
+PERF_INTERVAL = 1.0
+LOG_TAIL_LINES = 40
+STARTUP_RUNS = 10
+STARTUP_SETTLE_TIMEOUT = 10.0  # Wait for the deferred startup work after the first answer
+STARTUP_METRICS = ("launch_to_ready_s", "engine_ms", "ready_ms", "first_frame_ms", "deferred_done_ms")
+
+
+def find_godot(explicit: str = "") -> str:
+    for candidate in (explicit, os.environ.get("GODOT", ""), "godot", "godot4"):
+        if candidate:
+            path = shutil.which(candidate)
+            if path:
+                return path
+    return ""
+
+
+def port_in_use(host: str = HOST, port: int = PORT) -> bool:
+    try:
+        with socket.create_connection((host, port), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+def sandbox_stable_dir(env: dict) -> str:
+    """user://stable as the office will see it under env (Linux/XDG layout)."""
+    return os.path.join(env["XDG_DATA_HOME"], "godot", "app_userdata", office_paths.PROJECT_NAME, "stable")
+
+
+def sandbox_env(root: str) -> dict:
+    """Environment that points the office's user:// and ~/.claude at root."""
+    env = dict(os.environ)
+    env["HOME"] = root
+    env["XDG_DATA_HOME"] = os.path.join(root, ".local", "share")
+    env["XDG_CONFIG_HOME"] = os.path.join(root, ".config")
+    env.pop("CODEX_HOME", None)
+    return env
+
+
+def tail(path: str, lines: int = LOG_TAIL_LINES) -> str:
+    try:
+        with open(path, errors="replace") as f:
+            return "".join(f.readlines()[-lines:])
+    except OSError:
+        return ""
+
+
+class HeadlessOffice:
+    """A headless Godot office process and its lifecycle."""
+
+    def __init__(self, godot: str, log_path: str, env: dict, headless: bool = True):
+        self.godot = godot
+        self.log_path = log_path
+        self.env = env
+        self.headless = headless
+        self.proc = None
+        self._log = None
+        self._launched = 0.0
+        self.ready_s = 0.0
+
+    def import_project(self) -> bool:
+        """First run on a fresh checkout: build .godot/ so resources load."""
+        if os.path.isdir(os.path.join(HERE, ".godot", "imported")):
+            return True
+        print("Importing project (no .godot/ cache yet)...")
+        with open(self.log_path, "a") as log:
+            result = subprocess.run([self.godot, "--headless", "--path", HERE, "--import"],
+                                    stdout=log, stderr=subprocess.STDOUT, env=self.env,
+                                    timeout=IMPORT_TIMEOUT)
+        return result.returncode == 0
+
+    def start(self) -> None:
+        self._log = open(self.log_path, "a")
+        cmd = [self.godot, "--headless", "--path", HERE] if self.headless else [self.godot, "--path", HERE]
+        self._launched = time.monotonic()
+        self.proc = subprocess.Popen(cmd, stdout=self._log, stderr=subprocess.STDOUT, env=self.env)
+
+    def wait_ready(self, timeout: float = READY_TIMEOUT) -> bool:
+        """Poll until office://perf answers; False if the process dies or time runs out.
+
+        ready_s is measured from the launch, so it covers process start too.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.proc.poll() is not None:
+                return False
+            try:
+                with OfficeClient(HOST, PORT, timeout=2.0) as client:
+                    client.read_resource("office://perf")
+                self.ready_s = time.monotonic() - self._launched
+                return True
+            except (OfficeError, OSError):
+                time.sleep(0.25)
+        return False
+
+    def read_perf(self, uri: str = "office://perf") -> dict:
+        try:
+            with OfficeClient(HOST, PORT, timeout=5.0) as client:
+                perf = client.read_resource(uri)
+            return perf if isinstance(perf, dict) else {}
+        except (OfficeError, OSError):
+            return {}
+
+    def read_startup(self, timeout: float = STARTUP_SETTLE_TIMEOUT) -> dict:
+        """office://startup once the deferred startup work has finished (or whatever is there at timeout)."""
+        deadline = time.monotonic() + timeout
+        report = {}
+        while time.monotonic() < deadline:
+            report = self.read_perf("office://startup")
+            if report.get("deferred_done_ms", 0) > 0:
+                break
+            time.sleep(0.1)
+        return report
+
+    def stop(self, timeout: float = QUIT_TIMEOUT) -> bool:
+        """quit_office, then terminate/kill as fallbacks. True if it exited cleanly on request."""
+        if self.proc is None:
+            return True
+        clean = False
+        if self.proc.poll() is None:
+            try:
+                with OfficeClient(HOST, PORT, timeout=5.0) as client:
+                    client.call_tool("quit_office")
+            except (OfficeError, OSError) as e:
+                print(f"  quit_office failed: {e}")
+            try:
+                clean = self.proc.wait(timeout) == 0
+            except subprocess.TimeoutExpired:
+                print(f"  Office did not exit within {timeout:g}s, terminating")
+                self.proc.terminate()
+                try:
+                    self.proc.wait(5.0)
+                except subprocess.TimeoutExpired:
+                    self.proc.kill()
+                    self.proc.wait()
+        if self._log:
+            self._log.close()
+        return clean
+
+
+def run_scenario(script: str, scenario_args: list, timeout: float) -> int:
+    cmd = [sys.executable, os.path.join(HERE, script)] + scenario_args
+    print(f"Running: {' '.join(cmd[1:])}")
+    print()
+    env = dict(os.environ)
+    env.pop("OFFICE_SOCKET", None)  # Talk to this office over TCP
+    try:
+        return subprocess.run(cmd, cwd=HERE, env=env, timeout=timeout).returncode
+    except subprocess.TimeoutExpired:
+        print(f"\nScenario timed out after {timeout:g}s")
+        return 1
+
+
+def main():
+    argv = sys.argv[1:]
+    scenario_args = []
+    if "--" in argv:
+        idx = argv.index("--")
+        argv, scenario_args = argv[:idx], argv[idx + 1:]
+
+    parser = argparse.ArgumentParser(description="Run a scenario against a headless office")
+    parser.add_argument("--godot", default="", help="Godot 4 binary (default: $GODOT, then godot/godot4 on PATH)")
+    parser.add_argument("--script", default="smoke_test.py", help="Scenario script in this directory (default smoke_test.py)")
+    parser.add_argument("--out", default="", help="Write a JSON report (run info, perf summary, samples)")
+    parser.add_argument("--log", default="", help="Office log file (default: inside the sandbox, printed on failure)")
+    parser.add_argument("--keep-home", action="store_true", help="Run against the real HOME and user data")
+    parser.add_argument("--ready-timeout", type=float, default=READY_TIMEOUT)
+    parser.add_argument("--timeout", type=float, default=SCENARIO_TIMEOUT, help="Scenario timeout in seconds")
+    parser.add_argument("--interval", type=float, default=PERF_INTERVAL, help="office://perf sampling interval")
+    parser.add_argument("--startup", type=int, nargs="?", const=STARTUP_RUNS, default=0,
+                        help="Instead of a scenario, time N launches (default %d)" % STARTUP_RUNS)
+    parser.add_argument("--roster-agents", type=int, default=0, help="Pre-generate a roster of N agents (with --startup)")
+    parser.add_argument("--windowed", action="store_true", help="Launch with a window instead of --headless (with --startup)")
+    args = parser.parse_args(argv)
+
+    godot = find_godot(args.godot)
+    if not godot:
+        print("Error: Godot not found; pass --godot or set GODOT")
+        sys.exit(1)
+    if port_in_use():
+        print(f"Error: something is already listening on {HOST}:{PORT}; close the running office first")
+        sys.exit(1)
+
+    sandbox = tempfile.mkdtemp(prefix="office-headless-")
+    env = dict(os.environ) if args.keep_home else sandbox_env(sandbox)
+    log_path = args.log or os.path.join(sandbox, "office.log")
+    office = HeadlessOffice(godot, log_path, env)
+
+    print("=" * 50)
+    print("Headless Office Launcher")
+    print("=" * 50)
+    print(f"Godot:   {godot}")
+    print(f"Sandbox: {'(real HOME)' if args.keep_home else sandbox}")
+    print(f"Log:     {log_path}")
+
+    if args.startup:
+        if args.roster_agents:
+            if args.keep_home:
+                print("Error: --roster-agents would overwrite the real roster; drop --keep-home")
+                sys.exit(1)
+            stable_dir = sandbox_stable_dir(env)
+            os.makedirs(stable_dir, exist_ok=True)
+            roster_gen.write_store(roster_gen.make_profiles(args.roster_agents, random.Random(1)), stable_dir)
+            print(f"Roster:  {args.roster_agents} generated agents")
+        exit_code = run_startup_benchmark(godot, env, log_path, args)
+    else:
+        exit_code = run_with_scenario(office, args, scenario_args, log_path)
+
+    if exit_code == 0 and not args.keep_home and not args.log:
+        shutil.rmtree(sandbox, ignore_errors=True)
+    else:
+        print(f"\nOffice log: {log_path}")
+    print(f"Exit status: {exit_code}")
+    sys.exit(exit_code)
+
+
+def run_with_scenario(office: HeadlessOffice, args, scenario_args: list, log_path: str) -> int:
+    exit_code = 1
+    report = {"script": args.script, "args": scenario_args, "started_at": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    collector = None
+    try:
+        if not office.import_project():
+            print("FAIL: project import failed")
+            print(tail(log_path))
+            return 1
+        office.start()
+        if not office.wait_ready(args.ready_timeout):
+            print(f"FAIL: office not ready on port {PORT} within {args.ready_timeout:g}s")
+            print(tail(log_path))
+            return 1
+        print(f"Office ready in {office.ready_s:.1f}s")
+        report["ready_s"] = round(office.ready_s, 2)
+
+        collector = PerfCollector(interval=args.interval, socket_path="").start()
+        started = time.monotonic()
+        exit_code = run_scenario(args.script, scenario_args, args.timeout)
+        report["scenario_s"] = round(time.monotonic() - started, 2)
+        report["scenario_exit"] = exit_code
+        report["final_perf"] = office.read_perf()
+    finally:
+        if collector:
+            collector.stop()
+        clean = office.stop()
+        report["clean_exit"] = clean
+        if not clean:
+            print("FAIL: office did not shut down cleanly")
+            print(tail(log_path))
+            exit_code = exit_code or 1
+    if collector is None:
+        return exit_code
+
+    print()
+    print("=" * 50)
+    print("Office-side perf during the scenario")
+    print("=" * 50)
+    summary = collector.summary()
+    report["summary"] = summary
+    for key, value in summary.items():
+        print(f"  {key:<24} {value:.2f}" if isinstance(value, float) else f"  {key:<24} {value}")
+
+    if args.out:
+        report["samples"] = collector.samples
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n  Wrote report to {args.out}")
+    return exit_code
+
+
+def _percentile(values: list, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def run_startup_benchmark(godot: str, env: dict, log_path: str, args) -> int:
+    """Launch and quit the office args.startup times; report launch-to-ready percentiles and phase means."""
+    print()
+    print(f"Startup benchmark: {args.startup} launches ({'windowed' if args.windowed else 'headless'})")
+    print()
+    runs = []
+    for i in range(args.startup):
+        office = HeadlessOffice(godot, log_path, env, headless=not args.windowed)
+        if i == 0 and not office.import_project():
+            print("FAIL: project import failed")
+            print(tail(log_path))
+            return 1
+        office.start()
+        ready = office.wait_ready(args.ready_timeout)
+        startup = office.read_startup() if ready else {}
+        clean = office.stop()
+        if not ready or not startup:
+            print(f"  [{i + 1:>3}] FAIL: office not ready within {args.ready_timeout:g}s")
+            print(tail(log_path))
+            return 1
+        run = {"launch_to_ready_s": round(office.ready_s, 3), "clean_exit": clean}
+        run.update(startup)
+        runs.append(run)
+        print(f"  [{i + 1:>3}] ready {office.ready_s * 1000:7.0f} ms (wall)  "
+              f"engine {startup.get('engine_ms', 0):5d} ms  _ready {startup.get('ready_ms', 0):5d} ms  "
+              f"first frame {startup.get('first_frame_ms', 0):5d} ms  deferred {startup.get('deferred_done_ms', 0):5d} ms")
+
+    print()
+    print(f"  {'metric':<22} {'p50':>9} {'p90':>9} {'max':>9}")
+    summary = {}
+    for key in STARTUP_METRICS:
+        values = [run[key] * (1000 if key.endswith("_s") else 1) for run in runs if key in run]
+        if values:
+            summary[key] = {"p50": _percentile(values, 0.5), "p90": _percentile(values, 0.9), "max": max(values)}
+            label = key.replace("_s", "_ms") if key.endswith("_s") else key
+            print(f"  {label:<22} {summary[key]['p50']:>9.1f} {summary[key]['p90']:>9.1f} {summary[key]['max']:>9.1f}")
+
+    # Mean cost of each _ready phase, slowest first
+    phase_totals = {}
+    for run in runs:
+        for phase in run.get("phases", []):
+            phase_totals[phase["name"]] = phase_totals.get(phase["name"], 0.0) + phase["ms"]
+    phase_means = {name: total / len(runs) for name, total in phase_totals.items()}
+    summary["phase_mean_ms"] = phase_means
+    print()
+    print("  Mean phase cost:")
+    for name, mean in sorted(phase_means.items(), key=lambda item: -item[1]):
+        print(f"    {name:<22} {mean:8.2f} ms")
+
+    unclean = sum(1 for run in runs if not run["clean_exit"])
+    if unclean:
+        print(f"\n  FAIL: {unclean} launches did not shut down cleanly")
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"runs": runs, "summary": summary, "windowed": args.windowed,
+                       "roster_agents": args.roster_agents}, f, indent=2)
+        print(f"\n  Wrote report to {args.out}")
+    return 1 if unclean else 0
+
+
+if __name__ == "__main__":
+    main()
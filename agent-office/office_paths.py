@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Where the office keeps its user:// files, for scripts that read or write them.
+
+Godot maps user:// to app_userdata/<project name> under the platform's data
+directory. The office must be run with its default user dir (no custom
+user dir in project.godot) for these paths to match.
+"""
+
+import os
+import sys
+
+PROJECT_NAME = "Inference Inc."
+
+
+def user_dir() -> str:
+    """user:// for this project (Godot's default user dir on each platform)."""
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA", os.path.expanduser("~"))
+        root = os.path.join(base, "Godot", "app_userdata")
+    elif sys.platform == "darwin":
+        root = os.path.expanduser("~/Library/Application Support/Godot/app_userdata")
+    else:
+        data_home = os.environ.get("XDG_DATA_HOME", os.path.expanduser("~/.local/share"))
+        root = os.path.join(data_home, "godot", "app_userdata")
+    return os.path.join(root, PROJECT_NAME)
+
+
+def stable_dir() -> str:
+    """user://stable, where AgentRoster keeps roster.dat."""
+    return os.path.join(user_dir(), "stable")
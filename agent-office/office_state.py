@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Agent Office state mirror - keeps a local copy of get_office_state up to date
+by polling for deltas instead of full snapshots.
+
+get_office_state returns a "version" (and an "epoch" per office run). Passing
+since_version back returns only agents/desks/furniture that changed or were
+removed since then, so polling cost scales with churn rather than office size.
+The office journals changes where they happen: agents on spawn, completion,
+state changes and movement (every 16 px walked, and where they stop), desks
+when taken, freed or moved, furniture when placed, moved or removed.
+
+Usage:
+    python3 office_state.py                    # Poll every 0.25s, print changes
+    python3 office_state.py --interval 1.0     # Poll interval in seconds
+    python3 office_state.py --socket PATH      # Use the office's Unix domain socket
+
+As a library:
+    mirror = OfficeStateMirror()
+    mirror.poll()                              # First call fetches everything
+    mirror.poll()                              # Later calls fetch deltas
+    print(len(mirror.agents), mirror.weather)
+"""
+
+import os
+import sys
+import time
+
+from office_client import HOST, PORT, OfficeClient, OfficeError
+
+TIMEOUT = 2.0
+POLL_INTERVAL = 0.25
+
+
+class OfficeStateMirror:
+    """Local copy of the office state, maintained from get_office_state deltas."""
+
+    def __init__(self, host: str = HOST, port: int = PORT, socket_path: str = "",
+                 client: OfficeClient = None):
+        self.client = client or OfficeClient(host, port, socket_path=socket_path, timeout=TIMEOUT)
+        self.reset()
+
+    def reset(self) -> None:
+        self.version = 0
+        self.epoch = ""
+        self.weather = "unknown"
+        self.time = ""
+        self.agents = {}     # agent id -> entry
+        self.desks = {}      # desk index -> entry
+        self.furniture = {}  # furniture id -> entry (entry["default"] marks built-ins)
+        self.cat = {}
+        self.polls = 0
+
+    def apply(self, delta: dict) -> dict:
+        """Apply one get_office_state(since_version=...) reply.
+
+        Returns a summary of what changed: {"full": bool, "agents": (changed, removed), ...}.
+        """
+        if delta.get("full"):
+            self.agents.clear()
+            self.desks.clear()
+            self.furniture.clear()
+            self.cat = {}
+
+        summary = {"full": bool(delta.get("full"))}
+        for group, store, key in (("agents", self.agents, "id"),
+                                  ("desks", self.desks, "index"),
+                                  ("furniture", self.furniture, "id")):
+            section = delta.get(group, {})
+            changed = section.get("changed", [])
+            removed = section.get("removed", [])
+            for entry in changed:
+                store[entry[key]] = entry
+            for ident in removed:
+                store.pop(ident, None)
+            summary[group] = (len(changed), len(removed))
+
+        if "cat" in delta:
+            self.cat = delta["cat"]
+        self.weather = delta.get("weather", self.weather)
+        self.time = delta.get("time", self.time)
+        self.version = int(delta.get("version", self.version))
+        self.epoch = delta.get("epoch", self.epoch)
+        return summary
+
+    def poll(self) -> dict:
+        """Fetch and apply the changes since the last poll."""
+        delta = self.client.get_office_state(since_version=self.version, epoch=self.epoch)
+        self.polls += 1
+        return self.apply(delta)
+
+    def snapshot(self) -> dict:
+        """The mirror in the same shape as a plain get_office_state reply."""
+        furniture = list(self.furniture.values())
+        return {
+            "version": self.version,
+            "epoch": self.epoch,
+            "weather": self.weather,
+            "time": self.time,
+            "agents": list(self.agents.values()),
+            "furniture": {
+                "defaults": [_without_default(f) for f in furniture if f.get("default")],
+                "dynamic": [_without_default(f) for f in furniture if not f.get("default")],
+            },
+            "desks": [self.desks[i] for i in sorted(self.desks)],
+            "cat": self.cat,
+        }
+
+
+def _without_default(entry: dict) -> dict:
+    return {key: value for key, value in entry.items() if key != "default"}
+
+
+def main():
+    args = sys.argv[1:]
+    socket_path = os.environ.get("OFFICE_SOCKET", "")
+    interval = POLL_INTERVAL
+    if "--socket" in args:
+        idx = args.index("--socket")
+        if idx + 1 >= len(args):
+            print("Error: --socket requires a path")
+            sys.exit(1)
+        socket_path = args[idx + 1]
+    if "--interval" in args:
+        idx = args.index("--interval")
+        try:
+            interval = float(args[idx + 1])
+        except (IndexError, ValueError):
+            print("Error: --interval requires seconds")
+            sys.exit(1)
+
+    mirror = OfficeStateMirror(socket_path=socket_path)
+    try:
+        while True:
+            try:
+                summary = mirror.poll()
+            except OfficeError as e:
+                print(f"  [!] Poll failed: {e}")
+                time.sleep(interval)
+                continue
+            changes = sum(sum(summary[group]) for group in ("agents", "desks", "furniture"))
+            if summary["full"] or changes:
+                kind = "FULL" if summary["full"] else "DELTA"
+                print(f"[{kind}] v{mirror.version} agents={len(mirror.agents)} "
+                      f"desks={len(mirror.desks)} furniture={len(mirror.furniture)} "
+                      f"changes={changes} polls={mirror.polls}")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
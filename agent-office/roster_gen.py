@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Generate a large agent roster for startup-time measurements.
+
+Writes the same roster store AgentRoster.gd reads (user://stable/roster.dat):
+a 64-byte header pointing at the index, one relationship record per agent,
+then the index (meta line + one summary line per agent). With --legacy it
+writes the old index.json + agent_NNN.json layout instead, which the office
+migrates into roster.dat on its next start.
+
+Usage:
+    python3 roster_gen.py                      # 10000 agents into the office's user dir
+    python3 roster_gen.py --agents 2000
+    python3 roster_gen.py --legacy             # Per-file layout (exercises the migration)
+    python3 roster_gen.py --out /tmp/stable    # Write somewhere else
+    python3 roster_gen.py --seed 7
+
+The office must not be running while its roster is replaced. Existing roster
+files in the output directory are overwritten; back up user://stable first.
+Startup cost shows up in the office log ("[AgentRoster] Loaded N agents in X ms")
+and under roster_persistence.load_ms in office://perf.
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+
+import office_paths
+
+DEFAULT_AGENTS = 10000
+STORE_MAGIC = "AGENTROSTER3"
+STORE_VERSION = 3
+STORE_HEADER_SIZE = 64
+
+# Mirrors AgentProfile.NAMES; later hires fall back to Agent_N like the office does
+NAMES = [
+    "Alex", "Jordan", "Sam", "Taylor", "Morgan", "Casey", "Jamie", "Riley",
+    "Quinn", "Avery", "Dakota", "Skyler", "Parker", "Cameron", "Drew", "Finley",
+    "Hayden", "Kendall", "Logan", "Peyton", "Reese", "Rowan", "Sage", "Spencer",
+    "Blake", "Charlie", "Emery", "Frankie", "Gray", "Harper", "Jesse", "Kit",
+    "Lane", "Max", "Nico", "Phoenix", "Ray", "Scout", "Tatum", "Val",
+    "Winter", "Ash", "Bailey", "Ellis", "Flynn", "Glenn", "Hunter", "Indigo",
+    "Jules", "Kerry", "Lee", "Marley", "Nat", "Oakley", "Pat", "Robin",
+    "Shannon", "Terry", "Wren", "Zion",
+]
+LEVEL_THRESHOLDS = [0, 500, 1500, 4000, 8000, 15000, 30000, 50000]
+SKILLS = ["general-purpose", "Explore", "Plan", "code-reviewer", "test-runner", "docs-writer"]
+TOOLS = ["Read", "Edit", "Write", "Bash", "Grep", "Glob", "WebFetch", "WebSearch", "Task", "TodoWrite"]
+TOPS = ["white_shirt", "blue_shirt", "green_shirt", "red_blouse", "black_hoodie"]
+BOTTOMS = ["dark_pants", "khaki_pants", "blue_jeans", "black_skirt"]
+HAIR_COLORS = ["brown", "black", "blonde", "red", "gray"]
+HAIR_STYLES = ["short", "long", "bob", "ponytail", "bald"]
+
+
+def _level_for(xp: int) -> int:
+    level = 1
+    for i, threshold in enumerate(LEVEL_THRESHOLDS):
+        if xp >= threshold:
+            level = i + 1
+    return level
+
+
+def _timestamp(epoch: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(epoch))
+
+
+def make_profiles(count: int, rng: random.Random) -> list:
+    """Full profile dicts in AgentProfile.to_dict() shape."""
+    now = time.time()
+    profiles = []
+    for agent_id in range(1, count + 1):
+        name = NAMES[agent_id - 1] if agent_id <= len(NAMES) else "Agent_%d" % (agent_id - len(NAMES))
+        hired = now - rng.uniform(0, 180 * 86400)
+        tasks = rng.randint(0, 400)
+        tools = {tool: rng.randint(1, 300) for tool in rng.sample(TOOLS, rng.randint(1, len(TOOLS)))}
+        skills = {skill: rng.randint(1, max(1, tasks)) for skill in rng.sample(SKILLS, rng.randint(0, 3))}
+        worked_with = {}
+        chatted_with = {}
+        for _ in range(rng.randint(0, 25)):
+            other = rng.randint(1, count)
+            if other != agent_id:
+                worked_with[str(other)] = worked_with.get(str(other), 0) + rng.randint(1, 5)
+        for _ in range(rng.randint(0, 25)):
+            other = rng.randint(1, count)
+            if other != agent_id:
+                chatted_with[str(other)] = chatted_with.get(str(other), 0) + rng.randint(1, 8)
+        work_seconds = tasks * rng.uniform(30.0, 600.0)
+        xp = tasks * 100 + sum(tools.values()) * 5 + sum(chatted_with.values()) * 20 + int(work_seconds / 60)
+        profiles.append({
+            "id": agent_id,
+            "name": name,
+            "hired_at": _timestamp(hired),
+            "last_seen": _timestamp(rng.uniform(hired, now)),
+            "appearance": {
+                "top": rng.choice(TOPS),
+                "bottom": rng.choice(BOTTOMS),
+                "hair_color": rng.choice(HAIR_COLORS),
+                "hair_style": rng.choice(HAIR_STYLES),
+                "skin_color_index": rng.randint(0, 5),
+            },
+            "progression": {"xp": xp, "level": _level_for(xp)},
+            "stats": {
+                "tasks_completed": tasks,
+                "total_work_time_seconds": round(work_seconds, 1),
+                "orchestrator_sessions": rng.randint(0, 20),
+            },
+            "skills": skills,
+            "tools": tools,
+            "relationships": {"worked_with": worked_with, "chatted_with": chatted_with},
+        })
+    return profiles
+
+
+def _meta(count: int) -> dict:
+    return {
+        "version": STORE_VERSION,
+        "next_id": count + 1,
+        "used_name_indices": list(range(min(count, len(NAMES)))),
+        "saved_at": _timestamp(time.time()),
+    }
+
+
+def write_store(profiles: list, stable_dir: str) -> str:
+    """Write roster.dat; returns its path."""
+    path = os.path.join(stable_dir, "roster.dat")
+    spans = {}
+    with open(path + ".tmp", "wb") as f:
+        f.write(b" " * STORE_HEADER_SIZE)
+        for profile in profiles:
+            relationships = profile["relationships"]
+            record = (json.dumps({"id": profile["id"], **relationships}) + "\n").encode()
+            spans[str(profile["id"])] = [f.tell(), len(record)]
+            f.write(record)
+        lines = [json.dumps({**_meta(len(profiles)), "agent_count": len(profiles), "details": spans})]
+        for profile in profiles:
+            summary = {k: v for k, v in profile.items() if k != "relationships"}
+            relationships = profile["relationships"]
+            summary["counts"] = {
+                "chats": sum(relationships["chatted_with"].values()),
+                "colleagues": len(relationships["worked_with"]),
+            }
+            lines.append(json.dumps(summary))
+        index = ("\n".join(lines) + "\n").encode()
+        index_offset = f.tell()
+        f.write(index)
+        f.seek(0)
+        header = ("%s %016d %012d" % (STORE_MAGIC, index_offset, len(index))).ljust(STORE_HEADER_SIZE - 1) + "\n"
+        f.write(header.encode("ascii"))
+    os.replace(path + ".tmp", path)
+    return path
+
+
+def write_legacy(profiles: list, stable_dir: str) -> str:
+    """Write index.json + agent_NNN.json; returns the index path."""
+    for profile in profiles:
+        with open(os.path.join(stable_dir, "agent_%03d.json" % profile["id"]), "w") as f:
+            json.dump(profile, f, indent="\t")
+    index = _meta(len(profiles))
+    index["agents"] = [profile["id"] for profile in profiles]
+    path = os.path.join(stable_dir, "index.json")
+    with open(path, "w") as f:
+        json.dump(index, f, indent="\t")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a large agent roster for startup benchmarks")
+    parser.add_argument("--agents", type=int, default=DEFAULT_AGENTS, help="Number of agents (default %d)" % DEFAULT_AGENTS)
+    parser.add_argument("--out", default=None, help="Stable directory to write (default: the office's user://stable)")
+    parser.add_argument("--legacy", action="store_true", help="Write the per-file layout instead of roster.dat")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed (default 1)")
+    args = parser.parse_args()
+
+    if args.agents < 1:
+        parser.error("--agents must be at least 1")
+    stable_dir = args.out or office_paths.stable_dir()
+    os.makedirs(stable_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    profiles = make_profiles(args.agents, random.Random(args.seed))
+    if args.legacy:
+        path = write_legacy(profiles, stable_dir)
+        # A leftover store would win over index.json on load
+        for stale in ("roster.dat", "index.json.migrated"):
+            if os.path.exists(os.path.join(stable_dir, stale)):
+                os.remove(os.path.join(stable_dir, stale))
+    else:
+        path = write_store(profiles, stable_dir)
+    elapsed = time.perf_counter() - start
+
+    print("Wrote %d agents to %s (%.1f MB, %.2fs)" % (
+        len(profiles), path, os.path.getsize(path) / 1048576.0, elapsed))
+
+
+if __name__ == "__main__":
+    main()
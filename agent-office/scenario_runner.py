@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Scheduled scenario runner for Agent Office.
+
+Plays a declarative scenario - agents that spawn at a given time, run tool
+cycles, ramp context stress and complete - against the office on one shared
+clock. Every timeline is a time-ordered stream of events; a heap keyed on
+each stream's next due time merges thousands of them. The scheduler sleeps
+until just before each deadline and spins the last stretch, events that
+fall due together go out as one JSON-RPC batch, and sends never block the
+clock. The report compares planned send times with the moment the scheduler
+released each event (release), the moment its request was written to a
+connection (drift, which includes waiting for a pool slot) and the reply
+(latency).
+
+Usage:
+    python3 scenario_runner.py day.json             # Run a scenario file
+    python3 scenario_runner.py --example > day.json # Print the built-in multi-team day
+    python3 scenario_runner.py day.json --speed 10  # Compress the timeline 10x
+    python3 scenario_runner.py day.json --dry-run   # Count events, don't send
+    python3 scenario_runner.py day.json --json drift.json --max-drift-ms 1
+    python3 scenario_runner.py day.json --socket PATH
+
+Scenario format (times in seconds, relative to the agent's own start):
+
+    {
+      "name": "multi-team-day",
+      "seed": 1,
+      "timelines": [
+        {
+          "name": "leads",                 # Agent ID prefix
+          "count": 4,                      # Copies of this timeline
+          "start": 0, "stagger": 2.0,      # Copy i starts at start + i * stagger
+          "jitter": 0.5,                   # ... plus up to this much (seeded)
+          "agent_type": "orchestrator", "orchestrator": true,
+          "spawn_at": 0,
+          "tools": [{"at": 5, "every": 3, "repeat": 20,
+                     "cycle": ["Read", "Edit", "Bash"], "hold": 0.5}],
+          "stress": [{"at": 10, "from": 0.0, "to": 0.9, "over": 60, "steps": 9}],
+          "complete_at": 120
+        },
+        {"name": "devs", "count": 40, "parent": "leads", ...}
+      ]
+    }
+
+A tool cycle is waiting_for_input followed by input_received `hold` seconds
+later. `parent` names another timeline; copy i reports to that timeline's
+copy i % count. Agent IDs get a per-run prefix so reruns never collide.
+"""
+
+import argparse
+import asyncio
+import gc
+import heapq
+import json
+import random
+import sys
+import time
+import uuid
+from typing import Iterator, List, Optional, Tuple
+
+from office_client import AsyncOfficeClient, OfficeError
+
+# Sleep until this close to a deadline, then spin; asyncio.sleep overshoots by
+# up to a scheduler tick, spinning the last stretch keeps sends sub-millisecond
+SPIN_WINDOW = 0.002
+# Events due within this window of each other share one batch
+BATCH_WINDOW = 0.0005
+MAX_BATCH = 200
+MAX_CONNECTIONS = 32
+DEFAULT_HOLD = 0.2
+
+EXAMPLE_SCENARIO = {
+    "name": "multi-team-day",
+    "seed": 1,
+    "timelines": [
+        {
+            "name": "lead",
+            "count": 6,
+            "stagger": 5.0,
+            "jitter": 1.0,
+            "agent_type": "orchestrator",
+            "orchestrator": True,
+            "description": "Team lead",
+            "tools": [{"at": 2, "every": 4, "repeat": 80, "cycle": ["Read", "Grep", "Task", "TodoWrite"], "hold": 0.5}],
+            "stress": [
+                {"at": 30, "from": 0.0, "to": 0.7, "over": 180, "steps": 14},
+                {"at": 240, "from": 0.7, "to": 0.95, "over": 60, "steps": 5},
+                {"at": 310, "from": 0.95, "to": 0.2, "over": 5, "steps": 1},
+            ],
+            "complete_at": 360,
+        },
+        {
+            "name": "dev",
+            "count": 120,
+            "parent": "lead",
+            "start": 10,
+            "stagger": 2.0,
+            "jitter": 3.0,
+            "agent_type": "python-pro",
+            "description": "Feature work",
+            "tools": [
+                {"at": 1, "every": 1.5, "repeat": 40, "cycle": ["Read", "Grep", "Edit", "Bash"], "hold": 0.3},
+                {"at": 70, "every": 0.8, "repeat": 30, "cycle": ["Bash", "Read"], "hold": 0.1},
+            ],
+            "complete_at": 100,
+        },
+        {
+            "name": "review",
+            "count": 60,
+            "parent": "lead",
+            "start": 120,
+            "stagger": 1.5,
+            "jitter": 2.0,
+            "agent_type": "code-reviewer",
+            "description": "Review pass",
+            "tools": [{"at": 1, "every": 2.0, "repeat": 20, "cycle": ["Read", "Grep"], "hold": 0.2}],
+            "complete_at": 45,
+        },
+    ],
+}
+
+
+class ScenarioError(ValueError):
+    """The scenario file is malformed."""
+
+
+def timestamp() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def _number(spec: dict, key: str, default: Optional[float] = None, minimum: float = 0.0) -> float:
+    value = spec.get(key, default)
+    if value is None:
+        raise ScenarioError(f"{spec.get('name', 'entry')}: '{key}' is required")
+    if not isinstance(value, (int, float)) or isinstance(value, bool) or value < minimum:
+        raise ScenarioError(f"{spec.get('name', 'entry')}: '{key}' must be a number >= {minimum}")
+    return float(value)
+
+
+class Timeline:
+    """One agent's planned events, relative to its own start."""
+
+    def __init__(self, spec: dict, agent_id: str, parent_id: str, offset: float):
+        self.spec = spec
+        self.agent_id = agent_id
+        self.parent_id = parent_id
+        self.offset = offset
+
+    def _planned(self) -> List[Tuple[float, dict]]:
+        spec = self.spec
+        aid = self.agent_id
+        spawn = {"event": "agent_spawn", "agent_id": aid, "agent_type": spec.get("agent_type", "scenario"),
+                 "description": spec.get("description", spec["name"]), "parent_id": self.parent_id}
+        if spec.get("orchestrator"):
+            spawn["is_orchestrator"] = True
+        events = [(_number(spec, "spawn_at", 0.0), spawn)]
+        for block in spec.get("tools", []):
+            cycle = block.get("cycle") or ["Bash"]
+            at = _number(block, "at", 0.0)
+            every = _number(block, "every", 1.0, minimum=0.001)
+            hold = _number(block, "hold", DEFAULT_HOLD)
+            for i in range(int(_number(block, "repeat", 1))):
+                tool = cycle[i % len(cycle)]
+                t = at + i * every
+                events.append((t, {"event": "waiting_for_input", "agent_id": aid, "tool": tool,
+                                   "description": f"{tool} #{i}"}))
+                events.append((t + hold, {"event": "input_received", "agent_id": aid, "tool": tool}))
+        for ramp in spec.get("stress", []):
+            at = _number(ramp, "at", 0.0)
+            start = _number(ramp, "from", 0.0)
+            end = _number(ramp, "to", 1.0)
+            steps = max(1, int(_number(ramp, "steps", 10)))
+            over = _number(ramp, "over", 0.0)
+            for i in range(steps + 1):
+                events.append((at + over * i / steps, {"event": "set_context_stress", "agent_id": aid,
+                                                       "stress": round(start + (end - start) * i / steps, 4)}))
+        if "complete_at" in spec:
+            events.append((_number(spec, "complete_at"), {"event": "agent_complete", "agent_id": aid,
+                                                          "success": spec.get("success", True)}))
+        # Stable sort keeps same-time events in declaration order (spawn first)
+        events.sort(key=lambda e: e[0])
+        return events
+
+    def events(self) -> Iterator[Tuple[float, dict]]:
+        """(absolute planned time, event) in time order."""
+        for t, event in self._planned():
+            yield self.offset + t, event
+
+
+def load_scenario(scenario: dict, run_id: str) -> List[Timeline]:
+    """Expand a scenario dict into one Timeline per agent."""
+    specs = scenario.get("timelines")
+    if not isinstance(specs, list) or not specs:
+        raise ScenarioError("scenario needs a non-empty 'timelines' list")
+    rng = random.Random(scenario.get("seed", 1))
+    ids = {}
+    for spec in specs:
+        name = spec.get("name")
+        if not name or name in ids:
+            raise ScenarioError(f"timeline names must be unique and non-empty (got {name!r})")
+        count = int(_number(spec, "count", 1, minimum=1))
+        ids[name] = [f"{run_id}-{name}-{i:04d}" for i in range(count)]
+
+    timelines = []
+    for spec in specs:
+        parent = spec.get("parent")
+        if parent is not None and parent not in ids:
+            raise ScenarioError(f"{spec['name']}: unknown parent timeline {parent!r}")
+        start = _number(spec, "start", 0.0)
+        stagger = _number(spec, "stagger", 0.0)
+        jitter = _number(spec, "jitter", 0.0)
+        for i, agent_id in enumerate(ids[spec["name"]]):
+            parent_id = ids[parent][i % len(ids[parent])] if parent else spec.get("parent_id", "main")
+            offset = start + i * stagger + (rng.uniform(0.0, jitter) if jitter else 0.0)
+            timelines.append(Timeline(spec, agent_id, parent_id, offset))
+    return timelines
+
+
+def _percentile(values: list, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+class Scheduler:
+    """Merges timelines through a heap and sends each event at its planned time."""
+
+    def __init__(self, office: Optional[AsyncOfficeClient], timelines: List[Timeline], speed: float = 1.0):
+        self.office = office
+        self.speed = speed
+        self._heap = []
+        self._streams = []
+        for timeline in timelines:
+            self._push(len(self._streams), iter(timeline.events()))
+        self.planned_end = 0.0
+        self.release: List[float] = []     # scheduler wake-up - planned, seconds
+        self.drift: List[float] = []       # request written - planned, seconds
+        self.latency: List[float] = []     # reply - planned, seconds
+        self.sent = 0
+        self.failed = 0
+        self.batches = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.errors: List[str] = []
+
+    def _push(self, index: int, stream: Iterator) -> None:
+        """Queue the next event of a stream; streams are only advanced as they drain."""
+        if index == len(self._streams):
+            self._streams.append(stream)
+        for t, event in stream:
+            heapq.heappush(self._heap, (t / self.speed, index, event))
+            return
+
+    def count(self) -> Tuple[int, float]:
+        """Drain a copy of the plan: (event count, planned duration). Consumes the scheduler."""
+        total = 0
+        end = 0.0
+        while self._heap:
+            due, index, _ = heapq.heappop(self._heap)
+            total += 1
+            end = due
+            self._push(index, self._streams[index])
+        return total, end
+
+    async def _send(self, batch: List[Tuple[float, dict]], clock_zero: float) -> None:
+        self.in_flight += len(batch)
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        written = []  # Write times; a retry on a fresh connection writes again
+        try:
+            results = await self.office.post_events([event for _, event in batch],
+                                                     on_write=lambda: written.append(time.perf_counter()))
+        except OfficeError as e:
+            results = [e] * len(batch)
+        finally:
+            self.in_flight -= len(batch)
+        replied = time.perf_counter() - clock_zero
+        if written:
+            sent_at = written[-1] - clock_zero
+            self.drift.extend(sent_at - due for due, _ in batch)
+        for (due, _), result in zip(batch, results):
+            if isinstance(result, Exception):
+                self.failed += 1
+                if len(self.errors) < 10:
+                    self.errors.append(str(result))
+            else:
+                self.sent += 1
+                self.latency.append(replied - due)
+
+    async def run(self) -> float:
+        """Play every timeline; returns the elapsed wall time."""
+        now = time.perf_counter
+        tasks = set()
+        # A full collection mid-run stalls the loop for milliseconds
+        gc.disable()
+        clock_zero = now()
+        try:
+            await self._schedule(clock_zero, tasks)
+        finally:
+            gc.enable()
+        if tasks:
+            await asyncio.gather(*tasks)
+        return now() - clock_zero
+
+    async def _schedule(self, clock_zero: float, tasks: set) -> None:
+        loop_sleep = asyncio.sleep
+        now = time.perf_counter
+        while self._heap:
+            wait = self._heap[0][0] - (now() - clock_zero)
+            if wait > SPIN_WINDOW:
+                await loop_sleep(wait - SPIN_WINDOW)
+                continue
+            while now() - clock_zero < self._heap[0][0]:
+                pass
+            released = now() - clock_zero
+            batch = []
+            while self._heap and self._heap[0][0] <= released + BATCH_WINDOW and len(batch) < MAX_BATCH:
+                due, index, event = heapq.heappop(self._heap)
+                event["timestamp"] = timestamp()
+                batch.append((due, event))
+                self.release.append(released - due)
+                self.planned_end = due
+                self._push(index, self._streams[index])
+            self.batches += 1
+            task = asyncio.ensure_future(self._send(batch, clock_zero))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            # Let the send start before the next deadline check
+            await loop_sleep(0)
+
+    def report(self, elapsed: float) -> dict:
+        def ms(values: list, q: float) -> float:
+            return round(_percentile(values, q) * 1000.0, 3) if values else 0.0
+        late = sum(1 for d in self.drift if d > 0.001)
+        return {
+            "events": len(self.release),
+            "sent": self.sent,
+            "failed": self.failed,
+            "batches": self.batches,
+            "planned_s": round(self.planned_end, 3),
+            "elapsed_s": round(elapsed, 3),
+            "speed": self.speed,
+            "max_in_flight": self.max_in_flight,
+            "drift_ms": {"p50": ms(self.drift, 0.5), "p90": ms(self.drift, 0.9), "p99": ms(self.drift, 0.99),
+                         "max": ms(self.drift, 1.0), "late_over_1ms": late},
+            "release_ms": {"p50": ms(self.release, 0.5), "p99": ms(self.release, 0.99), "max": ms(self.release, 1.0)},
+            "reply_ms": {"p50": ms(self.latency, 0.5), "p99": ms(self.latency, 0.99), "max": ms(self.latency, 1.0)},
+            "errors": self.errors,
+        }
+
+
+async def run_scenario(timelines: List[Timeline], socket_path: Optional[str], speed: float) -> dict:
+    async with AsyncOfficeClient(socket_path=socket_path, max_connections=MAX_CONNECTIONS) as office:
+        await office.initialize()
+        scheduler = Scheduler(office, timelines, speed)
+        elapsed = await scheduler.run()
+        return scheduler.report(elapsed)
+
+
+def print_report(report: dict) -> None:
+    drift = report["drift_ms"]
+    reply = report["reply_ms"]
+    print(f"  Events:        {report['sent']}/{report['events']} sent in {report['batches']} batches"
+          f" ({report['failed']} failed)")
+    print(f"  Timeline:      {report['planned_s']:.1f}s planned, {report['elapsed_s']:.1f}s elapsed"
+          f" (speed {report['speed']:g}x)")
+    print(f"  Send drift:    p50 {drift['p50']:.3f}ms  p90 {drift['p90']:.3f}ms  p99 {drift['p99']:.3f}ms"
+          f"  max {drift['max']:.3f}ms")
+    print(f"  Late >1ms:     {drift['late_over_1ms']}")
+    release = report["release_ms"]
+    print(f"  Release:       p50 {release['p50']:.3f}ms  p99 {release['p99']:.3f}ms  max {release['max']:.3f}ms"
+          f"  (scheduler wake-up)")
+    print(f"  Reply latency: p50 {reply['p50']:.2f}ms  p99 {reply['p99']:.2f}ms  max {reply['max']:.2f}ms"
+          f"  (max in flight {report['max_in_flight']})")
+    for error in report["errors"]:
+        print(f"  ERROR: {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play a scheduled agent scenario against Agent Office")
+    parser.add_argument("scenario", nargs="?", help="Scenario JSON file")
+    parser.add_argument("--example", action="store_true", help="Print the built-in multi-team day scenario and exit")
+    parser.add_argument("--speed", type=float, default=1.0, help="Time compression factor (default 1)")
+    parser.add_argument("--dry-run", action="store_true", help="Expand the scenario and report its size only")
+    parser.add_argument("--socket", default=None, help="Office Unix domain socket path")
+    parser.add_argument("--json", help="Write the drift report to this path")
+    parser.add_argument("--max-drift-ms", type=float, default=None,
+                        help="Fail if p99 send drift exceeds this many milliseconds")
+    args = parser.parse_args()
+
+    if args.example:
+        print(json.dumps(EXAMPLE_SCENARIO, indent=2))
+        return
+    if not args.scenario:
+        parser.error("a scenario file is required (or --example)")
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+
+    try:
+        with open(args.scenario) as f:
+            scenario = json.load(f)
+        timelines = load_scenario(scenario, uuid.uuid4().hex[:6])
+        events, planned = Scheduler(None, timelines, args.speed).count()
+    except (OSError, ValueError) as e:
+        print(f"Invalid scenario: {e}")
+        sys.exit(2)
+
+    print("=" * 50)
+    print(f"Scenario: {scenario.get('name', args.scenario)}")
+    print("=" * 50)
+    print(f"  {len(timelines)} agent timelines, {events} events over {planned:.1f}s")
+    if args.dry_run:
+        return
+
+    try:
+        report = asyncio.run(run_scenario(timelines, args.socket, args.speed))
+    except OfficeError as e:
+        print(f"FAIL: Cannot reach the office: {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print("\nInterrupted")
+        sys.exit(1)
+    report["scenario"] = scenario.get("name", args.scenario)
+    print_report(report)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    ok = report["failed"] == 0
+    if args.max_drift_ms is not None and report["drift_ms"]["p99"] > args.max_drift_ms:
+        print(f"FAIL: p99 drift {report['drift_ms']['p99']:.3f}ms exceeds {args.max_drift_ms:g}ms")
+        ok = False
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
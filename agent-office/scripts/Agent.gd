@@ -2,6 +2,8 @@ extends Node2D
 class_name Agent
 
 signal work_completed(agent: Agent)
+signal state_changed(agent: Agent)  # Emitted on the frame a new state is first seen
+signal moved(agent: Agent)  # Position drifted MOVE_REPORT_DISTANCE from the last report, or came to rest
 
 enum State { SPAWNING, WALKING_TO_DESK, WORKING, DELIVERING, SOCIALIZING, LEAVING, COMPLETING, IDLE, MEETING, FURNITURE_TOUR, CHATTING, WANDERING }
 enum Mood { CONTENT, TIRED, FRUSTRATED, IRATE }
@@ -98,6 +100,8 @@ var harness_label: String = ""
 var state: State = State.SPAWNING
 var last_state: State = State.SPAWNING
 var state_timer: float = 0.0
+var _reported_position: Vector2  # Position as of the last state_changed/moved
+var _last_frame_position: Vector2
 var target_position: Vector2
 var assigned_desk: Node2D = null
 var shredder_position: Vector2 = OfficeConstants.SHREDDER_POSITION
@@ -122,6 +126,7 @@ var socialize_timer: float = 0.0
 var chat_timer: float = 0.0
 var chatting_with: Agent = null  # Reference to the other agent we're chatting with
 var chat_cooldown: float = 0.0  # Prevent immediate re-chatting after a chat ends
+const MOVE_REPORT_DISTANCE: float = 16.0  # Pixels walked before get_office_state deltas pick up the agent again
 const CHAT_DURATION_MIN: float = 3.0
 const CHAT_DURATION_MAX: float = 6.0
 const CHAT_COOLDOWN_TIME: float = 15.0  # Time before this agent can chat again
@@ -287,6 +292,7 @@ func _process(delta: float) -> void:
 	var new_z = int(position.y)
 	if new_z != z_index:
 		z_index = new_z
+	_report_movement()
 
 	# Track time on floor and update mood
 	if state != State.SPAWNING and state != State.COMPLETING:
@@ -534,10 +540,22 @@ func _recover_from_stuck() -> void:
 	# Release any reserved resources (desk, meeting spot) before going idle
 	_handle_unreachable_destination()
 
+func _report_movement() -> void:
+	## Emit moved every MOVE_REPORT_DISTANCE while walking, and once more where
+	## the agent stops, so the last reported position is exact at rest.
+	if position != _reported_position:
+		var at_rest = position == _last_frame_position
+		if at_rest or position.distance_squared_to(_reported_position) >= MOVE_REPORT_DISTANCE * MOVE_REPORT_DISTANCE:
+			_reported_position = position
+			moved.emit(self)
+	_last_frame_position = position
+
 func _update_state_timer(delta: float) -> void:
 	if state != last_state:
 		state_timer = 0.0
 		last_state = state
+		_reported_position = position
+		state_changed.emit(self)
 		return
 
 	state_timer += delta
@@ -64,8 +64,13 @@ var skills: Dictionary = {}
 var tools: Dictionary = {}
 
 # Relationships (agent_id as string -> count)
+# Loaded on demand by AgentRoster.ensure_details(); the totals below stay
+# valid either way so roster-wide rankings never need the full maps.
 var worked_with: Dictionary = {}
 var chatted_with: Dictionary = {}
+var details_loaded: bool = true
+var chat_total: int = 0
+var colleague_count: int = 0
 
 # Current badges held (calculated, not persisted)
 var badges: Array[String] = []
@@ -170,6 +175,7 @@ func add_chat(other_agent_id: int) -> int:
 	if not chatted_with.has(key):
 		chatted_with[key] = 0
 	chatted_with[key] += 1
+	chat_total += 1
 
 	xp += XP_CHAT
 	return _recalculate_level()
@@ -178,6 +184,7 @@ func add_worked_with(other_agent_id: int) -> void:
 	var key = str(other_agent_id)
 	if not worked_with.has(key):
 		worked_with[key] = 0
+		colleague_count += 1
 	worked_with[key] += 1
 
 func add_orchestrator_session() -> int:
@@ -197,13 +204,22 @@ func get_total_tool_uses() -> int:
 	return total
 
 func get_total_chats() -> int:
-	var total = 0
-	for count in chatted_with.values():
-		total += count
-	return total
+	return chat_total
 
 func get_unique_colleagues_count() -> int:
-	return worked_with.size()
+	return colleague_count
+
+func set_relationships(p_worked_with: Dictionary, p_chatted_with: Dictionary) -> void:
+	worked_with = p_worked_with
+	chatted_with = p_chatted_with
+	details_loaded = true
+	_recount_relationships()
+
+func _recount_relationships() -> void:
+	colleague_count = worked_with.size()
+	chat_total = 0
+	for count in chatted_with.values():
+		chat_total += int(count)
 
 func get_unique_skills_count() -> int:
 	return skills.size()
@@ -215,6 +231,16 @@ func get_work_time_hours() -> float:
 # SERIALIZATION
 # =============================================================================
 
+func to_summary_dict() -> Dictionary:
+	## Everything but the relationship maps (roster store index entry)
+	var data = to_dict()
+	data.erase("relationships")
+	data["counts"] = {"chats": chat_total, "colleagues": colleague_count}
+	return data
+
+func to_details_dict() -> Dictionary:
+	return {"id": id, "worked_with": worked_with, "chatted_with": chatted_with}
+
 func to_dict() -> Dictionary:
 	return {
 		"id": id,
@@ -291,8 +317,14 @@ static func from_dict(data: Dictionary) -> AgentProfile:
 	profile.skills = data.get("skills", {})
 	profile.tools = data.get("tools", {})
 
-	var relationships = data.get("relationships", {})
-	profile.worked_with = relationships.get("worked_with", {})
-	profile.chatted_with = relationships.get("chatted_with", {})
+	if data.has("relationships"):
+		var relationships = data.get("relationships", {})
+		profile.set_relationships(relationships.get("worked_with", {}), relationships.get("chatted_with", {}))
+	else:
+		# Summary entry: maps come later from the roster store
+		var counts = data.get("counts", {})
+		profile.details_loaded = false
+		profile.chat_total = int(counts.get("chats", 0))
+		profile.colleague_count = int(counts.get("colleagues", 0))
 
 	return profile
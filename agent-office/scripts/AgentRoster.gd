@@ -5,10 +5,34 @@ class_name AgentRoster
 # AGENT ROSTER - Named Agent Management
 # =============================================================================
 # Manages the stable of named agents, handles hiring, assignment, and persistence.
-# Each agent has their own profile file in user://stable/
+#
+# All profiles live in one store file, user://stable/roster.dat:
+#   - a fixed-size header pointing at the current index
+#   - the index: one meta line, then one summary line per agent (name,
+#     appearance, XP, stats, tools, relationship counts)
+#   - relationship records (worked_with/chatted_with), read only when
+#     ensure_details() needs them
+# Startup parses the index alone. Writes are write-behind: save_profile() and
+# save_roster() only mark things dirty, and within FLUSH_DELAY_MS a
+# WorkerThreadPool task appends new records plus a new index, then repoints
+# the header. Once dead records make up over half the file, it is rewritten
+# (temp file + rename). flush() writes synchronously for quit. The older
+# index.json + agent_NNN.json layout is migrated on first load.
+#
+# FileAccess.flush() is not a durability barrier, so after a crash the header
+# can point at an index that never fully reached disk. Each meta line carries
+# agent_count, and load falls back to the newest index block that is complete,
+# then rewrites the store. A copy of the damaged file is kept as .corrupt.
 
 const STABLE_DIR: String = "user://stable"
-const INDEX_FILE: String = "user://stable/index.json"
+const INDEX_FILE: String = "user://stable/index.json"  # Legacy per-file layout, migrated on load
+const STORE_FILE: String = "user://stable/roster.dat"
+const STORE_MAGIC: String = "AGENTROSTER3"
+const STORE_VERSION: int = 3
+const STORE_HEADER_SIZE: int = 64
+const COMPACT_MIN_BYTES: int = 1048576  # Small stores aren't worth compacting
+const FLUSH_DELAY_MS: int = 2000  # Changes inside this window share one background write
+const ROSTER_CHANGED_INTERVAL_MS: int = 250  # roster_changed fires at most this often
 
 # In-memory roster
 var agents: Dictionary = {}  # id -> AgentProfile
@@ -19,6 +43,26 @@ var used_name_indices: Array[int] = []  # Track which names have been used
 # Currently working agents (id -> true)
 var working_agents: Dictionary = {}
 
+# Write-behind state
+var dirty_profiles: Dictionary = {}  # id -> true, profile needs re-serializing
+var index_dirty: bool = false
+var details_spans: Dictionary = {}  # id -> [offset, length] of the latest relationship record
+var _summary_json: Dictionary = {}  # id -> index line, reused until the profile changes
+var store_size: int = 0
+var store_live_bytes: int = 0  # Bytes the current index still references
+var load_usec: int = 0
+var details_loads: int = 0
+var recovered_from_offset: int = -1  # Index block used when the header was unusable
+var _flush_due_msec: int = -1
+var _flush_task_id: int = -1
+var _flush_batch: Dictionary = {}  # Batch owned by the running task until it completes
+var flush_count: int = 0
+var profiles_written: int = 0
+var write_failures: int = 0
+var last_flush_usec: int = 0
+var _roster_changed_pending: bool = false
+var _last_roster_changed_msec: int = -ROSTER_CHANGED_INTERVAL_MS
+
 # Signals
 signal agent_hired(profile: AgentProfile)
 signal agent_level_up(profile: AgentProfile, new_level: int)
@@ -40,10 +84,28 @@ func _emit_roster_changed() -> void:
 		return
 	roster_changed.emit()
 
+func _notify_roster_changed() -> void:
+	## Bursts of stat updates collapse into one roster_changed per ROSTER_CHANGED_INTERVAL_MS
+	_roster_changed_pending = true
+
 func _ready() -> void:
 	_ensure_stable_dir()
 	load_roster()
 
+func _process(_delta: float) -> void:
+	var now = Time.get_ticks_msec()
+	if _roster_changed_pending and now - _last_roster_changed_msec >= ROSTER_CHANGED_INTERVAL_MS:
+		_roster_changed_pending = false
+		_last_roster_changed_msec = now
+		_emit_roster_changed()
+	if _flush_task_id != -1 and WorkerThreadPool.is_task_completed(_flush_task_id):
+		_finish_flush_task()
+	if _flush_due_msec >= 0 and now >= _flush_due_msec and _flush_task_id == -1:
+		_start_flush(true)
+
+func _exit_tree() -> void:
+	flush()
+
 func _ensure_stable_dir() -> void:
 	var dir = DirAccess.open("user://")
 	if dir and not dir.dir_exists("stable"):
@@ -57,12 +119,146 @@ func load_roster() -> void:
 	agents.clear()
 	agents_by_name.clear()
 	working_agents.clear()
-
-	if not FileAccess.file_exists(INDEX_FILE):
+	details_spans.clear()
+	_summary_json.clear()
+	recovered_from_offset = -1
+
+	var start = Time.get_ticks_usec()
+	if FileAccess.file_exists(STORE_FILE):
+		if _load_store():
+			if recovered_from_offset >= 0:
+				# Rewrite from live records so the header is sound again
+				index_dirty = true
+				_start_flush(false, true)
+		else:
+			# Keep the unreadable file for inspection instead of overwriting it on the next flush
+			push_warning("[AgentRoster] Roster store is unreadable, moved aside to %s.corrupt" % STORE_FILE)
+			DirAccess.rename_absolute(STORE_FILE, STORE_FILE + ".corrupt")
+			agents.clear()
+			agents_by_name.clear()
+			details_spans.clear()
+			_summary_json.clear()
+			return
+	elif FileAccess.file_exists(INDEX_FILE):
+		_migrate_legacy_roster()
+	else:
 		print("[AgentRoster] No roster found, starting fresh")
 		return
+	load_usec = Time.get_ticks_usec() - start
+
+	print("[AgentRoster] Loaded %d agents in %.1f ms" % [agents.size(), load_usec / 1000.0])
+	_notify_roster_changed()
 
-	# Load index
+func _load_store() -> bool:
+	## Read the header and index only; relationship records stay on disk until ensure_details()
+	var file = FileAccess.open(STORE_FILE, FileAccess.READ)
+	if file == null:
+		return false
+	store_size = file.get_length()
+	var header = file.get_buffer(STORE_HEADER_SIZE).get_string_from_ascii().strip_edges().split(" ", false)
+	if header.size() == 3 and header[0] == STORE_MAGIC and header[1].is_valid_int() and header[2].is_valid_int():
+		var index_offset = int(header[1])
+		var index_length = int(header[2])
+		if index_offset >= STORE_HEADER_SIZE and index_offset + index_length <= store_size:
+			file.seek(index_offset)
+			if _load_index(file.get_buffer(index_length)):
+				file.close()
+				return true
+	file.seek(0)
+	var data = file.get_buffer(store_size)
+	file.close()
+	return _recover_index(data)
+
+func _recover_index(data: PackedByteArray) -> bool:
+	## Walk back from the end of the store to the newest index block that is complete.
+	## Older blocks still describe a consistent roster, just without the last flushes.
+	var line_starts: Array[int] = []
+	var pos = STORE_HEADER_SIZE
+	while pos < data.size():
+		line_starts.append(pos)
+		var newline = data.find(10, pos)
+		if newline < 0:
+			break
+		pos = newline + 1
+	for i in range(line_starts.size() - 1, -1, -1):
+		var line_end = line_starts[i + 1] if i + 1 < line_starts.size() else data.size()
+		var line = data.slice(line_starts[i], line_end).get_string_from_utf8()
+		if not line.begins_with("{") or not line.contains("\"next_id\""):
+			continue
+		var meta = JSON.parse_string(line)
+		if not meta is Dictionary:
+			continue
+		var block_end = line_end
+		if meta.has("agent_count"):
+			var last = i + int(meta["agent_count"])
+			if last >= line_starts.size():
+				continue
+			block_end = line_starts[last + 1] if last + 1 < line_starts.size() else data.size()
+		else:
+			# Stores written before agent_count: summaries run until the next record or index
+			var j = i + 1
+			while j < line_starts.size():
+				var next_end = line_starts[j + 1] if j + 1 < line_starts.size() else data.size()
+				var entry = JSON.parse_string(data.slice(line_starts[j], next_end).get_string_from_utf8())
+				if not entry is Dictionary or not entry.has("name"):
+					break
+				j += 1
+			block_end = line_starts[j] if j < line_starts.size() else data.size()
+		if _load_index(data.slice(line_starts[i], block_end)):
+			recovered_from_offset = line_starts[i]
+			push_warning("[AgentRoster] Roster header pointed at a damaged index; recovered %d agents from the index at byte %d (copy kept as %s.corrupt)" % [agents.size(), line_starts[i], STORE_FILE])
+			DirAccess.copy_absolute(STORE_FILE, STORE_FILE + ".corrupt")
+			return true
+	return false
+
+func _load_index(buffer: PackedByteArray) -> bool:
+	## Parse one index block (meta line + summaries). False, with nothing loaded,
+	## if the block is torn: missing its last newline, short of agent_count lines,
+	## or pointing at relationship records past the end of the file.
+	if buffer.is_empty() or buffer[buffer.size() - 1] != 10:
+		return false
+	var lines = buffer.get_string_from_utf8().split("\n", false)
+	if lines.is_empty():
+		return false
+	var meta = JSON.parse_string(lines[0])
+	if not meta is Dictionary or not meta.has("next_id"):
+		return false
+	if meta.has("agent_count") and int(meta["agent_count"]) != lines.size() - 1:
+		return false
+	var spans: Dictionary = meta.get("details", {})
+	for key in spans:
+		var span = spans[key]
+		if int(span[0]) < STORE_HEADER_SIZE or int(span[0]) + int(span[1]) > store_size:
+			return false
+
+	next_id = int(meta.get("next_id", 1))
+	used_name_indices = []
+	for idx in meta.get("used_name_indices", []):
+		used_name_indices.append(int(idx))
+	store_live_bytes = buffer.size()
+	for key in spans:
+		var span = spans[key]
+		details_spans[int(key)] = [int(span[0]), int(span[1])]
+		store_live_bytes += int(span[1])
+
+	# One summary per line, so each line doubles as the cached serialization
+	var json = JSON.new()
+	var skipped = 0
+	for i in range(1, lines.size()):
+		if json.parse(lines[i]) != OK or not json.data is Dictionary:
+			skipped += 1
+			continue
+		var profile = AgentProfile.from_dict(json.data)
+		agents[profile.id] = profile
+		agents_by_name[profile.agent_name] = profile
+		_summary_json[profile.id] = lines[i]
+	if skipped > 0:
+		push_warning("[AgentRoster] Skipped %d unreadable roster entries" % skipped)
+	return true
+
+func _migrate_legacy_roster() -> void:
+	## One-time move from index.json + agent_NNN.json into the roster store.
+	## The old files are left in place (index.json is renamed) so a rollback is possible.
 	var file = FileAccess.open(INDEX_FILE, FileAccess.READ)
 	if file == null:
 		push_warning("[AgentRoster] Failed to open index file")
@@ -87,20 +283,30 @@ func load_roster() -> void:
 	for idx in data.get("used_name_indices", []):
 		used_name_indices.append(int(idx))
 
-	# Load each agent profile
-	print("[AgentRoster] Index lists %d agents: %s" % [agent_ids.size(), agent_ids])
+	var missing: Array = []
 	for agent_id in agent_ids:
 		var profile = _load_agent_profile(int(agent_id))
 		if profile:
 			agents[profile.id] = profile
 			agents_by_name[profile.agent_name] = profile
-			print("[AgentRoster] Loaded: %s (id=%d)" % [profile.agent_name, profile.id])
 		else:
-			print("[AgentRoster] FAILED to load agent id=%d" % agent_id)
+			missing.append(int(agent_id))
+	if not missing.is_empty():
+		push_warning("[AgentRoster] %d profiles listed in index.json could not be loaded: %s" % [missing.size(), missing])
 
-	print("[AgentRoster] Loaded %d agents" % agents.size())
-	_cleanup_orphaned_relationships()
-	call_deferred("_emit_roster_changed")
+	var cleaned = 0
+	for profile in agents.values():
+		cleaned += _drop_orphaned_relationships(profile)
+		dirty_profiles[profile.id] = true
+	if cleaned > 0:
+		print("[AgentRoster] Cleaned %d orphaned relationship records" % cleaned)
+	index_dirty = true
+
+	var failures_before = write_failures
+	_start_flush(false, true)
+	if write_failures == failures_before:
+		DirAccess.rename_absolute(INDEX_FILE, INDEX_FILE + ".migrated")
+		print("[AgentRoster] Migrated %d agents from %s/agent_*.json to %s" % [agents.size(), STABLE_DIR, STORE_FILE])
 
 func _load_agent_profile(agent_id: int) -> AgentProfile:
 	var path = "%s/agent_%03d.json" % [STABLE_DIR, agent_id]
@@ -121,76 +327,240 @@ func _load_agent_profile(agent_id: int) -> AgentProfile:
 
 	return AgentProfile.from_dict(json.data)
 
-func _cleanup_orphaned_relationships() -> void:
-	# Remove chat/work records referencing agents that no longer exist
-	var valid_ids: Array = []
-	for id in agents.keys():
-		valid_ids.append(id)
-	var cleaned_count = 0
-
-	for agent in agents.values():
-		# Clean chatted_with
-		var orphaned_chats: Array = []
-		for id_key in agent.chatted_with.keys():
-			var id_int = int(id_key) if id_key is String else id_key
-			if id_int not in valid_ids:
-				orphaned_chats.append(id_key)
-		for id_key in orphaned_chats:
-			agent.chatted_with.erase(id_key)
-			cleaned_count += 1
-
-		# Clean worked_with
-		var orphaned_work: Array = []
-		for id_key in agent.worked_with.keys():
-			var id_int = int(id_key) if id_key is String else id_key
-			if id_int not in valid_ids:
-				orphaned_work.append(id_key)
-		for id_key in orphaned_work:
-			agent.worked_with.erase(id_key)
-			cleaned_count += 1
-
-	if cleaned_count > 0:
-		print("[AgentRoster] Cleaned %d orphaned relationship records" % cleaned_count)
-		# Save cleaned data
-		for agent in agents.values():
-			save_profile(agent)
+func ensure_details(profile: AgentProfile) -> void:
+	## Load the profile's relationship maps from the store if they aren't in memory yet
+	if profile == null or profile.details_loaded:
+		return
+	if _flush_task_id != -1 and _flush_batch.get("compact", false):
+		_finish_flush_task()  # Spans are about to point into the rewritten file
+	var data = {}
+	var span = details_spans.get(profile.id)
+	if span != null:
+		var file = FileAccess.open(STORE_FILE, FileAccess.READ)
+		if file:
+			file.seek(span[0])
+			var parsed = JSON.parse_string(file.get_buffer(span[1]).get_string_from_utf8())
+			file.close()
+			if parsed is Dictionary:
+				data = parsed
+			else:
+				push_warning("[AgentRoster] Unreadable relationship record for %s (#%d)" % [profile.agent_name, profile.id])
+	details_loads += 1
+	profile.set_relationships(data.get("worked_with", {}), data.get("chatted_with", {}))
+	# Agents fired since this record was written
+	if _drop_orphaned_relationships(profile) > 0:
+		save_profile(profile)
+
+func _drop_orphaned_relationships(profile: AgentProfile) -> int:
+	## Remove chat/work records referencing agents that no longer exist
+	var worked_with: Dictionary = {}
+	for id_key in profile.worked_with:
+		if agents.has(int(id_key)):
+			worked_with[id_key] = profile.worked_with[id_key]
+	var chatted_with: Dictionary = {}
+	for id_key in profile.chatted_with:
+		if agents.has(int(id_key)):
+			chatted_with[id_key] = profile.chatted_with[id_key]
+	var removed = profile.worked_with.size() - worked_with.size() + profile.chatted_with.size() - chatted_with.size()
+	if removed > 0:
+		profile.set_relationships(worked_with, chatted_with)
+	return removed
 
 func save_roster() -> void:
-	_ensure_stable_dir()
+	## Queue an index write (autosave/quit); profile changes are queued by save_profile()
+	_save_index()
 
-	# Save index
-	var agent_ids: Array = []
-	for id in agents.keys():
-		agent_ids.append(id)
+func save_profile(profile: AgentProfile) -> void:
+	## Queue one profile for the next background flush
+	dirty_profiles[profile.id] = true
+	_schedule_flush()
+
+func _save_index() -> void:
+	index_dirty = true
+	_schedule_flush()
+
+func flush() -> void:
+	## Write everything pending now, on the calling thread (quit path)
+	if _flush_task_id != -1:
+		_finish_flush_task()
+	if index_dirty or not dirty_profiles.is_empty():
+		_start_flush(false)
+
+func get_persistence_stats() -> Dictionary:
+	return {
+		"agents": agents.size(),
+		"details_loaded": details_loads,
+		"load_ms": load_usec / 1000.0,
+		"store_bytes": store_size,
+		"store_live_bytes": store_live_bytes,
+		"dirty_profiles": dirty_profiles.size(),
+		"index_dirty": index_dirty,
+		"flush_in_flight": _flush_task_id != -1,
+		"flushes": flush_count,
+		"profiles_written": profiles_written,
+		"write_failures": write_failures,
+		"recovered_from_offset": recovered_from_offset,
+		"last_flush_ms": last_flush_usec / 1000.0
+	}
 
-	var index_data = {
-		"version": 2,
+func _schedule_flush() -> void:
+	# Not pushed back by later changes, so a steady trickle still gets written
+	if _flush_due_msec < 0:
+		_flush_due_msec = Time.get_ticks_msec() + FLUSH_DELAY_MS
+
+func _start_flush(in_background: bool, compact: bool = false) -> void:
+	_flush_due_msec = -1
+	if store_size > COMPACT_MIN_BYTES and store_size > store_live_bytes * 2:
+		compact = true
+	var batch = _build_flush_batch(compact)
+	if in_background:
+		_flush_batch = batch
+		_flush_task_id = WorkerThreadPool.add_task(_write_batch.bind(batch), false, "AgentRoster flush")
+	else:
+		_write_batch(batch)
+		_record_flush(batch)
+
+func _finish_flush_task() -> void:
+	WorkerThreadPool.wait_for_task_completion(_flush_task_id)
+	_flush_task_id = -1
+	_record_flush(_flush_batch)
+	_flush_batch = {}
+
+func _build_flush_batch(compact: bool) -> Dictionary:
+	## Serialize on the main thread so the worker never touches live profiles.
+	## Untouched agents reuse their cached summary line.
+	_ensure_stable_dir()
+	var details: Dictionary = {}
+	var profile_count = 0
+	for id in dirty_profiles.keys():
+		var profile: AgentProfile = agents.get(id)
+		if profile == null:
+			continue
+		_summary_json[id] = JSON.stringify(profile.to_summary_dict())
+		if profile.details_loaded:
+			details[id] = JSON.stringify(profile.to_details_dict())
+		profile_count += 1
+	var summaries = PackedStringArray()
+	for id in agents.keys():
+		if not _summary_json.has(id):
+			_summary_json[id] = JSON.stringify(agents[id].to_summary_dict())
+		summaries.append(_summary_json[id])
+	var meta = {
+		"version": STORE_VERSION,
 		"next_id": next_id,
-		"agents": agent_ids,
+		"agent_count": summaries.size(),
 		"used_name_indices": used_name_indices,
 		"saved_at": AgentProfile._get_iso_timestamp(),
 	}
+	dirty_profiles.clear()
+	index_dirty = false
+	return {
+		"path": STORE_FILE,
+		"compact": compact,
+		"meta": meta,
+		"summaries": summaries,
+		"details": details,
+		"spans": details_spans.duplicate(),  # Worker fills in new offsets
+		"profiles": profile_count,
+		"failed": 0,
+		"usec": 0,
+		"size": 0,
+		"live_bytes": 0
+	}
 
-	var index_json = JSON.stringify(index_data, "\t")
-	var file = FileAccess.open(INDEX_FILE, FileAccess.WRITE)
-	if file:
-		file.store_string(index_json)
-		file.close()
-
-	# Save each agent profile
-	for profile in agents.values():
-		save_profile(profile)
-
-	print("[AgentRoster] Saved %d agents" % agents.size())
-
-func save_profile(profile: AgentProfile) -> void:
-	var path = "%s/agent_%03d.json" % [STABLE_DIR, profile.id]
-	var json_string = JSON.stringify(profile.to_dict(), "\t")
-
-	var file = FileAccess.open(path, FileAccess.WRITE)
-	if file:
-		file.store_string(json_string)
-		file.close()
+static func _write_batch(batch: Dictionary) -> void:
+	## Runs on a WorkerThreadPool thread; only touches the data in batch.
+	## Appends new relationship records and a new index, then repoints the
+	## header. A crash before the header write leaves the previous index intact.
+	var start = Time.get_ticks_usec()
+	var path: String = batch["path"]
+	if batch["compact"] or not FileAccess.file_exists(path):
+		_write_compacted_store(batch)
+	else:
+		var file = FileAccess.open(path, FileAccess.READ_WRITE)
+		if file == null:
+			batch["failed"] = 1
+		else:
+			file.seek_end()
+			_append_records(file, batch)
+			file.close()
+	batch["usec"] = Time.get_ticks_usec() - start
+
+static func _write_compacted_store(batch: Dictionary) -> void:
+	## Rewrite only live records into a temp file, then rename it over the store
+	var path: String = batch["path"]
+	var tmp_path = path + ".tmp"
+	var old_file = FileAccess.open(path, FileAccess.READ) if FileAccess.file_exists(path) else null
+	var file = FileAccess.open(tmp_path, FileAccess.WRITE)
+	if file == null:
+		batch["failed"] = 1
+		return
+	file.store_buffer(_store_header(0, 0))
+	var spans: Dictionary = batch["spans"]
+	var details: Dictionary = batch["details"]
+	for id in spans.keys():
+		if details.has(id):
+			continue  # Newer record is in this batch
+		var span = spans[id]
+		if old_file == null:
+			spans.erase(id)
+			continue
+		old_file.seek(span[0])
+		var record = old_file.get_buffer(span[1])
+		spans[id] = [file.get_position(), record.size()]
+		file.store_buffer(record)
+	if old_file:
+		old_file.close()
+	_append_records(file, batch)
+	file.close()
+	if DirAccess.rename_absolute(tmp_path, path) != OK:
+		batch["failed"] = 1
+
+static func _append_records(file: FileAccess, batch: Dictionary) -> void:
+	var spans: Dictionary = batch["spans"]
+	var details: Dictionary = batch["details"]
+	for id in details.keys():
+		var record = (details[id] + "\n").to_utf8_buffer()
+		spans[id] = [file.get_position(), record.size()]
+		file.store_buffer(record)
+	var meta: Dictionary = batch["meta"].duplicate()
+	meta["details"] = spans
+	var summaries: PackedStringArray = batch["summaries"]
+	var index = (JSON.stringify(meta) + "\n" + "\n".join(summaries) + "\n").to_utf8_buffer()
+	var index_offset = file.get_position()
+	file.store_buffer(index)
+	file.flush()  # Index must be on disk before the header points at it
+	file.seek(0)
+	file.store_buffer(_store_header(index_offset, index.size()))
+	var live_bytes = index.size()
+	for span in spans.values():
+		live_bytes += span[1]
+	batch["size"] = file.get_length()
+	batch["live_bytes"] = live_bytes
+
+static func _store_header(index_offset: int, index_length: int) -> PackedByteArray:
+	return (("%s %016d %012d" % [STORE_MAGIC, index_offset, index_length]).rpad(STORE_HEADER_SIZE - 1) + "\n").to_ascii_buffer()
+
+func _record_flush(batch: Dictionary) -> void:
+	flush_count += 1
+	profiles_written += batch["profiles"]
+	last_flush_usec = batch["usec"]
+	if batch["failed"] > 0:
+		write_failures += batch["failed"]
+		push_warning("[AgentRoster] Failed to write roster store %s" % batch["path"])
+		# Nothing reached disk; write these profiles again next time
+		for id in batch["details"]:
+			dirty_profiles[id] = true
+		index_dirty = true
+		_schedule_flush()
+		return
+	store_size = batch["size"]
+	store_live_bytes = batch["live_bytes"]
+	# Keep spans only for agents that still exist (some may have been fired meanwhile)
+	var spans: Dictionary = batch["spans"]
+	for id in spans:
+		if agents.has(id):
+			details_spans[id] = spans[id]
 
 # =============================================================================
 # AGENT HIRING & ASSIGNMENT
@@ -207,11 +577,10 @@ func hire_agent() -> AgentProfile:
 
 	print("[AgentRoster] Hired new agent: %s (#%d)" % [profile.agent_name, profile.id])
 	agent_hired.emit(profile)
-	call_deferred("_emit_roster_changed")
+	_notify_roster_changed()
 
-	# Save immediately
 	save_profile(profile)
-	save_roster()
+	_save_index()
 
 	return profile
 
@@ -312,12 +681,11 @@ func fire_agent(agent_id: int) -> bool:
 	if name_index != -1 and name_index in used_name_indices:
 		used_name_indices.erase(name_index)
 
-	var path = "%s/agent_%03d.json" % [STABLE_DIR, profile.id]
-	if FileAccess.file_exists(path):
-		DirAccess.remove_absolute(path)
-
-	save_roster()
-	call_deferred("_emit_roster_changed")
+	dirty_profiles.erase(agent_id)
+	details_spans.erase(agent_id)
+	_summary_json.erase(agent_id)
+	_save_index()
+	_notify_roster_changed()
 	print("[AgentRoster] Fired agent: %s (#%d)" % [profile.agent_name, profile.id])
 	return true
 
@@ -339,7 +707,7 @@ func record_task_completed(agent_id: int, skill_name: String, work_time: float)
 		agent_level_up.emit(profile, new_level)
 
 	save_profile(profile)
-	call_deferred("_emit_roster_changed")
+	_notify_roster_changed()
 
 func record_tool_use(agent_id: int, tool_name: String) -> void:
 	if not agents.has(agent_id):
@@ -353,8 +721,9 @@ func record_tool_use(agent_id: int, tool_name: String) -> void:
 	if new_level > 0:
 		agent_level_up.emit(profile, new_level)
 
-	# Don't save on every tool use - too frequent
-	call_deferred("_emit_roster_changed")
+	# Coalesced with every other change inside the flush window
+	save_profile(profile)
+	_notify_roster_changed()
 
 func record_chat(agent_a_id: int, agent_b_id: int) -> void:
 	if not agents.has(agent_a_id) or not agents.has(agent_b_id):
@@ -362,6 +731,8 @@ func record_chat(agent_a_id: int, agent_b_id: int) -> void:
 
 	var profile_a = agents[agent_a_id]
 	var profile_b = agents[agent_b_id]
+	ensure_details(profile_a)
+	ensure_details(profile_b)
 
 	var new_level_a = profile_a.add_chat(agent_b_id)
 	var new_level_b = profile_b.add_chat(agent_a_id)
@@ -371,7 +742,9 @@ func record_chat(agent_a_id: int, agent_b_id: int) -> void:
 	if new_level_b > 0:
 		agent_level_up.emit(profile_b, new_level_b)
 
-	call_deferred("_emit_roster_changed")
+	save_profile(profile_a)
+	save_profile(profile_b)
+	_notify_roster_changed()
 
 func record_worked_with(agent_id: int, other_agent_id: int) -> void:
 	if not agents.has(agent_id) or not agents.has(other_agent_id):
@@ -379,8 +752,12 @@ func record_worked_with(agent_id: int, other_agent_id: int) -> void:
 	if agent_id == other_agent_id:
 		return
 
+	ensure_details(agents[agent_id])
+	ensure_details(agents[other_agent_id])
 	agents[agent_id].add_worked_with(other_agent_id)
 	agents[other_agent_id].add_worked_with(agent_id)
+	save_profile(agents[agent_id])
+	save_profile(agents[other_agent_id])
 
 func record_orchestrator_session(agent_id: int) -> void:
 	if not agents.has(agent_id):
@@ -393,13 +770,21 @@ func record_orchestrator_session(agent_id: int) -> void:
 		agent_level_up.emit(profile, new_level)
 
 	save_profile(profile)
-	call_deferred("_emit_roster_changed")
+	_notify_roster_changed()
 
 # =============================================================================
 # QUERIES
 # =============================================================================
 
 func get_agent(agent_id: int) -> AgentProfile:
+	## Full profile, relationship maps included (loaded from the store on first use)
+	var profile: AgentProfile = agents.get(agent_id, null)
+	ensure_details(profile)
+	return profile
+
+func get_agent_summary(agent_id: int) -> AgentProfile:
+	## Profile without touching the store: names, stats and appearance only,
+	## relationship maps may still be unloaded
 	return agents.get(agent_id, null)
 
 func get_agent_by_name(name: String) -> AgentProfile:
@@ -5,6 +5,8 @@ const _JsonLoader = preload("res://scripts/FurnitureJsonLoader.gd")
 
 ## Registry for JSON-driven agent appearance items.
 ## Scans directories for tops, bottoms, hair colors, and hair styles.
+## Each category is scanned the first time something asks for it, so startup
+## doesn't pay for catalogs only the appearance editor lists.
 
 const TOPS_DIR := "res://appearance/tops"
 const BOTTOMS_DIR := "res://appearance/bottoms"
@@ -22,16 +24,32 @@ var _bottom_ids: Array[String] = []
 var _hair_color_ids: Array[String] = []
 var _hair_style_ids: Array[String] = []
 
-func _init() -> void:
-	_scan_all()
+var _scanned: Dictionary = {}  # dir_path -> true once loaded
 
-func _scan_all() -> void:
-	_scan_category(TOPS_DIR, _tops, _top_ids)
-	_scan_category(BOTTOMS_DIR, _bottoms, _bottom_ids)
-	_scan_category(HAIR_COLORS_DIR, _hair_colors, _hair_color_ids)
-	_scan_category(HAIR_STYLES_DIR, _hair_styles, _hair_style_ids)
+func get_loaded_categories() -> Array[String]:
+	var result: Array[String] = []
+	for dir_path in _scanned:
+		result.append(dir_path.get_file())
+	return result
+
+func _ensure_tops() -> void:
+	if not _scanned.has(TOPS_DIR):
+		_scan_category(TOPS_DIR, _tops, _top_ids)
+
+func _ensure_bottoms() -> void:
+	if not _scanned.has(BOTTOMS_DIR):
+		_scan_category(BOTTOMS_DIR, _bottoms, _bottom_ids)
+
+func _ensure_hair_colors() -> void:
+	if not _scanned.has(HAIR_COLORS_DIR):
+		_scan_category(HAIR_COLORS_DIR, _hair_colors, _hair_color_ids)
+
+func _ensure_hair_styles() -> void:
+	if not _scanned.has(HAIR_STYLES_DIR):
+		_scan_category(HAIR_STYLES_DIR, _hair_styles, _hair_style_ids)
 
 func _scan_category(dir_path: String, target: Dictionary, id_list: Array[String]) -> void:
+	_scanned[dir_path] = true
 	var defs := _JsonLoader.scan_directory(dir_path, false)
 	for data in defs:
 		var item_id: String = data.get("id", "")
@@ -44,15 +62,18 @@ func _scan_category(dir_path: String, target: Dictionary, id_list: Array[String]
 # --- Tops ---
 
 func get_top(id: String) -> Dictionary:
+	_ensure_tops()
 	return _tops.get(id, {})
 
 func get_all_tops() -> Array[Dictionary]:
+	_ensure_tops()
 	var result: Array[Dictionary] = []
 	for item_id in _top_ids:
 		result.append(_tops[item_id])
 	return result
 
 func get_all_top_ids() -> Array[String]:
+	_ensure_tops()
 	return _top_ids
 
 func get_top_color(id: String) -> Color:
@@ -62,20 +83,24 @@ func get_top_color(id: String) -> Color:
 	return _JsonLoader.resolve_color(item.get("color", null))
 
 func has_top(id: String) -> bool:
+	_ensure_tops()
 	return _tops.has(id)
 
 # --- Bottoms ---
 
 func get_bottom(id: String) -> Dictionary:
+	_ensure_bottoms()
 	return _bottoms.get(id, {})
 
 func get_all_bottoms() -> Array[Dictionary]:
+	_ensure_bottoms()
 	var result: Array[Dictionary] = []
 	for item_id in _bottom_ids:
 		result.append(_bottoms[item_id])
 	return result
 
 func get_all_bottom_ids() -> Array[String]:
+	_ensure_bottoms()
 	return _bottom_ids
 
 func get_bottom_color(id: String) -> Color:
@@ -85,20 +110,24 @@ func get_bottom_color(id: String) -> Color:
 	return _JsonLoader.resolve_color(item.get("color", null))
 
 func has_bottom(id: String) -> bool:
+	_ensure_bottoms()
 	return _bottoms.has(id)
 
 # --- Hair Colors ---
 
 func get_hair_color(id: String) -> Dictionary:
+	_ensure_hair_colors()
 	return _hair_colors.get(id, {})
 
 func get_all_hair_colors() -> Array[Dictionary]:
+	_ensure_hair_colors()
 	var result: Array[Dictionary] = []
 	for item_id in _hair_color_ids:
 		result.append(_hair_colors[item_id])
 	return result
 
 func get_all_hair_color_ids() -> Array[String]:
+	_ensure_hair_colors()
 	return _hair_color_ids
 
 func get_hair_color_value(id: String) -> Color:
@@ -108,23 +137,28 @@ func get_hair_color_value(id: String) -> Color:
 	return _JsonLoader.resolve_color(item.get("color", null))
 
 func has_hair_color(id: String) -> bool:
+	_ensure_hair_colors()
 	return _hair_colors.has(id)
 
 # --- Hair Styles ---
 
 func get_hair_style(id: String) -> Dictionary:
+	_ensure_hair_styles()
 	return _hair_styles.get(id, {})
 
 func get_all_hair_styles() -> Array[Dictionary]:
+	_ensure_hair_styles()
 	var result: Array[Dictionary] = []
 	for item_id in _hair_style_ids:
 		result.append(_hair_styles[item_id])
 	return result
 
 func get_all_hair_style_ids() -> Array[String]:
+	_ensure_hair_styles()
 	return _hair_style_ids
 
 func has_hair_style(id: String) -> bool:
+	_ensure_hair_styles()
 	return _hair_styles.has(id)
 
 # --- Migration Helpers ---
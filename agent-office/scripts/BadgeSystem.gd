@@ -142,7 +142,7 @@ func _update_agent_badges(agents: Array[AgentProfile]) -> void:
 	# Assign badges based on current holders
 	for badge_id in badge_holders.keys():
 		var holder_id = badge_holders[badge_id]
-		var agent = roster.get_agent(holder_id)
+		var agent = roster.get_agent_summary(holder_id)
 		if agent:
 			agent.badges.append(badge_id)
 
@@ -153,7 +153,7 @@ func _update_agent_badges(agents: Array[AgentProfile]) -> void:
 func get_badge_holder(badge_id: String) -> AgentProfile:
 	if not badge_holders.has(badge_id):
 		return null
-	return roster.get_agent(badge_holders[badge_id])
+	return roster.get_agent_summary(badge_holders[badge_id])
 
 func get_badge_info(badge_id: String) -> Dictionary:
 	return BADGES.get(badge_id, {})
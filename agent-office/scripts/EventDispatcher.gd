@@ -0,0 +1,145 @@
+extends Node
+class_name EventDispatcher
+
+# Office-side event queue drained under a per-frame time budget.
+# Transcript and MCP events used to be handled the moment they arrived, so a
+# replay burst of hundreds of events all landed in one frame. Now they queue
+# here and _process() dispatches as many as fit in frame_budget_usec (always at
+# least one, so the queue cannot stall). Events that only restate the latest
+# state for the same agent/session are merged while still queued.
+
+const DEFAULT_FRAME_BUDGET_USEC: int = 4000  # ~25% of a 60 FPS frame
+const LATENCY_WINDOW: int = 256  # Recent dispatch latencies kept for percentiles
+
+var handler: Callable  # Called with each event Dictionary
+var frame_budget_usec: int = DEFAULT_FRAME_BUDGET_USEC
+
+var _queue: Array = []  # [{event, enqueued_usec, scope}]
+var _head: int = 0  # Index of the next entry to dispatch (compacted when drained)
+var _last_in_scope: Dictionary = {}  # scope -> newest queued entry for that agent/session
+
+# Metrics
+var enqueued_total: int = 0
+var dispatched_total: int = 0
+var merged_total: int = 0
+var max_depth: int = 0
+var backlog_frames: int = 0  # Frames that ended with events still queued
+var last_drain_usec: int = 0
+var _latencies_usec: PackedInt64Array = PackedInt64Array()
+var _latency_next: int = 0
+var _latency_count: int = 0
+
+func _ready() -> void:
+	_latencies_usec.resize(LATENCY_WINDOW)
+
+func get_depth() -> int:
+	return _queue.size() - _head
+
+func enqueue(event_data: Dictionary) -> void:
+	enqueued_total += 1
+	var scope = _scope_for(event_data)
+	if scope != "" and _try_merge(scope, event_data):
+		merged_total += 1
+		return
+	var entry = {"event": event_data, "enqueued_usec": Time.get_ticks_usec(), "scope": scope}
+	_queue.append(entry)
+	if scope != "":
+		_last_in_scope[scope] = entry
+	max_depth = maxi(max_depth, get_depth())
+
+func clear() -> void:
+	_queue.clear()
+	_head = 0
+	_last_in_scope.clear()
+
+func _process(_delta: float) -> void:
+	if get_depth() == 0:
+		return
+	var start = Time.get_ticks_usec()
+	var now = start
+	while _head < _queue.size():
+		var entry: Dictionary = _queue[_head]
+		_head += 1
+		if entry["scope"] != "" and is_same(_last_in_scope.get(entry["scope"]), entry):
+			_last_in_scope.erase(entry["scope"])
+		_record_latency(now - entry["enqueued_usec"])
+		dispatched_total += 1
+		if handler.is_valid():
+			handler.call(entry["event"])
+		now = Time.get_ticks_usec()
+		if now - start >= frame_budget_usec:
+			break
+	last_drain_usec = now - start
+	if _head >= _queue.size():
+		_queue.clear()
+		_head = 0
+	else:
+		backlog_frames += 1
+		if _head > 1024:
+			# Drop dispatched entries occasionally instead of pop_front() per event
+			_queue = _queue.slice(_head)
+			_head = 0
+
+func get_stats() -> Dictionary:
+	var latencies = _latencies_usec.slice(0, _latency_count)
+	latencies.sort()
+	var stats = {
+		"depth": get_depth(),
+		"max_depth": max_depth,
+		"enqueued": enqueued_total,
+		"dispatched": dispatched_total,
+		"merged": merged_total,
+		"backlog_frames": backlog_frames,
+		"frame_budget_ms": frame_budget_usec / 1000.0,
+		"last_drain_ms": last_drain_usec / 1000.0,
+		"latency_ms": {"p50": 0.0, "p99": 0.0, "max": 0.0}
+	}
+	if _latency_count > 0:
+		stats["latency_ms"] = {
+			"p50": latencies[_latency_count / 2] / 1000.0,
+			"p99": latencies[mini(_latency_count - 1, int(_latency_count * 0.99))] / 1000.0,
+			"max": latencies[_latency_count - 1] / 1000.0
+		}
+	return stats
+
+func _record_latency(usec: int) -> void:
+	_latencies_usec[_latency_next] = usec
+	_latency_next = (_latency_next + 1) % LATENCY_WINDOW
+	_latency_count = mini(_latency_count + 1, LATENCY_WINDOW)
+
+func _scope_for(event_data: Dictionary) -> String:
+	## Events in the same scope keep their relative order; merging only happens
+	## with the newest queued event of that scope.
+	var agent_id = str(event_data.get("agent_id", ""))
+	if agent_id != "":
+		return "agent:" + agent_id
+	var session = str(event_data.get("session_id", ""))
+	if session == "":
+		var session_path = str(event_data.get("session_path", ""))
+		session = session_path.get_file().get_basename() if session_path else ""
+	if session != "":
+		return "session:" + session
+	match event_data.get("event", ""):
+		"weather_set":
+			return "weather"
+		"tool_latency":
+			return "tool_latency"
+	return ""
+
+func _try_merge(scope: String, event_data: Dictionary) -> bool:
+	var previous = _last_in_scope.get(scope)
+	if previous == null:
+		return false
+	var queued: Dictionary = previous["event"]
+	var event_type = event_data.get("event", "")
+	if queued.get("event", "") != event_type:
+		return false
+	match event_type:
+		"weather_set", "set_context_stress", "tool_latency":
+			# Latest value wins; keep the queue slot (and its wait time)
+			previous["event"] = event_data
+			return true
+		"session_activity", "input_received":
+			# Idempotent while the first one is still waiting
+			return true
+	return false
@@ -0,0 +1,79 @@
+class_name EventHistory
+
+# =============================================================================
+# Fixed-capacity ring of recorded office events
+# =============================================================================
+# Events are stored already serialized to JSON, keyed by their sequence
+# number: seq N lives in slot N % capacity. Appending overwrites the oldest
+# slot, so recording costs the same at 200 or 10k entries, and readers copy
+# only the strings they asked for instead of deep-copying the whole history.
+
+const DEFAULT_CAPACITY: int = 200
+const MIN_CAPACITY: int = 10
+const MAX_CAPACITY: int = 100000
+
+var capacity: int = DEFAULT_CAPACITY
+var last_seq: int = 0  # Newest stored seq (0 = nothing recorded yet)
+var _count: int = 0
+var _json: PackedStringArray = PackedStringArray()
+
+func _init(size: int = DEFAULT_CAPACITY) -> void:
+	capacity = clampi(size, MIN_CAPACITY, MAX_CAPACITY)
+	_json.resize(capacity)
+
+func size() -> int:
+	return _count
+
+func oldest_seq() -> int:
+	## Oldest seq still held; last_seq + 1 when empty
+	return last_seq - _count + 1
+
+func append(seq: int, json: String) -> void:
+	## seq must follow last_seq; a jump (history cleared elsewhere) restarts the ring
+	if seq != last_seq + 1:
+		_count = 0
+	last_seq = seq
+	_json[seq % capacity] = json
+	_count = mini(_count + 1, capacity)
+
+func get_json(seq: int) -> String:
+	if seq < oldest_seq() or seq > last_seq:
+		return ""
+	return _json[seq % capacity]
+
+func since(after_seq: int, limit: int = -1) -> PackedStringArray:
+	## Entries with seq > after_seq, oldest first, at most limit of them (-1 = all)
+	var first = maxi(after_seq + 1, oldest_seq())
+	var last = last_seq
+	if limit >= 0:
+		last = mini(last, first + limit - 1)
+	var result = PackedStringArray()
+	if last < first:
+		return result
+	result.resize(last - first + 1)
+	for seq in range(first, last + 1):
+		result[seq - first] = _json[seq % capacity]
+	return result
+
+func latest(limit: int) -> PackedStringArray:
+	## The newest limit entries, oldest first
+	return since(last_seq - limit)
+
+func resize(new_capacity: int) -> void:
+	## Change capacity, keeping as many of the newest entries as fit
+	new_capacity = clampi(new_capacity, MIN_CAPACITY, MAX_CAPACITY)
+	if new_capacity == capacity:
+		return
+	var keep = since(last_seq - mini(_count, new_capacity))
+	capacity = new_capacity
+	_json = PackedStringArray()
+	_json.resize(capacity)
+	_count = keep.size()
+	var first = last_seq - _count + 1
+	for i in range(_count):
+		_json[(first + i) % capacity] = keep[i]
+
+func clear() -> void:
+	_count = 0
+	_json = PackedStringArray()
+	_json.resize(capacity)
@@ -0,0 +1,363 @@
+class_name HttpWorker
+
+# =============================================================================
+# Background HTTP transport for McpServer
+# =============================================================================
+# Owns the listening servers and every client peer. A worker thread accepts
+# connections, reads bytes, frames HTTP requests and parses JSON bodies; the
+# main thread only sees finished requests (take_messages) and hands back
+# response bytes (respond / stream). Each direction is one Mutex-guarded Array
+# that the reader swaps out whole, so a lock is held for a swap or a single
+# append no matter how many requests are in flight.
+
+const HEADER_TERMINATOR = "\r\n\r\n"
+const IDLE_SLEEP_USEC: int = 1000  # Poll interval when nothing happened last pass
+const CLOSE_LINGER_MS: int = 100  # Keep a finished connection open briefly so the kernel flushes it
+const STREAM_BACKLOG_LIMIT: int = 1048576  # Unsent SSE bytes before a subscriber counts as stuck
+const BUSY_RESPONSE = "HTTP/1.1 503 Service Unavailable\r\nContent-Type: text/plain\r\nContent-Length: 11\r\nRetry-After: 1\r\nConnection: close\r\n\r\nServer busy"
+
+class Client:
+	var peer
+	var is_uds: bool = false
+	var buffer: PackedByteArray = PackedByteArray()
+	var scan_from: int = 0  # Buffer offset already searched for the header terminator
+	var header_end: int = -1  # Offset of "\r\n\r\n" once the headers are complete
+	var content_length: int = 0
+	var outgoing: PackedByteArray = PackedByteArray()
+	var in_flight: int = 0  # Requests handed to the main thread and not yet answered
+	var streaming: bool = false  # GET /events subscriber: input is ignored, no idle timeout
+	var closing: bool = false  # Read no more requests; close once answered and flushed
+	var close_at_ms: int = -1
+	var last_activity_ms: int = 0
+
+var max_clients: int = 512
+var max_message_size: int = 65536
+var keepalive_idle_ms: int = 10000
+
+var _servers: Array = []  # [[server, is_uds]], only touched by the worker once started
+var _thread: Thread = null
+var _mutex: Mutex = Mutex.new()
+
+# Shared with the main thread, guarded by _mutex
+var _running: bool = false
+var _inbox: Array = []  # Worker -> main: connected / disconnected / request messages
+var _outbox: Array = []  # Main -> worker: respond / stream / close commands
+var _published_stats: Dictionary = {}
+
+# Worker thread only
+var _clients: Dictionary = {}  # client_id -> Client
+var _next_id: int = 1
+var _accepted: int = 0
+var _rejected: int = 0
+var _requests: int = 0
+var _dropped_subscribers: int = 0
+
+func start(servers: Array) -> void:
+	_servers = servers
+	_running = true
+	_thread = Thread.new()
+	_thread.start(_run)
+
+func stop() -> void:
+	if _thread == null:
+		return
+	_mutex.lock()
+	_running = false
+	_mutex.unlock()
+	_thread.wait_to_finish()
+	_thread = null
+	for client in _clients.values():
+		client.peer.disconnect_from_host()
+	_clients.clear()
+	_servers.clear()
+	_inbox.clear()
+	_outbox.clear()
+
+func is_running() -> bool:
+	return _thread != null
+
+func take_messages() -> Array:
+	## Everything the worker produced since the last call, in arrival order
+	_mutex.lock()
+	var messages = _inbox
+	_inbox = []
+	_mutex.unlock()
+	return messages
+
+func respond(client_id: int, data: PackedByteArray, close: bool) -> void:
+	## Answer the oldest unanswered request from client_id
+	_post({"op": "respond", "id": client_id, "data": data, "close": close})
+
+func start_stream(client_id: int, data: PackedByteArray) -> void:
+	## Answer a request by turning the connection into an SSE stream
+	_post({"op": "start_stream", "id": client_id, "data": data})
+
+func stream(client_id: int, data: PackedByteArray) -> void:
+	_post({"op": "stream", "id": client_id, "data": data})
+
+func close_client(client_id: int) -> void:
+	_post({"op": "close", "id": client_id})
+
+func get_stats() -> Dictionary:
+	_mutex.lock()
+	var stats = _published_stats.duplicate()
+	stats["inbox"] = _inbox.size()
+	stats["outbox"] = _outbox.size()
+	_mutex.unlock()
+	stats["max_clients"] = max_clients
+	return stats
+
+func _post(command: Dictionary) -> void:
+	_mutex.lock()
+	_outbox.append(command)
+	_mutex.unlock()
+
+# =============================================================================
+# Worker thread
+# =============================================================================
+
+func _run() -> void:
+	while true:
+		_mutex.lock()
+		var running = _running
+		var commands = _outbox
+		_outbox = []
+		_mutex.unlock()
+		if not running:
+			break
+
+		var messages: Array = []
+		var busy = not commands.is_empty()
+		for command in commands:
+			_apply_command(command, messages)
+		for entry in _servers:
+			if _accept_connections(entry[0], entry[1], messages):
+				busy = true
+		var now = Time.get_ticks_msec()
+		for client_id in _clients.keys():
+			if _service_client(client_id, now, messages):
+				busy = true
+
+		if busy or not messages.is_empty():
+			_mutex.lock()
+			if _inbox.is_empty():
+				_inbox = messages
+			else:
+				_inbox.append_array(messages)
+			_published_stats = {
+				"clients": _clients.size(),
+				"accepted": _accepted,
+				"rejected": _rejected,
+				"requests": _requests,
+				"dropped_subscribers": _dropped_subscribers
+			}
+			_mutex.unlock()
+		else:
+			OS.delay_usec(IDLE_SLEEP_USEC)
+
+func _apply_command(command: Dictionary, messages: Array) -> void:
+	var client: Client = _clients.get(command["id"])
+	if client == null:
+		return  # Disconnected while the main thread was answering
+	match command["op"]:
+		"respond":
+			client.in_flight = maxi(client.in_flight - 1, 0)
+			client.outgoing.append_array(command["data"])
+			client.last_activity_ms = Time.get_ticks_msec()
+			if command["close"]:
+				client.closing = true
+		"start_stream":
+			client.in_flight = maxi(client.in_flight - 1, 0)
+			client.streaming = true
+			# HTTP/1.0 or "Connection: close" marked it closing; a stream stays open
+			client.closing = false
+			client.close_at_ms = -1
+			client.buffer.clear()
+			client.outgoing.append_array(command["data"])
+		"stream":
+			if client.outgoing.size() + command["data"].size() > STREAM_BACKLOG_LIMIT:
+				# Dropped rather than buffered forever; it can resume via Last-Event-ID
+				push_warning("[McpServer] Dropping slow event subscriber %d" % command["id"])
+				_dropped_subscribers += 1
+				_drop_client(command["id"], messages)
+				return
+			client.outgoing.append_array(command["data"])
+		"close":
+			client.closing = true
+			client.in_flight = 0
+
+func _accept_connections(server, is_uds: bool, messages: Array) -> bool:
+	var accepted_any = false
+	while server.is_connection_available():
+		var peer = server.take_connection()
+		if peer == null:
+			break
+		accepted_any = true
+		if _clients.size() >= max_clients:
+			# Say so instead of just hanging up, so clients can back off and retry
+			peer.put_data(BUSY_RESPONSE.to_ascii_buffer())
+			peer.disconnect_from_host()
+			_rejected += 1
+			push_warning("[McpServer] Connection rejected: max clients (%d) reached" % max_clients)
+			continue
+		if not is_uds:
+			peer.set_no_delay(true)  # Disable Nagle's algorithm for faster response
+		var client = Client.new()
+		client.peer = peer
+		client.is_uds = is_uds
+		client.last_activity_ms = Time.get_ticks_msec()
+		var client_id = _next_id
+		_next_id += 1
+		_clients[client_id] = client
+		_accepted += 1
+		messages.append({"type": "connected", "id": client_id, "uds": is_uds})
+	return accepted_any
+
+func _service_client(client_id: int, now: int, messages: Array) -> bool:
+	var client: Client = _clients[client_id]
+	client.peer.poll()
+	var status = client.peer.get_status()
+	if status == StreamPeerTCP.STATUS_ERROR or status == StreamPeerTCP.STATUS_NONE:
+		_drop_client(client_id, messages)
+		return true
+	if status != StreamPeerTCP.STATUS_CONNECTED:
+		return false
+
+	var busy = _flush(client_id, client, messages)
+	if not _clients.has(client_id):
+		return true
+
+	var available = client.peer.get_available_bytes()
+	if available > 0:
+		var data = client.peer.get_data(available)
+		if data[0] != OK:
+			_drop_client(client_id, messages)
+			return true
+		busy = true
+		client.last_activity_ms = now
+		# Subscribers only listen, and nothing after a final request is read
+		if not client.streaming and not client.closing:
+			client.buffer.append_array(data[1])
+			_frame_requests(client_id, client, messages)
+
+	if client.closing and client.in_flight == 0 and client.outgoing.is_empty():
+		if client.close_at_ms < 0:
+			client.close_at_ms = now + CLOSE_LINGER_MS
+		elif now >= client.close_at_ms:
+			_drop_client(client_id, messages)
+			return true
+	elif not client.streaming and client.in_flight == 0 and now - client.last_activity_ms > keepalive_idle_ms:
+		_drop_client(client_id, messages)
+		return true
+	return busy
+
+func _flush(client_id: int, client: Client, messages: Array) -> bool:
+	if client.outgoing.is_empty():
+		return false
+	var result = client.peer.put_partial_data(client.outgoing)
+	if result[0] != OK:
+		_drop_client(client_id, messages)
+		return true
+	var sent: int = result[1]
+	if sent <= 0:
+		return false
+	client.outgoing = client.outgoing.slice(sent) if sent < client.outgoing.size() else PackedByteArray()
+	return true
+
+func _drop_client(client_id: int, messages: Array) -> void:
+	var client: Client = _clients.get(client_id)
+	if client == null:
+		return
+	client.peer.disconnect_from_host()
+	_clients.erase(client_id)
+	messages.append({"type": "disconnected", "id": client_id})
+
+# =============================================================================
+# HTTP framing (worker thread)
+# =============================================================================
+
+func _frame_requests(client_id: int, client: Client, messages: Array) -> void:
+	## Pull every complete request out of the client's buffer (keep-alive
+	## clients may pipeline several). Only bytes that arrived since the last
+	## pass are scanned for the header terminator.
+	while not client.closing:
+		if client.header_end < 0:
+			client.header_end = _find_header_end(client.buffer, client.scan_from)
+			if client.header_end < 0:
+				# A terminator can straddle two reads, so rescan the last 3 bytes
+				client.scan_from = maxi(client.buffer.size() - 3, 0)
+				if client.buffer.size() > max_message_size:
+					_reject_oversized(client)
+				return
+			client.content_length = _get_content_length(client.buffer.slice(0, client.header_end).get_string_from_utf8())
+		var total = client.header_end + HEADER_TERMINATOR.length() + client.content_length
+		if total > max_message_size:
+			_reject_oversized(client)
+			return
+		if client.buffer.size() < total:
+			return
+		messages.append(_build_request(client_id, client, total))
+		client.buffer = client.buffer.slice(total) if total < client.buffer.size() else PackedByteArray()
+		client.header_end = -1
+		client.scan_from = 0
+
+func _find_header_end(buffer: PackedByteArray, from: int) -> int:
+	var size = buffer.size()
+	var index = buffer.find(13, from)  # '\r'
+	while index != -1 and index + 3 < size:
+		if buffer[index + 1] == 10 and buffer[index + 2] == 13 and buffer[index + 3] == 10:
+			return index
+		index = buffer.find(13, index + 1)
+	return -1
+
+func _build_request(client_id: int, client: Client, total: int) -> Dictionary:
+	var headers = client.buffer.slice(0, client.header_end).get_string_from_utf8()
+	var body_start = client.header_end + HEADER_TERMINATOR.length()
+	var body = client.buffer.slice(body_start, total).get_string_from_utf8() if total > body_start else ""
+	var request_line = headers.get_slice("\r\n", 0).split(" ")
+	var request = {
+		"type": "request",
+		"id": client_id,
+		"method": request_line[0] if request_line.size() >= 2 else "",
+		"path": request_line[1] if request_line.size() >= 2 else "",
+		"headers": headers,
+		"keep_alive": _wants_keep_alive(request_line, headers),
+		"payload": null,
+		"parse_error": false
+	}
+	if request["method"] == "POST":
+		# Parsing here keeps large JSON-RPC batches off the main thread
+		var json = JSON.new()
+		if json.parse(body) == OK:
+			request["payload"] = json.data
+		else:
+			request["parse_error"] = true
+	_requests += 1
+	client.in_flight += 1
+	if not request["keep_alive"]:
+		client.closing = true
+	return request
+
+func _reject_oversized(client: Client) -> void:
+	var message = "Request too large"
+	var response = "HTTP/1.1 413 %s\r\nContent-Type: text/plain\r\nContent-Length: %d\r\nConnection: close\r\n\r\n%s" % [message, message.length(), message]
+	client.outgoing.append_array(response.to_ascii_buffer())
+	client.buffer.clear()
+	client.closing = true
+
+static func _wants_keep_alive(request_line: PackedStringArray, headers: String) -> bool:
+	var connection = get_header_value(headers, "Connection").to_lower()
+	if request_line.size() >= 3 and request_line[2] == "HTTP/1.0":
+		return connection == "keep-alive"
+	return connection != "close"
+
+static func _get_content_length(headers: String) -> int:
+	var value = get_header_value(headers, "Content-Length")
+	return maxi(int(value), 0) if value.is_valid_int() else 0
+
+static func get_header_value(headers: String, header_name: String) -> String:
+	var prefix = header_name.to_lower() + ":"
+	for line in headers.split("\r\n"):
+		if line.to_lower().begins_with(prefix):
+			return line.substr(prefix.length()).strip_edges()
+	return ""
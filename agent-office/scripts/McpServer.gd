@@ -12,25 +12,44 @@ const DEFAULT_PORT = 9999
 const DEFAULT_BIND_ADDRESS = "127.0.0.1"
 const WATCHER_CONFIG_FILE = "user://watchers.json"
 const MAX_MESSAGE_SIZE = 65536
-const MAX_CLIENTS = 25
-const EVENT_HISTORY_LIMIT = 200
+const MAX_CLIENTS = 512
+const EVENT_STREAM_PATH = "/events"
+const EVENT_STREAM_HEARTBEAT_MS = 15000  # Comment line so idle subscribers notice dead connections
 const SERVER_NAME = "Claude Office MCP"
 const SERVER_VERSION = "0.1"
 
 var tcp_server: TCPServer = null
-var tcp_clients: Dictionary = {}  # client_id -> StreamPeerTCP
-var tcp_buffers: Dictionary = {}  # client_id -> String (for HTTP request accumulation)
-var pending_disconnect: Dictionary = {}  # client_id -> timestamp (deferred disconnect)
-var next_tcp_id: int = 1
-const DISCONNECT_DELAY_MS: int = 100  # Wait for TCP buffer to flush
+var uds_server = null  # UDSServer, only on engine builds that provide it
+# Sockets live on the HttpWorker thread; the main thread only tracks client ids
+var http_worker: HttpWorker = null
+var tcp_clients: Dictionary = {}  # client_id -> true if accepted on the Unix socket
+var event_stream_clients: Dictionary = {}  # client_id -> true for open GET /events (SSE) subscribers
+var last_stream_heartbeat_ms: int = 0
+const KEEPALIVE_IDLE_MS: int = 10000  # Close reusable connections idle this long
+const HTTP_FRAME_BUDGET_USEC: int = 4000  # Main-thread time per frame for framed requests
+var keep_alive_clients: Dictionary = {}  # client_id -> true while the client keeps its connection open
+var http_pending: Array = []  # Worker messages not yet handled (over budget last frame)
+var http_pending_head: int = 0
 var transport: String = "none"
 var enabled: bool = true
 var port: int = DEFAULT_PORT
 var bind_address: String = DEFAULT_BIND_ADDRESS
+var socket_path: String = ""  # Optional Unix domain socket listener (empty = disabled)
+var active_socket_path: String = ""
 var office_manager: Node = null
-var recent_events: Array = []
+var event_history: EventHistory = EventHistory.new()
+var event_seq: int = 0  # Sequence number of the last recorded event
+var pending_event_emits: int = 0  # Events posted over MCP but not yet handed to OfficeManager
+# get_office_state versioning: bumped when a poll finds entities marked as changed
+const STATE_JOURNAL_LIMIT = 256
+var state_version: int = 0
+var state_epoch: String = ""  # Distinguishes office runs so clients don't mix up versions
+var state_dirty: Dictionary = {}  # entity key -> true (changed) / false (removed) since the last journal record
+var cat_fingerprint: Array = []
+var state_journal: Array = []  # [{version, changed: [keys], removed: [keys]}]
 
 func _ready() -> void:
+	state_epoch = "%d-%d" % [Time.get_unix_time_from_system(), randi() % 100000]
 	_register_with_settings()
 	_start_server()
 
@@ -43,7 +62,9 @@ func _register_with_settings() -> void:
 	var schema: Array = [
 		{"key": "enabled", "type": "bool", "default": true, "description": "Enable MCP HTTP server"},
 		{"key": "port", "type": "int", "default": DEFAULT_PORT, "min": 1, "max": 65535, "description": "MCP server port"},
-		{"key": "bind_address", "type": "string", "default": DEFAULT_BIND_ADDRESS, "description": "MCP server bind address"}
+		{"key": "bind_address", "type": "string", "default": DEFAULT_BIND_ADDRESS, "description": "MCP server bind address"},
+		{"key": "socket_path", "type": "string", "default": "", "description": "Unix domain socket path for local clients (empty = disabled)"},
+		{"key": "event_history", "type": "int", "default": EventHistory.DEFAULT_CAPACITY, "min": EventHistory.MIN_CAPACITY, "max": EventHistory.MAX_CAPACITY, "description": "Recorded events kept for office://events and GET /events replay"}
 	]
 
 	registry.register_category("mcp", WATCHER_CONFIG_FILE, schema, _on_setting_changed)
@@ -55,6 +76,11 @@ func _register_with_settings() -> void:
 	port = v_port if v_port != null else DEFAULT_PORT
 	var v_bind = registry.get_setting("mcp", "bind_address")
 	bind_address = v_bind if v_bind != null and not str(v_bind).is_empty() else DEFAULT_BIND_ADDRESS
+	var v_socket = registry.get_setting("mcp", "socket_path")
+	socket_path = str(v_socket).strip_edges() if v_socket != null else ""
+	var v_history = registry.get_setting("mcp", "event_history")
+	if v_history != null:
+		event_history.resize(int(v_history))
 
 func _on_setting_changed(key: String, value: Variant) -> void:
 	var needs_restart = false
@@ -76,12 +102,19 @@ func _on_setting_changed(key: String, value: Variant) -> void:
 			if new_bind != bind_address:
 				bind_address = new_bind
 				needs_restart = true
+		"socket_path":
+			var new_socket = str(value).strip_edges() if value != null else ""
+			if new_socket != socket_path:
+				socket_path = new_socket
+				needs_restart = true
+		"event_history":
+			event_history.resize(int(value))
 
 	if needs_restart:
 		_restart_server()
 
 func _process(_delta: float) -> void:
-	if tcp_server == null:
+	if http_worker == null:
 		return
 	_process_http()
 
@@ -92,14 +125,19 @@ func set_office_manager(manager: Node) -> void:
 	office_manager = manager
 
 func record_event(event_data: Dictionary) -> void:
-	var entry = event_data.duplicate(true)
+	## Serialized once here; history reads and SSE subscribers reuse the string
+	var entry = event_data.duplicate()
+	event_seq += 1
+	entry["seq"] = event_seq
 	entry["received_at"] = Time.get_datetime_string_from_system()
-	recent_events.append(entry)
-	if recent_events.size() > EVENT_HISTORY_LIMIT:
-		recent_events.pop_front()
+	var json = JSON.stringify(entry)
+	event_history.append(event_seq, json)
+	if not event_stream_clients.is_empty():
+		_broadcast_stream_event(event_seq, json)
 
 func _emit_event(event_data: Dictionary) -> void:
 	## Deferred emission helper - breaks synchronous cascades that can cause X11 threading issues.
+	pending_event_emits = maxi(0, pending_event_emits - 1)
 	if not is_inside_tree():
 		return
 	if is_queued_for_deletion():
@@ -112,9 +150,13 @@ func get_mcp_config() -> Dictionary:
 	return {
 		"enabled": enabled,
 		"port": port,
-		"bind_address": bind_address
+		"bind_address": bind_address,
+		"socket_path": socket_path
 	}
 
+func get_socket_path() -> String:
+	return active_socket_path
+
 func get_transport() -> String:
 	return transport
 
@@ -127,17 +169,21 @@ func set_mcp_config(config: Dictionary) -> void:
 			registry.set_setting("mcp", "port", config["port"])
 		if config.has("bind_address"):
 			registry.set_setting("mcp", "bind_address", config["bind_address"])
+		if config.has("socket_path"):
+			registry.set_setting("mcp", "socket_path", config["socket_path"])
 	else:
 		var next_enabled = bool(config.get("enabled", enabled))
 		var next_port = int(config.get("port", port))
 		var next_bind = str(config.get("bind_address", bind_address)).strip_edges()
 		if next_bind.is_empty():
 			next_bind = bind_address
+		var next_socket = str(config.get("socket_path", socket_path)).strip_edges()
 
-		var changed = next_enabled != enabled or next_port != port or next_bind != bind_address
+		var changed = next_enabled != enabled or next_port != port or next_bind != bind_address or next_socket != socket_path
 		enabled = next_enabled
 		port = next_port
 		bind_address = next_bind
+		socket_path = next_socket
 		_save_mcp_config()
 		if changed:
 			_restart_server()
@@ -150,166 +196,197 @@ func _start_server() -> void:
 	if err != OK:
 		push_error("Failed to start MCP HTTP server on %s:%d: %s" % [bind_address, port, error_string(err)])
 		tcp_server = null
+	else:
+		transport = "http"
+		print("[McpServer] Listening on http://%s:%d" % [bind_address, port])
+	_start_uds_server()
+	if tcp_server or uds_server:
+		_start_http_worker()
+		server_started.emit()
+
+func _start_http_worker() -> void:
+	var servers: Array = []
+	if tcp_server:
+		servers.append([tcp_server, false])
+	if uds_server:
+		servers.append([uds_server, true])
+	http_worker = HttpWorker.new()
+	http_worker.max_clients = MAX_CLIENTS
+	http_worker.max_message_size = MAX_MESSAGE_SIZE
+	http_worker.keepalive_idle_ms = KEEPALIVE_IDLE_MS
+	http_worker.start(servers)
+
+func _start_uds_server() -> void:
+	# Same HTTP/JSON-RPC protocol as the TCP listener, but reachable only through
+	# the filesystem: no port conflicts, and access is limited by file permissions.
+	if socket_path.is_empty():
+		return
+	if not ClassDB.class_exists("UDSServer"):
+		push_warning("[McpServer] Unix domain sockets not supported by this engine build, ignoring socket_path")
+		return
+	var path = _resolve_socket_path(socket_path)
+	if not _clear_stale_socket(path):
+		return
+	# Bind inside a private (0700) directory and chmod before moving the socket
+	# into place, so nobody else can connect while it is still world-accessible
+	var private_dir = path.get_base_dir().path_join(".%s.%d" % [path.get_file(), OS.get_process_id()])
+	var err = DirAccess.make_dir_absolute(private_dir)
+	if err != OK:
+		push_error("Failed to create %s for the MCP socket: %s" % [private_dir, error_string(err)])
 		return
-	transport = "http"
-	print("[McpServer] Listening on http://%s:%d" % [bind_address, port])
-	server_started.emit()
+	FileAccess.set_unix_permissions(private_dir, FileAccess.UNIX_READ_OWNER | FileAccess.UNIX_WRITE_OWNER | FileAccess.UNIX_EXECUTE_OWNER)
+	var private_path = private_dir.path_join("office.sock")
+	var server = ClassDB.instantiate("UDSServer")
+	err = server.listen(private_path)
+	if err == OK:
+		FileAccess.set_unix_permissions(private_path, FileAccess.UNIX_READ_OWNER | FileAccess.UNIX_WRITE_OWNER)
+		err = DirAccess.rename_absolute(private_path, path)
+		if err != OK:
+			server.stop()
+	DirAccess.remove_absolute(private_path)
+	DirAccess.remove_absolute(private_dir)
+	if err != OK:
+		push_error("Failed to start MCP socket server on %s: %s" % [path, error_string(err)])
+		return
+	uds_server = server
+	active_socket_path = path
+	if transport == "none":
+		transport = "uds"
+	print("[McpServer] Listening on unix://%s" % path)
+
+func _clear_stale_socket(path: String) -> bool:
+	## A crashed previous run leaves its socket behind, which makes listen() fail.
+	## Remove that, but never a regular file, a directory or a socket in use.
+	if FileAccess.file_exists(path) or DirAccess.dir_exists_absolute(path):
+		push_error("MCP socket_path %s exists and is not a socket; not removing it" % path)
+		return false
+	if FileAccess.get_modified_time(path) == 0:
+		return true  # Nothing there
+	if ClassDB.class_exists("StreamPeerUDS"):
+		var probe = ClassDB.instantiate("StreamPeerUDS")
+		if probe.connect_to_host(path) == OK:
+			probe.poll()
+			var live = probe.get_status() == StreamPeerTCP.STATUS_CONNECTED  # Same status values
+			probe.disconnect_from_host()
+			if live:
+				push_error("MCP socket %s is in use by another process" % path)
+				return false
+	DirAccess.remove_absolute(path)
+	return true
+
+func _resolve_socket_path(path: String) -> String:
+	if path.begins_with("user://") or path.begins_with("res://"):
+		return ProjectSettings.globalize_path(path)
+	return path
 
 func _stop_server() -> void:
-	var was_running = tcp_server != null
+	var was_running = tcp_server != null or uds_server != null
+	# Join the worker first: it owns the listeners and peers until it exits
+	_disconnect_tcp_clients()
 	if tcp_server:
 		tcp_server.stop()
 		tcp_server = null
 		print("[McpServer] HTTP server stopped")
-	_disconnect_tcp_clients()
+	if uds_server:
+		uds_server.stop()
+		uds_server = null
+		DirAccess.remove_absolute(active_socket_path)
+		print("[McpServer] Socket server stopped")
+	active_socket_path = ""
 	transport = "none"
 	if was_running:
 		server_stopped.emit()
 
 func _disconnect_tcp_clients() -> void:
-	for client_id in tcp_clients.keys():
-		var peer = tcp_clients[client_id]
-		peer.disconnect_from_host()
+	if http_worker:
+		http_worker.stop()
+		http_worker = null
 	tcp_clients.clear()
-	tcp_buffers.clear()
-	pending_disconnect.clear()
+	event_stream_clients.clear()
+	keep_alive_clients.clear()
+	http_pending.clear()
+	http_pending_head = 0
 
 func _restart_server() -> void:
 	_stop_server()
 	_start_server()
 
 func _process_http() -> void:
-	# Accept new connections
-	while tcp_server.is_connection_available():
-		if tcp_clients.size() >= MAX_CLIENTS:
-			var rejected = tcp_server.take_connection()
-			if rejected:
-				rejected.disconnect_from_host()
-			push_warning("[McpServer] Connection rejected: max clients (%d) reached" % MAX_CLIENTS)
+	## Handle what the worker thread framed since last frame: connection
+	## changes and parsed requests, within HTTP_FRAME_BUDGET_USEC. Leftovers
+	## wait for the next frame so a burst of clients can't stall rendering.
+	var messages = http_worker.take_messages()
+	if not messages.is_empty():
+		http_pending.append_array(messages)
+	var start = Time.get_ticks_usec()
+	while http_pending_head < http_pending.size():
+		var message: Dictionary = http_pending[http_pending_head]
+		http_pending_head += 1
+		var client_id: int = message["id"]
+		match message["type"]:
+			"connected":
+				tcp_clients[client_id] = message["uds"]
+				client_connected.emit(client_id)
+			"disconnected":
+				tcp_clients.erase(client_id)
+				event_stream_clients.erase(client_id)
+				keep_alive_clients.erase(client_id)
+				client_disconnected.emit(client_id)
+			"request":
+				if tcp_clients.has(client_id):
+					_handle_http_request(message)
+		if Time.get_ticks_usec() - start >= HTTP_FRAME_BUDGET_USEC:
 			break
-		var peer = tcp_server.take_connection()
-		if peer:
-			peer.set_no_delay(true)  # Disable Nagle's algorithm for faster response
-			var client_id = next_tcp_id
-			next_tcp_id += 1
-			tcp_clients[client_id] = peer
-			tcp_buffers[client_id] = ""
-			client_connected.emit(client_id)
-
-	# Process existing connections
-	var to_disconnect_now: Array[int] = []
-	for client_id in tcp_clients.keys():
-		# Skip clients pending deferred disconnect
-		if pending_disconnect.has(client_id):
-			continue
-		var client = tcp_clients[client_id]
-		client.poll()
-		var status = client.get_status()
-		if status == StreamPeerTCP.STATUS_ERROR or status == StreamPeerTCP.STATUS_NONE:
-			to_disconnect_now.append(client_id)
-			continue
-		if status != StreamPeerTCP.STATUS_CONNECTED:
-			continue
-		var available = client.get_available_bytes()
-		if available > MAX_MESSAGE_SIZE:
-			_send_http_error(client_id, 413, "Request too large")
-			_schedule_disconnect(client_id)
-			continue
-		if available > 0:
-			var data = client.get_data(available)
-			if data[0] == OK:
-				tcp_buffers[client_id] += data[1].get_string_from_utf8()
-				if tcp_buffers[client_id].length() > MAX_MESSAGE_SIZE:
-					_send_http_error(client_id, 413, "Request too large")
-					_schedule_disconnect(client_id)
-					continue
-				# Check if we have a complete HTTP request
-				if _has_complete_http_request(tcp_buffers[client_id]):
-					_handle_http_request(client_id, tcp_buffers[client_id])
-					_schedule_disconnect(client_id)
-
-	# Process deferred disconnects (wait for TCP buffer to flush)
-	var now = Time.get_ticks_msec()
-	for client_id in pending_disconnect.keys():
-		var scheduled_time = pending_disconnect[client_id]
-		if now >= scheduled_time:
-			to_disconnect_now.append(client_id)
-
-	# Actually disconnect clients
-	for id in to_disconnect_now:
-		pending_disconnect.erase(id)
-		if tcp_clients.has(id):
-			var peer = tcp_clients[id]
-			peer.disconnect_from_host()
-			tcp_clients.erase(id)
-			tcp_buffers.erase(id)
-			client_disconnected.emit(id)
-
-func _schedule_disconnect(client_id: int) -> void:
-	pending_disconnect[client_id] = Time.get_ticks_msec() + DISCONNECT_DELAY_MS
-
-func _has_complete_http_request(buffer: String) -> bool:
-	# Check for end of headers
-	var header_end = buffer.find("\r\n\r\n")
-	if header_end == -1:
-		return false
-	# Check Content-Length if present
-	var headers = buffer.substr(0, header_end)
-	var content_length = _get_content_length(headers)
-	if content_length == 0:
-		return true  # No body expected
-	var body_start = header_end + 4
-	var body = buffer.substr(body_start)
-	return body.length() >= content_length
-
-func _get_content_length(headers: String) -> int:
-	for line in headers.split("\r\n"):
-		if line.to_lower().begins_with("content-length:"):
-			var value = line.substr(15).strip_edges()
-			if value.is_valid_int():
-				return int(value)
-	return 0
-
-func _handle_http_request(client_id: int, raw_request: String) -> void:
-	var header_end = raw_request.find("\r\n\r\n")
-	var headers_part = raw_request.substr(0, header_end)
-	var body = raw_request.substr(header_end + 4)
-
-	var lines = headers_part.split("\r\n")
-	if lines.is_empty():
-		_send_http_error(client_id, 400, "Bad Request")
-		return
+	if http_pending_head >= http_pending.size():
+		http_pending.clear()
+		http_pending_head = 0
+	elif http_pending_head > 1024:
+		http_pending = http_pending.slice(http_pending_head)
+		http_pending_head = 0
 
-	var request_line = lines[0].split(" ")
-	if request_line.size() < 2:
+	var now = Time.get_ticks_msec()
+	if not event_stream_clients.is_empty() and now - last_stream_heartbeat_ms >= EVENT_STREAM_HEARTBEAT_MS:
+		last_stream_heartbeat_ms = now
+		var ping = ": ping\n\n".to_utf8_buffer()
+		for client_id in event_stream_clients.keys():
+			http_worker.stream(client_id, ping)
+
+func _connection_header(client_id: int) -> String:
+	return "keep-alive" if keep_alive_clients.has(client_id) else "close"
+
+func _handle_http_request(request: Dictionary) -> void:
+	## request is a message framed by HttpWorker; POST bodies arrive already parsed
+	var client_id: int = request["id"]
+	var method: String = request["method"]
+	var path: String = request["path"]
+	if request["keep_alive"]:
+		keep_alive_clients[client_id] = true
+	else:
+		keep_alive_clients.erase(client_id)
+	if method.is_empty():
 		_send_http_error(client_id, 400, "Bad Request")
 		return
 
-	var method = request_line[0]
-	var path = request_line[1]
-
 	# Handle CORS preflight
 	if method == "OPTIONS":
 		_send_http_cors_preflight(client_id)
 		return
 
+	# Server-Sent Events subscription to recorded office events
+	if method == "GET" and (path == EVENT_STREAM_PATH or path.begins_with(EVENT_STREAM_PATH + "?")):
+		_start_event_stream(client_id, _parse_stream_cursor(path, request["headers"]))
+		return
+
 	# Only accept POST for MCP
 	if method != "POST":
 		_send_http_error(client_id, 405, "Method Not Allowed")
 		return
 
-	# Parse JSON-RPC body
-	var content_length = _get_content_length(headers_part)
-	if content_length > 0:
-		body = body.substr(0, content_length)
-
-	var json = JSON.new()
-	var err = json.parse(body)
-	if err != OK:
+	if request["parse_error"]:
 		_send_http_json_rpc_error(client_id, null, -32700, "Parse error")
 		return
 
-	var payload = json.data
+	var payload = request["payload"]
 	if payload is Array:
 		var results: Array = []
 		for entry in payload:
@@ -336,10 +413,9 @@ func _process_request(request: Dictionary) -> Dictionary:
 			return _build_json_rpc_result(id, {"resources": _list_resources()})
 		"resources/read", "read_resource":
 			var params = request.get("params", {})
-			var uri = ""
-			if params is Dictionary:
-				uri = str(params.get("uri", ""))
-			return _build_json_rpc_result(id, _read_resource(uri))
+			if not params is Dictionary:
+				params = {}
+			return _build_json_rpc_result(id, _read_resource(str(params.get("uri", "")), params))
 		"tools/list", "list_tools":
 			return _build_json_rpc_result(id, {"tools": _list_tools()})
 		"tools/call", "call_tool":
@@ -369,11 +445,11 @@ func _send_http_json_response(client_id: int, payload) -> void:
 	var body = JSON.stringify(payload)
 	var response = "HTTP/1.1 200 OK\r\n"
 	response += "Content-Type: application/json\r\n"
-	response += "Content-Length: %d\r\n" % body.length()
+	response += "Content-Length: %d\r\n" % body.to_utf8_buffer().size()
 	response += "Access-Control-Allow-Origin: http://localhost\r\n"
 	response += "Access-Control-Allow-Methods: POST, OPTIONS\r\n"
 	response += "Access-Control-Allow-Headers: Content-Type\r\n"
-	response += "Connection: close\r\n"
+	response += "Connection: %s\r\n" % _connection_header(client_id)
 	response += "\r\n"
 	response += body
 	_send_raw(client_id, response)
@@ -382,6 +458,7 @@ func _send_http_json_rpc_error(client_id: int, id, code: int, message: String) -
 	_send_http_json_response(client_id, _build_json_rpc_error(id, code, message))
 
 func _send_http_error(client_id: int, status_code: int, message: String) -> void:
+	keep_alive_clients.erase(client_id)  # Errors always close the connection
 	var response = "HTTP/1.1 %d %s\r\n" % [status_code, message]
 	response += "Content-Type: text/plain\r\n"
 	response += "Content-Length: %d\r\n" % message.length()
@@ -396,16 +473,74 @@ func _send_http_cors_preflight(client_id: int) -> void:
 	response += "Access-Control-Allow-Methods: POST, OPTIONS\r\n"
 	response += "Access-Control-Allow-Headers: Content-Type\r\n"
 	response += "Access-Control-Max-Age: 86400\r\n"
-	response += "Connection: close\r\n"
+	response += "Connection: %s\r\n" % _connection_header(client_id)
 	response += "\r\n"
 	_send_raw(client_id, response)
 
-func _send_raw(client_id: int, data: String) -> void:
+func _parse_stream_cursor(path: String, headers: String) -> int:
+	## Resume position for a subscriber: Last-Event-ID wins over ?after=N.
+	## -1 means "only new events".
+	var last_id = HttpWorker.get_header_value(headers, "Last-Event-ID")
+	if last_id.is_valid_int():
+		return int(last_id)
+	var query_start = path.find("?")
+	if query_start == -1:
+		return -1
+	for pair in path.substr(query_start + 1).split("&"):
+		var parts = pair.split("=", true, 1)
+		if parts.size() == 2 and parts[0] == "after" and parts[1].is_valid_int():
+			return int(parts[1])
+	return -1
+
+func _start_event_stream(client_id: int, after_seq: int) -> void:
+	var response = "HTTP/1.1 200 OK\r\n"
+	response += "Content-Type: text/event-stream\r\n"
+	response += "Cache-Control: no-cache\r\n"
+	response += "Access-Control-Allow-Origin: http://localhost\r\n"
+	response += "Connection: keep-alive\r\n"
+	response += "\r\n"
+	keep_alive_clients.erase(client_id)
+	http_worker.start_stream(client_id, response.to_utf8_buffer())
+	event_stream_clients[client_id] = true
+	_send_stream(client_id, "event: ready\ndata: %s\n\n" % JSON.stringify({"seq": event_seq}))
+
+	if after_seq < 0:
+		return
+	# Replay what the history still holds; tell the client if it fell too far behind
+	var oldest_seq = event_history.oldest_seq()
+	if event_history.size() > 0 and after_seq + 1 < oldest_seq:
+		_send_stream(client_id, "event: gap\ndata: %s\n\n" % JSON.stringify({"from": after_seq + 1, "to": oldest_seq - 1}))
+	var seq = maxi(after_seq + 1, oldest_seq)
+	for json in event_history.since(after_seq):
+		if not _send_stream(client_id, _format_stream_event(seq, json)):
+			return
+		seq += 1
+
+func _format_stream_event(seq: int, json: String) -> String:
+	return "id: %d\nevent: office_event\ndata: %s\n\n" % [seq, json]
+
+func _broadcast_stream_event(seq: int, json: String) -> void:
+	if http_worker == null:
+		return
+	var bytes = _format_stream_event(seq, json).to_utf8_buffer()
+	for client_id in event_stream_clients.keys():
+		http_worker.stream(client_id, bytes)
+
+func _send_stream(client_id: int, message: String) -> bool:
+	## Queue bytes for a subscriber. The worker buffers what the socket can't
+	## take yet and drops subscribers that fall too far behind; they can resume
+	## via Last-Event-ID.
 	if not tcp_clients.has(client_id):
+		event_stream_clients.erase(client_id)
+		return false
+	http_worker.stream(client_id, message.to_utf8_buffer())
+	return true
+
+func _send_raw(client_id: int, data: String) -> void:
+	## Answer the client's oldest pending request; closes unless it asked for keep-alive
+	if not tcp_clients.has(client_id) or http_worker == null:
 		return
-	var peer = tcp_clients[client_id]
-	peer.put_data(data.to_utf8_buffer())
-	peer.poll()  # Attempt to flush send buffer
+	http_worker.respond(client_id, data.to_utf8_buffer(), not keep_alive_clients.has(client_id))
 
 func _build_initialize_result(params: Dictionary) -> Dictionary:
 	var protocol_version = str(params.get("protocolVersion", "2024-11-05"))
@@ -423,6 +558,9 @@ func _build_initialize_result(params: Dictionary) -> Dictionary:
 			"tools": {
 				"list": true,
 				"call": true
+			},
+			"experimental": {
+				"eventStream": {"path": EVENT_STREAM_PATH, "format": "text/event-stream"}
 			}
 		}
 	}
@@ -456,12 +594,24 @@ func _list_resources() -> Array[Dictionary]:
 		{
 			"uri": "office://events",
 			"name": "Recent Events",
-			"description": "Recent office events",
+			"description": "Recent office events; pass after_seq to get only newer ones, limit to cap the count (GET /events streams them as they happen)",
+			"mimeType": "application/json"
+		},
+		{
+			"uri": "office://perf",
+			"name": "Performance",
+			"description": "Frame-time percentiles, engine monitors, event backlog and cache stats",
+			"mimeType": "application/json"
+		},
+		{
+			"uri": "office://startup",
+			"name": "Startup Timing",
+			"description": "Launch-to-ready and first-frame times with a per-phase breakdown of office startup",
 			"mimeType": "application/json"
 		}
 	]
 
-func _read_resource(uri: String) -> Dictionary:
+func _read_resource(uri: String, params: Dictionary = {}) -> Dictionary:
 	var payload = {}
 	match uri:
 		"office://summary":
@@ -473,7 +623,18 @@ func _read_resource(uri: String) -> Dictionary:
 		"office://sessions":
 			payload = _build_sessions()
 		"office://events":
-			payload = {"events": recent_events.duplicate(true)}
+			# Entries are stored as JSON already, so splice them in rather than re-serializing
+			return {
+				"contents": [{
+					"uri": uri,
+					"mimeType": "application/json",
+					"text": _build_events_json(params)
+				}]
+			}
+		"office://perf":
+			payload = _build_perf()
+		"office://startup":
+			payload = office_manager.get_startup_report() if office_manager else {}
 		_:
 			return {
 				"contents": [{
@@ -555,10 +716,13 @@ func _list_tools() -> Array[Dictionary]:
 		},
 		{
 			"name": "get_office_state",
-			"description": "Get the full office state including agents, furniture positions, weather, and cat.",
+			"description": "Get the office state including agents, furniture positions, weather, and cat. Pass since_version (and epoch) from a previous reply to get only what changed since then.",
 			"inputSchema": {
 				"type": "object",
-				"properties": {}
+				"properties": {
+					"since_version": {"type": "integer", "description": "Version from a previous reply; returns a delta (0 = full snapshot in delta format)"},
+					"epoch": {"type": "string", "description": "Epoch from a previous reply; a mismatch (office restarted) forces a full snapshot"}
+				}
 			}
 		},
 		{
@@ -739,6 +903,17 @@ func _list_tools() -> Array[Dictionary]:
 				"required": ["category", "key", "value"]
 			}
 		},
+		{
+			"name": "benchmark_navigation",
+			"description": "Time uncached A* pathfinding between random desk work positions and furniture interaction points on the current layout.",
+			"inputSchema": {
+				"type": "object",
+				"properties": {
+					"queries": {"type": "integer", "description": "Number of path queries (default 2000, max 100000)"},
+					"seed": {"type": "integer", "description": "Random seed for repeatable runs (default 1)"}
+				}
+			}
+		},
 		{
 			"name": "reconcile_desks",
 			"description": "Release desk slots occupied by agents that no longer exist. Fixes ghost agents from ungraceful session termination.",
@@ -807,6 +982,8 @@ func _call_tool(params) -> Dictionary:
 			return _tool_set_setting(args)
 		"reconcile_desks":
 			return _tool_reconcile_desks(args)
+		"benchmark_navigation":
+			return _tool_benchmark_navigation(args)
 		_:
 			return _tool_error("Unknown tool")
 
@@ -816,8 +993,8 @@ func _tool_post_event(args: Dictionary) -> Dictionary:
 		return _tool_error("event is required")
 	# Build event data from args
 	var event_data = args.duplicate()
-	# Record and emit
-	record_event(event_data)
+	# Emit; OfficeManager records it once when handling
+	pending_event_emits += 1
 	call_deferred("_emit_event", event_data)
 	return _tool_ok("Event posted: %s" % event_type)
 
@@ -848,10 +1025,7 @@ func _tool_dismiss_all_agents(args: Dictionary) -> Dictionary:
 
 func _tool_quit_office(_args: Dictionary) -> Dictionary:
 	# Request clean shutdown - give time for response to be sent
-	if office_manager and office_manager.has_method("_request_quit"):
-		call_deferred("_deferred_quit")
-	else:
-		call_deferred("_deferred_quit")
+	call_deferred("_deferred_quit")
 	return _tool_ok("Quit requested - office shutting down")
 
 func _deferred_quit() -> void:
@@ -859,80 +1033,233 @@ func _deferred_quit() -> void:
 	await get_tree().create_timer(0.1).timeout
 	if not is_instance_valid(self):
 		return
-	get_tree().quit()
+	# Same path as closing the window, so positions and the roster get saved
+	if office_manager and office_manager.has_method("_request_quit"):
+		office_manager._request_quit()
+	else:
+		get_tree().quit()
 
-func _tool_get_office_state(_args: Dictionary) -> Dictionary:
+func _tool_get_office_state(args: Dictionary) -> Dictionary:
 	if not office_manager:
 		return _tool_error("Office manager not available")
 
+	_flush_state_journal()
+
 	var weather_name = "unknown"
 	if office_manager.weather_system:
 		var ws = office_manager.weather_system
 		weather_name = ws.WeatherState.keys()[ws.current_weather]
 
+	if args.has("since_version"):
+		return _tool_json(_build_state_delta(int(args.get("since_version", 0)), str(args.get("epoch", "")), weather_name), "")
+
 	var state = {
+		"version": state_version,
+		"epoch": state_epoch,
 		"weather": weather_name,
 		"time": Time.get_datetime_string_from_system(),
 		"agents": [],
-		"furniture": {},
+		"furniture": {"defaults": [], "dynamic": []},
 		"desks": [],
 		"cat": {}
 	}
+	var entities = _collect_state_entities()
+	for key in entities:
+		var entry = entities[key]
+		if key.begins_with("agent:"):
+			state.agents.append(entry)
+		elif key.begins_with("desk:"):
+			state.desks.append(entry)
+		elif key.begins_with("furniture:"):
+			# The plain reply already separates them; "default" is only needed in deltas
+			var is_default = entry.get("default", false)
+			entry.erase("default")
+			if is_default:
+				state.furniture.defaults.append(entry)
+			else:
+				state.furniture.dynamic.append(entry)
+		elif key == "cat":
+			state.cat = entry
+
+	return _tool_json(state)
+
+func mark_state_changed(key: String) -> void:
+	## Journal an entity ("agent:<id>", "desk:<i>", "furniture:<id>") as added or changed.
+	state_dirty[key] = true
 
-	# Agents
+func mark_state_removed(key: String) -> void:
+	state_dirty[key] = false
+
+func _collect_state_entities() -> Dictionary:
+	## Flat key -> entry view of the whole office, for full snapshots.
+	var entities: Dictionary = {}
 	for agent_id in office_manager.active_agents.keys():
 		var agent = office_manager.active_agents[agent_id]
 		if agent:
-			state.agents.append({
-				"id": agent.agent_id,
-				"type": agent.agent_type,
-				"name": agent.profile_name,
-				"state": Agent.State.keys()[agent.state] if agent is Agent else str(agent.state),
-				"position": {"x": agent.position.x, "y": agent.position.y}
-			})
-
-	# Default furniture (with IDs for removal)
-	state.furniture.defaults = []
-	if office_manager.draggable_water_cooler:
-		state.furniture.defaults.append({"id": "default_water_cooler", "type": "water_cooler", "x": office_manager.water_cooler_position.x, "y": office_manager.water_cooler_position.y})
-	if office_manager.draggable_plant:
-		state.furniture.defaults.append({"id": "default_plant", "type": "plant", "x": office_manager.plant_position.x, "y": office_manager.plant_position.y})
-	if office_manager.draggable_filing_cabinet:
-		state.furniture.defaults.append({"id": "default_filing_cabinet", "type": "filing_cabinet", "x": office_manager.filing_cabinet_position.x, "y": office_manager.filing_cabinet_position.y})
-	if office_manager.draggable_shredder:
-		state.furniture.defaults.append({"id": "default_shredder", "type": "shredder", "x": office_manager.shredder_position.x, "y": office_manager.shredder_position.y})
-	if office_manager.draggable_cat_bed:
-		state.furniture.defaults.append({"id": "default_cat_bed", "type": "cat_bed", "x": office_manager.cat_bed_position.x, "y": office_manager.cat_bed_position.y})
-	if office_manager.meeting_table:
-		state.furniture.defaults.append({"id": "default_meeting_table", "type": "meeting_table", "x": office_manager.meeting_table_position.x, "y": office_manager.meeting_table_position.y})
-
-	# Dynamic furniture (user-placed)
-	state.furniture.dynamic = []
+			entities["agent:%s" % agent.agent_id] = _agent_state_entry(agent)
+	for item in _default_furniture():
+		if item[0]:
+			entities["furniture:default_%s" % item[1]] = _default_furniture_entry(item)
 	for f in office_manager.placed_furniture:
-		state.furniture.dynamic.append({"id": f.id, "type": f.type, "x": f.position.x, "y": f.position.y})
-
-	# Desks
+		entities["furniture:%s" % f.id] = _dynamic_furniture_entry(f)
 	for i in range(office_manager.desks.size()):
-		var desk = office_manager.desks[i]
-		state.desks.append({
-			"index": i,
-			"position": {"x": desk.position.x, "y": desk.position.y},
-			"occupied": desk.is_occupied
-		})
-
-	# Cat
-	if office_manager.office_cat:
-		var cat = office_manager.office_cat
-		var cat_state_name = "unknown"
-		if "state" in cat:
-			cat_state_name = cat.State.keys()[cat.state] if cat.state < cat.State.size() else "unknown"
-		state.cat = {
-			"position": {"x": cat.position.x, "y": cat.position.y},
-			"state": cat_state_name,
-			"pet_count": cat.pet_count if "pet_count" in cat else 0
-		}
+		entities["desk:%d" % i] = _desk_state_entry(i)
+	var cat_entry = _cat_state_entry()
+	if not cat_entry.is_empty():
+		entities["cat"] = cat_entry
+	return entities
+
+func _state_entry(key: String) -> Dictionary:
+	## Current entry for one journaled key; empty if the entity is gone.
+	if key.begins_with("agent:"):
+		var agent = office_manager.active_agents.get(key.substr(6))
+		return _agent_state_entry(agent) if agent else {}
+	if key.begins_with("desk:"):
+		var index = int(key.substr(5))
+		return _desk_state_entry(index) if index < office_manager.desks.size() else {}
+	if key.begins_with("furniture:default_"):
+		var type = key.substr(18)
+		for item in _default_furniture():
+			if item[1] == type:
+				return _default_furniture_entry(item) if item[0] else {}
+		return {}
+	if key.begins_with("furniture:"):
+		var fid = key.substr(10)
+		for f in office_manager.placed_furniture:
+			if f.id == fid:
+				return _dynamic_furniture_entry(f)
+	return {}
 
-	return _tool_json(state)
+func _agent_state_entry(agent) -> Dictionary:
+	return {
+		"id": agent.agent_id,
+		"type": agent.agent_type,
+		"name": agent.profile_name,
+		"state": Agent.State.keys()[agent.state] if agent is Agent else str(agent.state),
+		"position": {"x": agent.position.x, "y": agent.position.y}
+	}
+
+func _default_furniture() -> Array:
+	## [node, type, position] for each built-in piece (node is null once removed).
+	return [
+		[office_manager.draggable_water_cooler, "water_cooler", office_manager.water_cooler_position],
+		[office_manager.draggable_plant, "plant", office_manager.plant_position],
+		[office_manager.draggable_filing_cabinet, "filing_cabinet", office_manager.filing_cabinet_position],
+		[office_manager.draggable_shredder, "shredder", office_manager.shredder_position],
+		[office_manager.draggable_cat_bed, "cat_bed", office_manager.cat_bed_position],
+		[office_manager.meeting_table, "meeting_table", office_manager.meeting_table_position],
+	]
+
+func _default_furniture_entry(item: Array) -> Dictionary:
+	return {"id": "default_%s" % item[1], "type": item[1], "x": item[2].x, "y": item[2].y, "default": true}
+
+func _dynamic_furniture_entry(f: Dictionary) -> Dictionary:
+	return {"id": f.id, "type": f.type, "x": f.position.x, "y": f.position.y, "default": false}
+
+func _desk_state_entry(index: int) -> Dictionary:
+	var desk = office_manager.desks[index]
+	return {
+		"index": index,
+		"position": {"x": desk.position.x, "y": desk.position.y},
+		"occupied": desk.is_occupied
+	}
+
+func _cat_state_entry() -> Dictionary:
+	if not office_manager.office_cat:
+		return {}
+	var cat = office_manager.office_cat
+	var cat_state_name = "unknown"
+	if "state" in cat:
+		cat_state_name = cat.State.keys()[cat.state] if cat.state < cat.State.size() else "unknown"
+	return {
+		"position": {"x": cat.position.x, "y": cat.position.y},
+		"state": cat_state_name,
+		"pet_count": cat.pet_count if "pet_count" in cat else 0
+	}
+
+func _cat_fingerprint(entry: Dictionary) -> Array:
+	# Whole-pixel resolution so sub-pixel wandering doesn't count as a change
+	if entry.is_empty():
+		return []
+	return [roundi(entry.position.x), roundi(entry.position.y), entry.state, entry.pet_count]
+
+func _flush_state_journal() -> void:
+	## Turn the keys marked since the last poll into one journal record. The
+	## office marks entities where they change (OfficeManager._mark_state), so
+	## this costs the number of changes, not the size of the office. The cat is
+	## the one entity that moves on its own; it is compared directly.
+	var fp = _cat_fingerprint(_cat_state_entry())
+	if fp != cat_fingerprint:
+		cat_fingerprint = fp
+		state_dirty["cat"] = true
+	if state_dirty.is_empty():
+		return
+
+	var changed: Array = []
+	var removed: Array = []
+	for key in state_dirty:
+		if state_dirty[key]:
+			changed.append(key)
+		else:
+			removed.append(key)
+	state_dirty.clear()
+	state_version += 1
+	state_journal.append({"version": state_version, "changed": changed, "removed": removed})
+	if state_journal.size() > STATE_JOURNAL_LIMIT:
+		state_journal.pop_front()
+
+func _build_state_delta(since_version: int, epoch: String, weather_name: String) -> Dictionary:
+	var delta = {
+		"version": state_version,
+		"epoch": state_epoch,
+		"full": false,
+		"weather": weather_name,
+		"time": Time.get_datetime_string_from_system(),
+		"agents": {"changed": [], "removed": []},
+		"desks": {"changed": [], "removed": []},
+		"furniture": {"changed": [], "removed": []}
+	}
+
+	# The journal can only answer for versions it still covers, from this run
+	var oldest_covered = state_journal[0].version - 1 if not state_journal.is_empty() else state_version
+	var full = since_version <= 0 or since_version > state_version or since_version < oldest_covered
+	if not epoch.is_empty() and epoch != state_epoch:
+		full = true
+
+	var entries: Dictionary = {}  # key -> entry ({} = removed)
+	if full:
+		delta.full = true
+		entries = _collect_state_entities()
+	else:
+		var keys: Dictionary = {}
+		for record in state_journal:
+			if record.version <= since_version:
+				continue
+			for key in record.changed:
+				keys[key] = true
+			for key in record.removed:
+				keys[key] = true
+		for key in keys:
+			entries[key] = _cat_state_entry() if key == "cat" else _state_entry(key)
+
+	for key in entries:
+		var entry: Dictionary = entries[key]
+		if key == "cat":
+			if not entry.is_empty():
+				delta["cat"] = entry
+			continue
+		var group = "agents"
+		if key.begins_with("desk:"):
+			group = "desks"
+		elif key.begins_with("furniture:"):
+			group = "furniture"
+		if not entry.is_empty():
+			delta[group].changed.append(entry)
+		else:
+			var ident = key.substr(key.find(":") + 1)
+			delta[group].removed.append(int(ident) if group == "desks" else ident)
+
+	return delta
 
 func _tool_list_agents(_args: Dictionary) -> Dictionary:
 	if not office_manager:
@@ -1001,6 +1328,7 @@ func _tool_move_furniture(args: Dictionary) -> Dictionary:
 			if f["id"] == item:
 				f["node"].position = new_pos
 				f["position"] = new_pos
+				mark_state_changed("furniture:" + item)
 				office_manager._save_positions()
 				return _tool_ok("Moved %s to (%d, %d)" % [item, int(x), int(y)])
 		return _tool_error("Dynamic furniture not found: %s" % item)
@@ -1034,6 +1362,7 @@ func _tool_move_furniture(args: Dictionary) -> Dictionary:
 				office_manager.meeting_table_position = new_pos
 		_:
 			return _tool_error("Unknown furniture: %s. Valid: water_cooler, plant, filing_cabinet, shredder, cat_bed, meeting_table, or furniture_<id>" % item)
+	mark_state_changed("furniture:default_" + item)
 
 	# Update navigation grid
 	if office_manager.has_method("_register_with_navigation_grid"):
@@ -1135,7 +1464,7 @@ func _tool_spawn_agent(args: Dictionary) -> Dictionary:
 		"source": "mcp"
 	}
 
-	record_event(event_data)
+	pending_event_emits += 1
 	call_deferred("_emit_event", event_data)
 
 	return _tool_ok("Spawned agent: %s (%s)" % [agent_type, agent_id])
@@ -1302,7 +1631,7 @@ func _refresh_agent_visuals(profile_id: int) -> bool:
 		if agent == null or agent.profile_id != profile_id:
 			continue
 		if agent.visuals and agent.visuals.has_method("refresh_appearance"):
-			agent.visuals.refresh_appearance(office_manager.agent_roster.get_agent(profile_id))
+			agent.visuals.refresh_appearance(office_manager.agent_roster.get_agent_summary(profile_id))
 			refreshed = true
 	return refreshed
 
@@ -1518,6 +1847,18 @@ func _tool_reconcile_desks(_args: Dictionary) -> Dictionary:
 	else:
 		return _tool_ok("No ghost slots found — all desks consistent")
 
+func _tool_benchmark_navigation(args: Dictionary) -> Dictionary:
+	if not office_manager or not office_manager.navigation_grid:
+		return _tool_error("Navigation grid not available")
+	var queries = clampi(int(args.get("queries", 2000)), 1, 100000)
+	var targets = office_manager.get_navigation_targets()
+	if targets["desks"].is_empty() or targets["furniture"].is_empty():
+		return _tool_error("Need at least one desk and one furniture interaction point")
+	var result = office_manager.navigation_grid.run_benchmark(targets["desks"], targets["furniture"], queries, int(args.get("seed", 1)))
+	result["desk_targets"] = targets["desks"].size()
+	result["furniture_targets"] = targets["furniture"].size()
+	return _tool_json(result)
+
 # Legacy function - kept for backwards compatibility but no longer used
 func _tool_get_settings(_args: Dictionary) -> Dictionary:
 	if not office_manager:
@@ -1651,11 +1992,11 @@ func _tool_set_weather_config(args: Dictionary) -> Dictionary:
 
 	return _tool_ok("Weather config updated: " + ", ".join(changes))
 
-func _tool_json(data: Dictionary) -> Dictionary:
+func _tool_json(data: Dictionary, indent: String = "  ") -> Dictionary:
 	return {
 		"content": [{
 			"type": "text",
-			"text": JSON.stringify(data, "  ")
+			"text": JSON.stringify(data, indent)
 		}]
 	}
 
@@ -1688,6 +2029,58 @@ func _build_summary() -> Dictionary:
 		summary["watchers"] = office_manager.transcript_watcher.get_harness_summary()
 	return summary
 
+func _build_events_json(params: Dictionary) -> String:
+	var limit = int(params.get("limit", -1))
+	var events: PackedStringArray
+	if params.has("after_seq"):
+		events = event_history.since(int(params["after_seq"]), limit)
+	elif limit >= 0:
+		events = event_history.latest(limit)
+	else:
+		events = event_history.since(0)
+	return '{"seq":%d,"oldest_seq":%d,"capacity":%d,"events":[%s]}' % [
+		event_seq, event_history.oldest_seq(), event_history.capacity, ",".join(events)
+	]
+
+func _build_perf() -> Dictionary:
+	var perf = {
+		"timestamp": Time.get_datetime_string_from_system(),
+		"uptime_ms": Time.get_ticks_msec(),
+		"event_queue_depth": pending_event_emits,
+		"event_seq": event_seq,
+		"event_history": event_history.size(),
+		"event_history_capacity": event_history.capacity,
+		"event_stream_clients": event_stream_clients.size(),
+		"mcp_clients": tcp_clients.size(),
+		"http_pending": http_pending.size() - http_pending_head
+	}
+	if http_worker:
+		perf["http"] = http_worker.get_stats()
+	if office_manager == null:
+		return perf
+	if office_manager.perf_monitor:
+		perf.merge(office_manager.perf_monitor.get_snapshot())
+	if office_manager.event_dispatcher:
+		var dispatch = office_manager.event_dispatcher.get_stats()
+		perf["event_dispatch"] = dispatch
+		perf["event_queue_depth"] = pending_event_emits + dispatch["depth"]
+	perf["headless"] = office_manager.headless
+	perf["agents_active"] = office_manager.active_agents.size()
+	perf["agent_capacity"] = office_manager.get_agent_capacity()
+	perf["agents_rejected"] = office_manager.spawns_rejected
+	if office_manager.agent_roster:
+		perf["roster_persistence"] = office_manager.agent_roster.get_persistence_stats()
+	if office_manager.navigation_grid:
+		perf["path_cache"] = office_manager.navigation_grid.get_path_cache_stats()
+		perf["flow_fields"] = office_manager.navigation_grid.get_flow_field_stats()
+	if office_manager.transcript_watcher and office_manager.transcript_watcher.has_method("get_watched_count"):
+		perf["watched_sessions"] = office_manager.transcript_watcher.get_watched_count()
+	var tables = office_manager.get_table_sizes()
+	if office_manager.transcript_watcher and office_manager.transcript_watcher.has_method("get_table_sizes"):
+		tables.merge(office_manager.transcript_watcher.get_table_sizes())
+	perf["tables"] = tables
+	return perf
+
 func _build_agents() -> Dictionary:
 	var agents: Array = []
 	if office_manager:
@@ -1736,6 +2129,7 @@ func _load_mcp_config() -> void:
 	enabled = true
 	port = DEFAULT_PORT
 	bind_address = DEFAULT_BIND_ADDRESS
+	socket_path = ""
 	if not FileAccess.file_exists(WATCHER_CONFIG_FILE):
 		return
 	var file = FileAccess.open(WATCHER_CONFIG_FILE, FileAccess.READ)
@@ -1756,6 +2150,8 @@ func _load_mcp_config() -> void:
 		bind_address = str(mcp.get("bind_address", bind_address)).strip_edges()
 		if bind_address.is_empty():
 			bind_address = DEFAULT_BIND_ADDRESS
+		socket_path = str(mcp.get("socket_path", socket_path)).strip_edges()
+		event_history.resize(int(mcp.get("event_history", event_history.capacity)))
 
 func _save_mcp_config() -> void:
 	var data: Dictionary = {}
@@ -1771,7 +2167,8 @@ func _save_mcp_config() -> void:
 	data["mcp"] = {
 		"enabled": enabled,
 		"port": port,
-		"bind_address": bind_address
+		"bind_address": bind_address,
+		"socket_path": socket_path
 	}
 	if not data.has("harnesses"):
 		data["harnesses"] = {}
@@ -5,65 +5,74 @@ class_name NavigationGrid
 # =============================================================================
 
 class MinHeap:
-	var _positions: Array[Vector2i] = []
-	var _priorities: Array[float] = []
+	## Binary heap of cell indices keyed by priority. Storage grows once and is
+	## reused across searches (clear() only resets the size).
+	var _cells: PackedInt32Array = PackedInt32Array()
+	var _priorities: PackedFloat32Array = PackedFloat32Array()
+	var _size: int = 0
+
+	func clear() -> void:
+		_size = 0
 
 	func is_empty() -> bool:
-		return _positions.is_empty()
-
-	func push(pos: Vector2i, priority: float) -> void:
-		_positions.append(pos)
-		_priorities.append(priority)
-		_sift_up(_positions.size() - 1)
-
-	func pop() -> Dictionary:
-		if _positions.is_empty():
-			return {}
-		var pos = _positions[0]
-		var priority = _priorities[0]
-		var last_index = _positions.size() - 1
-		if last_index == 0:
-			_positions.clear()
-			_priorities.clear()
-			return {"pos": pos, "priority": priority}
-		_positions[0] = _positions[last_index]
-		_priorities[0] = _priorities[last_index]
-		_positions.remove_at(last_index)
-		_priorities.remove_at(last_index)
-		_sift_down(0)
-		return {"pos": pos, "priority": priority}
-
-	func _sift_up(index: int) -> void:
-		var i = index
+		return _size == 0
+
+	func push(cell: int, priority: float) -> void:
+		if _size == _cells.size():
+			var capacity = maxi(64, _size * 2)
+			_cells.resize(capacity)
+			_priorities.resize(capacity)
+		# Sift up by moving parents into the hole
+		var i = _size
+		_size += 1
 		while i > 0:
-			var parent = (i - 1) / 2
-			if _priorities[i] >= _priorities[parent]:
+			var parent = (i - 1) >> 1
+			if _priorities[parent] <= priority:
 				break
-			_swap(i, parent)
+			_cells[i] = _cells[parent]
+			_priorities[i] = _priorities[parent]
 			i = parent
-
-	func _sift_down(index: int) -> void:
-		var i = index
+		_cells[i] = cell
+		_priorities[i] = priority
+
+	func pop() -> int:
+		## Returns the lowest-priority cell, or -1 when empty
+		if _size == 0:
+			return -1
+		var top = _cells[0]
+		_size -= 1
+		if _size > 0:
+			_sift_down(_cells[_size], _priorities[_size])
+		return top
+
+	func _sift_down(cell: int, priority: float) -> void:
+		var i = 0
 		while true:
-			var left = i * 2 + 1
-			var right = i * 2 + 2
-			var smallest = i
-			if left < _positions.size() and _priorities[left] < _priorities[smallest]:
-				smallest = left
-			if right < _positions.size() and _priorities[right] < _priorities[smallest]:
-				smallest = right
-			if smallest == i:
+			var child = i * 2 + 1
+			if child >= _size:
 				break
-			_swap(i, smallest)
-			i = smallest
+			if child + 1 < _size and _priorities[child + 1] < _priorities[child]:
+				child += 1
+			if priority <= _priorities[child]:
+				break
+			_cells[i] = _cells[child]
+			_priorities[i] = _priorities[child]
+			i = child
+		_cells[i] = cell
+		_priorities[i] = priority
+
+class FlowField:
+	## Distance-to-target for every cell (INF = unreachable), built by Dijkstra
+	## from the target. Rebuilt lazily after a nearby cell changes.
+	var target: int = -1
+	var distance: PackedFloat32Array = PackedFloat32Array()
+	var dirty: bool = true
 
-	func _swap(a: int, b: int) -> void:
-		var temp_pos = _positions[a]
-		_positions[a] = _positions[b]
-		_positions[b] = temp_pos
-		var temp_priority = _priorities[a]
-		_priorities[a] = _priorities[b]
-		_priorities[b] = temp_priority
+	func _init(target_index: int) -> void:
+		target = target_index
+
+	func reaches(index: int) -> bool:
+		return not dirty and distance[index] < INF
 
 enum CellState { WALKABLE, BLOCKED, WORK_POSITION }
 
@@ -76,10 +85,51 @@ var obstacles: Dictionary = {}
 # Work position tracking - grid_pos string -> desk reference
 var work_positions: Dictionary = {}
 
-# Path cache (start_grid|end_grid -> Array[Vector2i])
+# Cells are also addressed by packed index: y * GRID_WIDTH + x
+const CELL_COUNT: int = OfficeConstants.GRID_WIDTH * OfficeConstants.GRID_HEIGHT
+
+# 8-directional movement (N, NE, E, SE, S, SW, W, NW)
+const NEIGHBOR_DX: Array[int] = [0, 1, 1, 1, 0, -1, -1, -1]
+const NEIGHBOR_DY: Array[int] = [-1, -1, 0, 1, 1, 1, 0, -1]
+const NEIGHBOR_COST: Array[float] = [1.0, 1.414, 1.0, 1.414, 1.0, 1.414, 1.0, 1.414]
+
+# Walkability by packed index (1 = WALKABLE or WORK_POSITION), mirrors cells
+var walkable: PackedByteArray = PackedByteArray()
+
+# A* search arena, allocated once. A cell's score/parent are only meaningful when
+# its visit generation matches the current search, so nothing is cleared per search.
+var _g_score: PackedFloat32Array = PackedFloat32Array()
+var _came_from: PackedInt32Array = PackedInt32Array()
+var _visit_gen: PackedInt32Array = PackedInt32Array()
+var _closed_gen: PackedInt32Array = PackedInt32Array()
+var _search_gen: int = 0
+var _open_heap: MinHeap = MinHeap.new()
+var astar_searches: int = 0
+var astar_expansions: int = 0
+
+# Path cache (start_index * CELL_COUNT + end_index -> Array[Vector2i]).
+# Dictionaries keep insertion order, so re-inserting on hit makes the first key
+# the least recently used one: O(1) touch and eviction.
 const PATH_CACHE_LIMIT: int = 200
 var path_cache: Dictionary = {}
-var path_cache_order: Array[String] = []
+var path_cache_hits: int = 0
+var path_cache_misses: int = 0
+var path_cache_invalidations: int = 0
+
+# Inverted index for incremental invalidation: when a cell becomes blocked only
+# the cached paths crossing it are evicted. Cached "no path" results are evicted
+# whenever any cell opens up, since a route may now exist.
+var path_cache_by_cell: Dictionary = {}  # cell index -> {cache key: true}
+var path_cache_unreachable: Dictionary = {}  # cache key -> true for cached empty paths
+
+# Flow fields for hot destinations (desk work positions and registered targets
+# such as furniture interaction points): target cell index -> FlowField.
+# find_path to a target follows the field's gradient instead of searching.
+var flow_target_positions: Array[Vector2] = []  # World positions from set_flow_targets()
+var flow_fields: Dictionary = {}
+var _flow_targets_dirty: bool = true  # Target cells need re-resolving (grid or targets changed)
+var flow_field_builds: int = 0
+var flow_field_queries: int = 0
 
 # =============================================================================
 # INITIALIZATION
@@ -95,16 +145,28 @@ func _initialize_grid() -> void:
 		for y in range(OfficeConstants.GRID_HEIGHT):
 			column.append(CellState.WALKABLE)
 		cells.append(column)
+	walkable.resize(CELL_COUNT)
+	walkable.fill(1)
+	_g_score.resize(CELL_COUNT)
+	_came_from.resize(CELL_COUNT)
+	_visit_gen.resize(CELL_COUNT)
+	_visit_gen.fill(0)
+	_closed_gen.resize(CELL_COUNT)
+	_closed_gen.fill(0)
+	_search_gen = 0
 
 func clear() -> void:
 	obstacles.clear()
 	work_positions.clear()
 	clear_path_cache()
+	flow_fields.clear()
+	_flow_targets_dirty = true
 	_initialize_grid()
 
 func clear_path_cache() -> void:
 	path_cache.clear()
-	path_cache_order.clear()
+	path_cache_by_cell.clear()
+	path_cache_unreachable.clear()
 
 # =============================================================================
 # COORDINATE CONVERSION
@@ -125,6 +187,12 @@ func grid_to_world_center(grid_pos: Vector2i) -> Vector2:
 	var wy = grid_pos.y * OfficeConstants.CELL_SIZE + OfficeConstants.GRID_ORIGIN.y + OfficeConstants.CELL_SIZE / 2.0
 	return Vector2(wx, wy)
 
+func cell_index(grid_pos: Vector2i) -> int:
+	return grid_pos.y * OfficeConstants.GRID_WIDTH + grid_pos.x
+
+func index_to_grid(index: int) -> Vector2i:
+	return Vector2i(index % OfficeConstants.GRID_WIDTH, index / OfficeConstants.GRID_WIDTH)
+
 func is_valid_grid_pos(grid_pos: Vector2i) -> bool:
 	return grid_pos.x >= 0 and grid_pos.x < OfficeConstants.GRID_WIDTH and \
 		   grid_pos.y >= 0 and grid_pos.y < OfficeConstants.GRID_HEIGHT
@@ -136,6 +204,16 @@ func is_valid_grid_pos(grid_pos: Vector2i) -> bool:
 func set_cell_state(grid_pos: Vector2i, state: CellState) -> void:
 	if is_valid_grid_pos(grid_pos):
 		cells[grid_pos.x][grid_pos.y] = state
+		var index = cell_index(grid_pos)
+		var now_walkable = 0 if state == CellState.BLOCKED else 1
+		if walkable[index] == now_walkable:
+			return
+		walkable[index] = now_walkable
+		if now_walkable == 0:
+			_invalidate_paths_through(index)
+		else:
+			_invalidate_unreachable_paths()
+		_invalidate_flow_fields_near(index)
 
 func get_cell_state(grid_pos: Vector2i) -> CellState:
 	if is_valid_grid_pos(grid_pos):
@@ -143,8 +221,9 @@ func get_cell_state(grid_pos: Vector2i) -> CellState:
 	return CellState.BLOCKED  # Out of bounds = blocked
 
 func is_walkable(grid_pos: Vector2i) -> bool:
-	var state = get_cell_state(grid_pos)
-	return state == CellState.WALKABLE or state == CellState.WORK_POSITION
+	if not is_valid_grid_pos(grid_pos):
+		return false
+	return walkable[cell_index(grid_pos)] == 1
 
 # =============================================================================
 # OBSTACLE REGISTRATION
@@ -154,9 +233,9 @@ func register_obstacle(world_rect: Rect2, obstacle_id: String) -> void:
 	# Convert world rect to grid cells and mark as blocked
 	var grid_cells: Array[Vector2i] = _rect_to_grid_cells(world_rect)
 	obstacles[obstacle_id] = grid_cells
+	# set_cell_state evicts only the cached paths that cross newly blocked cells
 	for cell in grid_cells:
 		set_cell_state(cell, CellState.BLOCKED)
-	clear_path_cache()
 
 func unregister_obstacle(obstacle_id: String) -> void:
 	if obstacles.has(obstacle_id):
@@ -164,7 +243,6 @@ func unregister_obstacle(obstacle_id: String) -> void:
 		for cell in grid_cells:
 			set_cell_state(cell, CellState.WALKABLE)
 		obstacles.erase(obstacle_id)
-		clear_path_cache()
 
 func update_obstacle(obstacle_id: String, new_world_rect: Rect2) -> void:
 	unregister_obstacle(obstacle_id)
@@ -236,7 +314,7 @@ func find_nearest_valid_position(world_rect: Rect2, exclude_obstacle_id: String
 	var start_grid = world_to_grid(center)
 	var queue: Array[Vector2i] = [start_grid]
 	var visited: Dictionary = {}
-	visited[_grid_pos_to_key(start_grid)] = true
+	visited[cell_index(start_grid)] = true
 
 	var half_size = world_rect.size / 2
 
@@ -254,9 +332,8 @@ func find_nearest_valid_position(world_rect: Rect2, exclude_obstacle_id: String
 				if dx == 0 and dy == 0:
 					continue
 				var neighbor = Vector2i(current.x + dx, current.y + dy)
-				var key = _grid_pos_to_key(neighbor)
-				if is_valid_grid_pos(neighbor) and not visited.has(key):
-					visited[key] = true
+				if is_valid_grid_pos(neighbor) and not visited.has(cell_index(neighbor)):
+					visited[cell_index(neighbor)] = true
 					queue.append(neighbor)
 
 	# Fallback to original position
@@ -283,6 +360,7 @@ func register_work_position(world_pos: Vector2, desk: Node2D) -> void:
 	var key = _grid_pos_to_key(grid_pos)
 	work_positions[key] = desk
 	set_cell_state(grid_pos, CellState.WORK_POSITION)
+	_flow_targets_dirty = true
 
 func unregister_work_position(desk: Node2D) -> void:
 	var to_remove: Array[String] = []
@@ -293,6 +371,8 @@ func unregister_work_position(desk: Node2D) -> void:
 		var grid_pos = _key_to_grid_pos(key)
 		set_cell_state(grid_pos, CellState.WALKABLE)
 		work_positions.erase(key)
+	if not to_remove.is_empty():
+		_flow_targets_dirty = true
 
 func get_desk_for_work_position(world_pos: Vector2) -> Node2D:
 	var grid_pos = world_to_grid(world_pos)
@@ -309,149 +389,218 @@ func _key_to_grid_pos(key: String) -> Vector2i:
 		return Vector2i.ZERO
 	return Vector2i(int(parts[0]), int(parts[1]))
 
-func _path_cache_key(start: Vector2i, end: Vector2i) -> String:
-	return "%d,%d|%d,%d" % [start.x, start.y, end.x, end.y]
-
-func _touch_path_cache(key: String) -> void:
-	if path_cache_order.has(key):
-		path_cache_order.erase(key)
-	path_cache_order.append(key)
-	if path_cache_order.size() > PATH_CACHE_LIMIT:
-		var oldest = path_cache_order.pop_front()
-		path_cache.erase(oldest)
+func get_path_cache_stats() -> Dictionary:
+	var lookups = path_cache_hits + path_cache_misses
+	return {
+		"size": path_cache.size(),
+		"limit": PATH_CACHE_LIMIT,
+		"hits": path_cache_hits,
+		"misses": path_cache_misses,
+		"invalidated": path_cache_invalidations,
+		"hit_rate": float(path_cache_hits) / lookups if lookups > 0 else 0.0
+	}
+
+func _path_cache_key(start: Vector2i, end: Vector2i) -> int:
+	return cell_index(start) * CELL_COUNT + cell_index(end)
+
+func _touch_path_cache(key: int) -> void:
+	# Re-insert to mark most recently used
+	var grid_path = path_cache[key]
+	path_cache.erase(key)
+	path_cache[key] = grid_path
+
+func _store_path_cache(key: int, grid_path: Array) -> void:
+	if path_cache.has(key):
+		_evict_path_cache(key)
+	path_cache[key] = grid_path
+	if grid_path.is_empty():
+		path_cache_unreachable[key] = true
+	for cell in grid_path:
+		var index = cell_index(cell)
+		if not path_cache_by_cell.has(index):
+			path_cache_by_cell[index] = {}
+		path_cache_by_cell[index][key] = true
+	if path_cache.size() > PATH_CACHE_LIMIT:
+		var oldest = -1
+		for cached_key in path_cache:
+			oldest = cached_key
+			break
+		_evict_path_cache(oldest)
+
+func _evict_path_cache(key: int) -> void:
+	var grid_path = path_cache.get(key)
+	if grid_path == null:
+		return
+	path_cache.erase(key)
+	path_cache_unreachable.erase(key)
+	for cell in grid_path:
+		var index = cell_index(cell)
+		var keys = path_cache_by_cell.get(index)
+		if keys == null:
+			continue
+		keys.erase(key)
+		if keys.is_empty():
+			path_cache_by_cell.erase(index)
+
+func _invalidate_paths_through(index: int) -> void:
+	# Paths crossing the cell are broken, and so are diagonal steps that cut its
+	# corner - those paths visit one of its orthogonal neighbours.
+	var blocked = index_to_grid(index)
+	var candidates: Dictionary = {}
+	for neighbor in [blocked, blocked + Vector2i.UP, blocked + Vector2i.DOWN, blocked + Vector2i.LEFT, blocked + Vector2i.RIGHT]:
+		if not is_valid_grid_pos(neighbor):
+			continue
+		var keys = path_cache_by_cell.get(cell_index(neighbor))
+		if keys != null:
+			candidates.merge(keys)
+	for key in candidates:
+		if path_cache.has(key) and _path_uses_cell(path_cache[key], blocked):
+			_evict_path_cache(key)
+			path_cache_invalidations += 1
+
+func _path_uses_cell(grid_path: Array, cell: Vector2i) -> bool:
+	for i in range(grid_path.size()):
+		var b: Vector2i = grid_path[i]
+		if b == cell:
+			return true
+		if i == 0:
+			continue
+		var a: Vector2i = grid_path[i - 1]
+		if a.x != b.x and a.y != b.y:
+			if Vector2i(b.x, a.y) == cell or Vector2i(a.x, b.y) == cell:
+				return true
+	return false
+
+func _invalidate_unreachable_paths() -> void:
+	if path_cache_unreachable.is_empty():
+		return
+	for key in path_cache_unreachable.keys():
+		_evict_path_cache(key)
+		path_cache_invalidations += 1
 
 # =============================================================================
 # A* PATHFINDING
 # =============================================================================
 
 func find_path(start_world: Vector2, end_world: Vector2) -> Array[Vector2]:
-	var start_grid = world_to_grid(start_world)
-	var end_grid = world_to_grid(end_world)
-
-	# Clamp to valid grid bounds
-	start_grid.x = clampi(start_grid.x, 0, OfficeConstants.GRID_WIDTH - 1)
-	start_grid.y = clampi(start_grid.y, 0, OfficeConstants.GRID_HEIGHT - 1)
-	end_grid.x = clampi(end_grid.x, 0, OfficeConstants.GRID_WIDTH - 1)
-	end_grid.y = clampi(end_grid.y, 0, OfficeConstants.GRID_HEIGHT - 1)
-
-	# If start or end is blocked, find nearest walkable cell
-	if not is_walkable(start_grid):
-		start_grid = _find_nearest_walkable(start_grid)
-	if not is_walkable(end_grid):
-		end_grid = _find_nearest_walkable(end_grid)
+	var start_grid = _to_walkable_grid(start_world)
+	var end_grid = _to_walkable_grid(end_world)
 
 	if start_grid == end_grid:
 		return [end_world]
 
+	# Hot destinations: walk down the precomputed distance field, no search
+	var field = _get_flow_field(cell_index(end_grid))
+	if field:
+		flow_field_queries += 1
+		var field_path = _follow_flow_field(field, start_grid)
+		if field_path.is_empty():
+			print("[NavigationGrid] No path from %s to %s" % [start_world, end_world])
+			return []
+		return _smooth_path(field_path, end_world)
+
 	var cache_key = _path_cache_key(start_grid, end_grid)
 	if path_cache.has(cache_key):
+		path_cache_hits += 1
 		_touch_path_cache(cache_key)
 		var cached_path: Array = path_cache[cache_key]
 		if cached_path.is_empty():
 			return []
 		return _smooth_path(cached_path, end_world)
 
+	path_cache_misses += 1
 	var grid_path = _astar_search(start_grid, end_grid)
 	if grid_path.is_empty():
 		# No path found - return empty (let agent handle gracefully)
 		print("[NavigationGrid] No path from %s to %s" % [start_world, end_world])
-		path_cache[cache_key] = []
-		_touch_path_cache(cache_key)
+		_store_path_cache(cache_key, [])
 		return []
 
-	path_cache[cache_key] = grid_path
-	_touch_path_cache(cache_key)
+	_store_path_cache(cache_key, grid_path)
 
 	var world_path = _smooth_path(grid_path, end_world)
 	return world_path
 
-func _astar_search(start: Vector2i, goal: Vector2i) -> Array[Vector2i]:
-	var open_set = MinHeap.new()
-	var came_from: Dictionary = {}
-
-	var g_score: Dictionary = {}
-	g_score[_grid_pos_to_key(start)] = 0.0
-
-	var f_score: Dictionary = {}
-	var start_f = _heuristic(start, goal)
-	f_score[_grid_pos_to_key(start)] = start_f
-	open_set.push(start, start_f)
-
-	var iterations = 0
-	var max_iterations = OfficeConstants.GRID_WIDTH * OfficeConstants.GRID_HEIGHT * 2
-
-	while not open_set.is_empty() and iterations < max_iterations:
-		iterations += 1
-
-		var current_item = open_set.pop()
-		if current_item.is_empty():
-			break
-		var current = current_item["pos"]
-		var current_key = _grid_pos_to_key(current)
-		var current_f = current_item["priority"]
-		if current_f > f_score.get(current_key, INF):
-			continue
-
-		if current == goal:
-			return _reconstruct_path(came_from, current)
+func _to_walkable_grid(world_pos: Vector2) -> Vector2i:
+	var grid_pos = world_to_grid(world_pos)
+	# Clamp to valid grid bounds
+	grid_pos.x = clampi(grid_pos.x, 0, OfficeConstants.GRID_WIDTH - 1)
+	grid_pos.y = clampi(grid_pos.y, 0, OfficeConstants.GRID_HEIGHT - 1)
+	# If blocked, find nearest walkable cell
+	if not is_walkable(grid_pos):
+		grid_pos = _find_nearest_walkable(grid_pos)
+	return grid_pos
 
-		for neighbor in _get_neighbors(current):
-			var neighbor_key = _grid_pos_to_key(neighbor)
-			var move_cost = 1.0 if (neighbor.x == current.x or neighbor.y == current.y) else 1.414
-			var tentative_g = g_score.get(current_key, INF) + move_cost
+func _astar_search(start: Vector2i, goal: Vector2i) -> Array[Vector2i]:
+	var width = OfficeConstants.GRID_WIDTH
+	var height = OfficeConstants.GRID_HEIGHT
+	var start_index = cell_index(start)
+	var goal_index = cell_index(goal)
+
+	_search_gen += 1
+	if _search_gen >= 0x7fffffff:
+		# Generation wrapped: stale marks could alias, so reset them once
+		_visit_gen.fill(0)
+		_closed_gen.fill(0)
+		_search_gen = 1
+	var gen = _search_gen
+	astar_searches += 1
+
+	_open_heap.clear()
+	_visit_gen[start_index] = gen
+	_g_score[start_index] = 0.0
+	_came_from[start_index] = -1
+	_open_heap.push(start_index, _heuristic(start, goal))
+
+	while not _open_heap.is_empty():
+		var current = _open_heap.pop()
+		if _closed_gen[current] == gen:
+			continue  # Stale heap entry
+		_closed_gen[current] = gen
+		astar_expansions += 1
+
+		if current == goal_index:
+			return _reconstruct_path(current)
+
+		var cx = current % width
+		var cy = current / width
+		var current_g = _g_score[current]
+		for d in range(8):
+			var nx = cx + NEIGHBOR_DX[d]
+			var ny = cy + NEIGHBOR_DY[d]
+			if nx < 0 or nx >= width or ny < 0 or ny >= height:
+				continue
+			var neighbor = ny * width + nx
+			if walkable[neighbor] == 0 or _closed_gen[neighbor] == gen:
+				continue
+			# For diagonal movement, check that we're not cutting corners
+			if nx != cx and ny != cy:
+				if walkable[cy * width + nx] == 0 or walkable[ny * width + cx] == 0:
+					continue
 
-			if tentative_g < g_score.get(neighbor_key, INF):
-				came_from[neighbor_key] = current
-				g_score[neighbor_key] = tentative_g
-				var neighbor_f = tentative_g + _heuristic(neighbor, goal)
-				f_score[neighbor_key] = neighbor_f
-				open_set.push(neighbor, neighbor_f)
+			var tentative_g = current_g + NEIGHBOR_COST[d]
+			if _visit_gen[neighbor] != gen or tentative_g < _g_score[neighbor]:
+				_visit_gen[neighbor] = gen
+				_g_score[neighbor] = tentative_g
+				_came_from[neighbor] = current
+				_open_heap.push(neighbor, tentative_g + _heuristic(Vector2i(nx, ny), goal))
 
 	# No path found
 	return []
 
-func _get_neighbors(pos: Vector2i) -> Array[Vector2i]:
-	var neighbors: Array[Vector2i] = []
-	# 8-directional movement
-	var directions = [
-		Vector2i(0, -1),   # N
-		Vector2i(1, -1),   # NE
-		Vector2i(1, 0),    # E
-		Vector2i(1, 1),    # SE
-		Vector2i(0, 1),    # S
-		Vector2i(-1, 1),   # SW
-		Vector2i(-1, 0),   # W
-		Vector2i(-1, -1),  # NW
-	]
-
-	for dir in directions:
-		var neighbor = pos + dir
-		if is_walkable(neighbor):
-			# For diagonal movement, check that we're not cutting corners
-			if dir.x != 0 and dir.y != 0:
-				var horiz = Vector2i(pos.x + dir.x, pos.y)
-				var vert = Vector2i(pos.x, pos.y + dir.y)
-				if not is_walkable(horiz) or not is_walkable(vert):
-					continue  # Can't cut corners
-			neighbors.append(neighbor)
-
-	return neighbors
-
 func _heuristic(a: Vector2i, b: Vector2i) -> float:
 	# Diagonal distance (Chebyshev with adjustment for diagonal cost)
 	var dx = abs(a.x - b.x)
 	var dy = abs(a.y - b.y)
 	return dx + dy + (1.414 - 2) * min(dx, dy)
 
-func _reconstruct_path(came_from: Dictionary, current: Vector2i) -> Array[Vector2i]:
-	var path: Array[Vector2i] = [current]
-	var current_key = _grid_pos_to_key(current)
-
-	while came_from.has(current_key):
-		current = came_from[current_key]
-		current_key = _grid_pos_to_key(current)
-		path.insert(0, current)
-
+func _reconstruct_path(goal_index: int) -> Array[Vector2i]:
+	var path: Array[Vector2i] = []
+	var current = goal_index
+	while current != -1:
+		path.append(index_to_grid(current))
+		current = _came_from[current]
+	path.reverse()
 	return path
 
 func _smooth_path(grid_path: Array[Vector2i], final_destination: Vector2) -> Array[Vector2]:
@@ -517,7 +666,7 @@ func _find_nearest_walkable(pos: Vector2i) -> Vector2i:
 	# BFS to find nearest walkable cell
 	var queue: Array[Vector2i] = [pos]
 	var visited: Dictionary = {}
-	visited[_grid_pos_to_key(pos)] = true
+	visited[cell_index(pos)] = true
 
 	while not queue.is_empty():
 		var current = queue.pop_front()
@@ -529,13 +678,156 @@ func _find_nearest_walkable(pos: Vector2i) -> Vector2i:
 				if dx == 0 and dy == 0:
 					continue
 				var neighbor = Vector2i(current.x + dx, current.y + dy)
-				var key = _grid_pos_to_key(neighbor)
-				if is_valid_grid_pos(neighbor) and not visited.has(key):
-					visited[key] = true
+				if is_valid_grid_pos(neighbor) and not visited.has(cell_index(neighbor)):
+					visited[cell_index(neighbor)] = true
 					queue.append(neighbor)
 
 	return pos  # Fallback to original if nothing found
 
+# =============================================================================
+# FLOW FIELDS
+# =============================================================================
+
+func set_flow_targets(world_positions: Array) -> void:
+	## Destinations (besides desk work positions) that get a precomputed flow field.
+	## Unchanged targets keep their fields.
+	var positions: Array[Vector2] = []
+	for pos in world_positions:
+		positions.append(pos)
+	if positions == flow_target_positions:
+		return
+	flow_target_positions = positions
+	_flow_targets_dirty = true
+
+func get_flow_field_stats() -> Dictionary:
+	var built = 0
+	for target in flow_fields:
+		if not flow_fields[target].dirty:
+			built += 1
+	return {
+		"targets": flow_fields.size(),
+		"built": built,
+		"builds": flow_field_builds,
+		"queries": flow_field_queries
+	}
+
+func _sync_flow_targets() -> void:
+	# Re-resolve target cells (blocked targets snap to the nearest walkable cell,
+	# like find_path does); fields for cells that are still targets are kept.
+	_flow_targets_dirty = false
+	var wanted: Dictionary = {}
+	for pos in flow_target_positions:
+		wanted[cell_index(_to_walkable_grid(pos))] = true
+	for key in work_positions:
+		var work_cell = _key_to_grid_pos(key)
+		if is_walkable(work_cell):
+			wanted[cell_index(work_cell)] = true
+	for target in flow_fields.keys():
+		if not wanted.has(target):
+			flow_fields.erase(target)
+	for target in wanted:
+		if not flow_fields.has(target):
+			flow_fields[target] = FlowField.new(target)
+
+func _get_flow_field(target: int) -> FlowField:
+	if _flow_targets_dirty:
+		_sync_flow_targets()
+	var field: FlowField = flow_fields.get(target)
+	if field and field.dirty:
+		_build_flow_field(field)
+	return field
+
+func _build_flow_field(field: FlowField) -> void:
+	# Dijkstra outward from the target. Moves are symmetric (same corner rule and
+	# costs both ways), so distance from the target equals distance to it.
+	var width = OfficeConstants.GRID_WIDTH
+	var height = OfficeConstants.GRID_HEIGHT
+	field.distance.resize(CELL_COUNT)
+	field.distance.fill(INF)
+	field.distance[field.target] = 0.0
+	_open_heap.clear()
+	_open_heap.push(field.target, 0.0)
+	while not _open_heap.is_empty():
+		var current = _open_heap.pop()
+		var cx = current % width
+		var cy = current / width
+		var current_distance = field.distance[current]
+		for d in range(8):
+			var nx = cx + NEIGHBOR_DX[d]
+			var ny = cy + NEIGHBOR_DY[d]
+			if nx < 0 or nx >= width or ny < 0 or ny >= height:
+				continue
+			var neighbor = ny * width + nx
+			if walkable[neighbor] == 0:
+				continue
+			if nx != cx and ny != cy:
+				if walkable[cy * width + nx] == 0 or walkable[ny * width + cx] == 0:
+					continue
+			var new_distance = current_distance + NEIGHBOR_COST[d]
+			if new_distance < field.distance[neighbor]:
+				field.distance[neighbor] = new_distance
+				_open_heap.push(neighbor, new_distance)
+	field.dirty = false
+	flow_field_builds += 1
+
+func _follow_flow_field(field: FlowField, start: Vector2i) -> Array[Vector2i]:
+	## Steepest descent from start to the field's target; empty if unreachable
+	var path: Array[Vector2i] = []
+	var width = OfficeConstants.GRID_WIDTH
+	var height = OfficeConstants.GRID_HEIGHT
+	var current = cell_index(start)
+	if field.distance[current] == INF:
+		return path
+	path.append(start)
+	var steps = 0
+	while current != field.target and steps < CELL_COUNT:
+		steps += 1
+		var cx = current % width
+		var cy = current / width
+		var best = -1
+		var best_total = INF
+		for d in range(8):
+			var nx = cx + NEIGHBOR_DX[d]
+			var ny = cy + NEIGHBOR_DY[d]
+			if nx < 0 or nx >= width or ny < 0 or ny >= height:
+				continue
+			var neighbor = ny * width + nx
+			if walkable[neighbor] == 0:
+				continue
+			if nx != cx and ny != cy:
+				if walkable[cy * width + nx] == 0 or walkable[ny * width + cx] == 0:
+					continue
+			var total = NEIGHBOR_COST[d] + field.distance[neighbor]
+			if total < best_total:
+				best_total = total
+				best = neighbor
+		if best == -1:
+			return []
+		current = best
+		path.append(index_to_grid(current))
+	return path
+
+func _invalidate_flow_fields_near(index: int) -> void:
+	# A changed cell only matters to fields that reach it or one of its neighbours
+	if flow_fields.is_empty():
+		return
+	var changed = index_to_grid(index)
+	for target in flow_fields:
+		var field: FlowField = flow_fields[target]
+		if field.dirty:
+			continue
+		for dx in range(-1, 2):
+			for dy in range(-1, 2):
+				var neighbor = changed + Vector2i(dx, dy)
+				if is_valid_grid_pos(neighbor) and field.reaches(cell_index(neighbor)):
+					field.dirty = true
+					break
+			if field.dirty:
+				break
+	# A blocked or reopened target cell changes where that target resolves to
+	if flow_fields.has(index) or walkable[index] == 1:
+		_flow_targets_dirty = true
+
 # =============================================================================
 # DEBUG UTILITIES
 # =============================================================================
@@ -552,3 +844,66 @@ func print_grid_summary() -> void:
 	var blocked = get_blocked_cell_count()
 	var total = OfficeConstants.GRID_WIDTH * OfficeConstants.GRID_HEIGHT
 	print("[NavigationGrid] %d/%d cells blocked, %d obstacles registered" % [blocked, total, obstacles.size()])
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+func run_benchmark(origins: Array, destinations: Array, queries: int, seed_value: int = 0) -> Dictionary:
+	## Times uncached A* between random origin/destination pairs on the current layout,
+	## and the same queries through flow fields where the destination has one.
+	## The path cache is left untouched.
+	if origins.is_empty() or destinations.is_empty() or queries <= 0:
+		return {"queries": 0}
+	var rng = RandomNumberGenerator.new()
+	rng.seed = seed_value
+	var timings = PackedInt64Array()
+	timings.resize(queries)
+	var flow_timings = PackedInt64Array()
+	var found = 0
+	var expansions_before = astar_expansions
+	var builds_before = flow_field_builds
+	var total_start = Time.get_ticks_usec()
+	for i in range(queries):
+		var start_grid = _to_walkable_grid(origins[rng.randi() % origins.size()])
+		var end_grid = _to_walkable_grid(destinations[rng.randi() % destinations.size()])
+		var search_start = Time.get_ticks_usec()
+		var grid_path: Array[Vector2i] = [end_grid]
+		if start_grid != end_grid:
+			grid_path = _astar_search(start_grid, end_grid)
+		timings[i] = Time.get_ticks_usec() - search_start
+		if not grid_path.is_empty():
+			found += 1
+		# Same query through the destination's flow field, when it has one (builds included)
+		var field_start = Time.get_ticks_usec()
+		var field = _get_flow_field(cell_index(end_grid))
+		if field:
+			_follow_flow_field(field, start_grid)
+			flow_timings.append(Time.get_ticks_usec() - field_start)
+	var total_usec = Time.get_ticks_usec() - total_start
+	timings.sort()
+	flow_timings.sort()
+	var search_usec = 0
+	for t in timings:
+		search_usec += t
+	var flow_usec = 0
+	for t in flow_timings:
+		flow_usec += t
+	var flow_count = flow_timings.size()
+	return {
+		"queries": queries,
+		"found": found,
+		"no_path": queries - found,
+		"total_ms": total_usec / 1000.0,
+		"mean_us": float(search_usec) / queries,
+		"p50_us": timings[queries / 2],
+		"p99_us": timings[mini(queries - 1, int(queries * 0.99))],
+		"max_us": timings[queries - 1],
+		"mean_expansions": float(astar_expansions - expansions_before) / queries,
+		"flow_queries": flow_count,
+		"flow_mean_us": float(flow_usec) / flow_count if flow_count > 0 else 0.0,
+		"flow_p99_us": flow_timings[mini(flow_count - 1, int(flow_count * 0.99))] if flow_count > 0 else 0,
+		"flow_field_builds": flow_field_builds - builds_before,
+		"blocked_cells": get_blocked_cell_count(),
+		"cells": CELL_COUNT
+	}
@@ -52,6 +52,11 @@ var draggable_cat_bed: Node2D = null
 # Position persistence
 const POSITIONS_FILE: String = "user://furniture_positions.json"
 
+# Headless runs (godot --headless, used for CI load tests): Godot swaps in its
+# dummy renderer and audio driver, everything else simulates as usual
+const HEADLESS_MAX_FPS: int = 60
+var headless: bool = false
+
 # Gamification (achievements only - agent tracking handled by AgentRoster)
 var gamification_manager: GamificationManager = null
 
@@ -73,6 +78,7 @@ var taskboard: Node2D
 var taskboard_labels: Dictionary = {}  # key -> Label
 var profiler_label: Label
 var profiler_enabled: bool = false
+var tool_latency: Dictionary = {}  # tool -> {count, p50, p90, p99} (ms), from watcher.py --stats-push
 var profiler_update_timer: float = 0.0
 var debug_overlay_enabled: bool = false
 
@@ -164,6 +170,9 @@ const CAT_INTERACTION_PROXIMITY: float = 40.0  # How close to cat to trigger rea
 const PROFILER_UPDATE_INTERVAL: float = 0.5  # Update profiler every 0.5s
 const AUTO_SAVE_INTERVAL: float = 60.0  # Periodic safety save
 
+# Uniform-grid index of agent positions (keyed by agent_id) for chat and cat proximity checks
+var agent_spatial_index: SpatialHash = SpatialHash.new(AGENT_CHAT_PROXIMITY)
+
 # Roster reconciliation (catch orphaned working_agents entries)
 var roster_reconcile_timer: float = 0.0
 const ROSTER_RECONCILE_INTERVAL: float = 5.0  # Check every 5 seconds
@@ -174,13 +183,28 @@ var office_obstacles: Array[Rect2] = []
 # Grid-based navigation system
 var navigation_grid: NavigationGrid = null
 
+# Frame-time sampling for the office://perf MCP resource
+var perf_monitor: PerfMonitor = null
+var spawns_rejected: int = 0  # agent_spawn events dropped because every desk and meeting spot was taken
+
 # Drag arbitration - resolves overlapping click candidates
 var _drag_candidates: Array = []  # [{node: Node2D, event: InputEvent}]
 var _drag_arbitration_pending: bool = false
 
+# Startup timing (office://startup). _ready() phases are timed in place; the
+# first frame and the work deferred past it are stamped from _process().
+var startup_phases: Array = []  # [{name, ms}] in order
+var startup_engine_msec: int = 0  # Engine start -> OfficeManager._ready (boot, autoloads, children)
+var startup_ready_msec: int = 0  # Engine start -> end of _ready
+var startup_first_frame_msec: int = 0  # Engine start -> first _process
+var startup_deferred_msec: int = 0  # Engine start -> deferred startup work done
+var _startup_mark_usec: int = 0
+var _startup_frames: int = 0
+
 # Event sources
 @onready var mcp_server: McpServer = $McpServer
 var transcript_watcher: Node = null
+var event_dispatcher: EventDispatcher = null
 
 # Table mapping item names to position setter method names
 const POSITION_SETTERS = {
@@ -204,24 +228,38 @@ const DEFAULT_POSITIONS = {
 }
 
 func _ready() -> void:
+	startup_engine_msec = Time.get_ticks_msec()
+	_startup_mark_usec = Time.get_ticks_usec()
+
+	# Without a window there is no vsync, so cap the loop to keep frame times comparable
+	headless = DisplayServer.get_name() == "headless"
+	if headless and Engine.max_fps == 0:
+		Engine.max_fps = HEADLESS_MAX_FPS
+
 	# Reset static agent state (prevents stale color mappings on scene reload)
 	Agent.reset_color_assignments()
 
 	# Initialize navigation grid
 	navigation_grid = NavigationGrid.new()
 
+	# Initialize frame-time sampling (read via office://perf)
+	perf_monitor = PerfMonitor.new()
+	add_child(perf_monitor)
+
 	# Initialize furniture registry
 	furniture_registry = FurnitureRegistry.new()
 	furniture_registry.navigation_grid = navigation_grid
 
-	# Initialize appearance registry
+	# Initialize appearance registry (categories load on first use)
 	appearance_registry = AppearanceRegistry.new()
+	_mark_startup("registries")
 
 	# Initialize agent roster (replaces AgentStable)
 	agent_roster = AgentRoster.new()
 	add_child(agent_roster)
 	agent_roster.agent_level_up.connect(_on_agent_level_up)
 	agent_roster.roster_changed.connect(_on_roster_changed)
+	_mark_startup("roster")
 
 	# Initialize gamification system (achievements only)
 	gamification_manager = GamificationManagerScript.new()
@@ -237,31 +275,40 @@ func _ready() -> void:
 	badge_system = BadgeSystem.new()
 	add_child(badge_system)
 	badge_system.setup(agent_roster)
+	_mark_startup("gamification_audio")
 
 	# Load saved positions before creating furniture
 	_load_positions()
 
 	_setup_office()
+	_mark_startup("office_setup")
 	_create_desks()
 	_create_furniture()
 	_create_office_cat()
 	_create_mcp_manager()
 	_init_interaction_points()
+	_mark_startup("furniture")
 
 	# Register desks and furniture with navigation grid
 	_register_with_navigation_grid()
 
 	# Verify and normalize furniture IDs for consistent collision detection
 	_verify_furniture_ids()
+	_mark_startup("navigation")
+
+	# Events are queued and handled under a per-frame budget
+	event_dispatcher = EventDispatcher.new()
+	event_dispatcher.handler = _handle_queued_event
+	add_child(event_dispatcher)
 
 	# Connect event sources
 	transcript_watcher = TranscriptWatcherScript.new()
 	add_child(transcript_watcher)
-	transcript_watcher.event_received.connect(_on_event_received)
+	transcript_watcher.event_received.connect(_queue_event)
 	transcript_watcher.context_updated.connect(_on_context_updated)
 	if mcp_server:
 		mcp_server.set_office_manager(self)
-		mcp_server.event_received.connect(_on_event_received)
+		mcp_server.event_received.connect(_queue_event)
 		mcp_server.client_connected.connect(_on_mcp_client_connected)
 		mcp_server.client_disconnected.connect(_on_mcp_client_disconnected)
 		mcp_server.tool_called.connect(_on_mcp_tool_called)
@@ -270,12 +317,51 @@ func _ready() -> void:
 
 	# Initialize VIP photo with top agent (if any)
 	_update_vip_photo()
+	_mark_startup("event_sources")
+	startup_ready_msec = Time.get_ticks_msec()
 
 	print("[OfficeManager] Ready. Desks: %d" % desks.size())
+	if headless:
+		print("[OfficeManager] Headless mode: rendering and audio disabled, max %d FPS" % Engine.max_fps)
 
 func get_appearance_registry() -> AppearanceRegistry:
 	return appearance_registry
 
+func _mark_startup(phase: String) -> void:
+	## Close the current startup phase (time since the previous mark)
+	var now = Time.get_ticks_usec()
+	startup_phases.append({"name": phase, "ms": (now - _startup_mark_usec) / 1000.0})
+	_startup_mark_usec = now
+
+func _advance_startup() -> void:
+	## Frame 1 shows the office; work it doesn't need runs on frame 2
+	_startup_frames += 1
+	if _startup_frames == 1:
+		startup_first_frame_msec = Time.get_ticks_msec()
+		return
+	_startup_mark_usec = Time.get_ticks_usec()
+	if transcript_watcher:
+		transcript_watcher.scan_for_sessions()
+	_mark_startup("session_scan")
+	startup_deferred_msec = Time.get_ticks_msec()
+	print("[OfficeManager] Startup: ready %d ms, first frame %d ms, deferred work done %d ms" % [startup_ready_msec, startup_first_frame_msec, startup_deferred_msec])
+
+func get_startup_report() -> Dictionary:
+	var report = {
+		"engine_ms": startup_engine_msec,
+		"ready_ms": startup_ready_msec,
+		"first_frame_ms": startup_first_frame_msec,
+		"deferred_done_ms": startup_deferred_msec,
+		"phases": startup_phases.duplicate(true),
+		"headless": headless
+	}
+	if agent_roster:
+		var roster = agent_roster.get_persistence_stats()
+		report["roster"] = {"agents": roster["agents"], "load_ms": roster["load_ms"], "store_bytes": roster["store_bytes"]}
+	if appearance_registry:
+		report["appearance_categories_loaded"] = appearance_registry.get_loaded_categories()
+	return report
+
 func _notification(what: int) -> void:
 	# Save all data when the game window is closed
 	if what == NOTIFICATION_WM_CLOSE_REQUEST:
@@ -290,11 +376,14 @@ func _request_quit() -> void:
 	# Disconnect transcript watcher first to prevent event cascades during shutdown
 	# This stops session_end events from triggering UI updates that race with X11 cleanup
 	if transcript_watcher:
-		if transcript_watcher.event_received.is_connected(_on_event_received):
-			transcript_watcher.event_received.disconnect(_on_event_received)
+		if transcript_watcher.event_received.is_connected(_queue_event):
+			transcript_watcher.event_received.disconnect(_queue_event)
 		if transcript_watcher.context_updated.is_connected(_on_context_updated):
 			transcript_watcher.context_updated.disconnect(_on_context_updated)
 
+	if event_dispatcher:
+		event_dispatcher.clear()
+
 	# Disconnect roster signals to prevent UI updates during shutdown
 	if agent_roster:
 		if agent_roster.roster_changed.is_connected(_on_roster_changed):
@@ -303,6 +392,7 @@ func _request_quit() -> void:
 	_save_positions()
 	if agent_roster:
 		agent_roster.save_roster()
+		agent_roster.flush()  # Write-behind: don't leave queued profiles to the background task
 	if gamification_manager:
 		gamification_manager.save_all()
 	get_tree().quit()
@@ -332,11 +422,17 @@ func _is_terminal_focused() -> bool:
 	return focused.get_class() == "Terminal"
 
 func _process(delta: float) -> void:
+	if _startup_frames < 2:
+		_advance_startup()
+
 	# Throttle taskboard updates (doesn't need to run every frame)
 	taskboard_update_timer += delta
 	if taskboard_update_timer >= TASKBOARD_UPDATE_INTERVAL:
 		taskboard_update_timer = 0.0
+		var taskboard_start = Time.get_ticks_usec()
 		_update_taskboard()
+		if perf_monitor:
+			perf_monitor.record_section("update_taskboard", Time.get_ticks_usec() - taskboard_start, active_agents.size())
 		_update_day_night_cycle()  # Check time changes (throttled with taskboard)
 
 	_animate_clouds(delta)
@@ -602,6 +698,7 @@ func _add_furniture_with_id(furniture_type: String, pos: Vector2, fid: String) -
 	# Register obstacle with navigation grid
 	var obstacle_rect = Rect2(pos - furniture.obstacle_size / 2, furniture.obstacle_size)
 	navigation_grid.register_obstacle(obstacle_rect, fid)
+	_mark_state("furniture:" + fid)
 
 func _create_desks() -> void:
 	# Use saved desk positions if available, otherwise use defaults
@@ -788,6 +885,13 @@ func _register_with_navigation_grid() -> void:
 		var taskboard_obstacle_center = taskboard_position + OfficeConstants.TASKBOARD_OBSTACLE_OFFSET
 		_register_furniture_obstacle("taskboard", taskboard_obstacle_center, OfficeConstants.TASKBOARD_OBSTACLE)
 
+	_refresh_flow_targets()
+
+func _refresh_flow_targets() -> void:
+	# Furniture destinations get precomputed flow fields (desk work positions are tracked by the grid)
+	if navigation_grid:
+		navigation_grid.set_flow_targets(get_navigation_targets()["furniture"])
+
 func _register_furniture_obstacle(obstacle_id: String, pos: Vector2, size: Vector2) -> void:
 	var rect = Rect2(pos.x - size.x / 2, pos.y - size.y / 2, size.x, size.y)
 	navigation_grid.register_obstacle(rect, obstacle_id)
@@ -1243,13 +1347,22 @@ func register_trait_furniture(furniture: FurnitureBase) -> void:
 		trait_furniture.append(furniture)
 		furniture.navigation_grid = navigation_grid
 		furniture.office_manager = self
+		if furniture is FurnitureDesk:
+			furniture.slot_reserved.connect(_on_desk_slot_changed)
+			furniture.slot_released.connect(_on_desk_slot_changed)
 
 func unregister_trait_furniture(furniture: FurnitureBase) -> void:
 	## Remove furniture from the trait system.
 	trait_furniture.erase(furniture)
 
+func _on_desk_slot_changed(desk: FurnitureBase, _slot_index: int, _agent_id: String) -> void:
+	var index = desks.find(desk)
+	if index >= 0:
+		_mark_state("desk:%d" % index)
+
 func _on_desk_position_changed(desk: FurnitureDesk, new_position: Vector2) -> void:
 	print("[OfficeManager] Desk moved to %s" % new_position)
+	_mark_state("desk:%d" % desks.find(desk))
 
 	# Update navigation grid - remove old position, add new
 	var desk_id = desk.furniture_id
@@ -1439,15 +1552,29 @@ func register_spontaneous_bubble(agent: Agent) -> void:
 # EVENT HANDLING
 # =============================================================================
 
-func _on_event_received(event_data: Dictionary) -> void:
+func _queue_event(event_data: Dictionary) -> void:
 	# Skip all event processing during shutdown to prevent X11 cascades
 	if is_quitting:
 		return
+	event_dispatcher.enqueue(event_data)
 
-	var event_type = event_data.get("event", "")
+func _handle_queued_event(event_data: Dictionary) -> void:
+	## Recorded only once handled, so a seq in history or on GET /events means
+	## the office acted on the event (smoke_test probes wait on exactly that).
+	## Events the dispatcher merged away are never recorded.
+	_on_event_received(event_data)
+	if is_quitting:
+		return
 	if mcp_server and mcp_server.has_method("record_event"):
 		mcp_server.record_event(event_data)
 
+func _on_event_received(event_data: Dictionary) -> void:
+	# Called by event_dispatcher within the frame budget
+	if is_quitting:
+		return
+
+	var event_type = event_data.get("event", "")
+
 	# Session lifecycle
 	if event_type == "session_start":
 		_handle_session_start(event_data)
@@ -1461,6 +1588,9 @@ func _on_event_received(event_data: Dictionary) -> void:
 	if event_type == "session_activity":
 		_handle_session_activity(event_data)
 		return
+	if event_type == "tool_latency":
+		_handle_tool_latency(event_data)
+		return
 
 	# Update status
 	var tool_name = event_data.get("tool", "")
@@ -1492,6 +1622,13 @@ func _on_event_received(event_data: Dictionary) -> void:
 		"set_context_stress":
 			_handle_set_context_stress(event_data)
 
+func _handle_tool_latency(data: Dictionary) -> void:
+	var tools = data.get("tools", {})
+	if tools is Dictionary:
+		tool_latency = tools
+		if profiler_enabled:
+			_update_profiler_overlay()
+
 func _handle_set_context_stress(data: Dictionary) -> void:
 	# Test event: manually set context stress for an agent
 	var agent_id = data.get("agent_id", "")
@@ -1768,6 +1905,7 @@ func _handle_agent_spawn(data: Dictionary) -> void:
 		meeting_spot_idx = _find_available_meeting_spot()
 		if meeting_spot_idx == -1:
 			push_warning("No available desks or meeting spots!")
+			spawns_rejected += 1
 			return
 		print("[OfficeManager] No desk available, using meeting table spot %d" % meeting_spot_idx)
 
@@ -1795,6 +1933,8 @@ func _handle_agent_spawn(data: Dictionary) -> void:
 	agent.office_manager = self  # For spontaneous bubble coordination
 	agent.audio_manager = audio_manager  # For typing sounds
 	agent.work_completed.connect(_on_agent_completed)
+	agent.state_changed.connect(_on_agent_changed)
+	agent.moved.connect(_on_agent_changed)
 
 	# Assign agent profile from roster (orchestrators get the best/highest level agent)
 	# Note: is_orchestrator already defined above for Task tool tracking
@@ -1830,6 +1970,7 @@ func _handle_agent_spawn(data: Dictionary) -> void:
 
 	# Track agent
 	active_agents[agent_id] = agent
+	_mark_state("agent:" + agent_id)
 	if not agent_by_type.has(agent_type):
 		agent_by_type[agent_type] = []
 	agent_by_type[agent_type].append(agent_id)
@@ -1837,6 +1978,29 @@ func _handle_agent_spawn(data: Dictionary) -> void:
 	# Visual feedback
 	status_label.text = "Spawned: %s" % agent_type
 
+func get_agent_capacity() -> int:
+	return desks.size() + OfficeConstants.MEETING_SPOT_OFFSETS.size()
+
+func get_table_sizes() -> Dictionary:
+	## Sizes of the per-agent bookkeeping tables, for leak hunting in long soak runs
+	var typed_ids = 0
+	for ids in agent_by_type.values():
+		typed_ids += ids.size()
+	var session_ids = 0
+	for ids in agents_by_session.values():
+		session_ids += ids.size()
+	return {
+		"active_agents": active_agents.size(),
+		"agent_by_type": typed_ids,
+		"agents_by_session": session_ids,
+		"sessions": agents_by_session.size(),
+		"known_agent_ids": known_agent_ids.size(),
+		"completed_agent_ids": completed_agent_ids.size(),
+		"agents_in_meeting": agents_in_meeting.size(),
+		"agents_at_interaction_points": agents_at_interaction_points.size(),
+		"connection_lines": connection_lines.size()
+	}
+
 func _find_available_meeting_spot() -> int:
 	for i in range(meeting_spots_occupied.size()):
 		if not meeting_spots_occupied[i]:
@@ -1871,6 +2035,22 @@ func _update_meeting_spots() -> void:
 					# Still walking to table - recalculate path to new destination
 					agent._build_path_to(new_spot)
 
+func get_navigation_targets() -> Dictionary:
+	## World positions agents routinely walk to: desk work positions and furniture interaction points
+	var desk_positions: Array[Vector2] = []
+	for desk in desks:
+		if is_instance_valid(desk):
+			desk_positions.append(desk.get_work_position())
+	var furniture_positions: Array[Vector2] = []
+	for furniture_name in interaction_points_occupied:
+		for point_idx in range(interaction_points_occupied[furniture_name].size()):
+			furniture_positions.append(get_interaction_point_position(furniture_name, point_idx))
+	for spot_idx in range(OfficeConstants.MEETING_SPOT_OFFSETS.size()):
+		furniture_positions.append(get_meeting_spot_position(spot_idx))
+	if draggable_cat_bed:
+		furniture_positions.append(cat_bed_position)
+	return {"desks": desk_positions, "furniture": furniture_positions}
+
 func get_meeting_spot_position(spot_idx: int) -> Vector2:
 	# Get meeting spot position: table position + relative offset
 	if spot_idx < 0 or spot_idx >= OfficeConstants.MEETING_SPOT_OFFSETS.size():
@@ -2042,8 +2222,11 @@ func _handle_furniture_tour(data: Dictionary) -> void:
 	agent.modulate.a = 1.0  # Fully visible immediately
 	agent.state = Agent.State.IDLE
 
+	agent.state_changed.connect(_on_agent_changed)
+	agent.moved.connect(_on_agent_changed)
 	add_child(agent)
 	active_agents[agent_id] = agent
+	_mark_state("agent:" + agent_id)
 
 	# Start the tour immediately
 	agent.start_furniture_tour(meeting_table_position)
@@ -2053,35 +2236,63 @@ func _handle_furniture_tour(data: Dictionary) -> void:
 # =============================================================================
 
 func _check_agent_interactions() -> void:
+	var index_start = Time.get_ticks_usec()
+	_refresh_agent_spatial_index()
 	# Check for agent-agent small talk opportunities
+	var small_talk_start = Time.get_ticks_usec()
 	_check_agent_small_talk()
 	# Check for agent-cat interactions
+	var cat_start = Time.get_ticks_usec()
 	_check_agent_cat_interactions()
+	if perf_monitor:
+		perf_monitor.record_section("refresh_agent_spatial_index", small_talk_start - index_start, active_agents.size())
+		perf_monitor.record_section("check_agent_small_talk", cat_start - small_talk_start, active_agents.size())
+		perf_monitor.record_section("check_agent_cat_interactions", Time.get_ticks_usec() - cat_start, active_agents.size())
+
+func _refresh_agent_spatial_index() -> void:
+	# Agents move every frame; re-bucket them once per interaction check (O(n))
+	for agent_id in active_agents:
+		var agent = active_agents[agent_id] as Agent
+		if is_instance_valid(agent):
+			agent_spatial_index.update(agent_id, agent.global_position)
+		else:
+			agent_spatial_index.remove(agent_id)
 
 func _check_agent_small_talk() -> void:
-	# Get all agents that can chat
+	# Get all agents that can chat (order decides which pair wins when several are close)
 	var chattable_agents: Array[Agent] = []
+	var chattable_order: Dictionary = {}  # agent_id -> index in chattable_agents
 	for agent_id in active_agents:
 		var agent = active_agents[agent_id] as Agent
 		if is_instance_valid(agent) and agent.can_chat():
+			chattable_order[agent_id] = chattable_agents.size()
 			chattable_agents.append(agent)
 
-	# Check pairs for proximity
+	# Check each agent against neighbours from the spatial index, not every other agent
 	for i in range(chattable_agents.size()):
-		for j in range(i + 1, chattable_agents.size()):
-			var agent_a = chattable_agents[i]
-			var agent_b = chattable_agents[j]
+		var agent_a = chattable_agents[i]
+		# Skip if already chatting (might have started this frame)
+		if agent_a.state == Agent.State.CHATTING:
+			continue
 
-			# Skip if either is already chatting (might have started this frame)
-			if agent_a.state == Agent.State.CHATTING or agent_b.state == Agent.State.CHATTING:
+		var partner: Agent = null
+		var partner_index = chattable_agents.size()
+		for other_id in agent_spatial_index.query_radius(agent_a.global_position, AGENT_CHAT_PROXIMITY):
+			var j = chattable_order.get(other_id, -1)
+			# Only later agents, earliest first - same pair the full scan would pick
+			if j <= i or j >= partner_index:
 				continue
+			var agent_b = chattable_agents[j]
+			if agent_b.state == Agent.State.CHATTING:
+				continue
+			partner = agent_b
+			partner_index = j
 
-			var distance = agent_a.global_position.distance_to(agent_b.global_position)
-			if distance < AGENT_CHAT_PROXIMITY:
-				# Start chat between these two agents
-				_start_agent_chat(agent_a, agent_b)
-				# Only one chat per check to avoid overwhelming
-				return
+		if partner:
+			# Start chat between these two agents
+			_start_agent_chat(agent_a, partner)
+			# Only one chat per check to avoid overwhelming
+			return
 
 func _start_agent_chat(agent_a: Agent, agent_b: Agent) -> void:
 	print("[OfficeManager] Small talk: %s and %s" % [agent_a.agent_id.substr(0, 8), agent_b.agent_id.substr(0, 8)])
@@ -2098,23 +2309,24 @@ func _check_agent_cat_interactions() -> void:
 
 	var cat_pos = office_cat.global_position
 
-	for agent_id in active_agents:
+	# Only agents near the cat, via the spatial index
+	for agent_id in agent_spatial_index.query_radius(cat_pos, CAT_INTERACTION_PROXIMITY):
+		if not active_agents.has(agent_id):
+			continue
 		var agent = active_agents[agent_id] as Agent
 		if not is_instance_valid(agent):
 			continue
 		if not agent.can_react_to_cat():
 			continue
 
-		var distance = agent.global_position.distance_to(cat_pos)
-		if distance < CAT_INTERACTION_PROXIMITY:
-			# Agent reacts to cat
-			agent.react_to_cat()
-			# Make the cat meow back sometimes
-			if randf() < 0.5 and office_cat.has_method("_show_meow"):
-				office_cat._show_meow()
-			# Track for cat achievements
-			if gamification_manager:
-				gamification_manager.record_cat_interaction()
+		# Agent reacts to cat
+		agent.react_to_cat()
+		# Make the cat meow back sometimes
+		if randf() < 0.5 and office_cat.has_method("_show_meow"):
+			office_cat._show_meow()
+		# Track for cat achievements
+		if gamification_manager:
+			gamification_manager.record_cat_interaction()
 
 func _configure_agent_positions(agent: Agent) -> void:
 	agent.set_shredder_position(shredder_position)
@@ -2144,6 +2356,8 @@ func _on_agent_completed(agent: Agent) -> void:
 		gamification_manager.record_task_completed(agent.last_task_duration)
 
 	active_agents.erase(aid)
+	agent_spatial_index.remove(aid)
+	_mark_state("agent:" + aid, true)
 	completed_agent_ids[aid] = true
 	if agent_by_type.has(agent.agent_type):
 		agent_by_type[agent.agent_type].erase(aid)
@@ -2223,8 +2437,28 @@ func _prune_session_agent_ids(session_id: String) -> void:
 # FURNITURE POSITION UPDATES
 # =============================================================================
 
+func _mark_state(key: String, removed: bool = false) -> void:
+	## Journal an entity change so get_office_state(since_version) deltas stay
+	## proportional to churn (see McpServer._flush_state_journal).
+	if not mcp_server:
+		return
+	if removed:
+		mcp_server.mark_state_removed(key)
+	else:
+		mcp_server.mark_state_changed(key)
+
+func _mark_default_furniture(item_name: String, removed: bool = false) -> void:
+	if item_name == "taskboard":
+		return  # Not part of get_office_state (see McpServer._default_furniture)
+	_mark_state("furniture:default_" + item_name, removed)
+
+func _on_agent_changed(agent: Agent) -> void:
+	if active_agents.has(agent.agent_id):
+		_mark_state("agent:" + agent.agent_id)
+
 func _on_item_position_changed(item_name: String, new_position: Vector2) -> void:
 	print("[OfficeManager] %s moved to %s" % [item_name, new_position])
+	_mark_default_furniture(item_name)
 
 	# Get obstacle size for this item
 	var obstacle_size: Vector2 = Vector2.ZERO
@@ -2271,6 +2505,7 @@ func _on_item_position_changed(item_name: String, new_position: Vector2) -> void
 	if navigation_grid and obstacle_size != Vector2.ZERO:
 		var new_rect = Rect2(new_position.x - obstacle_size.x / 2, new_position.y - obstacle_size.y / 2, obstacle_size.x, obstacle_size.y)
 		navigation_grid.update_obstacle(item_name, new_rect)
+	_refresh_flow_targets()
 
 	_update_all_agents_position(item_name, new_position)
 
@@ -2323,6 +2558,18 @@ func _update_profiler_overlay() -> void:
 	if transcript_watcher and transcript_watcher.has_method("get_watched_count"):
 		session_count = transcript_watcher.get_watched_count()
 	profiler_label.text = "FPS: %d | Agents: %d | Sessions: %d" % [fps, agent_count, session_count]
+	if not tool_latency.is_empty():
+		profiler_label.text += "\nSlowest tools (p90): " + _format_slowest_tools(3)
+
+func _format_slowest_tools(limit: int) -> String:
+	var tools: Array = tool_latency.keys()
+	tools.sort_custom(func(a, b): return float(tool_latency[a].get("p90", 0.0)) > float(tool_latency[b].get("p90", 0.0)))
+	var parts: Array[String] = []
+	for tool in tools.slice(0, limit):
+		var p90 = float(tool_latency[tool].get("p90", 0.0))
+		var shown = "%.1fs" % (p90 / 1000.0) if p90 >= 1000.0 else "%dms" % int(p90)
+		parts.append("%s %s (%d)" % [tool, shown, int(tool_latency[tool].get("count", 0))])
+	return ", ".join(parts)
 
 func _update_taskboard() -> void:
 	if not taskboard:
@@ -2897,6 +3144,7 @@ func _add_furniture(furniture_type: String, pos: Vector2) -> void:
 	# Register obstacle with navigation grid
 	var obstacle_rect = Rect2(pos - furniture.obstacle_size / 2, furniture.obstacle_size)
 	navigation_grid.register_obstacle(obstacle_rect, fid)
+	_mark_state("furniture:" + fid)
 
 	_save_positions()
 	print("[OfficeManager] Added furniture: %s at %s" % [furniture_type, position])
@@ -2909,6 +3157,7 @@ func _on_dynamic_furniture_moved(item_name: String, new_position: Vector2, furni
 			var obstacle_size = f.obstacle_size if f.has("obstacle_size") else Vector2(40, 40)
 			var new_rect = Rect2(new_position - obstacle_size / 2, obstacle_size)
 			navigation_grid.update_obstacle(furniture_id, new_rect)
+			_mark_state("furniture:" + furniture_id)
 			print("[OfficeManager] Dynamic furniture %s moved to %s" % [furniture_id, new_position])
 			break
 	# Update cat obstacles
@@ -2930,6 +3179,7 @@ func _remove_furniture(furniture_id: String) -> void:
 				navigation_grid.unregister_obstacle(furniture_id)
 				f.node.queue_free()
 			placed_furniture.remove_at(i)
+			_mark_state("furniture:" + furniture_id, true)
 			_save_positions()
 			print("[OfficeManager] Removed furniture: %s" % furniture_id)
 			return
@@ -2975,6 +3225,7 @@ func _remove_default_furniture(furniture_id: String) -> void:
 		if not obstacle_id.is_empty():
 			navigation_grid.unregister_obstacle(obstacle_id)
 		node.queue_free()
+		_mark_default_furniture(obstacle_id, true)
 		_save_positions()
 		print("[OfficeManager] Removed default furniture: %s" % furniture_id)
 
@@ -3000,9 +3251,12 @@ func _remove_desk(desk_index: int) -> bool:
 	# Unregister from trait furniture system
 	unregister_trait_furniture(desk)
 
-	# Remove from array and free node
+	# Remove from array and free node; later desks shift down an index
 	desks.remove_at(desk_index)
 	desk.queue_free()
+	for i in range(desk_index, desks.size()):
+		_mark_state("desk:%d" % i)
+	_mark_state("desk:%d" % desks.size(), true)
 
 	_save_positions()
 	print("[OfficeManager] Removed desk at index %d" % desk_index)
@@ -3024,6 +3278,7 @@ func _add_desk(pos: Vector2) -> int:
 
 	desks.append(desk)
 	register_trait_furniture(desk)
+	_mark_state("desk:%d" % desk_index)
 
 	# Register obstacle - use furniture_id to match item_name for drag exclusion
 	var desk_rect = Rect2(
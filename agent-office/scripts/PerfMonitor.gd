@@ -0,0 +1,84 @@
+extends Node
+class_name PerfMonitor
+
+# Rolling frame-time window for the office://perf MCP resource.
+# Samples every frame into fixed-size ring buffers; percentiles are only
+# computed when someone asks for a snapshot.
+
+const WINDOW_SIZE: int = 600  # ~10 s at 60 FPS
+
+var frame_times_ms: PackedFloat32Array = PackedFloat32Array()
+var process_times_ms: PackedFloat32Array = PackedFloat32Array()
+var _next_index: int = 0
+var _sample_count: int = 0
+var total_frames: int = 0
+# Named per-frame code paths timed by their callers via record_section().
+# name -> {calls, total_usec, max_usec, last_usec, last_items}; cumulative so
+# clients can diff two snapshots to get the mean cost over any interval.
+var section_stats: Dictionary = {}
+
+func _ready() -> void:
+	frame_times_ms.resize(WINDOW_SIZE)
+	process_times_ms.resize(WINDOW_SIZE)
+
+func _process(delta: float) -> void:
+	frame_times_ms[_next_index] = delta * 1000.0
+	# TIME_PROCESS is the previous frame's _process cost, which is what we want to track
+	process_times_ms[_next_index] = Performance.get_monitor(Performance.TIME_PROCESS) * 1000.0
+	_next_index = (_next_index + 1) % WINDOW_SIZE
+	_sample_count = mini(_sample_count + 1, WINDOW_SIZE)
+	total_frames += 1
+
+func get_snapshot() -> Dictionary:
+	return {
+		"fps": Engine.get_frames_per_second(),
+		"frames_sampled": _sample_count,
+		"total_frames": total_frames,
+		"frame_ms": _summarize(frame_times_ms),
+		"process_ms": _summarize(process_times_ms),
+		"physics_ms": Performance.get_monitor(Performance.TIME_PHYSICS_PROCESS) * 1000.0,
+		"node_count": int(Performance.get_monitor(Performance.OBJECT_NODE_COUNT)),
+		"orphan_node_count": int(Performance.get_monitor(Performance.OBJECT_ORPHAN_NODE_COUNT)),
+		"object_count": int(Performance.get_monitor(Performance.OBJECT_COUNT)),
+		"static_memory_mb": Performance.get_monitor(Performance.MEMORY_STATIC) / 1048576.0,
+		"static_memory_max_mb": Performance.get_monitor(Performance.MEMORY_STATIC_MAX) / 1048576.0,
+		"sections": section_stats.duplicate(true)
+	}
+
+func record_section(section: String, usec: int, items: int = -1) -> void:
+	## items: how many things the section iterated over (agents, pairs...), for scaling plots
+	var stats = section_stats.get(section)
+	if stats == null:
+		stats = {"calls": 0, "total_usec": 0, "max_usec": 0, "last_usec": 0, "last_items": -1}
+		section_stats[section] = stats
+	stats["calls"] += 1
+	stats["total_usec"] += usec
+	stats["last_usec"] = usec
+	stats["last_items"] = items
+	if usec > stats["max_usec"]:
+		stats["max_usec"] = usec
+
+func reset() -> void:
+	_next_index = 0
+	_sample_count = 0
+	section_stats.clear()
+
+func _summarize(ring: PackedFloat32Array) -> Dictionary:
+	if _sample_count == 0:
+		return {"p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0, "mean": 0.0}
+	var samples = ring.slice(0, _sample_count) if _sample_count < WINDOW_SIZE else ring.duplicate()
+	samples.sort()
+	var total = 0.0
+	for value in samples:
+		total += value
+	return {
+		"p50": _percentile(samples, 0.50),
+		"p90": _percentile(samples, 0.90),
+		"p99": _percentile(samples, 0.99),
+		"max": samples[samples.size() - 1],
+		"mean": total / samples.size()
+	}
+
+func _percentile(sorted_samples: PackedFloat32Array, q: float) -> float:
+	var index = int(round(q * (sorted_samples.size() - 1)))
+	return sorted_samples[clampi(index, 0, sorted_samples.size() - 1)]
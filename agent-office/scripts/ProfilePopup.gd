@@ -608,7 +608,7 @@ func _populate_colleagues(profile: AgentProfile) -> void:
 		for agent_id_str in profile.worked_with.keys():
 			var count = profile.worked_with[agent_id_str]
 			if is_instance_valid(roster):
-				var other = roster.get_agent(int(agent_id_str))
+				var other = roster.get_agent_summary(int(agent_id_str))
 				if other:
 					worked.append("%s (%dx)" % [other.agent_name, count])
 		if not worked.is_empty():
@@ -620,7 +620,7 @@ func _populate_colleagues(profile: AgentProfile) -> void:
 		for agent_id_str in profile.chatted_with.keys():
 			var count = profile.chatted_with[agent_id_str]
 			if is_instance_valid(roster):
-				var other = roster.get_agent(int(agent_id_str))
+				var other = roster.get_agent_summary(int(agent_id_str))
 				if other:
 					chatted.append("%s (%dx)" % [other.agent_name, count])
 		if not chatted.is_empty():
@@ -0,0 +1,75 @@
+class_name SpatialHash
+
+# =============================================================================
+# Uniform-grid spatial index for proximity queries
+# =============================================================================
+# Items are bucketed by the cell containing their position. A radius query
+# only visits the cells overlapping the query circle (3x3 when the radius is
+# no larger than cell_size), so n queries cost O(n) instead of O(n^2) pairs.
+
+var cell_size: float = 80.0
+var _cells: Dictionary = {}  # Vector2i -> Array of items
+var _item_cells: Dictionary = {}  # item -> Vector2i
+var _item_positions: Dictionary = {}  # item -> Vector2
+
+func _init(size: float = 80.0) -> void:
+	cell_size = maxf(size, 1.0)
+
+func clear() -> void:
+	_cells.clear()
+	_item_cells.clear()
+	_item_positions.clear()
+
+func size() -> int:
+	return _item_positions.size()
+
+func has(item) -> bool:
+	return _item_positions.has(item)
+
+func update(item, pos: Vector2) -> void:
+	## Insert item, or move it if it is already indexed
+	var cell = _cell_for(pos)
+	_item_positions[item] = pos
+	if _item_cells.has(item):
+		var old_cell: Vector2i = _item_cells[item]
+		if old_cell == cell:
+			return
+		_remove_from_cell(item, old_cell)
+	_item_cells[item] = cell
+	if not _cells.has(cell):
+		_cells[cell] = []
+	_cells[cell].append(item)
+
+func remove(item) -> void:
+	if not _item_cells.has(item):
+		return
+	_remove_from_cell(item, _item_cells[item])
+	_item_cells.erase(item)
+	_item_positions.erase(item)
+
+func query_radius(pos: Vector2, radius: float) -> Array:
+	## Items strictly closer than radius to pos, in no particular order
+	var results: Array = []
+	var radius_sq = radius * radius
+	var min_cell = _cell_for(pos - Vector2(radius, radius))
+	var max_cell = _cell_for(pos + Vector2(radius, radius))
+	for cx in range(min_cell.x, max_cell.x + 1):
+		for cy in range(min_cell.y, max_cell.y + 1):
+			var bucket = _cells.get(Vector2i(cx, cy))
+			if bucket == null:
+				continue
+			for item in bucket:
+				if pos.distance_squared_to(_item_positions[item]) < radius_sq:
+					results.append(item)
+	return results
+
+func _cell_for(pos: Vector2) -> Vector2i:
+	return Vector2i(floori(pos.x / cell_size), floori(pos.y / cell_size))
+
+func _remove_from_cell(item, cell: Vector2i) -> void:
+	var bucket = _cells.get(cell)
+	if bucket == null:
+		return
+	bucket.erase(item)
+	if bucket.is_empty():
+		_cells.erase(cell)
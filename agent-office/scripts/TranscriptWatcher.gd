@@ -58,8 +58,8 @@ var pending_tools: Dictionary = {}  # tool_use_id -> {tool_name, session_path}
 
 func _ready() -> void:
 	_register_with_settings()
-	# Find and start watching all active sessions
-	scan_for_sessions()
+	# The first scan for active sessions is run by OfficeManager once the
+	# first frame is up (or by _process after SCAN_INTERVAL when standalone)
 
 func _register_with_settings() -> void:
 	var registry = get_node_or_null("/root/SettingsRegistry")
@@ -856,3 +856,14 @@ func _derive_harness(session_path: String) -> String:
 
 func get_watched_count() -> int:
 	return watched_sessions.size()
+
+func get_table_sizes() -> Dictionary:
+	var context_entries = 0
+	for entries in session_context_entries.values():
+		context_entries += entries.size()
+	return {
+		"watched_sessions": watched_sessions.size(),
+		"session_context_entries": context_entries,
+		"pending_agents": pending_agents.size(),
+		"pending_tools": pending_tools.size()
+	}
@@ -398,9 +398,13 @@ func _update_help_text() -> void:
 		lines.append("")
 		if transport == "none":
 			lines.append("MCP: disabled")
-		else:
+		elif transport != "uds":
 			var scheme = "tcp" if transport == "tcp" else "ws"
 			lines.append("MCP (%s): %s://%s:%d" % [transport, scheme, host, port])
+		if mcp_server.has_method("get_socket_path"):
+			var socket_path = str(mcp_server.get_socket_path())
+			if not socket_path.is_empty():
+				lines.append("MCP (uds): unix://%s" % socket_path)
 
 	help_label.text = "\n".join(lines)
 	var line_height = 11.0
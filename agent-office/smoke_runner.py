@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+Concurrent, assertion-based smoke runner for Agent Office.
+
+Runs independent scenarios at the same time, each on its own agent IDs, and
+replaces fixed sleeps with waits on conditions observed through list_agents /
+get_office_state. Every step has a timeout; nothing needs a human watching.
+
+Usage:
+    python3 smoke_runner.py                        # Run all scenarios
+    python3 smoke_runner.py --only lifecycle,weather
+    python3 smoke_runner.py --junit results.xml --json results.json
+    python3 smoke_runner.py --socket PATH          # Use the office's Unix domain socket
+    python3 smoke_runner.py --timeout 20           # Per-condition timeout (seconds)
+    python3 smoke_runner.py --list                 # List scenarios
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+import uuid
+import xml.etree.ElementTree as ET
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from office_client import AsyncOfficeClient, OfficeError, ToolError
+from office_state import OfficeStateMirror
+
+CONDITION_TIMEOUT = 15.0
+POLL_INTERVAL = 0.05
+# Agents walk between journaled positions (Agent.MOVE_REPORT_DISTANCE is 16 px),
+# and the cat is compared at whole pixels, so mirrored positions may trail a little
+STATE_POSITION_TOLERANCE = 24.0
+
+# States an agent passes through once it has been told to finish
+FINISHING_STATES = {"DELIVERING", "LEAVING", "COMPLETING"}
+# States that mean the office placed the agent somewhere
+PLACED_STATES = {"WALKING_TO_DESK", "WORKING", "MEETING", "IDLE", "WANDERING",
+                 "SOCIALIZING", "CHATTING", "FURNITURE_TOUR"}
+
+
+class ScenarioFailure(AssertionError):
+    """A condition was not met."""
+
+
+def timestamp() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+class Scenario:
+    """Per-scenario context: a client, a unique ID prefix and a step log."""
+
+    def __init__(self, name: str, office: AsyncOfficeClient, run_id: str, timeout: float):
+        self.name = name
+        self.office = office
+        self.prefix = f"{run_id}-{name[:6]}"
+        self.timeout = timeout
+        self.steps: List[dict] = []
+        self._started = time.monotonic()
+
+    def agent_id(self, n: int = 0) -> str:
+        return f"{self.prefix}-{n:02d}"
+
+    def step(self, message: str) -> None:
+        self.steps.append({"t": round(time.monotonic() - self._started, 3), "step": message})
+
+    async def post(self, event: dict) -> None:
+        event.setdefault("timestamp", timestamp())
+        await self.office.post_event(event)
+
+    async def post_many(self, events: List[dict]) -> None:
+        for event in events:
+            event.setdefault("timestamp", timestamp())
+        for result in await self.office.post_events(events):
+            if isinstance(result, Exception):
+                raise ScenarioFailure(f"post_event failed in batch: {result}")
+
+    async def wait_until(self, description: str, probe: Callable[[], Awaitable],
+                         predicate: Callable[[object], bool], timeout: Optional[float] = None):
+        """Poll probe() until predicate(value) holds; fail after the timeout."""
+        deadline = time.monotonic() + (timeout or self.timeout)
+        last = None
+        while True:
+            last = await probe()
+            if predicate(last):
+                self.step(f"ok: {description}")
+                return last
+            if time.monotonic() >= deadline:
+                raise ScenarioFailure(f"timed out waiting for {description}")
+            await asyncio.sleep(POLL_INTERVAL)
+
+    async def agents(self) -> Dict[str, str]:
+        """agent_id -> state name for every active agent."""
+        listing = await self.office.list_agents()
+        return {a["agent_id"]: a.get("state", "") for a in listing.get("agents", [])}
+
+    async def wait_agents(self, ids: List[str], states: Optional[set] = None) -> None:
+        def ready(agents):
+            return all(i in agents and (states is None or agents[i] in states) for i in ids)
+        what = f"{len(ids)} agent(s) present" + (f" in {sorted(states)}" if states else "")
+        await self.wait_until(what, self.agents, ready)
+
+    async def wait_agents_finishing(self, ids: List[str]) -> None:
+        def done(agents):
+            return all(i not in agents or agents[i] in FINISHING_STATES for i in ids)
+        await self.wait_until(f"{len(ids)} agent(s) finishing or gone", self.agents, done)
+
+
+# =============================================================================
+# Scenarios
+# =============================================================================
+
+async def scenario_lifecycle(s: Scenario) -> None:
+    """One agent: spawn, wait for permission, resume, complete."""
+    agent = s.agent_id()
+    await s.post({"event": "agent_spawn", "agent_id": agent, "agent_type": "smoke-test",
+                  "description": "Runner lifecycle agent", "parent_id": "main"})
+    await s.wait_agents([agent], PLACED_STATES)
+
+    await s.post({"event": "waiting_for_input", "agent_id": agent, "tool": "Bash",
+                  "description": "echo runner"})
+    await s.post({"event": "input_received", "agent_id": agent, "tool": "Bash"})
+    await s.wait_agents([agent])
+
+    await s.post({"event": "agent_complete", "agent_id": agent, "success": "true", "force": True})
+    await s.wait_agents_finishing([agent])
+
+
+async def scenario_multi_spawn(s: Scenario) -> None:
+    """Several agents spawned in one batch all get placed, then all leave."""
+    ids = [s.agent_id(i) for i in range(6)]
+    types = ["typescript-pro", "debugger", "python-pro", "tdd", "security-auditor", "devops-engineer"]
+    await s.post_many([
+        {"event": "agent_spawn", "agent_id": agent, "agent_type": agent_type,
+         "description": f"Runner agent {n}", "parent_id": "main"}
+        for n, (agent, agent_type) in enumerate(zip(ids, types))
+    ])
+    await s.wait_agents(ids, PLACED_STATES)
+
+    await s.post_many([
+        {"event": "agent_complete", "agent_id": agent, "success": "true", "force": True}
+        for agent in ids
+    ])
+    await s.wait_agents_finishing(ids)
+
+
+async def scenario_session(s: Scenario) -> None:
+    """session_start creates an orchestrator; session_end sends it home."""
+    session_id = f"runner-{s.prefix}"
+    orchestrator = "orch_" + session_id[-8:]
+    session = {"session_id": session_id, "session_path": f"/tmp/{session_id}.jsonl"}
+
+    await s.post(dict(session, event="session_start"))
+    await s.wait_agents([orchestrator])
+    await s.post(dict(session, event="session_end"))
+    await s.wait_agents_finishing([orchestrator])
+
+
+async def scenario_furniture(s: Scenario) -> None:
+    """add_furniture shows up in get_office_state; remove_furniture takes it away."""
+    async def dynamic():
+        state = await s.office.get_office_state()
+        return {f["id"]: f for f in state.get("furniture", {}).get("dynamic", [])}
+
+    before = await dynamic()
+    await s.office.call_tool("add_furniture", {"type": "plant", "x": 1100, "y": 620})
+    after = await s.wait_until("new plant in office state", dynamic,
+                               lambda items: any(i not in before for i in items))
+    new_ids = [i for i in after if i not in before]
+    if after[new_ids[0]].get("type") != "plant":
+        raise ScenarioFailure(f"expected a plant, got {after[new_ids[0]].get('type')}")
+
+    await s.office.call_tool("remove_furniture", {"furniture_id": new_ids[0]})
+    await s.wait_until("plant removed", dynamic, lambda items: new_ids[0] not in items)
+
+
+def _by_key(state: dict) -> dict:
+    """get_office_state (plain or mirrored) as {(group, key): entry}."""
+    entries = {("agents", a["id"]): a for a in state.get("agents", [])}
+    entries.update((("desks", d["index"]), d) for d in state.get("desks", []))
+    for group in ("defaults", "dynamic"):
+        entries.update((("furniture." + group, f["id"]), f) for f in state.get("furniture", {}).get(group, []))
+    if state.get("cat"):
+        entries[("cat", "")] = state["cat"]
+    return entries
+
+
+# Groups whose entries move on their own; their positions are checked by _position_drift
+WALKING_GROUPS = ("agents", "cat")
+
+
+def _without_position(key: tuple, entry: dict) -> dict:
+    if key[0] not in WALKING_GROUPS:
+        return entry
+    return {k: v for k, v in entry.items() if k != "position"}
+
+
+def _state_mismatch(mirrored: dict, full: dict) -> str:
+    """First difference other than positions of things that walk, or "".
+
+    The two replies are fetched one after the other, so an agent can arrive or
+    leave in between; callers retry these.
+    """
+    ours, theirs = _by_key(mirrored), _by_key(full)
+    if ours.keys() != theirs.keys():
+        return f"mirror has {sorted(ours.keys() - theirs.keys())}, office has {sorted(theirs.keys() - ours.keys())}"
+    for key, entry in ours.items():
+        if _without_position(key, entry) != _without_position(key, theirs[key]):
+            return f"{key}: mirror {entry} != office {theirs[key]}"
+    if mirrored.get("weather") != full.get("weather"):
+        return f"weather: mirror {mirrored.get('weather')} != office {full.get('weather')}"
+    return ""
+
+
+def _position_drift(mirrored: dict, full: dict) -> str:
+    """An agent or the cat the mirror shows STATE_POSITION_TOLERANCE or more from where it is.
+
+    Nothing walks that far between a delta and the snapshot right after it,
+    so unlike _state_mismatch this is never a race.
+    """
+    theirs = _by_key(full)
+    for key, entry in _by_key(mirrored).items():
+        other = theirs.get(key)
+        if key[0] not in WALKING_GROUPS or not other or _without_position(key, entry) != _without_position(key, other):
+            continue
+        ours_xy = (entry["position"]["x"], entry["position"]["y"])
+        theirs_xy = (other["position"]["x"], other["position"]["y"])
+        if math.dist(ours_xy, theirs_xy) >= STATE_POSITION_TOLERANCE:
+            return f"{key} at {ours_xy} in the mirror, {theirs_xy} in the office"
+    return ""
+
+
+async def scenario_state_deltas(s: Scenario) -> None:
+    """A mirror kept up from since_version deltas matches a fresh full snapshot."""
+    mirror = OfficeStateMirror()
+    # Built-in pieces are never added mid-run, so a removal the mirror can't
+    # match means the office journaled something no snapshot reports
+    phantom_removals = set()
+    mismatch = ""
+
+    async def sync() -> OfficeStateMirror:
+        delta = await s.office.get_office_state(since_version=mirror.version, epoch=mirror.epoch)
+        if not delta.get("full"):
+            phantom_removals.update(i for i in delta.get("furniture", {}).get("removed", [])
+                                    if i.startswith("default_") and i not in mirror.furniture)
+        mirror.apply(delta)
+        return mirror
+
+    async def compare() -> str:
+        nonlocal mismatch
+        mismatch = ""
+        await sync()
+        full = await s.office.get_office_state()
+        drift = _position_drift(mirror.snapshot(), full)
+        if drift:
+            raise ScenarioFailure(f"mirror missed movement: {drift}")
+        mismatch = _state_mismatch(mirror.snapshot(), full)
+        return mismatch
+
+    async def wait_matching(description: str) -> None:
+        try:
+            await s.wait_until(description, compare, lambda result: not result)
+        except ScenarioFailure as e:
+            if not mismatch:
+                raise
+            raise ScenarioFailure(f"{e}: {mismatch}") from None
+
+    await sync()
+    if not mirror.epoch:
+        raise ScenarioFailure("get_office_state(since_version=0) returned no epoch")
+
+    ids = [s.agent_id(i) for i in range(3)]
+    await s.post_many([
+        {"event": "agent_spawn", "agent_id": agent, "agent_type": "smoke-test",
+         "description": f"Delta agent {n}", "parent_id": "main"}
+        for n, agent in enumerate(ids)
+    ])
+    await s.wait_agents(ids, PLACED_STATES)
+    await s.wait_until("spawned agents in the mirror", sync, lambda m: all(i in m.agents for i in ids))
+
+    before = set(mirror.furniture)
+    await s.office.call_tool("add_furniture", {"type": "plant", "x": 1150, "y": 600})
+    await s.wait_until("new plant in the mirror", sync, lambda m: set(m.furniture) - before)
+    plant = sorted(set(mirror.furniture) - before)[0]
+    await s.office.call_tool("move_furniture", {"item": plant, "x": 1180, "y": 580})
+    await s.wait_until("moved plant in the mirror", sync,
+                       lambda m: (m.furniture[plant]["x"], m.furniture[plant]["y"]) == (1180, 580))
+
+    shredder = mirror.furniture.get("default_shredder")
+    if shredder:
+        await s.office.call_tool("move_furniture", {"item": "shredder", "x": shredder["x"] + 20, "y": shredder["y"]})
+        await s.wait_until("moved shredder in the mirror", sync,
+                           lambda m: m.furniture["default_shredder"]["x"] != shredder["x"])
+        await s.office.call_tool("move_furniture", {"item": "shredder", "x": shredder["x"], "y": shredder["y"]})
+
+    await s.post_many([
+        {"event": "agent_complete", "agent_id": agent, "success": "true", "force": True}
+        for agent in ids
+    ])
+    await s.wait_agents_finishing(ids)
+    await s.wait_until("finishing agents in the mirror", sync,
+                       lambda m: all(i not in m.agents or m.agents[i]["state"] in FINISHING_STATES for i in ids))
+
+    # Walking out involves no state change, so only movement journaling keeps the mirror current
+    def positions(state: dict) -> dict:
+        return {a["id"]: (a["position"]["x"], a["position"]["y"]) for a in state.get("agents", []) if a["id"] in ids}
+
+    leaving = positions(mirror.snapshot())
+
+    def walked_off(state: dict) -> bool:
+        now = positions(state)
+        return not now or any(math.dist(leaving.get(i, p), p) > 2 * STATE_POSITION_TOLERANCE for i, p in now.items())
+
+    await s.wait_until("finishing agents walking out", s.office.get_office_state, walked_off)
+    await wait_matching("mirror keeping up with walking agents")
+    await s.office.call_tool("remove_furniture", {"furniture_id": plant})
+    await s.wait_until("plant gone from the mirror", sync, lambda m: plant not in m.furniture)
+
+    await wait_matching("mirror matching a full snapshot")
+    if phantom_removals:
+        raise ScenarioFailure(f"deltas removed furniture no snapshot held: {sorted(phantom_removals)}")
+
+
+async def scenario_weather(s: Scenario) -> None:
+    """Each weather_set is reflected in get_office_state."""
+    async def weather():
+        return str((await s.office.get_office_state()).get("weather", "")).upper()
+
+    for name in ("rain", "snow", "fog", "clear"):
+        await s.post({"event": "weather_set", "state": name, "mode": "lock"})
+        await s.wait_until(f"weather {name}", weather, lambda w, n=name: w == n.upper())
+    await s.post({"event": "weather_set", "state": "clear", "mode": "random"})
+
+
+async def scenario_edge_cases(s: Scenario) -> None:
+    """Bad input is rejected cleanly and the office keeps answering."""
+    try:
+        await s.office.post_event({"agent_id": s.agent_id()})
+    except ToolError:
+        s.step("ok: post_event without event type rejected")
+    else:
+        raise ScenarioFailure("post_event without an event type was accepted")
+
+    try:
+        await s.office.call_tool("no_such_tool", {})
+    except ToolError:
+        s.step("ok: unknown tool rejected")
+    else:
+        raise ScenarioFailure("unknown tool call succeeded")
+
+    await s.post({"event": "agent_complete", "agent_id": s.agent_id(99), "success": "true"})
+    await s.post({"event": "invalid_event_type", "agent_id": s.agent_id(98)})
+    await s.wait_until("office still responsive", s.office.list_agents,
+                       lambda listing: isinstance(listing, dict) and "agents" in listing)
+
+
+# name -> (coroutine, shared resource it needs exclusively or None)
+SCENARIOS = {
+    "lifecycle": (scenario_lifecycle, None),
+    "multi_spawn": (scenario_multi_spawn, None),
+    "session": (scenario_session, None),
+    "furniture": (scenario_furniture, None),
+    "state_deltas": (scenario_state_deltas, None),
+    "weather": (scenario_weather, "weather"),
+    "edge_cases": (scenario_edge_cases, None),
+}
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+async def _run_one(name: str, office: AsyncOfficeClient, run_id: str, timeout: float,
+                   locks: Dict[str, asyncio.Lock]) -> dict:
+    func, resource = SCENARIOS[name]
+    scenario = Scenario(name, office, run_id, timeout)
+    started = time.monotonic()
+    status, message = "passed", ""
+    try:
+        if resource:
+            async with locks.setdefault(resource, asyncio.Lock()):
+                await func(scenario)
+        else:
+            await func(scenario)
+    except ScenarioFailure as e:
+        status, message = "failed", str(e)
+    except OfficeError as e:
+        status, message = "error", str(e)
+    duration = time.monotonic() - started
+    print(f"  {status.upper():<6} {name:<12} {duration:6.2f}s  {message}")
+    return {"name": name, "status": status, "duration": round(duration, 3),
+            "message": message, "steps": scenario.steps}
+
+
+async def run_scenarios(names: List[str], socket_path: str = "", timeout: float = CONDITION_TIMEOUT) -> List[dict]:
+    run_id = uuid.uuid4().hex[:6]
+    locks: Dict[str, asyncio.Lock] = {}
+    async with AsyncOfficeClient(socket_path=socket_path, max_connections=len(names) + 1) as office:
+        await office.initialize()
+        return await asyncio.gather(*(_run_one(n, office, run_id, timeout, locks) for n in names))
+
+
+def write_junit(results: List[dict], path: str, total_time: float) -> None:
+    failures = sum(1 for r in results if r["status"] == "failed")
+    errors = sum(1 for r in results if r["status"] == "error")
+    suite = ET.Element("testsuite", name="agent-office-smoke", tests=str(len(results)),
+                       failures=str(failures), errors=str(errors), time=f"{total_time:.3f}")
+    for r in results:
+        case = ET.SubElement(suite, "testcase", classname="smoke_runner", name=r["name"],
+                             time=f"{r['duration']:.3f}")
+        if r["status"] in ("failed", "error"):
+            tag = "failure" if r["status"] == "failed" else "error"
+            ET.SubElement(case, tag, message=r["message"]).text = "\n".join(
+                f"[{s['t']:.3f}s] {s['step']}" for s in r["steps"])
+    ET.ElementTree(suite).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent smoke runner for Agent Office")
+    parser.add_argument("--only", help="Comma-separated scenario names")
+    parser.add_argument("--junit", help="Write JUnit XML results to this path")
+    parser.add_argument("--json", help="Write JSON results to this path")
+    parser.add_argument("--socket", default=None, help="Office Unix domain socket path")
+    parser.add_argument("--timeout", type=float, default=CONDITION_TIMEOUT, help="Per-condition timeout")
+    parser.add_argument("--list", action="store_true", help="List scenarios and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, (func, _) in SCENARIOS.items():
+            print(f"  {name:<12} {func.__doc__}")
+        return
+
+    names = list(SCENARIOS)
+    if args.only:
+        names = [n.strip() for n in args.only.split(",") if n.strip()]
+        unknown = [n for n in names if n not in SCENARIOS]
+        if unknown:
+            print(f"Unknown scenario(s): {', '.join(unknown)}")
+            sys.exit(2)
+
+    print("=" * 50)
+    print(f"Agent Office Smoke Runner - {len(names)} scenarios")
+    print("=" * 50)
+    started = time.monotonic()
+    try:
+        results = asyncio.run(run_scenarios(names, args.socket, args.timeout))
+    except OfficeError as e:
+        print(f"FAIL: Cannot reach the office: {e}")
+        sys.exit(1)
+    total = time.monotonic() - started
+
+    passed = sum(1 for r in results if r["status"] == "passed")
+    print("=" * 50)
+    print(f"Results: {passed} passed, {len(results) - passed} failed in {total:.2f}s")
+    print("=" * 50)
+
+    if args.junit:
+        write_junit(results, args.junit, total)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"total_time": round(total, 3), "results": results}, f, indent=2)
+
+    sys.exit(0 if passed == len(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -21,99 +21,131 @@ Usage:
     python3 smoke_test.py --edge        # Edge case handling
     python3 smoke_test.py --weather     # Weather animation smoke test
     python3 smoke_test.py --all         # Run all tests
+    python3 smoke_test.py --socket PATH # Talk to the office over its Unix domain socket
+    python3 smoke_test.py --bench [N]   # Compare TCP vs Unix socket latency (needs --socket for UDS)
+    python3 smoke_test.py --perf        # Sample office://perf until Ctrl+C
+        [--interval S] [--duration S] [--out perf.csv|perf.json]
+    python3 smoke_test.py --scale       # Ramp 8/32/128/500 agents, report per-frame cost growth
+        [--steps 8,32,128,500] [--hold S] [--out scale.json]
+    python3 smoke_test.py --nav-bench [N] # Time N random desk-to-furniture A* queries in the office
+    python3 smoke_test.py --burst [N]   # Post N events at once, check frame time while the backlog drains
+    python3 smoke_test.py --clients [N] # N concurrent keep-alive clients, check rejections and frame time
+    python3 smoke_test.py --completions [N] # N rapid agent completions, check roster saves stay off the frame
+    python3 smoke_test.py --soak HOURS  # Mixed load for hours; fail if memory, nodes or tables keep growing
+        [--interval S] [--out soak.json|soak.csv] [--transcripts DIR]
 """
 
+import asyncio
+import csv
 import json
-import socket
+import math
+import os
+import random
+import statistics
+import subprocess
 import sys
+import threading
 import time
 from typing import Optional
-import urllib.request
-import urllib.error
+
+from office_client import AsyncOfficeClient, OfficeClient, OfficeError
+from office_events import EventPoller, EventSubscriber, StreamError
 
 HOST = "localhost"
 PORT = 9999
 TIMEOUT = 5.0
 WEATHER_STATES = ["clear", "cloudy", "drizzle", "rain", "showers", "storm", "snow", "fog"]
 WEATHER_SMOKE_INTERVAL = 2.0
-
-# JSON-RPC request ID counter
-_rpc_id = 0
-
-
-def _next_rpc_id() -> int:
-    global _rpc_id
-    _rpc_id += 1
-    return _rpc_id
-
-
-def send_event(event: dict) -> bool:
+SOCKET_PATH = os.environ.get("OFFICE_SOCKET", "")  # Unix domain socket (mcp.socket_path); empty = TCP
+BENCH_DEFAULT_EVENTS = 500
+PERF_INTERVAL = 1.0
+PERF_RESOURCE = "office://perf"
+SCALE_STEPS = [8, 32, 128, 500]
+SCALE_HOLD = 10.0           # Seconds measured per step (PerfMonitor keeps ~10s of frames)
+SCALE_SETTLE = 3.0          # Seconds for newly spawned agents to walk in before measuring
+SCALE_PROBES = 10           # Event latency probes per step
+SCALE_BATCH = 64            # Spawn events per JSON-RPC batch
+SCALE_SUPERLINEAR = 1.5     # Cost exponent vs agent count above which a path is flagged
+NAV_BENCH_QUERIES = 2000
+NAV_BENCH_TIMEOUT = 120.0   # The office runs the whole benchmark inside one tool call
+BURST_DEFAULT_EVENTS = 500
+BURST_BATCH = 100
+BURST_DRAIN_TIMEOUT = 30.0
+BURST_FRAME_LIMIT_MS = 50.0  # Worst frame allowed while the backlog drains
+CLIENTS_DEFAULT = 300
+CLIENTS_REQUESTS = 20       # Requests per client, each on the client's own keep-alive connection
+CLIENTS_TIMEOUT = 30.0      # Per request; generous because hundreds queue on one office
+CLIENTS_FRAME_LIMIT_MS = 50.0
+COMPLETIONS_DEFAULT = 300
+COMPLETIONS_WAVE = 20       # Agents per spawn/complete wave (stays under desk capacity)
+COMPLETIONS_SETTLE = 0.5    # Seconds between spawning a wave and completing it
+COMPLETIONS_FLUSH_WAIT = 5.0  # Roster write-behind window plus slack
+COMPLETIONS_FRAME_LIMIT_MS = 50.0
+SOAK_INTERVAL = 30.0        # Seconds between samples (short runs sample faster, see SOAK_MIN_SAMPLES)
+SOAK_MIN_SAMPLES = 60
+SOAK_WAVE_AGENTS = 12       # Agents per load wave (stays under desk capacity)
+SOAK_WAVE_ROUNDS = 6        # Tool-call rounds per wave
+SOAK_ROUND_PAUSE = 1.5      # Seconds between rounds
+SOAK_WARMUP = 0.15          # Leading fraction of samples left out of the trend fit
+SOAK_MIN_R2 = 0.5           # Fit quality below which a rise is treated as noise
+SOAK_RELATIVE_GROWTH = 0.10  # Fitted rise, as a fraction of the starting level, that counts as growth
+# Metric -> smallest fitted rise over the run that counts as growth ("tables.*" use the default)
+SOAK_METRICS = {
+    "static_memory_mb": 16.0,
+    "watcher_rss_mb": 16.0,
+    "node_count": 100,
+    "orphan_node_count": 20,
+    "object_count": 500,
+    "agents_active": 10,
+    "event_queue_depth": 50,
+    "path_cache.size": 50,
+    "frame_ms.p99": 4.0,
+}
+SOAK_DEFAULT_FLOOR = 20
+SOAK_TOOLS = ["Read", "Edit", "Bash", "Grep", "Glob", "Write", "WebFetch", "TodoWrite"]
+SOAK_AGENT_TYPES = ["general-purpose", "Explore", "Plan", "code-reviewer", "python-pro", "debugger"]
+
+# One persistent client per transport ("" = TCP, otherwise a Unix socket path)
+_clients = {}
+
+
+def _client(socket_path: str = None) -> OfficeClient:
+    path = SOCKET_PATH if socket_path is None else socket_path
+    if path not in _clients:
+        _clients[path] = OfficeClient(HOST, PORT, socket_path=path, timeout=TIMEOUT)
+    return _clients[path]
+
+
+def send_event(event: dict, socket_path: str = None) -> bool:
     """Send an event via MCP post_event tool using HTTP JSON-RPC.
 
-    Creates a new HTTP connection for each request.
-    Returns True if server responded with HTTP 200 OK.
+    Reuses a keep-alive connection per transport.
+    Returns True if the office accepted the event.
     """
     try:
-        # Build JSON-RPC request for post_event tool
-        rpc_request = {
-            "jsonrpc": "2.0",
-            "id": _next_rpc_id(),
-            "method": "tools/call",
-            "params": {
-                "name": "post_event",
-                "arguments": event
-            }
-        }
-        body = json.dumps(rpc_request)
-        body_bytes = body.encode('utf-8')
-
-        # Build HTTP request with correct Content-Length for UTF-8 bytes
-        http_request = (
-            f"POST / HTTP/1.1\r\n"
-            f"Host: {HOST}:{PORT}\r\n"
-            f"Content-Type: application/json\r\n"
-            f"Content-Length: {len(body_bytes)}\r\n"
-            f"Connection: close\r\n"
-            f"\r\n"
-        ).encode('utf-8') + body_bytes
-
-        # Create new connection for each request
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(TIMEOUT)
-            s.connect((HOST, PORT))
-            s.sendall(http_request)
-
-            # Read complete response
-            response = b""
-            while True:
-                try:
-                    chunk = s.recv(4096)
-                    if not chunk:
-                        break
-                    response += chunk
-                except socket.timeout:
-                    break  # Timeout reading is acceptable for smoke tests
-
-        # Check for HTTP 200 OK
-        response_str = response.decode('utf-8', errors='replace')
-        return response_str.startswith("HTTP/1.1 200")
-    except socket.error as e:
+        _client(socket_path).post_event(event)
+        return True
+    except OfficeError as e:
         print(f"  FAIL: Send error - {e}")
         return False
 
 
-def connect() -> Optional[socket.socket]:
-    """Test TCP connection to MCP server."""
+def connect() -> Optional[OfficeClient]:
+    """Test connection to MCP server (TCP or Unix socket)."""
+    client = _client()
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(TIMEOUT)
-        sock.connect((HOST, PORT))
-        return sock
-    except socket.error as e:
+        client.initialize()
+        return client
+    except OfficeError as e:
         print(f"  FAIL: {e}")
         return None
 
 
+def _endpoint() -> str:
+    """Human-readable description of the configured endpoint."""
+    return f"unix://{SOCKET_PATH}" if SOCKET_PATH else f"{HOST}:{PORT}"
+
+
 def timestamp() -> str:
     """Get current UTC timestamp in ISO format."""
     return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
@@ -123,16 +155,16 @@ def timestamp() -> str:
 # Basic Tests
 # =============================================================================
 
-def test_connection() -> Optional[socket.socket]:
+def test_connection() -> Optional[OfficeClient]:
     """Test basic TCP connection."""
-    print(f"[1/4] Connecting to {HOST}:{PORT}...")
+    print(f"[1/4] Connecting to {_endpoint()}...")
     sock = connect()
     if sock:
         print("  PASS: Connected")
     return sock
 
 
-def test_agent_spawn(sock: socket.socket, agent_id: str = "smoke001") -> bool:
+def test_agent_spawn(sock: OfficeClient, agent_id: str = "smoke001") -> bool:
     """Test sending agent_spawn event."""
     print("[2/4] Sending agent_spawn event...")
     event = {
@@ -149,7 +181,7 @@ def test_agent_spawn(sock: socket.socket, agent_id: str = "smoke001") -> bool:
     return False
 
 
-def test_waiting_for_input(sock: socket.socket, agent_id: str = "smoke001") -> bool:
+def test_waiting_for_input(sock: OfficeClient, agent_id: str = "smoke001") -> bool:
     """Test sending waiting_for_input event (replaces old tool_use)."""
     print("[3/4] Sending waiting_for_input event...")
     event = {
@@ -166,7 +198,7 @@ def test_waiting_for_input(sock: socket.socket, agent_id: str = "smoke001") -> b
     return False
 
 
-def test_agent_complete(sock: socket.socket, agent_id: str = "smoke001") -> bool:
+def test_agent_complete(sock: OfficeClient, agent_id: str = "smoke001") -> bool:
     """Test sending agent_complete event."""
     print("[4/4] Sending agent_complete event...")
     event = {
@@ -181,6 +213,39 @@ def test_agent_complete(sock: socket.socket, agent_id: str = "smoke001") -> bool
     return False
 
 
+def _open_event_stream():
+    """Subscribe to office events so tests can confirm delivery instead of sleeping.
+
+    Falls back to polling office://events with after_seq, then to fixed delays.
+    """
+    try:
+        return EventSubscriber(host=HOST, port=PORT, socket_path=SOCKET_PATH, reconnect=False).start()
+    except (OSError, StreamError) as e:
+        print(f"  (event stream unavailable, polling office://events instead: {e})")
+    try:
+        return EventPoller(host=HOST, port=PORT, socket_path=SOCKET_PATH).start()
+    except (OfficeError, AttributeError) as e:
+        print(f"  (event history unavailable, falling back to fixed delays: {e})")
+        return None
+
+
+def _confirm_event(events: Optional[EventSubscriber], event_type: str, agent_id: str,
+                   fallback_delay: float = 0.5) -> bool:
+    """Wait until the office records event_type for agent_id (or sleep without a stream)."""
+    if events is None:
+        time.sleep(fallback_delay)
+        return True
+    seen = events.wait_for(
+        lambda e: e.get("event") == event_type and e.get("agent_id") == agent_id,
+        timeout=TIMEOUT
+    )
+    if seen:
+        print(f"  PASS: office recorded {event_type} (seq {seen.get('seq')})")
+        return True
+    print(f"  FAIL: office never recorded {event_type} for {agent_id}")
+    return False
+
+
 def run_basic_tests() -> bool:
     """Run basic connectivity and event tests."""
     print("=" * 50)
@@ -201,30 +266,28 @@ def run_basic_tests() -> bool:
         print(f"Make sure the Godot app is running with TCP server on port {PORT}")
         return False
 
-    time.sleep(0.1)
+    events = _open_event_stream()
 
     # Test 2: agent_spawn
-    if test_agent_spawn(sock):
+    if test_agent_spawn(sock) and _confirm_event(events, "agent_spawn", "smoke001"):
         passed += 1
     else:
         failed += 1
 
-    time.sleep(0.5)
-
     # Test 3: waiting_for_input (triggers monitor color change)
-    if test_waiting_for_input(sock):
+    if test_waiting_for_input(sock) and _confirm_event(events, "waiting_for_input", "smoke001"):
         passed += 1
     else:
         failed += 1
 
-    time.sleep(0.5)
-
     # Test 4: agent_complete
-    if test_agent_complete(sock):
+    if test_agent_complete(sock) and _confirm_event(events, "agent_complete", "smoke001", fallback_delay=0):
         passed += 1
     else:
         failed += 1
 
+    if events:
+        events.close()
     sock.close()
 
     # Summary
@@ -917,13 +980,938 @@ def run_weather_tests() -> bool:
     return failed == 0
 
 
+# =============================================================================
+# Transport Benchmark
+# =============================================================================
+
+BENCH_RESOURCE = "office://summary"  # Small, read-only; nothing enters the event pipeline
+
+
+def _bench_transport(label: str, socket_path: str, count: int) -> Optional[dict]:
+    """Read a small resource `count` times over one transport and time each round trip."""
+    client = _client(socket_path)
+    latencies = []
+    failures = 0
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for i in range(count):
+        t0 = time.perf_counter()
+        try:
+            client.read_resource(BENCH_RESOURCE)
+            ok = True
+        except OfficeError as e:
+            print(f"  FAIL: Read error - {e}")
+            ok = False
+        latencies.append(time.perf_counter() - t0)
+        if not ok:
+            failures += 1
+            if failures >= 5 and failures == i + 1:
+                print(f"  {label}: giving up, server not reachable")
+                return None
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    latencies.sort()
+    return {
+        "transport": label,
+        "requests": count,
+        "failures": failures,
+        "requests_per_sec": count / wall if wall > 0 else 0.0,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "client_cpu_us_per_request": cpu / count * 1_000_000,
+    }
+
+
+def run_transport_benchmark(count: int) -> bool:
+    """Compare loopback TCP against the Unix domain socket, same JSON-RPC payloads."""
+    print()
+    print("=" * 50)
+    print("Agent Office Transport Benchmark")
+    print("=" * 50)
+    print(f"{count} sequential {BENCH_RESOURCE} reads per transport (one keep-alive connection each)")
+    print()
+
+    results = []
+    tcp = _bench_transport(f"tcp {HOST}:{PORT}", "", count)
+    if tcp:
+        results.append(tcp)
+    if SOCKET_PATH:
+        uds = _bench_transport(f"uds {SOCKET_PATH}", SOCKET_PATH, count)
+        if uds:
+            results.append(uds)
+    else:
+        print("  (no --socket given, skipping Unix domain socket run)")
+
+    if not results:
+        print("Benchmark FAILED: no transport reachable")
+        return False
+
+    print(f"  {'transport':<32} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'cpu us/req':>10} {'fail':>5}")
+    for r in results:
+        print(f"  {r['transport']:<32} {r['requests_per_sec']:>8.0f} {r['p50_ms']:>8.3f} "
+              f"{r['p99_ms']:>8.3f} {r['client_cpu_us_per_request']:>10.1f} {r['failures']:>5}")
+    if len(results) == 2 and results[1]["p50_ms"] > 0:
+        print()
+        print(f"  UDS p50 speedup: {results[0]['p50_ms'] / results[1]['p50_ms']:.2f}x")
+
+    return all(r["failures"] == 0 for r in results)
+
+
+# =============================================================================
+# Office Performance Collector
+# =============================================================================
+
+def _flatten(data: dict, prefix: str = "") -> dict:
+    """Flatten nested dicts into dotted keys ("frame_ms.p99") for CSV columns."""
+    flat = {}
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, name + "."))
+        else:
+            flat[name] = value
+    return flat
+
+
+class PerfCollector:
+    """Samples office://perf at a fixed interval, optionally on a background thread.
+
+    Load scenarios can wrap their run in start()/stop() to get office-side
+    frame times and queue depths alongside their own client-side timings.
+    """
+
+    def __init__(self, interval: float = PERF_INTERVAL, socket_path: str = None):
+        self.interval = interval
+        path = SOCKET_PATH if socket_path is None else socket_path
+        # Own connection so sampling never queues behind the load being measured
+        self.client = OfficeClient(HOST, PORT, socket_path=path, timeout=TIMEOUT)
+        self.samples = []
+        self.errors = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._started = 0.0
+
+    def sample(self) -> Optional[dict]:
+        try:
+            perf = self.client.read_resource(PERF_RESOURCE)
+        except OfficeError:
+            self.errors += 1
+            return None
+        if not isinstance(perf, dict):
+            self.errors += 1
+            return None
+        row = {"elapsed_s": round(time.monotonic() - self._started, 3), "sampled_at": timestamp()}
+        row.update(_flatten(perf))
+        self.samples.append(row)
+        return row
+
+    def run(self, duration: float = 0.0, on_sample=None) -> None:
+        """Sample in the foreground until duration elapses (0 = until stop())."""
+        self._started = time.monotonic()
+        deadline = self._started + duration if duration > 0 else None
+        while not self._stop.is_set():
+            row = self.sample()
+            if row and on_sample:
+                on_sample(row)
+            if deadline and time.monotonic() >= deadline:
+                break
+            self._stop.wait(self.interval)
+
+    def start(self, on_sample=None) -> "PerfCollector":
+        self._thread = threading.Thread(target=self.run, kwargs={"on_sample": on_sample}, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> list:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + TIMEOUT)
+        self.client.close()
+        return self.samples
+
+    def summary(self) -> dict:
+        """Worst-case view of the run: max over samples of the key office-side metrics."""
+        keys = ("frame_ms.p99", "frame_ms.max", "process_ms.p99", "event_queue_depth",
+                "agents_active", "node_count", "static_memory_mb")
+        result = {"samples": len(self.samples), "errors": self.errors}
+        for key in keys:
+            values = [row[key] for row in self.samples if isinstance(row.get(key), (int, float))]
+            if values:
+                result[f"max {key}"] = max(values)
+        return result
+
+    def write(self, path: str) -> None:
+        """Write samples as JSON (.json) or CSV (anything else)."""
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump(self.samples, f, indent=2)
+            return
+        columns = []
+        for row in self.samples:
+            for key in row:
+                if key not in columns:
+                    columns.append(key)
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(self.samples)
+
+
+def _print_perf_row(row: dict) -> None:
+    print(f"  [{row['elapsed_s']:>8.1f}s] fps={row.get('fps', 0):>5.1f} "
+          f"frame p50/p99={row.get('frame_ms.p50', 0):.2f}/{row.get('frame_ms.p99', 0):.2f}ms "
+          f"agents={row.get('agents_active', 0)} queue={row.get('event_queue_depth', 0)} "
+          f"nodes={row.get('node_count', 0)} "
+          f"path_hit={row.get('path_cache.hit_rate', 0) * 100:.0f}% "
+          f"sessions={row.get('watched_sessions', 0)}")
+
+
+def run_perf_collector(interval: float, duration: float, out_path: str) -> bool:
+    """Sample office://perf and optionally save the series as CSV or JSON."""
+    print()
+    print("=" * 50)
+    print("Agent Office Performance Collector")
+    print("=" * 50)
+    span = f"{duration:g}s" if duration > 0 else "until Ctrl+C"
+    print(f"Sampling {PERF_RESOURCE} at {_endpoint()} every {interval}s, {span}")
+    print()
+
+    collector = PerfCollector(interval=interval)
+    try:
+        collector.run(duration, on_sample=_print_perf_row)
+    except KeyboardInterrupt:
+        pass
+    collector.stop()
+
+    print()
+    for key, value in collector.summary().items():
+        print(f"  {key:<24} {value:.2f}" if isinstance(value, float) else f"  {key:<24} {value}")
+    if out_path and collector.samples:
+        collector.write(out_path)
+        print(f"\n  Wrote {len(collector.samples)} samples to {out_path}")
+    return bool(collector.samples)
+
+
+# =============================================================================
+# Agent Scaling Benchmark
+# =============================================================================
+
+def _read_perf() -> Optional[dict]:
+    try:
+        perf = _client().read_resource(PERF_RESOURCE)
+    except OfficeError as e:
+        print(f"  FAIL: could not read {PERF_RESOURCE}: {e}")
+        return None
+    return perf if isinstance(perf, dict) else None
+
+
+def _section_means(before: dict, after: dict) -> dict:
+    """Mean microseconds per call for each timed section between two perf snapshots."""
+    means = {}
+    start = before.get("sections", {})
+    for name, stats in after.get("sections", {}).items():
+        prev = start.get(name, {})
+        calls = stats.get("calls", 0) - prev.get("calls", 0)
+        if calls > 0:
+            means[name] = (stats.get("total_usec", 0) - prev.get("total_usec", 0)) / calls
+    return means
+
+
+def _probe_event_latency(events: Optional[EventSubscriber], run_id: str, step: int,
+                         count: int, spacing: float) -> list:
+    """Post marker events and time how long the office takes to dispatch and record each one.
+
+    Without an event stream this falls back to the post_event round trip.
+    """
+    latencies = []
+    for i in range(count):
+        probe = f"{step}-{i}"
+        t0 = time.perf_counter()
+        if not send_event({"event": "bench_probe", "agent_id": run_id, "probe": probe}):
+            continue
+        if events is not None:
+            seen = events.wait_for(lambda e, p=probe: e.get("probe") == p and e.get("agent_id") == run_id,
+                                   timeout=TIMEOUT)
+            if not seen:
+                continue
+        latencies.append((time.perf_counter() - t0) * 1000)
+        time.sleep(spacing)
+    return sorted(latencies)
+
+
+def _scaling_exponents(results: list) -> dict:
+    """Log-log slope of each section's cost against admitted agents between successive steps."""
+    exponents = {}
+    for prev, cur in zip(results, results[1:]):
+        n0, n1 = prev["agents_active"], cur["agents_active"]
+        if n0 <= 0 or n1 <= n0:
+            continue  # capacity reached; more requests did not mean more agents
+        for name, t1 in cur["sections_us"].items():
+            t0 = prev["sections_us"].get(name, 0)
+            if t0 > 0 and t1 > 0:
+                exponents.setdefault(name, []).append(math.log(t1 / t0) / math.log(n1 / n0))
+    return exponents
+
+
+def run_scaling_benchmark(steps: list, hold: float, out_path: str) -> bool:
+    """Ramp simultaneous agents through `steps`, sampling office-side cost at each one."""
+    print()
+    print("=" * 50)
+    print("Agent Office Scaling Benchmark")
+    print("=" * 50)
+    print(f"Steps: {steps}, {hold:g}s measured per step at {_endpoint()}")
+    print()
+
+    if connect() is None or _read_perf() is None:
+        print("Scaling benchmark FAILED: office not reachable")
+        return False
+
+    run_id = f"scale{int(time.time()) % 100000}"
+    session_path = f"/tmp/bench/{run_id}.jsonl"
+    events = _open_event_stream()
+    agent_ids = []
+    results = []
+    try:
+        for target in steps:
+            spawns = [{
+                "event": "agent_spawn",
+                "agent_id": f"{run_id}_{i:04d}",
+                "agent_type": "scale-bench",
+                "description": f"Scaling benchmark agent {i}",
+                "session_path": session_path,
+                "timestamp": timestamp()
+            } for i in range(len(agent_ids), target)]
+            t0 = time.perf_counter()
+            for start in range(0, len(spawns), SCALE_BATCH):
+                _client().post_events(spawns[start:start + SCALE_BATCH])
+            spawn_ms = (time.perf_counter() - t0) * 1000
+            agent_ids.extend(e["agent_id"] for e in spawns)
+            time.sleep(SCALE_SETTLE)
+
+            before = _read_perf()
+            latencies = _probe_event_latency(events, run_id, target, SCALE_PROBES, hold / SCALE_PROBES)
+            after = _read_perf()
+            if before is None or after is None:
+                return False
+
+            frame = after.get("frame_ms", {})
+            step = {
+                "requested": target,
+                "agents_active": after.get("agents_active", 0),
+                "agents_rejected": after.get("agents_rejected", 0),
+                "spawn_post_ms": spawn_ms,
+                "fps": after.get("fps", 0),
+                "frame_p50_ms": frame.get("p50", 0),
+                "frame_p99_ms": frame.get("p99", 0),
+                "frame_max_ms": frame.get("max", 0),
+                "process_p99_ms": after.get("process_ms", {}).get("p99", 0),
+                "node_count": after.get("node_count", 0),
+                "event_p50_ms": latencies[len(latencies) // 2] if latencies else None,
+                "event_max_ms": latencies[-1] if latencies else None,
+                "sections_us": _section_means(before, after),
+            }
+            results.append(step)
+            event_p50 = f"{step['event_p50_ms']:.1f}ms" if latencies else "n/a"
+            print(f"  {target:>4} requested -> {step['agents_active']:>4} active "
+                  f"({step['agents_rejected']} rejected so far) | fps {step['fps']:>5.1f} "
+                  f"frame p99 {step['frame_p99_ms']:.2f}ms | event p50 {event_p50}")
+            for name, mean_us in sorted(step["sections_us"].items()):
+                print(f"         {name:<30} {mean_us:>10.1f} us/call")
+    finally:
+        if agent_ids:
+            completes = [{"event": "agent_complete", "agent_id": aid, "success": "true",
+                          "timestamp": timestamp()} for aid in agent_ids]
+            for start in range(0, len(completes), SCALE_BATCH):
+                try:
+                    _client().post_events(completes[start:start + SCALE_BATCH])
+                except OfficeError:
+                    break
+        if events:
+            events.close()
+
+    print()
+    capacity = results[-1]["agents_active"] if results else 0
+    if results and results[-1]["requested"] > capacity:
+        print(f"  Ceiling: office admitted {capacity} of {results[-1]['requested']} requested agents "
+              f"(desks + meeting spots); extra spawns are dropped")
+    exponents = _scaling_exponents(results)
+    flagged = []
+    for name, values in sorted(exponents.items()):
+        worst = max(values)
+        marker = "SUPER-LINEAR" if worst > SCALE_SUPERLINEAR else "ok"
+        if worst > SCALE_SUPERLINEAR:
+            flagged.append(name)
+        print(f"  {name:<30} cost ~ n^{worst:.2f}  {marker}")
+    if not exponents:
+        print("  (not enough distinct agent counts to estimate scaling)")
+
+    if out_path:
+        with open(out_path, "w") as f:
+            json.dump({"steps": results, "exponents": exponents, "flagged": flagged}, f, indent=2)
+        print(f"\n  Wrote results to {out_path}")
+    return True
+
+
+# =============================================================================
+# Navigation Benchmark
+# =============================================================================
+
+def run_navigation_benchmark(queries: int) -> bool:
+    """Ask the office to time uncached A* between desks and furniture on its live layout."""
+    print()
+    print("=" * 50)
+    print("Agent Office Navigation Benchmark")
+    print("=" * 50)
+    print(f"{queries} random desk -> furniture queries at {_endpoint()}")
+    print()
+
+    client = OfficeClient(HOST, PORT, socket_path=SOCKET_PATH, timeout=NAV_BENCH_TIMEOUT)
+    try:
+        result = client.call_tool("benchmark_navigation", {"queries": queries})
+    except OfficeError as e:
+        print(f"  FAIL: {e}")
+        return False
+    finally:
+        client.close()
+
+    if not isinstance(result, dict) or not result.get("queries"):
+        print(f"  FAIL: unexpected reply: {result}")
+        return False
+    print(f"  targets     {result.get('desk_targets')} desks, {result.get('furniture_targets')} furniture points")
+    print(f"  grid        {result.get('blocked_cells')}/{result.get('cells')} cells blocked")
+    print(f"  found       {result['found']}/{result['queries']} paths")
+    print(f"  per query   mean {result['mean_us']:.1f}us  p50 {result['p50_us']}us  "
+          f"p99 {result['p99_us']}us  max {result['max_us']}us")
+    print(f"  expansions  {result['mean_expansions']:.1f} cells/query")
+    if result.get("flow_queries"):
+        print(f"  flow field  {result['flow_queries']} queries, mean {result['flow_mean_us']:.1f}us  "
+              f"p99 {result['flow_p99_us']}us  ({result['flow_field_builds']} fields built)")
+    print(f"  total       {result['total_ms']:.1f}ms")
+    return True
+
+
+# =============================================================================
+# Event Burst Test
+# =============================================================================
+
+def _burst_events(run_id: str, count: int) -> list:
+    """A replay-like burst: one session's tool calls, input and activity pings."""
+    session_path = f"/tmp/bench/{run_id}.jsonl"
+    tools = ["Read", "Edit", "Bash", "Grep"]
+    events = [{"event": "session_start", "session_id": run_id, "session_path": session_path}]
+    i = 0
+    while len(events) < count - 1:
+        events.append({"event": "waiting_for_input", "tool": tools[i % len(tools)],
+                       "session_path": session_path, "timestamp": timestamp()})
+        events.append({"event": "input_received", "session_path": session_path, "timestamp": timestamp()})
+        events.append({"event": "session_activity", "session_id": run_id, "session_path": session_path})
+        i += 1
+    events = events[:count - 1]
+    events.append({"event": "session_end", "session_id": run_id, "session_path": session_path})
+    return events
+
+
+def run_burst_test(count: int) -> bool:
+    """Post `count` events as fast as possible and watch the office drain them."""
+    print()
+    print("=" * 50)
+    print("Agent Office Event Burst Test")
+    print("=" * 50)
+    print(f"{count} events in batches of {BURST_BATCH} at {_endpoint()}")
+    print()
+
+    before = _read_perf() if connect() else None
+    if before is None:
+        print("Burst test FAILED: office not reachable")
+        return False
+    dispatch_before = before.get("event_dispatch", {})
+
+    run_id = f"burst{int(time.time()) % 100000}"
+    events = _burst_events(run_id, count)
+    collector = PerfCollector(interval=0.1).start()
+    t0 = time.perf_counter()
+    for start in range(0, len(events), BURST_BATCH):
+        _client().post_events(events[start:start + BURST_BATCH])
+    post_s = time.perf_counter() - t0
+
+    drained = False
+    after = before
+    deadline = time.monotonic() + BURST_DRAIN_TIMEOUT
+    while time.monotonic() < deadline:
+        after = _read_perf() or after
+        if after.get("event_queue_depth", 0) == 0 and \
+                after.get("event_dispatch", {}).get("enqueued", 0) >= dispatch_before.get("enqueued", 0) + count:
+            drained = True
+            break
+        time.sleep(0.05)
+    drain_s = time.perf_counter() - t0
+    samples = collector.stop()
+
+    dispatch = after.get("event_dispatch", {})
+    worst_frame = max([row.get("frame_ms.max", 0) for row in samples] + [after.get("frame_ms", {}).get("max", 0)])
+    peak_depth = max([row.get("event_queue_depth", 0) for row in samples] + [dispatch.get("max_depth", 0)])
+    latency = dispatch.get("latency_ms", {})
+    print(f"  posted       {count} events in {post_s * 1000:.0f}ms")
+    print(f"  drained      {'yes' if drained else 'NO'} after {drain_s:.2f}s")
+    print(f"  queue depth  peak {peak_depth}")
+    print(f"  merged       {dispatch.get('merged', 0) - dispatch_before.get('merged', 0)} superseded events")
+    print(f"  backlog      {dispatch.get('backlog_frames', 0) - dispatch_before.get('backlog_frames', 0)} frames "
+          f"ended with events still queued (budget {dispatch.get('frame_budget_ms', 0):.1f}ms)")
+    print(f"  dispatch     latency p50 {latency.get('p50', 0):.1f}ms  p99 {latency.get('p99', 0):.1f}ms  "
+          f"max {latency.get('max', 0):.1f}ms")
+    print(f"  worst frame  {worst_frame:.1f}ms (limit {BURST_FRAME_LIMIT_MS:.0f}ms)")
+
+    bounded = worst_frame <= BURST_FRAME_LIMIT_MS
+    if not drained:
+        print("  FAIL: backlog did not drain")
+    if not bounded:
+        print("  FAIL: frame time spiked during the burst")
+    return drained and bounded
+
+
+async def _client_session(requests: int, latencies: list, errors: list) -> None:
+    async with AsyncOfficeClient(socket_path=SOCKET_PATH, timeout=CLIENTS_TIMEOUT, max_connections=1) as client:
+        for _ in range(requests):
+            t0 = time.perf_counter()
+            try:
+                await client.read_resource("office://summary")
+            except OfficeError as e:
+                errors.append(str(e))
+                continue
+            latencies.append((time.perf_counter() - t0) * 1000)
+
+
+async def _run_clients(count: int, requests: int) -> tuple:
+    latencies, errors = [], []
+    await asyncio.gather(*(_client_session(requests, latencies, errors) for _ in range(count)))
+    return latencies, errors
+
+
+def run_client_concurrency_test(count: int) -> bool:
+    """Hold `count` keep-alive connections open at once and make sure all are served."""
+    print()
+    print("=" * 50)
+    print("Agent Office Client Concurrency Test")
+    print("=" * 50)
+    print(f"{count} clients x {CLIENTS_REQUESTS} requests at {_endpoint()}")
+    print()
+
+    before = _read_perf() if connect() else None
+    if before is None:
+        print("Concurrency test FAILED: office not reachable")
+        return False
+    http_before = before.get("http", {})
+
+    collector = PerfCollector(interval=0.25).start()
+    t0 = time.perf_counter()
+    latencies, errors = asyncio.run(_run_clients(count, CLIENTS_REQUESTS))
+    elapsed = time.perf_counter() - t0
+    samples = collector.stop()
+    after = _read_perf() or before
+    http_after = after.get("http", {})
+
+    worst_frame = max([row.get("frame_ms.max", 0) for row in samples] + [after.get("frame_ms", {}).get("max", 0)])
+    peak_clients = max([row.get("http.clients", 0) for row in samples] + [0])
+    rejected = http_after.get("rejected", 0) - http_before.get("rejected", 0)
+    latencies.sort()
+    print(f"  served       {len(latencies)}/{count * CLIENTS_REQUESTS} requests in {elapsed:.2f}s "
+          f"({len(latencies) / elapsed:.0f}/s)")
+    if latencies:
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(f"  latency      p50 {statistics.median(latencies):.1f}ms  p99 {p99:.1f}ms  max {latencies[-1]:.1f}ms")
+    print(f"  connections  peak {peak_clients} open (limit {http_after.get('max_clients', '?')}), {rejected} rejected")
+    print(f"  worst frame  {worst_frame:.1f}ms (limit {CLIENTS_FRAME_LIMIT_MS:.0f}ms)")
+    for message in sorted(set(errors))[:5]:
+        print(f"  error        {message}")
+
+    passed = not errors and rejected == 0 and worst_frame <= CLIENTS_FRAME_LIMIT_MS
+    if errors or rejected:
+        print(f"  FAIL: {len(errors)} failed requests, {rejected} rejected connections")
+    if worst_frame > CLIENTS_FRAME_LIMIT_MS:
+        print("  FAIL: frame time spiked while serving clients")
+    return passed
+
+
+def run_completion_burst(count: int) -> bool:
+    """Complete `count` agents in quick waves; roster saves must not show up as frame spikes."""
+    print()
+    print("=" * 50)
+    print("Agent Office Completion Burst Test")
+    print("=" * 50)
+    print(f"{count} completions in waves of {COMPLETIONS_WAVE} at {_endpoint()}")
+    print()
+
+    before = _read_perf() if connect() else None
+    if before is None:
+        print("Completion burst FAILED: office not reachable")
+        return False
+    roster_before = before.get("roster_persistence", {})
+
+    run_id = f"done{int(time.time()) % 100000}"
+    session_path = f"/tmp/bench/{run_id}.jsonl"
+    collector = PerfCollector(interval=0.1).start()
+    t0 = time.perf_counter()
+    for wave_start in range(0, count, COMPLETIONS_WAVE):
+        ids = [f"{run_id}_{i:04d}" for i in range(wave_start, min(wave_start + COMPLETIONS_WAVE, count))]
+        _client().post_events([{"event": "agent_spawn", "agent_id": aid, "agent_type": "completion-bench",
+                                "description": "Completion burst", "session_path": session_path,
+                                "timestamp": timestamp()} for aid in ids])
+        time.sleep(COMPLETIONS_SETTLE)
+        _client().post_events([{"event": "agent_complete", "agent_id": aid, "success": "true",
+                                "timestamp": timestamp()} for aid in ids])
+    post_s = time.perf_counter() - t0
+    time.sleep(COMPLETIONS_FLUSH_WAIT)
+    samples = collector.stop()
+    after = _read_perf() or before
+
+    roster = after.get("roster_persistence", {})
+    flushes = roster.get("flushes", 0) - roster_before.get("flushes", 0)
+    written = roster.get("profiles_written", 0) - roster_before.get("profiles_written", 0)
+    worst_frame = max([row.get("frame_ms.max", 0) for row in samples] + [after.get("frame_ms", {}).get("max", 0)])
+    print(f"  completed    {count} agents in {post_s:.1f}s")
+    print(f"  roster I/O   {flushes} background flushes, {written} profile writes "
+          f"(last flush {roster.get('last_flush_ms', 0):.1f}ms off-thread), "
+          f"{roster.get('dirty_profiles', 0)} still dirty")
+    print(f"  worst frame  {worst_frame:.1f}ms (limit {COMPLETIONS_FRAME_LIMIT_MS:.0f}ms)")
+
+    passed = worst_frame <= COMPLETIONS_FRAME_LIMIT_MS and roster.get("write_failures", 0) == 0
+    if worst_frame > COMPLETIONS_FRAME_LIMIT_MS:
+        print("  FAIL: frame time spiked during the completion burst")
+    if roster.get("write_failures", 0):
+        print(f"  FAIL: {roster['write_failures']} roster writes failed")
+    return passed
+
+
+# =============================================================================
+# Soak Test
+# =============================================================================
+
+def _watcher_pids() -> list:
+    """PIDs of running watcher.py processes (Linux /proc only)."""
+    pids = []
+    if not os.path.isdir("/proc"):
+        return pids
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit() or int(entry) == os.getpid():
+            continue
+        try:
+            with open(f"/proc/{entry}/cmdline", "rb") as f:
+                argv = f.read().split(b"\0")
+        except OSError:
+            continue
+        if any(os.path.basename(arg) == b"watcher.py" for arg in argv[:3]):
+            pids.append(int(entry))
+    return pids
+
+
+def _rss_mb(pid: int) -> Optional[float]:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024.0
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+class SoakCollector(PerfCollector):
+    """PerfCollector that also records the resident size of watcher.py processes."""
+
+    def __init__(self, interval: float, watcher_pids: list):
+        super().__init__(interval=interval)
+        self.watcher_pids = watcher_pids
+
+    def sample(self) -> Optional[dict]:
+        row = super().sample()
+        if row is not None and self.watcher_pids:
+            sizes = [size for size in (_rss_mb(pid) for pid in self.watcher_pids) if size is not None]
+            if sizes:
+                row["watcher_rss_mb"] = round(sum(sizes), 2)
+        return row
+
+
+def _soak_wave(rng, run_id: str, wave: int, stop: threading.Event) -> int:
+    """One session's worth of mixed load: orchestrator, subagents, tool calls, stress, completions.
+
+    Returns the number of events posted. About one wave in ten leaves an agent
+    without agent_complete, as an interrupted session would, so cleanup on
+    session_end is exercised too.
+    """
+    client = _client()
+    session_id = f"{run_id}-session-{wave:05d}"
+    session_path = f"/tmp/soak/{session_id}.jsonl"
+    ids = [f"{run_id}_{wave:05d}_{i:02d}" for i in range(rng.randint(SOAK_WAVE_AGENTS // 2, SOAK_WAVE_AGENTS))]
+    posted = 0
+
+    def post(events: list) -> None:
+        nonlocal posted
+        for event in events:
+            event.setdefault("timestamp", timestamp())
+        try:
+            client.post_events(events)
+            posted += len(events)
+        except OfficeError as e:
+            print(f"  WARN: wave {wave}: {e}")
+
+    post([{"event": "session_start", "session_id": session_id, "session_path": session_path}])
+    post([{"event": "agent_spawn", "agent_id": aid, "agent_type": rng.choice(SOAK_AGENT_TYPES),
+           "description": f"Soak wave {wave}", "parent_id": "main", "session_path": session_path}
+          for aid in ids])
+    for round_index in range(SOAK_WAVE_ROUNDS):
+        if stop.wait(SOAK_ROUND_PAUSE):
+            break
+        busy = rng.sample(ids, max(1, len(ids) // 2))
+        tools = {aid: rng.choice(SOAK_TOOLS) for aid in busy}
+        post([{"event": "waiting_for_input", "agent_id": aid, "tool": tool, "description": f"{tool} call"}
+              for aid, tool in tools.items()])
+        post([{"event": "input_received", "agent_id": aid, "tool": tool} for aid, tool in tools.items()])
+        post([{"event": "set_context_stress", "agent_id": "",
+               "stress": round((round_index + 1) / SOAK_WAVE_ROUNDS * rng.uniform(0.6, 1.0), 2)}])
+    if wave % 10 == 0:
+        post([{"event": "weather_set", "state": rng.choice(WEATHER_STATES)}])
+    finishing = ids[:-1] if wave % 10 == 5 else ids
+    post([{"event": "agent_complete", "agent_id": aid, "success": "true" if rng.random() < 0.9 else "false"}
+          for aid in finishing])
+    stop.wait(SOAK_ROUND_PAUSE)
+    post([{"event": "session_end", "session_id": session_id, "session_path": session_path}])
+    return posted
+
+
+def _fit_line(points: list) -> tuple:
+    """Least-squares (slope, r2) for [(t, value), ...]."""
+    n = len(points)
+    mean_t = sum(t for t, _ in points) / n
+    mean_v = sum(v for _, v in points) / n
+    var_t = sum((t - mean_t) ** 2 for t, _ in points)
+    var_v = sum((v - mean_v) ** 2 for _, v in points)
+    if var_t == 0 or var_v == 0:
+        return 0.0, 0.0
+    cov = sum((t - mean_t) * (v - mean_v) for t, v in points)
+    return cov / var_t, cov * cov / (var_t * var_v)
+
+
+def _soak_trends(samples: list) -> list:
+    """Fit a line to each tracked metric after warm-up and flag the ones still climbing.
+
+    A metric is flagged when its fitted rise over the run beats both its
+    absolute floor and SOAK_RELATIVE_GROWTH of its starting level, the fit is
+    decent (r2 >= SOAK_MIN_R2), and the last third of the run still sits
+    above the middle third. The last check keeps one-off steps that plateau
+    (a cache filling up to its limit) from failing the run.
+    """
+    measured = samples[max(1, int(len(samples) * SOAK_WARMUP)):]
+    if len(measured) < 6:
+        return []
+    keys = [k for k in SOAK_METRICS] + sorted({k for row in measured for k in row if k.startswith("tables.")})
+    trends = []
+    for key in keys:
+        points = [(row["elapsed_s"], float(row[key])) for row in measured
+                  if isinstance(row.get(key), (int, float)) and not isinstance(row.get(key), bool)]
+        if len(points) < 6:
+            continue
+        slope, r2 = _fit_line(points)
+        span = points[-1][0] - points[0][0]
+        third = len(points) // 3
+        start = statistics.mean(v for _, v in points[:third])
+        middle = statistics.mean(v for _, v in points[third:2 * third])
+        end = statistics.mean(v for _, v in points[2 * third:])
+        rise = slope * span
+        floor = max(SOAK_METRICS.get(key, SOAK_DEFAULT_FLOOR), abs(start) * SOAK_RELATIVE_GROWTH)
+        growing = rise > floor and r2 >= SOAK_MIN_R2 and end - middle > rise / 6
+        trends.append({"metric": key, "start": round(start, 2), "end": round(end, 2),
+                       "rise": round(rise, 2), "per_hour": round(slope * 3600.0, 2),
+                       "r2": round(r2, 3), "floor": floor, "growing": growing})
+    return trends
+
+
+def run_soak_test(hours: float, interval: float, out_path: str, transcripts: str) -> bool:
+    """Drive mixed load for `hours`, sample office and watcher resources, fail on unbounded growth."""
+    duration = hours * 3600.0
+    interval = interval or min(SOAK_INTERVAL, max(1.0, duration / SOAK_MIN_SAMPLES))
+    print()
+    print("=" * 50)
+    print("Agent Office Soak Test")
+    print("=" * 50)
+    print(f"{hours:g}h of mixed load at {_endpoint()}, sampling every {interval:g}s")
+
+    if not connect():
+        print("Soak test FAILED: office not reachable")
+        return False
+    pids = _watcher_pids()
+    print(f"Watcher RSS: {', '.join(str(p) for p in pids) if pids else 'no watcher.py process found'}")
+
+    generator = None
+    if transcripts:
+        cmd = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "transcript_gen.py"),
+               "--out", transcripts, "--live", "--format", "mix", "--sessions", "8", "--rate", "20",
+               "--duration", str(int(duration))]
+        generator = subprocess.Popen(cmd, stdout=subprocess.DEVNULL)
+        print(f"Transcripts: appending live sessions under {transcripts} (pid {generator.pid})")
+    print()
+
+    rng = random.Random(int(time.time()))
+    run_id = f"soak{int(time.time()) % 100000}"
+    stop = threading.Event()
+    collector = SoakCollector(interval, pids)
+    print_every = max(1, int(60.0 / interval))
+
+    def on_sample(row: dict) -> None:
+        if len(collector.samples) % print_every == 1 or print_every == 1:
+            rss = f" watcher={row['watcher_rss_mb']:.1f}MB" if "watcher_rss_mb" in row else ""
+            print(f"  [{row['elapsed_s'] / 60:>6.1f}m] mem={row.get('static_memory_mb', 0):.1f}MB "
+                  f"nodes={row.get('node_count', 0)} orphans={row.get('orphan_node_count', 0)} "
+                  f"agents={row.get('agents_active', 0)} known={row.get('tables.known_agent_ids', 0)} "
+                  f"pending={row.get('tables.pending_agents', 0)} "
+                  f"frame p99={row.get('frame_ms.p99', 0):.1f}ms{rss}")
+
+    collector.start(on_sample)
+    deadline = time.monotonic() + duration
+    waves = 0
+    events = 0
+    try:
+        while time.monotonic() < deadline:
+            events += _soak_wave(rng, run_id, waves, stop)
+            waves += 1
+    except KeyboardInterrupt:
+        print("\n  Interrupted, evaluating what was collected")
+    stop.set()
+    samples = collector.stop()
+    if generator:
+        generator.terminate()
+        generator.wait()
+
+    print()
+    print(f"  load         {waves} waves, {events} events, {collector.errors} failed samples")
+    trends = _soak_trends(samples)
+    if not trends:
+        print("  FAIL: not enough samples to fit trends")
+        return False
+    print(f"  {'metric':<36} {'start':>10} {'end':>10} {'per hour':>10} {'r2':>6}")
+    for trend in trends:
+        flag = "  GROWING" if trend["growing"] else ""
+        print(f"  {trend['metric']:<36} {trend['start']:>10.1f} {trend['end']:>10.1f} "
+              f"{trend['per_hour']:>10.1f} {trend['r2']:>6.2f}{flag}")
+    if out_path:
+        if out_path.endswith(".json"):
+            with open(out_path, "w") as f:
+                json.dump({"hours": hours, "waves": waves, "events": events, "trends": trends,
+                           "samples": samples}, f, indent=2)
+        else:
+            collector.write(out_path)
+        print(f"\n  Wrote {len(samples)} samples to {out_path}")
+
+    growing = [t["metric"] for t in trends if t["growing"]]
+    if growing:
+        print(f"  FAIL: unbounded growth in {', '.join(growing)}")
+    return not growing
+
+
+def _float_arg(args: list, flag: str, default: float) -> float:
+    if flag not in args:
+        return default
+    idx = args.index(flag)
+    try:
+        return float(args[idx + 1])
+    except (IndexError, ValueError):
+        print(f"Error: {flag} requires seconds")
+        sys.exit(1)
+
+
+def _path_arg(args: list, flag: str) -> str:
+    if flag not in args:
+        return ""
+    idx = args.index(flag)
+    if idx + 1 >= len(args):
+        print(f"Error: {flag} requires a path")
+        sys.exit(1)
+    return args[idx + 1]
+
+
 # =============================================================================
 # Main
 # =============================================================================
 
 def main():
+    global SOCKET_PATH
     args = sys.argv[1:]
 
+    if "--socket" in args:
+        idx = args.index("--socket")
+        if idx + 1 >= len(args):
+            print("Error: --socket requires a path")
+            sys.exit(1)
+        SOCKET_PATH = args[idx + 1]
+        del args[idx:idx + 2]
+
+    if "--bench" in args:
+        idx = args.index("--bench")
+        count = BENCH_DEFAULT_EVENTS
+        if idx + 1 < len(args) and args[idx + 1].isdigit():
+            count = int(args[idx + 1])
+        sys.exit(0 if run_transport_benchmark(count) else 1)
+
+    if "--perf" in args:
+        interval = _float_arg(args, "--interval", PERF_INTERVAL)
+        duration = _float_arg(args, "--duration", 0.0)
+        out_path = _path_arg(args, "--out")
+        sys.exit(0 if run_perf_collector(interval, duration, out_path) else 1)
+
+    if "--nav-bench" in args:
+        idx = args.index("--nav-bench")
+        queries = NAV_BENCH_QUERIES
+        if idx + 1 < len(args) and args[idx + 1].isdigit():
+            queries = int(args[idx + 1])
+        sys.exit(0 if run_navigation_benchmark(queries) else 1)
+
+    if "--burst" in args:
+        idx = args.index("--burst")
+        count = BURST_DEFAULT_EVENTS
+        if idx + 1 < len(args) and args[idx + 1].isdigit():
+            count = int(args[idx + 1])
+        sys.exit(0 if run_burst_test(count) else 1)
+
+    if "--clients" in args:
+        idx = args.index("--clients")
+        count = CLIENTS_DEFAULT
+        if idx + 1 < len(args) and args[idx + 1].isdigit():
+            count = int(args[idx + 1])
+        sys.exit(0 if run_client_concurrency_test(count) else 1)
+
+    if "--completions" in args:
+        idx = args.index("--completions")
+        count = COMPLETIONS_DEFAULT
+        if idx + 1 < len(args) and args[idx + 1].isdigit():
+            count = int(args[idx + 1])
+        sys.exit(0 if run_completion_burst(count) else 1)
+
+    if "--soak" in args:
+        idx = args.index("--soak")
+        try:
+            hours = float(args[idx + 1])
+        except (IndexError, ValueError):
+            print("Error: --soak requires a duration in hours")
+            sys.exit(1)
+        interval = _float_arg(args, "--interval", 0.0)
+        out_path = _path_arg(args, "--out")
+        transcripts = _path_arg(args, "--transcripts")
+        sys.exit(0 if run_soak_test(hours, interval, out_path, transcripts) else 1)
+
+    if "--scale" in args:
+        steps = SCALE_STEPS
+        if "--steps" in args:
+            idx = args.index("--steps")
+            try:
+                steps = sorted(int(n) for n in args[idx + 1].split(","))
+            except (IndexError, ValueError):
+                print("Error: --steps requires a comma-separated list of agent counts")
+                sys.exit(1)
+        hold = _float_arg(args, "--hold", SCALE_HOLD)
+        out_path = _path_arg(args, "--out")
+        sys.exit(0 if run_scaling_benchmark(steps, hold, out_path) else 1)
+
     tour_mode = "--tour" in args
     refactor_mode = "--refactor" in args
     interactions_mode = "--interactions" in args
@@ -978,6 +1966,17 @@ def main():
         print("  --edge          Edge case handling")
         print("  --weather       Weather animation smoke test")
         print("  --all           Run all tests")
+        print("  --socket PATH   Use the office's Unix domain socket")
+        print("  --bench [N]     Compare TCP vs Unix socket round trips")
+        print("  --perf          Sample office://perf (--interval, --duration, --out .csv/.json)")
+        print("  --scale         Agent-count scaling benchmark (--steps 8,32,128,500 --hold S)")
+        print("  --nav-bench [N] Time N uncached A* queries inside the office")
+        print("  --burst [N]     Post N events at once, check frame time while they drain")
+        print("  --clients [N]   N concurrent keep-alive clients, check none are rejected")
+        print("  --completions [N] N rapid agent completions, check roster saves don't spike frames")
+        print("  --soak HOURS    Long mixed load, fit growth trends (--interval, --out, --transcripts DIR)")
+        print()
+        print("  For unattended runs: python3 smoke_runner.py (concurrent, assertion-based, JUnit/JSON output)")
 
     if all_mode and not all_passed:
         print("\nSome tests FAILED")
@@ -3,19 +3,18 @@
 Test context stress feature by simulating different stress levels.
 """
 
-import socket
-import json
 import time
 import sys
 
-HOST = "localhost"
-PORT = 9999
+from office_client import OfficeClient, OfficeError
 
-def send_event(sock, event: dict) -> None:
-    """Send a JSON event to the office."""
-    data = json.dumps(event) + "\n"
-    sock.sendall(data.encode())
-    print(f"  Sent: {event.get('event', 'unknown')}")
+def send_event(sock: OfficeClient, event: dict) -> None:
+    """Send an event to the office via post_event."""
+    try:
+        sock.post_event(event)
+        print(f"  Sent: {event.get('event', 'unknown')}")
+    except OfficeError as e:
+        print(f"  FAIL: {event.get('event', 'unknown')} - {e}")
 
 def test_context_stress():
     print("=" * 50)
@@ -23,11 +22,11 @@ def test_context_stress():
     print("=" * 50)
     print()
 
+    sock = OfficeClient()
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.connect((HOST, PORT))
-        print(f"Connected to {HOST}:{PORT}")
-    except ConnectionRefusedError:
+        sock.initialize()
+        print(f"Connected to {sock.endpoint}")
+    except OfficeError:
         print("ERROR: Could not connect. Is the office running?")
         return False
 
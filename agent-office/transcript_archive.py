@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Compressed transcript archives: streaming reads, seekable frames, rotation.
+
+Old transcripts can be kept as .jsonl.gz or .jsonl.zst next to the live
+.jsonl files. Everything that reads transcripts (watcher.py discovery and
+--replay, transcript_index.py) goes through open_transcript()/iter_lines(),
+which decompress as a stream with a bounded buffer.
+
+Both formats allow a file to be a sequence of independent frames (gzip
+members, zstd frames). `rotate` writes archives that way, cutting a frame at
+the first line end after every --frame-size bytes, and stores a sidecar
+frame index (<archive>.idx: compressed offset -> uncompressed offset per
+frame). Seeking to an uncompressed offset then means decompressing at most
+one frame instead of everything before it. Archives made by other tools
+(one big gzip member) still work; build_frame_index() finds whatever frame
+boundaries they have, and reads fall back to decompress-and-skip.
+
+zstandard is optional: without it .jsonl.zst files are skipped with a
+warning and everything else works.
+
+Usage:
+    python3 transcript_archive.py rotate FILE.jsonl [--format gz|zst] [--frame-size 4M] [--keep]
+    python3 transcript_archive.py rotate ~/.claude/projects --older-than 7   # Every idle .jsonl under a dir
+    python3 transcript_archive.py index FILE.jsonl.gz     # (Re)build the sidecar frame index
+    python3 transcript_archive.py cat FILE.jsonl.zst [--offset N]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+import zlib
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # optional; .jsonl.zst support needs it
+    zstandard = None
+
+TRANSCRIPT_SUFFIXES = (".jsonl", ".jsonl.gz", ".jsonl.zst")
+COMPRESSED_SUFFIXES = (".jsonl.gz", ".jsonl.zst")
+READ_CHUNK = 1 << 20          # Decompressed bytes read per step
+DEFAULT_FRAME_SIZE = 4 << 20  # Uncompressed bytes per frame written by rotate
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 1
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 10
+
+_DECOMPRESS_ERRORS = (zlib.error, EOFError) + ((zstandard.ZstdError,) if zstandard else ())
+
+_warned_zstd = False
+
+
+class ArchiveError(Exception):
+    """A compressed transcript can't be read."""
+
+
+def is_transcript(name: str) -> bool:
+    return name.endswith(TRANSCRIPT_SUFFIXES)
+
+
+def is_compressed(name: str) -> bool:
+    return name.endswith(COMPRESSED_SUFFIXES)
+
+
+def strip_suffix(name: str) -> str:
+    """Session stem: "abc.jsonl.gz" -> "abc"."""
+    for suffix in COMPRESSED_SUFFIXES + (".jsonl",):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+def plain_path(path: str) -> str:
+    """The .jsonl a rotated archive came from: "x.jsonl.zst" -> "x.jsonl"."""
+    for suffix in COMPRESSED_SUFFIXES:
+        if path.endswith(suffix):
+            return path[:-len(suffix)] + ".jsonl"
+    return path
+
+
+def readable(path: str) -> bool:
+    """False for .jsonl.zst when zstandard isn't installed (warns once)."""
+    global _warned_zstd
+    if path.endswith(".jsonl.zst") and zstandard is None:
+        if not _warned_zstd:
+            print("  [!] zstandard is not installed; skipping .jsonl.zst transcripts (pip install zstandard)")
+            _warned_zstd = True
+        return False
+    return True
+
+
+# =============================================================================
+# Frame index
+# =============================================================================
+
+def _index_path(path: str) -> str:
+    return path + INDEX_SUFFIX
+
+
+def load_frame_index(path: str) -> Optional[List[Tuple[int, int]]]:
+    """[(compressed offset, uncompressed offset), ...] from the sidecar, if it matches the archive."""
+    try:
+        st = os.stat(path)
+        with open(_index_path(path)) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != INDEX_VERSION or index.get("size") != st.st_size:
+        return None
+    return [tuple(frame) for frame in index.get("frames", [])]
+
+
+def save_frame_index(path: str, frames: List[Tuple[int, int]], uncompressed: int) -> None:
+    st = os.stat(path)
+    tmp = _index_path(path) + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({"version": INDEX_VERSION, "size": st.st_size, "uncompressed_size": uncompressed,
+                   "frames": [list(frame) for frame in frames]}, f)
+    os.replace(tmp, _index_path(path))
+
+
+def _decompressor(path: str):
+    if path.endswith(".gz"):
+        return zlib.decompressobj(wbits=31)
+    return zstandard.ZstdDecompressor().decompressobj()
+
+
+def build_frame_index(path: str, save: bool = True) -> List[Tuple[int, int]]:
+    """Decompress once, recording where each gzip member / zstd frame starts."""
+    if not readable(path):
+        raise ArchiveError(f"{path}: zstandard is not installed")
+    frames = []
+    compressed = 0
+    uncompressed = 0
+    with open(path, "rb") as f:
+        pending = b""
+        decomp = None
+        while True:
+            data = pending or f.read(READ_CHUNK)
+            pending = b""
+            if not data:
+                break
+            if decomp is None:
+                frames.append((compressed, uncompressed))
+                decomp = _decompressor(path)
+            try:
+                out = decomp.decompress(data)
+            except _DECOMPRESS_ERRORS as e:
+                raise ArchiveError(f"{path}: corrupt frame at byte {compressed}: {e}") from e
+            uncompressed += len(out)
+            leftover = decomp.unused_data if decomp.eof else b""
+            compressed += len(data) - len(leftover)
+            if decomp.eof:
+                decomp = None
+                pending = leftover
+    if save:
+        save_frame_index(path, frames, uncompressed)
+    return frames
+
+
+# =============================================================================
+# Reading
+# =============================================================================
+
+def _open_at_frame(path: str, compressed_offset: int) -> BinaryIO:
+    raw = open(path, "rb")
+    raw.seek(compressed_offset)
+    if path.endswith(".gz"):
+        return gzip.GzipFile(fileobj=raw, mode="rb")
+    return zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+
+
+def _skip(stream: BinaryIO, count: int) -> None:
+    while count > 0:
+        data = stream.read(min(count, READ_CHUNK))
+        if not data:
+            raise ArchiveError("offset is past the end of the archive")
+        count -= len(data)
+
+
+def open_transcript(path: str, offset: int = 0) -> BinaryIO:
+    """Binary stream of the transcript's JSONL, positioned at uncompressed `offset`."""
+    if not is_compressed(path):
+        f = open(path, "rb")
+        f.seek(offset)
+        return f
+    if not readable(path):
+        raise ArchiveError(f"{path}: zstandard is not installed")
+    start = (0, 0)
+    if offset:
+        frames = load_frame_index(path)
+        if frames is None and offset >= DEFAULT_FRAME_SIZE:
+            # Worth one full pass to make this and later seeks cheap
+            frames = build_frame_index(path)
+        for frame in frames or []:
+            if frame[1] > offset:
+                break
+            start = frame
+    stream = _open_at_frame(path, start[0])
+    try:
+        _skip(stream, offset - start[1])
+    except (ArchiveError, OSError):
+        stream.close()
+        raise
+    except _DECOMPRESS_ERRORS as e:
+        stream.close()
+        raise ArchiveError(str(e)) from e
+    return stream
+
+
+def read_head(path: str, size: int) -> bytes:
+    """The first `size` uncompressed bytes; ArchiveError if they don't decode."""
+    try:
+        with open_transcript(path) as f:
+            return f.read(size)
+    except _DECOMPRESS_ERRORS as e:
+        raise ArchiveError(str(e)) from e
+
+
+def iter_lines(path: str, offset: int = 0) -> Iterator[Tuple[bytes, int]]:
+    """(line without newline, uncompressed offset after it) for each complete line from offset on.
+
+    A trailing partial line is left for the next call, so growing plain files
+    can be read incrementally. The buffer only grows past READ_CHUNK for a
+    line longer than that.
+    """
+    with open_transcript(path, offset) as f:
+        buffer = b""
+        while True:
+            try:
+                chunk = f.read(READ_CHUNK)
+            except (OSError,) + _DECOMPRESS_ERRORS as e:
+                # Truncated archive: keep what decoded cleanly
+                print(f"  [!] {os.path.basename(path)}: stopped at byte {offset}: {e}")
+                return
+            if not chunk:
+                return
+            buffer += chunk
+            start = 0
+            while True:
+                end = buffer.find(b"\n", start)
+                if end < 0:
+                    break
+                offset += end + 1 - start
+                yield buffer[start:end], offset
+                start = end + 1
+            buffer = buffer[start:]
+
+
+def transcript_size(path: str) -> int:
+    """Uncompressed size when the frame index knows it, else the size on disk."""
+    if is_compressed(path):
+        try:
+            with open(_index_path(path)) as f:
+                return int(json.load(f).get("uncompressed_size", 0)) or os.path.getsize(path)
+        except (OSError, ValueError):
+            pass
+    return os.path.getsize(path)
+
+
+# =============================================================================
+# Rotation
+# =============================================================================
+
+def _frame_compressor(fmt: str):
+    if fmt == "gz":
+        return lambda data: gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL, write_content_size=True)
+    return cctx.compress
+
+
+def rotate(path: str, fmt: str = "gz", frame_size: int = DEFAULT_FRAME_SIZE, keep: bool = False) -> str:
+    """Compress a .jsonl into independent frames cut at line ends; writes the frame index. Returns the archive path."""
+    if fmt == "zst" and zstandard is None:
+        raise ArchiveError("zstandard is not installed (pip install zstandard)")
+    out_path = f"{path}.{fmt}"
+    compress = _frame_compressor(fmt)
+    frames = []
+    written = 0
+    uncompressed = 0
+    st = os.stat(path)
+    with open(path, "rb") as src, open(out_path + ".tmp", "wb") as dst:
+        pending = b""
+        while True:
+            chunk = src.read(READ_CHUNK)
+            pending += chunk
+            while len(pending) >= frame_size or (not chunk and pending):
+                cut = pending.find(b"\n", frame_size - 1) + 1 if chunk else len(pending)
+                if cut <= 0:
+                    break  # Current line runs past frame_size; read more
+                frames.append((written, uncompressed))
+                block = compress(pending[:cut])
+                dst.write(block)
+                written += len(block)
+                uncompressed += cut
+                pending = pending[cut:]
+            if not chunk:
+                break
+    os.replace(out_path + ".tmp", out_path)
+    # Keep the original mtime so "recently active" checks see the session's real age
+    os.utime(out_path, (st.st_atime, st.st_mtime))
+    save_frame_index(out_path, frames, uncompressed)
+    if not keep:
+        os.remove(path)
+    return out_path
+
+
+def _rotate_dir(root: str, fmt: str, frame_size: int, older_than_days: float, keep: bool) -> int:
+    cutoff = time.time() - older_than_days * 86400.0
+    count = 0
+    for directory, _, files in os.walk(root):
+        for name in sorted(files):
+            path = os.path.join(directory, name)
+            if not name.endswith(".jsonl") or os.path.getmtime(path) > cutoff:
+                continue
+            before = os.path.getsize(path)
+            out = rotate(path, fmt, frame_size, keep)
+            print(f"  {path} -> {os.path.basename(out)} ({before / 1048576.0:.1f} -> "
+                  f"{os.path.getsize(out) / 1048576.0:.1f} MB)")
+            count += 1
+    return count
+
+
+def _parse_size(text: str) -> int:
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    text = text.strip().upper()
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compressed transcript archives")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rot = sub.add_parser("rotate", help="Compress .jsonl transcripts into seekable archives")
+    rot.add_argument("path", help="A .jsonl file, or a directory to rotate idle transcripts under")
+    rot.add_argument("--format", choices=("gz", "zst"), default="gz")
+    rot.add_argument("--frame-size", type=_parse_size, default=DEFAULT_FRAME_SIZE,
+                     help="Uncompressed bytes per frame (default 4M)")
+    rot.add_argument("--older-than", type=float, default=7.0, help="Days idle before a directory's files rotate")
+    rot.add_argument("--keep", action="store_true", help="Keep the original .jsonl")
+    idx = sub.add_parser("index", help="Build the frame index for an archive")
+    idx.add_argument("path")
+    cat = sub.add_parser("cat", help="Write a transcript's JSONL to stdout")
+    cat.add_argument("path")
+    cat.add_argument("--offset", type=int, default=0, help="Uncompressed byte offset to start at")
+    args = parser.parse_args()
+
+    try:
+        if args.command == "rotate":
+            if os.path.isdir(args.path):
+                count = _rotate_dir(args.path, args.format, args.frame_size, args.older_than, args.keep)
+                print(f"Rotated {count} transcripts")
+            else:
+                out = rotate(args.path, args.format, args.frame_size, args.keep)
+                print(f"Wrote {out} ({len(load_frame_index(out) or [])} frames)")
+        elif args.command == "index":
+            start = time.perf_counter()
+            frames = build_frame_index(args.path)
+            print(f"{len(frames)} frames in {time.perf_counter() - start:.2f}s -> {_index_path(args.path)}")
+        elif args.command == "cat":
+            with open_transcript(args.path, args.offset) as f:
+                while True:
+                    chunk = f.read(READ_CHUNK)
+                    if not chunk:
+                        break
+                    sys.stdout.buffer.write(chunk)
+    except BrokenPipeError:
+        # Reader went away (cat ... | head); keep the interpreter from complaining at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    except (ArchiveError, OSError) + _DECOMPRESS_ERRORS as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
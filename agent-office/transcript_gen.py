@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Synthetic transcript generator for parser and watcher throughput benchmarks.
+
+Writes Claude Code, Codex and Clawdbot style .jsonl transcripts under a
+HOME-like root, in the layout the office and watcher.py discover them in:
+
+    <out>/.claude/projects/<project>/<session>.jsonl     (+ agent-<id>.jsonl per Task)
+    <out>/.codex/sessions/YYYY/MM/DD/rollout-<time>-<session>.jsonl
+    <out>/.clawdbot/agents/<agent>/sessions/<session>.jsonl
+
+Everything comes from one seeded RNG, so the same arguments give the same
+corpus (live mode timestamps aside).
+
+Usage:
+    python3 transcript_gen.py --out /tmp/corpus                  # 20 Claude sessions x 200 tool calls
+    python3 transcript_gen.py --out /tmp/corpus --format mix --sessions 100 --calls 500
+    python3 transcript_gen.py --out /tmp/corpus --tool-mix Read=5,Bash=3,Edit=2 --task-rate 0.1 --max-depth 3
+    python3 transcript_gen.py --out /tmp/corpus --result-median 4096 --result-max 8000000
+    python3 transcript_gen.py --out /tmp/live --live --sessions 50 --rate 200 --duration 60
+        # Keep 50 sessions growing at 200 entries/s in total for a minute;
+        # finished sessions are replaced, so discovery keeps running too
+
+Measuring against a live corpus:
+    python3 transcript_gen.py --out /tmp/live --live --sessions 50 --rate 200 &
+    python3 watcher.py --all --projects /tmp/live/.claude/projects
+    HOME=/tmp/live godot --headless --path .       # the office discovers all three harnesses
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import string
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Optional
+
+DEFAULT_SESSIONS = 20
+DEFAULT_CALLS = 200
+DEFAULT_TOOL_MIX = {"Read": 30, "Bash": 25, "Edit": 15, "Grep": 10, "Glob": 8, "Write": 7, "WebFetch": 3, "TodoWrite": 2}
+DEFAULT_TASK_RATE = 0.03      # Chance a Claude tool call is a Task spawn
+DEFAULT_MAX_DEPTH = 2         # Task nesting: subagents of subagents of ...
+DEFAULT_SIDECHAIN_CALLS = 25  # Tool calls per subagent transcript
+DEFAULT_RESULT_MEDIAN = 1500  # Bytes; result sizes are log-normal around this
+DEFAULT_RESULT_SIGMA = 1.6
+DEFAULT_RESULT_MAX = 4 * 1024 * 1024
+DEFAULT_TEXT_RATE = 0.3       # Chance of an assistant text entry before a tool call
+FORMATS = ("claude", "codex", "clawdbot")
+SUBAGENT_TYPES = ["general-purpose", "Explore", "Plan", "code-reviewer", "test-runner"]
+PROGRESS_INTERVAL = 5.0
+FILLER_LINES = 2000
+
+# Claude tool name -> tool name in the other harnesses
+CODEX_TOOLS = {"Edit": "apply_patch", "Write": "apply_patch", "TodoWrite": "update_plan"}
+CLAWDBOT_TOOLS = {"Read": "read", "Write": "write", "Edit": "edit", "WebFetch": "web_fetch"}
+
+
+class Spawn:
+    """Yielded by a session script: run child to completion, then resume the parent."""
+
+    def __init__(self, child: "Stream"):
+        self.child = child
+
+
+class Stream:
+    """One transcript file and the script that produces its lines."""
+
+    def __init__(self, path: str, script: Iterator, fmt: str, parent: Optional["Stream"] = None):
+        self.path = path
+        self.script = script
+        self.fmt = fmt
+        self.parent = parent
+
+
+class Generator:
+    def __init__(self, args, rng: random.Random):
+        self.args = args
+        self.rng = rng
+        self.tools = list(args.tool_mix)
+        self.weights = [args.tool_mix[name] for name in self.tools]
+        self.filler = self._make_filler()
+        self.clock = datetime.now(timezone.utc) - timedelta(days=1)
+        self.started = time.monotonic()
+        self.stats = {"sessions": 0, "sidechains": 0, "entries": 0, "bytes": 0, "tool_calls": 0,
+                      "largest_result": 0, "by_format": {fmt: 0 for fmt in FORMATS}}
+
+    # --- Content ---------------------------------------------------------
+
+    def _make_filler(self) -> str:
+        """A block of code/log-like text that results are cut from."""
+        words = ["def", "return", "self", "import", "value", "config", "result", "error", "count",
+                 "path", "items", "update", "test", "assert", "None", "True", "data", "index"]
+        lines = []
+        for i in range(FILLER_LINES):
+            indent = "    " * self.rng.randint(0, 3)
+            body = " ".join(self.rng.choice(words) for _ in range(self.rng.randint(2, 10)))
+            lines.append(f"{i + 1:>5}\t{indent}{body}")
+        return "\n".join(lines) + "\n"
+
+    def _text(self, size: int) -> str:
+        start = self.rng.randrange(len(self.filler))
+        repeats = (start + size) // len(self.filler) + 1
+        return (self.filler * repeats)[start:start + size]
+
+    def _result_text(self) -> str:
+        size = int(self.rng.lognormvariate(math.log(self.args.result_median), self.args.result_sigma))
+        size = max(1, min(self.args.result_max, size))
+        self.stats["largest_result"] = max(self.stats["largest_result"], size)
+        return self._text(size)
+
+    def _token(self, length: int) -> str:
+        return "".join(self.rng.choice(string.ascii_letters + string.digits) for _ in range(length))
+
+    def _uuid(self) -> str:
+        return "%08x-%04x-4%03x-%04x-%012x" % (self.rng.getrandbits(32), self.rng.getrandbits(16),
+                                                self.rng.getrandbits(12), 0x8000 | self.rng.getrandbits(14),
+                                                self.rng.getrandbits(48))
+
+    def _timestamp(self) -> str:
+        if self.args.live:
+            now = datetime.now(timezone.utc)
+        else:
+            self.clock += timedelta(seconds=self.rng.expovariate(0.5))
+            now = self.clock
+        return now.strftime("%Y-%m-%dT%H:%M:%S.") + "%03dZ" % (now.microsecond // 1000)
+
+    def _pick_tool(self, fmt: str, depth: int) -> str:
+        if fmt == "claude" and depth < self.args.max_depth and self.rng.random() < self.args.task_rate:
+            return "Task"
+        return self.rng.choices(self.tools, self.weights)[0]
+
+    def _tool_input(self, name: str) -> dict:
+        path = f"/bench/project/src/module_{self.rng.randint(1, 400)}.py"
+        if name == "Read":
+            return {"file_path": path}
+        if name == "Bash":
+            return {"command": f"python3 -m pytest -q tests/test_{self.rng.randint(1, 80)}.py",
+                    "description": "Run tests"}
+        if name == "Edit":
+            return {"file_path": path, "old_string": self._text(120), "new_string": self._text(140)}
+        if name == "Write":
+            return {"file_path": path, "content": self._text(self.rng.randint(200, 6000))}
+        if name == "Grep":
+            return {"pattern": f"def {self._token(6)}", "path": "/bench/project"}
+        if name == "Glob":
+            return {"pattern": "**/*.py"}
+        if name == "WebFetch":
+            return {"url": f"https://example.com/docs/{self._token(8)}", "prompt": "Summarize"}
+        if name == "TodoWrite":
+            return {"todos": [{"content": self._text(40), "status": "pending"} for _ in range(3)]}
+        if name == "Task":
+            return {"description": f"Investigate {self._token(6)}", "prompt": self._text(400),
+                    "subagent_type": self.rng.choice(SUBAGENT_TYPES)}
+        return {"input": self._text(60)}
+
+    # --- Session scripts ---------------------------------------------------
+
+    def new_session(self, fmt: str) -> Stream:
+        self.stats["sessions"] += 1
+        self.stats["by_format"][fmt] += 1
+        session_id = self._uuid()
+        out = self.args.out
+        if fmt == "claude":
+            project_dir = os.path.join(out, ".claude", "projects", f"-bench-project-{self.rng.randint(1, 4)}")
+            path = os.path.join(project_dir, f"{session_id}.jsonl")
+            script = self._claude_session(session_id, project_dir, 0, self.args.calls, None)
+        elif fmt == "codex":
+            day = datetime.now()
+            day_dir = os.path.join(out, ".codex", "sessions", day.strftime("%Y"), day.strftime("%m"), day.strftime("%d"))
+            path = os.path.join(day_dir, f"rollout-{day.strftime('%Y-%m-%dT%H-%M-%S')}-{session_id}.jsonl")
+            script = self._codex_session(session_id, self.args.calls)
+        else:
+            agent_dir = os.path.join(out, ".clawdbot", "agents", f"agent{self.rng.randint(1, 3)}", "sessions")
+            path = os.path.join(agent_dir, f"{session_id}.jsonl")
+            script = self._clawdbot_session(session_id, self.args.calls)
+        return Stream(path, script, fmt)
+
+    def _claude_session(self, session_id: str, project_dir: str, depth: int, calls: int,
+                        agent_id: Optional[str]) -> Iterator:
+        parent_uuid = None
+
+        def entry(kind: str, message: dict) -> str:
+            nonlocal parent_uuid
+            uuid = self._uuid()
+            data = {"parentUuid": parent_uuid, "isSidechain": agent_id is not None, "userType": "external",
+                    "cwd": "/bench/project", "sessionId": session_id, "version": "2.0.0", "gitBranch": "main"}
+            if agent_id:
+                data["agentId"] = agent_id
+            data.update({"type": kind, "message": message, "uuid": uuid, "timestamp": self._timestamp()})
+            parent_uuid = uuid
+            return json.dumps(data, separators=(",", ":"))
+
+        def assistant(content: list, stop_reason: str) -> str:
+            return entry("assistant", {"id": "msg_" + self._token(24), "type": "message", "role": "assistant",
+                                       "model": "synthetic", "content": content, "stop_reason": stop_reason,
+                                       "usage": {"input_tokens": self.rng.randint(100, 9000),
+                                                 "output_tokens": self.rng.randint(10, 800)}})
+
+        yield entry("user", {"role": "user", "content": self._text(self.rng.randint(40, 600))})
+        for _ in range(calls):
+            if self.rng.random() < self.args.text_rate:
+                yield assistant([{"type": "text", "text": self._text(self.rng.randint(40, 800))}], "tool_use")
+            name = self._pick_tool("claude", depth)
+            tool_id = "toolu_" + self._token(24)
+            self.stats["tool_calls"] += 1
+            yield assistant([{"type": "tool_use", "id": tool_id, "name": name, "input": self._tool_input(name)}],
+                            "tool_use")
+            if name == "Task":
+                child_id = self._token(8)
+                self.stats["sidechains"] += 1
+                child = Stream(os.path.join(project_dir, f"agent-{child_id}.jsonl"),
+                               self._claude_session(session_id, project_dir, depth + 1, self.args.sidechain_calls, child_id),
+                               "claude")
+                yield Spawn(child)
+                result = [{"type": "text", "text": self._text(self.rng.randint(200, 3000))}]
+            else:
+                result = self._result_text()
+            yield entry("user", {"role": "user", "content": [{"tool_use_id": tool_id, "type": "tool_result",
+                                                              "content": result}]})
+        yield assistant([{"type": "text", "text": self._text(self.rng.randint(40, 800))}], "end_turn")
+
+    def _codex_session(self, session_id: str, calls: int) -> Iterator:
+        def entry(kind: str, payload: dict) -> str:
+            return json.dumps({"timestamp": self._timestamp(), "type": kind, "payload": payload}, separators=(",", ":"))
+
+        yield entry("session_meta", {"id": session_id, "timestamp": self._timestamp(), "cwd": "/bench/project",
+                                     "originator": "codex_cli_rs", "cli_version": "0.40.0"})
+        yield entry("turn_context", {"cwd": "/bench/project", "approval_policy": "on-request", "model": "synthetic"})
+        yield entry("response_item", {"type": "message", "role": "user",
+                                      "content": [{"type": "input_text", "text": self._text(self.rng.randint(40, 600))}]})
+        for _ in range(calls):
+            if self.rng.random() < self.args.text_rate:
+                yield entry("response_item", {"type": "message", "role": "assistant",
+                                              "content": [{"type": "output_text", "text": self._text(self.rng.randint(40, 800))}]})
+            name = self._pick_tool("codex", 0)
+            call_id = "call_" + self._token(24)
+            self.stats["tool_calls"] += 1
+            codex_name = CODEX_TOOLS.get(name, "shell")
+            arguments = {"command": ["bash", "-lc", self._tool_input(name).get("command", "rg --files")]}
+            if codex_name != "shell":
+                arguments = {"input": self._text(self.rng.randint(100, 2000))}
+            yield entry("response_item", {"type": "function_call", "name": codex_name,
+                                          "arguments": json.dumps(arguments), "call_id": call_id})
+            output = json.dumps({"output": self._result_text(),
+                                 "metadata": {"exit_code": 0, "duration_seconds": round(self.rng.uniform(0.01, 5.0), 2)}})
+            yield entry("response_item", {"type": "function_call_output", "call_id": call_id, "output": output})
+            if self.rng.random() < 0.2:
+                yield entry("event_msg", {"type": "token_count", "info": {"total_token_usage": {
+                    "input_tokens": self.rng.randint(1000, 90000), "output_tokens": self.rng.randint(100, 9000)}}})
+
+    def _clawdbot_session(self, session_id: str, calls: int) -> Iterator:
+        parent_id = None
+
+        def message(role: str, content: list, extra: Optional[dict] = None) -> str:
+            nonlocal parent_id
+            entry_id = self._token(8)
+            msg = {"role": role, "content": content}
+            if extra:
+                msg.update(extra)
+            data = {"type": "message", "id": entry_id, "parentId": parent_id, "timestamp": self._timestamp(),
+                    "message": msg}
+            parent_id = entry_id
+            return json.dumps(data, separators=(",", ":"))
+
+        yield json.dumps({"type": "session", "version": 3, "id": session_id, "timestamp": self._timestamp(),
+                          "cwd": "/bench/project"}, separators=(",", ":"))
+        yield message("user", [{"type": "text", "text": self._text(self.rng.randint(40, 600))}])
+        for _ in range(calls):
+            if self.rng.random() < self.args.text_rate:
+                yield message("assistant", [{"type": "text", "text": self._text(self.rng.randint(40, 800))}])
+            name = self._pick_tool("clawdbot", 0)
+            call_id = "call_" + self._token(16)
+            self.stats["tool_calls"] += 1
+            tool_name = CLAWDBOT_TOOLS.get(name, "exec")
+            yield message("assistant", [{"type": "toolCall", "id": call_id, "name": tool_name,
+                                         "arguments": self._tool_input(name)}])
+            yield message("toolResult", [{"type": "text", "text": self._result_text()}],
+                          {"toolCallId": call_id, "toolName": tool_name})
+        yield message("assistant", [{"type": "text", "text": self._text(self.rng.randint(40, 800))}])
+
+    # --- Scheduling ----------------------------------------------------------
+
+    def _pick_format(self) -> str:
+        return self.rng.choice(FORMATS) if self.args.format == "mix" else self.args.format
+
+    def _write(self, stream: Stream, line: str) -> None:
+        # Open/append/close per entry, the way the CLIs themselves append
+        os.makedirs(os.path.dirname(stream.path), exist_ok=True)
+        data = (line + "\n").encode()
+        with open(stream.path, "ab") as f:
+            f.write(data)
+        self.stats["entries"] += 1
+        self.stats["bytes"] += len(data)
+
+    def run(self) -> dict:
+        """Interleave entries across --sessions concurrent sessions (paced in --live mode)."""
+        args = self.args
+        runnable = []
+        roots_active = 0
+        started = self.started = time.monotonic()
+        deadline = started + args.duration if args.live and args.duration > 0 else None
+        next_progress = started + PROGRESS_INTERVAL
+        while True:
+            now = time.monotonic()
+            if deadline and now >= deadline:
+                break
+            # Live mode replaces finished sessions; batch mode writes exactly --sessions of them
+            while roots_active < args.sessions and (args.live or self.stats["sessions"] < args.sessions):
+                runnable.append(self.new_session(self._pick_format()))
+                roots_active += 1
+            if not runnable:
+                break
+            stream = self.rng.choice(runnable)
+            item = next(stream.script, None)
+            if item is None:
+                runnable.remove(stream)
+                if stream.parent:
+                    runnable.append(stream.parent)
+                else:
+                    roots_active -= 1
+                continue
+            if isinstance(item, Spawn):
+                item.child.parent = stream
+                runnable.remove(stream)
+                runnable.append(item.child)
+                continue
+            self._write(stream, item)
+
+            if args.live:
+                ahead = started + self.stats["entries"] / args.rate - time.monotonic()
+                if ahead > 0.002:
+                    time.sleep(ahead)
+                if time.monotonic() >= next_progress:
+                    next_progress += PROGRESS_INTERVAL
+                    self._print_progress(time.monotonic() - started)
+        self.stats["elapsed_s"] = time.monotonic() - started
+        return self.stats
+
+    def _print_progress(self, elapsed: float) -> None:
+        print(f"  [{elapsed:7.1f}s] {self.stats['entries']} entries "
+              f"({self.stats['entries'] / elapsed:.0f}/s, {self.stats['bytes'] / elapsed / 1048576:.2f} MB/s), "
+              f"{self.stats['sessions']} sessions, {self.stats['sidechains']} subagents")
+        sys.stdout.flush()
+
+
+def _parse_tool_mix(text: str) -> dict:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if not name.strip() or not weight:
+            raise argparse.ArgumentTypeError(f"bad tool mix entry '{part}' (expected Name=weight)")
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic Claude/Codex/Clawdbot transcripts")
+    parser.add_argument("--out", required=True, help="Root to write under (acts as HOME)")
+    parser.add_argument("--format", choices=FORMATS + ("mix",), default="claude")
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS,
+                        help="Sessions to write (batch) or keep growing at once (--live)")
+    parser.add_argument("--calls", type=int, default=DEFAULT_CALLS, help="Tool calls per top-level session")
+    parser.add_argument("--tool-mix", type=_parse_tool_mix, default=dict(DEFAULT_TOOL_MIX),
+                        help="Relative tool weights, e.g. Read=30,Bash=25,Edit=15")
+    parser.add_argument("--task-rate", type=float, default=DEFAULT_TASK_RATE, help="Chance a Claude call spawns a Task")
+    parser.add_argument("--max-depth", type=int, default=DEFAULT_MAX_DEPTH, help="Maximum Task nesting depth")
+    parser.add_argument("--sidechain-calls", type=int, default=DEFAULT_SIDECHAIN_CALLS, help="Tool calls per subagent")
+    parser.add_argument("--text-rate", type=float, default=DEFAULT_TEXT_RATE, help="Chance of assistant text before a call")
+    parser.add_argument("--result-median", type=int, default=DEFAULT_RESULT_MEDIAN, help="Median tool result bytes")
+    parser.add_argument("--result-sigma", type=float, default=DEFAULT_RESULT_SIGMA, help="Log-normal spread of result sizes")
+    parser.add_argument("--result-max", type=int, default=DEFAULT_RESULT_MAX, help="Largest tool result in bytes")
+    parser.add_argument("--live", action="store_true", help="Append at --rate in real time instead of as fast as possible")
+    parser.add_argument("--rate", type=float, default=100.0, help="Entries per second across all sessions (--live)")
+    parser.add_argument("--duration", type=float, default=0.0, help="Seconds to run in --live mode (0 = until Ctrl+C)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.sessions < 1 or args.calls < 1 or args.rate <= 0 or args.result_median < 1:
+        parser.error("--sessions, --calls, --rate and --result-median must be positive")
+    if not args.tool_mix or sum(args.tool_mix.values()) <= 0:
+        parser.error("--tool-mix needs at least one positive weight")
+
+    generator = Generator(args, random.Random(args.seed))
+    mode = f"live at {args.rate:g} entries/s" if args.live else "batch"
+    print(f"Writing {args.format} transcripts to {args.out} ({mode})")
+    try:
+        stats = generator.run()
+    except KeyboardInterrupt:
+        stats = generator.stats
+        stats["elapsed_s"] = time.monotonic() - generator.started
+    elapsed = stats["elapsed_s"]
+    print()
+    print(f"  Sessions:       {stats['sessions']} ({', '.join(f'{k} {v}' for k, v in stats['by_format'].items() if v)})")
+    print(f"  Subagents:      {stats['sidechains']}")
+    print(f"  Tool calls:     {stats['tool_calls']}")
+    print(f"  Entries:        {stats['entries']}")
+    print(f"  Written:        {stats['bytes'] / 1048576:.1f} MB (largest result {stats['largest_result'] / 1048576:.2f} MB)")
+    if elapsed > 0:
+        print(f"  Rate:           {stats['entries'] / elapsed:.0f} entries/s, {stats['bytes'] / elapsed / 1048576:.2f} MB/s "
+              f"over {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,511 @@
+#!/usr/bin/env python3
+"""
+Incremental SQLite index of Claude, Codex and Clawdbot transcripts.
+
+Records every session, tool call (with its result time) and Task spawn (with
+its completion time) in a local database. Each run reads only the bytes
+appended since the last one, so re-indexing a large archive costs about as
+much as the new traffic. Queries run against the database and never touch
+the JSONL files.
+
+Archived transcripts (.jsonl.gz, .jsonl.zst; see transcript_archive.py) are
+indexed too, with offsets counted in uncompressed bytes. When a live .jsonl
+has been rotated into an archive, its row follows the file and indexing
+resumes at the same offset, seeking through the archive's frame index.
+
+Usage:
+    python3 transcript_index.py                       # Index everything under ~ (incremental)
+    python3 transcript_index.py --home /tmp/corpus    # Index a HOME-like root (transcript_gen output)
+    python3 transcript_index.py --rebuild             # Drop the index and start over
+    python3 transcript_index.py --query spawns        # Sessions that spawned the most subagents
+    python3 transcript_index.py --query tools         # Calls, errors and durations per tool
+    python3 transcript_index.py --query hourly --tool Bash   # Calls per hour, average per active hour
+    python3 transcript_index.py --query sessions      # Most recent sessions
+    python3 transcript_index.py --query agent-types   # Spawns and run time per subagent type
+    python3 transcript_index.py --query tools --update --json   # Index first, print JSON
+    python3 transcript_index.py --sql "SELECT tool, COUNT(*) FROM tool_calls GROUP BY tool"
+
+The database lives next to the office's roster in its user:// directory
+(--db to override), so the office can read agent history from it instead of
+reparsing transcripts.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from typing import Iterator, Optional
+
+import office_paths
+import transcript_archive
+
+SCHEMA_VERSION = 1
+HEAD_BYTES = 256            # Fingerprint of a file's start, to notice rewritten or rotated files
+DEFAULT_LIMIT = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    harness TEXT NOT NULL,
+    session_id TEXT,
+    agent_id TEXT,              -- Claude sidechain file (agent-<id>.jsonl)
+    head BLOB,
+    offset INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL DEFAULT 0,
+    mtime REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    harness TEXT NOT NULL,
+    project TEXT,
+    path TEXT,
+    started REAL,
+    last REAL
+);
+CREATE TABLE IF NOT EXISTS tool_calls (
+    file_id INTEGER NOT NULL,
+    session_id TEXT,
+    agent_id TEXT,
+    tool_use_id TEXT,
+    tool TEXT NOT NULL,
+    started REAL,
+    completed REAL,
+    is_error INTEGER
+);
+CREATE TABLE IF NOT EXISTS spawns (
+    file_id INTEGER NOT NULL,
+    session_id TEXT,
+    tool_use_id TEXT,
+    agent_type TEXT,
+    description TEXT,
+    started REAL,
+    completed REAL
+);
+CREATE INDEX IF NOT EXISTS tool_calls_use_id ON tool_calls(tool_use_id);
+CREATE INDEX IF NOT EXISTS tool_calls_session ON tool_calls(session_id);
+CREATE INDEX IF NOT EXISTS tool_calls_tool ON tool_calls(tool, started);
+CREATE INDEX IF NOT EXISTS spawns_use_id ON spawns(tool_use_id);
+CREATE INDEX IF NOT EXISTS spawns_session ON spawns(session_id);
+"""
+
+# Lines without these never carry a tool call or result, so they are skipped unparsed
+TOOL_MARKERS = {
+    "claude": (b'"tool_use',),
+    "codex": (b'"function_call', b'"custom_tool_call', b'"session_meta"'),
+    "clawdbot": (b'"toolCall"', b'"toolResult"', b'"type":"session"'),
+}
+
+
+def default_db_path() -> str:
+    """user://transcripts.db for the office (next to user://stable)."""
+    return os.path.join(office_paths.user_dir(), "transcripts.db")
+
+
+def _epoch(value) -> Optional[float]:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def discover(home: str) -> Iterator[tuple]:
+    """(harness, path) for every transcript under a HOME-like root."""
+    claude = os.path.join(home, ".claude", "projects")
+    if os.path.isdir(claude):
+        for project in sorted(os.listdir(claude)):
+            project_dir = os.path.join(claude, project)
+            if os.path.isdir(project_dir):
+                for name in sorted(os.listdir(project_dir)):
+                    if _indexable(project_dir, name):
+                        yield "claude", os.path.join(project_dir, name)
+    codex = os.path.join(home, ".codex", "sessions")
+    for root, _, files in sorted(os.walk(codex)):
+        for name in sorted(files):
+            if _indexable(root, name):
+                yield "codex", os.path.join(root, name)
+    clawdbot = os.path.join(home, ".clawdbot", "agents")
+    if os.path.isdir(clawdbot):
+        for agent in sorted(os.listdir(clawdbot)):
+            sessions = os.path.join(clawdbot, agent, "sessions")
+            if os.path.isdir(sessions):
+                for name in sorted(os.listdir(sessions)):
+                    if _indexable(sessions, name):
+                        yield "clawdbot", os.path.join(sessions, name)
+
+
+def _indexable(directory: str, name: str) -> bool:
+    """Transcripts, archived or not; an archive kept next to its live file (rotate --keep) is skipped."""
+    if not transcript_archive.is_transcript(name):
+        return False
+    if transcript_archive.is_compressed(name):
+        return not os.path.exists(os.path.join(directory, transcript_archive.plain_path(name)))
+    return True
+
+
+class FileState:
+    """What one transcript file contributes while it is being read."""
+
+    def __init__(self, file_id: int, harness: str, path: str, session_id: Optional[str], agent_id: Optional[str]):
+        self.file_id = file_id
+        self.harness = harness
+        self.path = path
+        self.session_id = session_id
+        self.agent_id = agent_id
+        self.calls = []         # tool_calls rows
+        self.spawns = []        # spawns rows
+        self.results = []       # (completed, is_error, tool_use_id)
+        self.first = None
+        self.last = None
+
+    def seen(self, when: Optional[float]) -> None:
+        if when is None:
+            return
+        if self.first is None or when < self.first:
+            self.first = when
+        if self.last is None or when > self.last:
+            self.last = when
+
+    def call(self, tool_use_id: str, tool: str, when: Optional[float]) -> None:
+        self.calls.append((self.file_id, self.session_id, self.agent_id, tool_use_id, tool, when))
+
+    def result(self, tool_use_id: str, when: Optional[float], is_error: bool) -> None:
+        self.results.append((when, 1 if is_error else 0, tool_use_id))
+
+
+def _claude_entry(state: FileState, entry: dict) -> None:
+    when = _epoch(entry.get("timestamp"))
+    state.seen(when)
+    if state.session_id is None and entry.get("sessionId"):
+        state.session_id = entry["sessionId"]
+    message = entry.get("message")
+    content = message.get("content") if isinstance(message, dict) else None
+    if not isinstance(content, list):
+        return
+    for item in content:
+        if not isinstance(item, dict):
+            continue
+        kind = item.get("type")
+        if kind == "tool_use":
+            tool = item.get("name", "")
+            state.call(item.get("id", ""), tool, when)
+            if tool == "Task":
+                args = item.get("input") or {}
+                state.spawns.append((state.file_id, state.session_id, item.get("id", ""),
+                                     args.get("subagent_type", "default"), args.get("description", ""), when))
+        elif kind == "tool_result":
+            state.result(item.get("tool_use_id", ""), when, bool(item.get("is_error")))
+
+
+def _codex_entry(state: FileState, entry: dict) -> None:
+    when = _epoch(entry.get("timestamp"))
+    state.seen(when)
+    payload = entry.get("payload")
+    if not isinstance(payload, dict):
+        return
+    kind = payload.get("type")
+    if entry.get("type") == "session_meta":
+        state.session_id = payload.get("id") or state.session_id
+    elif kind in ("function_call", "custom_tool_call"):
+        state.call(payload.get("call_id", ""), payload.get("name", ""), when)
+    elif kind in ("function_call_output", "custom_tool_call_output"):
+        state.result(payload.get("call_id", ""), when, False)
+
+
+def _clawdbot_entry(state: FileState, entry: dict) -> None:
+    when = _epoch(entry.get("timestamp"))
+    state.seen(when)
+    if entry.get("type") == "session":
+        state.session_id = entry.get("id") or state.session_id
+        return
+    message = entry.get("message")
+    if not isinstance(message, dict):
+        return
+    if message.get("role") == "toolResult":
+        state.result(message.get("toolCallId", ""), when, bool(message.get("isError")))
+        return
+    for item in message.get("content") or []:
+        if isinstance(item, dict) and item.get("type") == "toolCall":
+            state.call(item.get("id", ""), item.get("name", ""), when)
+
+
+ENTRY_HANDLERS = {"claude": _claude_entry, "codex": _codex_entry, "clawdbot": _clawdbot_entry}
+
+
+class TranscriptIndex:
+    """The SQLite database and the incremental indexer that fills it."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db = sqlite3.connect(db_path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        self.db.execute("INSERT OR IGNORE INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+        self.db.commit()
+
+    def close(self) -> None:
+        self.db.close()
+
+    def rebuild(self) -> None:
+        with self.db:
+            for table in ("files", "sessions", "tool_calls", "spawns"):
+                self.db.execute(f"DELETE FROM {table}")
+
+    def update(self, home: str, verbose: bool = False) -> dict:
+        """Index new bytes in every transcript under home; returns counters for the run."""
+        stats = {"files": 0, "changed": 0, "reset": 0, "bytes": 0, "lines": 0, "parsed": 0,
+                 "tool_calls": 0, "spawns": 0, "results": 0}
+        known = {row[1]: row for row in self.db.execute(
+            "SELECT id, path, session_id, agent_id, head, offset, size, mtime FROM files")}
+        for harness, path in discover(home):
+            stats["files"] += 1
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            row = known.get(path)
+            compressed = transcript_archive.is_compressed(path)
+            if row is None and compressed:
+                row = self._follow_rotation(path, known)
+            if row and row[6] == st.st_size and row[7] == st.st_mtime:
+                continue
+            if not transcript_archive.readable(path):
+                continue
+            try:
+                head = transcript_archive.read_head(path, HEAD_BYTES)
+            except (OSError, transcript_archive.ArchiveError) as e:
+                print(f"  [!] {path}: {e}")
+                continue
+            # Archive sizes are compressed bytes and say nothing about the offset
+            shrunk = not compressed and row and st.st_size < row[5]
+            if row and (shrunk or head[:len(row[4] or b"")] != (row[4] or b"")[:len(head)]):
+                # Truncated or rewritten: forget what this file contributed and read it again
+                self._forget(row[0])
+                stats["reset"] += 1
+                row = None
+            stats["changed"] += 1
+            try:
+                read = self._index_file(harness, path, row, head, st, stats)
+            except transcript_archive.ArchiveError as e:
+                if row is None:
+                    print(f"  [!] {path}: {e}")
+                    continue
+                # Archive shorter than the offset its live file had reached
+                self._forget(row[0])
+                stats["reset"] += 1
+                read = self._index_file(harness, path, None, head, st, stats)
+            stats["bytes"] += read
+            if verbose and read:
+                print(f"  {harness:<9} {read / 1024:>10.1f} KB  {path}")
+        return stats
+
+    def _follow_rotation(self, path: str, known: dict):
+        """Re-point the row of a live file that was rotated into this archive, keeping its offset."""
+        original = known.get(transcript_archive.plain_path(path))
+        if original is None or os.path.exists(original[1]):
+            return None
+        with self.db:
+            self.db.execute("UPDATE files SET path = ? WHERE id = ?", (path, original[0]))
+            self.db.execute("UPDATE sessions SET path = ? WHERE path = ?", (path, original[1]))
+        return (original[0], path) + tuple(original[2:])
+
+    def _forget(self, file_id: int) -> None:
+        with self.db:
+            self.db.execute("DELETE FROM tool_calls WHERE file_id = ?", (file_id,))
+            self.db.execute("DELETE FROM spawns WHERE file_id = ?", (file_id,))
+            self.db.execute("UPDATE files SET offset = 0, session_id = NULL WHERE id = ?", (file_id,))
+
+    def _index_file(self, harness: str, path: str, row, head: bytes, st, stats: dict) -> int:
+        if row is None:
+            agent_id = None
+            name = os.path.basename(path)
+            if harness == "claude" and name.startswith("agent-"):
+                agent_id = transcript_archive.strip_suffix(name)[len("agent-"):]
+            with self.db:
+                self.db.execute("INSERT OR IGNORE INTO files (path, harness, agent_id) VALUES (?, ?, ?)",
+                                (path, harness, agent_id))
+            row = self.db.execute("SELECT id, path, session_id, agent_id, head, offset, size, mtime "
+                                  "FROM files WHERE path = ?", (path,)).fetchone()
+        file_id, _, session_id, agent_id, _, offset, _, _ = row
+        if session_id is None and harness == "claude" and agent_id is None:
+            session_id = transcript_archive.strip_suffix(os.path.basename(path))
+        state = FileState(file_id, harness, path, session_id, agent_id)
+        handler = ENTRY_HANDLERS[harness]
+        markers = TOOL_MARKERS[harness]
+        start = offset
+        first_line = offset == 0
+        for raw, offset in transcript_archive.iter_lines(path, offset):
+            stats["lines"] += 1
+            # The first line is always parsed so the session gets an id and a start time
+            if not first_line and not any(marker in raw for marker in markers):
+                continue
+            first_line = False
+            try:
+                entry = json.loads(raw)
+            except ValueError:
+                continue
+            if isinstance(entry, dict):
+                stats["parsed"] += 1
+                handler(state, entry)
+        self._store(state, harness, path, head, offset, st)
+        stats["tool_calls"] += len(state.calls)
+        stats["spawns"] += len(state.spawns)
+        stats["results"] += len(state.results)
+        return offset - start
+
+    def _store(self, state: FileState, harness: str, path: str, head: bytes, offset: int, st) -> None:
+        with self.db:
+            db = self.db
+            db.executemany("INSERT INTO tool_calls (file_id, session_id, agent_id, tool_use_id, tool, started) "
+                           "VALUES (?, ?, ?, ?, ?, ?)", state.calls)
+            db.executemany("INSERT INTO spawns (file_id, session_id, tool_use_id, agent_type, description, started) "
+                           "VALUES (?, ?, ?, ?, ?, ?)", state.spawns)
+            # Results can land in a later run (or a sidechain file) than their call
+            db.executemany("UPDATE tool_calls SET completed = ?, is_error = ? WHERE tool_use_id = ?",
+                           state.results)
+            db.executemany("UPDATE spawns SET completed = ? WHERE tool_use_id = ?",
+                           [(when, use_id) for when, _, use_id in state.results])
+            if state.session_id:
+                project = os.path.basename(os.path.dirname(path)) if harness == "claude" else None
+                session_path = None if state.agent_id else path
+                db.execute(
+                    "INSERT INTO sessions (session_id, harness, project, path, started, last) VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(session_id) DO UPDATE SET "
+                    "path = COALESCE(sessions.path, excluded.path), "
+                    "started = MIN(COALESCE(sessions.started, excluded.started), COALESCE(excluded.started, sessions.started)), "
+                    "last = MAX(COALESCE(sessions.last, excluded.last), COALESCE(excluded.last, sessions.last))",
+                    (state.session_id, harness, project, session_path, state.first, state.last))
+            db.execute("UPDATE files SET session_id = ?, head = ?, offset = ?, size = ?, mtime = ? WHERE id = ?",
+                       (state.session_id, head, offset, st.st_size, st.st_mtime, state.file_id))
+
+
+# =============================================================================
+# Queries
+# =============================================================================
+
+QUERIES = {
+    "sessions": (
+        "Most recently active sessions",
+        """SELECT s.session_id, s.harness, s.project,
+                  datetime(s.started, 'unixepoch') AS started,
+                  ROUND((s.last - s.started) / 60.0, 1) AS minutes,
+                  (SELECT COUNT(*) FROM tool_calls t WHERE t.session_id = s.session_id) AS tool_calls,
+                  (SELECT COUNT(*) FROM spawns p WHERE p.session_id = s.session_id) AS spawns
+           FROM sessions s ORDER BY s.last DESC LIMIT :limit""",
+    ),
+    "spawns": (
+        "Sessions that spawned the most subagents",
+        """SELECT p.session_id, s.project, COUNT(*) AS spawns,
+                  SUM(p.completed IS NULL) AS unfinished,
+                  ROUND(AVG(p.completed - p.started), 1) AS avg_seconds
+           FROM spawns p LEFT JOIN sessions s ON s.session_id = p.session_id
+           GROUP BY p.session_id ORDER BY spawns DESC LIMIT :limit""",
+    ),
+    "tools": (
+        "Calls, errors and result latency per tool",
+        """SELECT tool, COUNT(*) AS calls, SUM(is_error) AS errors,
+                  SUM(completed IS NULL) AS no_result,
+                  ROUND(AVG(completed - started) * 1000.0, 1) AS avg_ms,
+                  ROUND(MAX(completed - started) * 1000.0, 1) AS max_ms
+           FROM tool_calls WHERE (:tool IS NULL OR tool = :tool)
+           GROUP BY tool ORDER BY calls DESC LIMIT :limit""",
+    ),
+    "hourly": (
+        "Calls per hour (UTC) and the average per active hour",
+        """WITH hours AS (
+               SELECT strftime('%Y-%m-%d %H:00', started, 'unixepoch') AS hour, COUNT(*) AS calls
+               FROM tool_calls WHERE started IS NOT NULL AND (:tool IS NULL OR tool = :tool)
+               GROUP BY hour)
+           SELECT hour, calls, (SELECT ROUND(AVG(calls), 1) FROM hours) AS avg_per_active_hour
+           FROM hours ORDER BY hour DESC LIMIT :limit""",
+    ),
+    "agent-types": (
+        "Spawns and run time per subagent type",
+        """SELECT agent_type, COUNT(*) AS spawns, COUNT(DISTINCT session_id) AS sessions,
+                  ROUND(AVG(completed - started), 1) AS avg_seconds,
+                  ROUND(MAX(completed - started), 1) AS max_seconds
+           FROM spawns GROUP BY agent_type ORDER BY spawns DESC LIMIT :limit""",
+    ),
+}
+
+
+def run_query(db: sqlite3.Connection, sql: str, params: Optional[dict] = None) -> tuple:
+    """(column names, rows, elapsed ms)."""
+    start = time.perf_counter()
+    cursor = db.execute(sql, params or {})
+    rows = cursor.fetchall()
+    columns = [d[0] for d in cursor.description or []]
+    return columns, rows, (time.perf_counter() - start) * 1000.0
+
+
+def print_table(columns: list, rows: list) -> None:
+    cells = [[("" if v is None else str(v)) for v in row] for row in rows]
+    widths = [max([len(c)] + [len(r[i]) for r in cells]) for i, c in enumerate(columns)]
+    print("  " + "  ".join(c.ljust(w) for c, w in zip(columns, widths)))
+    print("  " + "  ".join("-" * w for w in widths))
+    for row in cells:
+        print("  " + "  ".join(v.ljust(w) for v, w in zip(row, widths)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental SQLite index of agent transcripts")
+    parser.add_argument("--db", default=None, help="Database path (default: the office's user://transcripts.db)")
+    parser.add_argument("--home", default=os.path.expanduser("~"), help="Root holding .claude/.codex/.clawdbot")
+    parser.add_argument("--rebuild", action="store_true", help="Drop the index before updating")
+    parser.add_argument("--query", choices=sorted(QUERIES), help="Run a canned query instead of indexing")
+    parser.add_argument("--sql", help="Run an SQL query instead of indexing")
+    parser.add_argument("--update", action="store_true", help="With --query/--sql: index new bytes first")
+    parser.add_argument("--tool", default=None, help="Limit tools/hourly to one tool")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help=f"Rows to show (default {DEFAULT_LIMIT})")
+    parser.add_argument("--json", action="store_true", help="Print query results as JSON")
+    parser.add_argument("-v", "--verbose", action="store_true", help="List files with new bytes")
+    args = parser.parse_args()
+
+    index = TranscriptIndex(args.db or default_db_path())
+    try:
+        querying = args.query or args.sql
+        if args.rebuild:
+            index.rebuild()
+        if not querying or args.update:
+            start = time.perf_counter()
+            stats = index.update(args.home, args.verbose)
+            elapsed = time.perf_counter() - start
+            if not querying:
+                print(f"Indexed {stats['changed']}/{stats['files']} changed files into {index.db_path}")
+                print(f"  {stats['bytes'] / 1048576.0:.1f} MB, {stats['lines']} lines "
+                      f"({stats['parsed']} parsed), {stats['tool_calls']} tool calls, "
+                      f"{stats['spawns']} spawns, {stats['results']} results, "
+                      f"{stats['reset']} files re-read, {elapsed:.2f}s")
+                return
+        if args.sql:
+            sql, title = args.sql, None
+        else:
+            title, sql = QUERIES[args.query]
+        try:
+            columns, rows, ms = run_query(index.db, sql, {"limit": args.limit, "tool": args.tool})
+        except sqlite3.Error as e:
+            print(f"Query failed: {e}")
+            sys.exit(1)
+        if args.json:
+            print(json.dumps([dict(zip(columns, row)) for row in rows], indent=2))
+            return
+        if title:
+            print(f"{title}:")
+        print_table(columns, rows)
+        print(f"\n  {len(rows)} rows in {ms:.1f} ms")
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
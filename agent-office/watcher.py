@@ -5,21 +5,75 @@ Agent Office Watcher - Monitors Claude Code transcript files and sends events to
 Usage:
     python watcher.py                    # Auto-detect latest session
     python watcher.py <session_id>       # Watch specific session
-    python watcher.py --list             # List available sessions
+    python watcher.py --list             # List available sessions (archived ones too)
+    python watcher.py --replay <session_id|FILE>  # Re-send a finished or archived transcript
+        [--speed N] [--offset BYTES]
+    python watcher.py --all              # Follow every active session, picking up new ones
+    python watcher.py --projects DIR     # Read sessions from DIR instead of ~/.claude/projects
+    python watcher.py --socket PATH      # Send over the office's Unix domain socket
+    python watcher.py --all --profile    # Time each stage; see "Profiling" below
+        [--profile-out FILE] [--tracemalloc]
+    python watcher.py --all --stats      # Per-tool latency p50/p90/p99 (tool_use -> tool_result)
+        [--stats-out FILE] [--stats-push]
+
+Profiling:
+    --profile times reading, JSON parsing, entry processing and sending to
+    the office, and appends a report to --profile-out (default
+    watcher-profile-<pid>.txt) on exit. While it runs:
+        kill -USR1 <pid>   start cProfile; send again to stop and append the
+                           top functions to the report (raw stats in FILE.prof)
+        kill -USR2 <pid>   append a report now, without stopping
+    --tracemalloc adds the memory held by the pending tables and the top
+    allocation sites to each report (slows the watcher down noticeably).
+
+Latency stats:
+    --stats times every tool call from its tool_use to its tool_result
+    (transcript timestamps, so nothing extra is read) and keeps the durations
+    in mergeable quantile sketches (latency_sketch.py) per tool and per
+    session; memory stays bounded however long it runs. A table is printed
+    every minute while entries arrive and on exit. --stats-out FILE saves the
+    sketches as JSON and resumes from them on the next start;
+    --stats-push also posts a tool_latency summary to the office, which shows
+    the slowest tools in its profiler overlay.
+
+Archived transcripts:
+    Sessions rotated to .jsonl.gz / .jsonl.zst (transcript_archive.py) are
+    listed and can be replayed, but not tailed. --replay streams the
+    transcript through the same processing as a live session, paced by the
+    entry timestamps divided by --speed (default 10; 0 sends as fast as the
+    office accepts), with idle gaps capped at REPLAY_MAX_GAP seconds.
+    --offset starts at an uncompressed byte offset (for example one from
+    transcript_index.py); archives with a frame index seek straight to it.
 """
 
+import contextlib
+import cProfile
+import io
 import json
+import os
+import pstats
+import signal
+import sqlite3
 import sys
 import time
-import urllib.request
-import urllib.error
+import tracemalloc
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
 
+import transcript_archive
+from latency_sketch import LatencySketch
+from office_client import OfficeClient, OfficeError
+from transcript_index import default_db_path
+
 # Configuration
-GODOT_MCP_URL = "http://localhost:9999"
 CLAUDE_PROJECTS_DIR = Path.home() / ".claude" / "projects"
 POLL_INTERVAL = 0.5  # seconds
+SCAN_INTERVAL = 1.0  # seconds between scans for new sessions (--all)
+ACTIVE_THRESHOLD = 300  # seconds - sessions modified within this are followed (--all)
+
+# Persistent connection to the office (OFFICE_SOCKET / --socket selects the Unix socket)
+office = OfficeClient(timeout=2.0)
 
 # Track tool_use_id -> agent info for matching with tool_result
 pending_agents = {}  # tool_use_id -> {agent_type, description, timestamp}
@@ -27,45 +81,289 @@ pending_agents = {}  # tool_use_id -> {agent_type, description, timestamp}
 # Track ALL pending tool calls - any tool can require permission
 pending_tools = {}  # tool_use_id -> {tool_name, timestamp}
 
+# Set by --profile
+profiler = None
+# Set by --stats
+latency = None
+STATS_INTERVAL = 60.0   # Seconds between latency tables while entries arrive
+STATS_MAX_SESSIONS = 50  # Per-session sketches kept; older sessions only count toward the tool totals
+STATS_PUSH_TOOLS = 12   # Busiest tools included in the tool_latency event
+PROFILE_STAGES = ("read", "parse", "process", "send")
+REPLAY_SPEED = 10.0   # Transcript seconds per wall second for --replay
+REPLAY_MAX_GAP = 2.0  # Longest wall-clock pause between replayed entries
+PROFILE_TOP = 25  # Rows in the cProfile and tracemalloc sections
+
+
+def _parse_time(value: str):
+    """Epoch seconds for an ISO-8601 transcript timestamp, or None."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class ToolLatencyStats:
+    """tool_use -> tool_result durations (ms) per tool and per recent session."""
+
+    def __init__(self, out_path: str = "", push: bool = False):
+        self.out_path = out_path
+        self.push = push
+        self.tools = {}  # tool -> LatencySketch across every session seen, including evicted ones
+        self.sessions = OrderedDict()  # session_id -> {tool -> LatencySketch}, least recently active first
+        self.recorded = 0
+        self._last_report = time.monotonic()
+        self._reported = 0
+        if out_path and os.path.exists(out_path):
+            self._resume(out_path)
+
+    def _resume(self, path: str) -> None:
+        try:
+            with open(path) as f:
+                state = json.load(f)
+            for tool, sketch in state.get("tools", {}).items():
+                self.tools[tool] = LatencySketch.from_state(sketch)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"  [!] Could not resume latency stats from {path}: {e}")
+            return
+        print(f"Resumed latency stats for {len(self.tools)} tools from {path}")
+
+    def record(self, session_id: str, tool: str, started: str, finished: str) -> None:
+        start = _parse_time(started)
+        end = _parse_time(finished)
+        if start is None or end is None or end < start:
+            return
+        ms = (end - start) * 1000.0
+        self.tools.setdefault(tool, LatencySketch()).add(ms)
+        per_session = self.sessions.pop(session_id, None) or {}
+        per_session.setdefault(tool, LatencySketch()).add(ms)
+        self.sessions[session_id] = per_session
+        if len(self.sessions) > STATS_MAX_SESSIONS:
+            self.sessions.popitem(last=False)
+        self.recorded += 1
+
+    def maybe_report(self) -> None:
+        if time.monotonic() - self._last_report >= STATS_INTERVAL and self.recorded != self._reported:
+            self.report()
+
+    def report(self) -> None:
+        self._last_report = time.monotonic()
+        self._reported = self.recorded
+        print(f"\n  [STATS] Tool latency (tool_use -> tool_result), {self.recorded} calls this run")
+        print(f"  {'tool':<16} {'calls':>8} {'p50':>10} {'p90':>10} {'p99':>10} {'max':>10}")
+        for tool, sketch in sorted(self.tools.items(), key=lambda kv: -kv[1].count):
+            row = sketch.summary()
+            print(f"  {tool:<16} {row['count']:>8} {_ms(row['p50']):>10} {_ms(row['p90']):>10} "
+                  f"{_ms(row['p99']):>10} {_ms(row['max']):>10}")
+        recent = list(self.sessions.items())[-5:]
+        if recent:
+            print(f"  {'session':<16} {'calls':>8} {'p50':>10} {'p99':>10}  slowest (p90)")
+            for session_id, tools in reversed(recent):
+                merged = LatencySketch()
+                for sketch in tools.values():
+                    merged.merge(sketch)
+                slowest = max(tools.items(), key=lambda kv: kv[1].quantile(0.9) or 0.0)
+                print(f"  {session_id[:16]:<16} {merged.count:>8} {_ms(merged.quantile(0.5)):>10} "
+                      f"{_ms(merged.quantile(0.99)):>10}  {slowest[0]} {_ms(slowest[1].quantile(0.9))}")
+        print()
+        if self.out_path:
+            self._save()
+        if self.push and self.tools:
+            busiest = sorted(self.tools.items(), key=lambda kv: -kv[1].count)[:STATS_PUSH_TOOLS]
+            send_to_godot({
+                "event": "tool_latency",
+                "source": "watcher",
+                "tools": {tool: {k: v for k, v in sketch.summary().items() if k in ("count", "p50", "p90", "p99")}
+                          for tool, sketch in busiest},
+                "timestamp": datetime.now().isoformat()
+            })
+
+    def _save(self) -> None:
+        state = {
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+            "tools": {tool: sketch.to_state() for tool, sketch in self.tools.items()},
+            "summary": {tool: sketch.summary() for tool, sketch in self.tools.items()},
+            "sessions": {sid: {tool: sketch.summary() for tool, sketch in tools.items()}
+                         for sid, tools in self.sessions.items()},
+        }
+        tmp = self.out_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp, self.out_path)
+
+
+def _ms(value) -> str:
+    if value is None:
+        return "-"
+    return f"{value / 1000.0:.2f}s" if value >= 1000.0 else f"{value:.0f}ms"
+
+
+def _deep_size(value) -> int:
+    """sys.getsizeof over a table of plain dicts/lists/strings."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_deep_size(k) + _deep_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(_deep_size(v) for v in value)
+    return size
+
+
+class _StageTimer:
+    """Context manager timing one stage for StageProfiler."""
+
+    __slots__ = ("profiler", "stats")
+
+    def __init__(self, profiler: "StageProfiler", stats: list):
+        self.profiler = profiler
+        self.stats = stats
+
+    def __enter__(self):
+        self.profiler._starts.append(time.perf_counter())
+        self.profiler._child_time.append(0.0)
+
+    def __exit__(self, *exc):
+        children = self.profiler._child_time
+        elapsed = time.perf_counter() - self.profiler._starts.pop()
+        own = elapsed - children.pop()
+        if children:
+            children[-1] += elapsed
+        stats = self.stats
+        stats[0] += 1
+        stats[1] += own
+        if own > stats[2]:
+            stats[2] = own
+        return False
+
+
+_NOT_PROFILING = contextlib.nullcontext()
+
+
+def stage(name: str):
+    """Time the enclosed block as `name` under --profile; a no-op otherwise."""
+    return profiler.timers[name] if profiler else _NOT_PROFILING
+
+
+def _count_read(size: int) -> None:
+    if profiler:
+        profiler.bytes_read += size
+
+
+class StageProfiler:
+    """Exclusive wall time per watcher stage, plus on-demand cProfile and tracemalloc dumps.
+
+    Call sites time themselves with `with stage("parse"):`. Nested stages are
+    subtracted from the enclosing one, so process's time does not include
+    send. Whatever is left of the wall time is polling sleep and loop overhead.
+    """
+
+    def __init__(self, path: str, trace_memory: bool = False):
+        self.path = path
+        self.trace_memory = trace_memory
+        self.stats = {name: [0, 0.0, 0.0] for name in PROFILE_STAGES}  # calls, total_s, max_s
+        self.timers = {name: _StageTimer(self, self.stats[name]) for name in PROFILE_STAGES}
+        self.bytes_read = 0
+        self.started = time.perf_counter()
+        self._starts = []       # Start time of each open stage
+        self._child_time = []   # Time spent in stages nested inside each open stage
+        self._cprofile = None
+        if trace_memory:
+            tracemalloc.start()
+
+    def install(self) -> None:
+        """Hook the report signals."""
+        if hasattr(signal, "SIGUSR1"):
+            signal.signal(signal.SIGUSR1, lambda *_: self.toggle_cprofile())
+            signal.signal(signal.SIGUSR2, lambda *_: self.write("SIGUSR2"))
+
+    def toggle_cprofile(self) -> None:
+        if self._cprofile is None:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+            print("  [PROFILE] cProfile started")
+            return
+        self._cprofile.disable()
+        self._cprofile.dump_stats(self.path + ".prof")
+        out = io.StringIO()
+        pstats.Stats(self._cprofile, stream=out).sort_stats("cumulative").print_stats(PROFILE_TOP)
+        self._cprofile = None
+        self.write("cProfile stopped", extra="[cProfile, cumulative]\n" + out.getvalue())
+
+    def report(self) -> str:
+        wall = time.perf_counter() - self.started
+        lines = [f"{'stage':<10} {'calls':>10} {'total_s':>10} {'mean_ms':>9} {'max_ms':>9} {'share':>7}"]
+        busy = 0.0
+        for stage, (calls, total, worst) in self.stats.items():
+            busy += total
+            mean = total / calls * 1000.0 if calls else 0.0
+            lines.append(f"{stage:<10} {calls:>10} {total:>10.3f} {mean:>9.3f} {worst * 1000.0:>9.3f} "
+                         f"{total / wall * 100.0 if wall else 0.0:>6.1f}%")
+        idle = max(0.0, wall - busy)
+        lines.append(f"{'idle':<10} {'':>10} {idle:>10.3f} {'':>9} {'':>9} {idle / wall * 100.0 if wall else 0.0:>6.1f}%")
+        lines.append(f"read {self.bytes_read} bytes, pending_agents {len(pending_agents)}, "
+                     f"pending_tools {len(pending_tools)}")
+        if self.trace_memory and tracemalloc.is_tracing():
+            lines.append("")
+            lines.extend(self._memory_report())
+        return "\n".join(lines)
+
+    def _memory_report(self) -> list:
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [f"[tracemalloc] traced {current / 1024:.1f} KB (peak {peak / 1024:.1f} KB)"]
+        for name, table in (("pending_agents", pending_agents), ("pending_tools", pending_tools)):
+            lines.append(f"{name}: {len(table)} entries, {_deep_size(table) / 1024:.1f} KB")
+        # Pending-table entries are allocated in process_tool_use; read buffers show up here too
+        own = snapshot.filter_traces([tracemalloc.Filter(True, __file__)])
+        held = sum(stat.size for stat in own.statistics("filename"))
+        lines.append(f"allocated in {os.path.basename(__file__)}: {held / 1024:.1f} KB")
+        for stat in own.statistics("lineno")[:PROFILE_TOP // 2]:
+            lines.append(f"  {stat}")
+        lines.append("top allocation sites:")
+        for stat in snapshot.statistics("lineno")[:PROFILE_TOP // 2]:
+            lines.append(f"  {stat}")
+        return lines
+
+    def write(self, reason: str, extra: str = "") -> None:
+        wall = time.perf_counter() - self.started
+        header = f"=== watcher profile {datetime.now().isoformat(timespec='seconds')} " \
+                 f"(pid {os.getpid()}, {wall:.1f}s, {reason}) ==="
+        with open(self.path, "a") as f:
+            f.write(header + "\n" + self.report() + "\n")
+            if extra:
+                f.write("\n" + extra)
+            f.write("\n")
+        print(f"  [PROFILE] Wrote {self.path}")
+
 
 def send_to_godot(event: dict) -> bool:
     """Send event to Godot via HTTP MCP call."""
     try:
-        # Build MCP tool call request
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "tools/call",
-            "params": {
-                "name": "post_event",
-                "arguments": event
-            }
-        }
-        req = urllib.request.Request(
-            GODOT_MCP_URL,
-            data=json.dumps(request_data).encode('utf-8'),
-            headers={'Content-Type': 'application/json'},
-            method='POST'
-        )
-        with urllib.request.urlopen(req, timeout=2.0) as response:
-            return response.status == 200
-    except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError) as e:
+        with stage("send"):
+            office.post_event(event)
+        return True
+    except OfficeError as e:
         print(f"  [!] Failed to send to Godot: {e}")
         return False
 
 
 def find_session_file(session_id: str = None) -> Path:
-    """Find the transcript file for a session."""
+    """Find the transcript file for a session.
+
+    A specific session may be archived (.jsonl.gz / .jsonl.zst); the latest
+    session is always a live .jsonl.
+    """
     # Look in all project directories
     for project_dir in CLAUDE_PROJECTS_DIR.iterdir():
         if not project_dir.is_dir():
             continue
 
         if session_id:
-            # Look for specific session
-            session_file = project_dir / f"{session_id}.jsonl"
-            if session_file.exists():
-                return session_file
+            # Look for specific session, preferring the live file
+            for suffix in transcript_archive.TRANSCRIPT_SUFFIXES:
+                session_file = project_dir / f"{session_id}{suffix}"
+                if session_file.exists():
+                    return session_file
         else:
             # Find most recently modified .jsonl file
             jsonl_files = list(project_dir.glob("*.jsonl"))
@@ -77,34 +375,83 @@ def find_session_file(session_id: str = None) -> Path:
 
 def list_sessions():
     """List available sessions."""
-    sessions = []
+    sessions = {}
     for project_dir in CLAUDE_PROJECTS_DIR.iterdir():
         if not project_dir.is_dir():
             continue
-        for jsonl_file in project_dir.glob("*.jsonl"):
+        for jsonl_file in project_dir.glob("*.jsonl*"):
+            if not transcript_archive.is_transcript(jsonl_file.name):
+                continue
+            session_id = transcript_archive.strip_suffix(jsonl_file.name)
+            archived = transcript_archive.is_compressed(jsonl_file.name)
+            if archived and session_id in sessions:
+                continue  # Rotated with --keep; the live file wins
             stat = jsonl_file.stat()
-            sessions.append({
-                "id": jsonl_file.stem,
+            sessions[session_id] = {
+                "id": session_id,
                 "project": project_dir.name,
                 "size": stat.st_size,
                 "modified": datetime.fromtimestamp(stat.st_mtime),
-                "path": jsonl_file
-            })
+                "path": jsonl_file,
+                "archived": jsonl_file.name.rsplit(".", 1)[1] if archived else "",
+            }
+    sessions = list(sessions.values())
 
     # Sort by modification time, newest first
     sessions.sort(key=lambda s: s["modified"], reverse=True)
+    counts = _indexed_counts([s["id"] for s in sessions[:10]])
 
     print("\nAvailable sessions (newest first):\n")
     for s in sessions[:10]:
         size_kb = s["size"] / 1024
         print(f"  {s['id']}")
         print(f"    Modified: {s['modified'].strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"    Size: {size_kb:.1f} KB")
+        if s["archived"]:
+            print(f"    Size: {size_kb:.1f} KB ({s['archived']} archive; --replay to re-send)")
+        else:
+            print(f"    Size: {size_kb:.1f} KB")
+        if s["id"] in counts:
+            calls, spawns = counts[s["id"]]
+            print(f"    Indexed: {calls} tool calls, {spawns} subagents")
         print()
 
 
-def process_entry(entry: dict):
-    """Process a single transcript entry."""
+def _indexed_counts(session_ids: list) -> dict:
+    """session_id -> (tool calls, spawns) from transcript_index.py's database, if there is one."""
+    path = default_db_path()
+    if not session_ids or not os.path.exists(path):
+        return {}
+    try:
+        db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            marks = ",".join("?" * len(session_ids))
+            rows = db.execute(
+                f"SELECT session_id, (SELECT COUNT(*) FROM tool_calls t WHERE t.session_id = s.session_id), "
+                f"(SELECT COUNT(*) FROM spawns p WHERE p.session_id = s.session_id) "
+                f"FROM sessions s WHERE session_id IN ({marks})", session_ids).fetchall()
+        finally:
+            db.close()
+    except sqlite3.Error:
+        return {}
+    return {row[0]: (row[1], row[2]) for row in rows}
+
+
+def session_agent_id(session_path: str) -> str:
+    """The office's id for a session's main agent ("orch_" + last 8 chars of the session id)."""
+    session_id = transcript_archive.strip_suffix(os.path.basename(session_path))
+    if session_id.startswith("rollout-") and len(session_id) > 8:
+        session_id = session_id[8:]
+    if not session_id:
+        return "main"
+    return "orch_" + session_id[-8:]
+
+
+def process_entry(entry: dict, session_path: str = ""):
+    """Process a single transcript entry.
+
+    session_path tells the office which session the events belong to, so
+    concurrent sessions (--all) stay separate.
+    """
     entry_type = entry.get("type")
     message = entry.get("message", {})
     content = message.get("content", [])
@@ -120,12 +467,12 @@ def process_entry(entry: dict):
         item_type = item.get("type")
 
         if item_type == "tool_use":
-            process_tool_use(item, entry)
+            process_tool_use(item, entry, session_path)
         elif item_type == "tool_result":
-            process_tool_result(item, entry)
+            process_tool_result(item, entry, session_path)
 
 
-def process_tool_use(item: dict, entry: dict):
+def process_tool_use(item: dict, entry: dict, session_path: str = ""):
     """Handle tool_use entries."""
     tool_name = item.get("name", "")
     tool_id = item.get("id", "")
@@ -153,8 +500,9 @@ def process_tool_use(item: dict, entry: dict):
             "agent_id": tool_id[:8],  # Short ID for display
             "agent_type": agent_type,
             "description": description,
-            "parent_id": "main",
-            "timestamp": timestamp
+            "parent_id": session_agent_id(session_path),
+            "timestamp": timestamp,
+            "session_path": session_path
         })
     else:
         # ALL tools can potentially wait for permission - track them all
@@ -179,14 +527,15 @@ def process_tool_use(item: dict, entry: dict):
         # Send waiting event - monitor turns red until result comes back
         send_to_godot({
             "event": "waiting_for_input",
-            "agent_id": "main",
+            "agent_id": session_agent_id(session_path),
             "tool": tool_name,
             "description": tool_desc[:50] if tool_desc else "",
-            "timestamp": timestamp
+            "timestamp": timestamp,
+            "session_path": session_path
         })
 
 
-def process_tool_result(item: dict, entry: dict):
+def process_tool_result(item: dict, entry: dict, session_path: str = ""):
     """Handle tool_result entries."""
     tool_use_id = item.get("tool_use_id", "")
     timestamp = entry.get("timestamp", "")
@@ -194,6 +543,8 @@ def process_tool_result(item: dict, entry: dict):
     # Check if this completes a pending agent
     if tool_use_id in pending_agents:
         agent_info = pending_agents.pop(tool_use_id)
+        if latency:
+            latency.record(entry.get("sessionId", ""), "Task", agent_info["timestamp"], timestamp)
 
         print(f"  [COMPLETE] {agent_info['agent_type']}: {agent_info['description']}")
 
@@ -202,21 +553,25 @@ def process_tool_result(item: dict, entry: dict):
             "event": "agent_complete",
             "agent_id": tool_use_id[:8],
             "success": "true",
-            "timestamp": timestamp
+            "timestamp": timestamp,
+            "session_path": session_path
         })
 
     # Check if this clears a waiting state (tool completed)
     if tool_use_id in pending_tools:
         tool_info = pending_tools.pop(tool_use_id)
+        if latency:
+            latency.record(entry.get("sessionId", ""), tool_info["tool_name"], tool_info["timestamp"], timestamp)
 
         print(f"  [TOOL DONE] {tool_info['tool_name']}")
 
         # Send input received event to Godot
         send_to_godot({
             "event": "input_received",
-            "agent_id": "main",
+            "agent_id": session_agent_id(session_path),
             "tool": tool_info["tool_name"],
-            "timestamp": timestamp
+            "timestamp": timestamp,
+            "session_path": session_path
         })
 
 
@@ -227,42 +582,249 @@ def tail_file(filepath: Path):
         f.seek(0, 2)
 
         while True:
-            line = f.readline()
+            with stage("read"):
+                line = f.readline()
+            _count_read(len(line))
             if line:
                 yield line.strip()
             else:
                 time.sleep(POLL_INTERVAL)
 
 
+def _process_line(line: str, session_path: str = "") -> None:
+    if not line:
+        return
+    try:
+        with stage("parse"):
+            entry = json.loads(line)
+    except json.JSONDecodeError as e:
+        print(f"  [!] Invalid JSON: {e}")
+        return
+    with stage("process"):
+        process_entry(entry, session_path)
+    if latency:
+        latency.maybe_report()
+
+
+def watch_all_sessions():
+    """Follow every recently active session, tailing each from its end like the office does."""
+    print(f"\n{'='*60}")
+    print(f"Agent Office Watcher (all sessions)")
+    print(f"{'='*60}")
+    print(f"Watching: {CLAUDE_PROJECTS_DIR}")
+    print(f"Sending to: {office.endpoint}")
+    print(f"{'='*60}\n")
+
+    tails = {}  # Path -> [offset of the next unread byte, unfinished last line]
+    last_scan = 0.0
+    try:
+        while True:
+            now = time.time()
+            if now - last_scan >= SCAN_INTERVAL:
+                last_scan = now
+                for path in CLAUDE_PROJECTS_DIR.glob("*/*.jsonl"):
+                    if path in tails:
+                        continue
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    if now - stat.st_mtime < ACTIVE_THRESHOLD:
+                        tails[path] = [stat.st_size, b""]
+                        print(f"  [WATCH] {path.name}")
+                for path in list(tails):
+                    try:
+                        stale = now - path.stat().st_mtime > ACTIVE_THRESHOLD
+                    except OSError:
+                        stale = True
+                    if stale:
+                        del tails[path]
+                        print(f"  [DONE] {path.name}")
+
+            for path, tail in tails.items():
+                try:
+                    with stage("read"), open(path, "rb") as f:
+                        f.seek(tail[0])
+                        data = f.read()
+                except OSError:
+                    continue
+                _count_read(len(data))
+                if not data:
+                    continue
+                # Each byte is read once; an unfinished last line waits in the tail
+                tail[0] += len(data)
+                data = tail[1] + data
+                end = data.rfind(b"\n") + 1
+                tail[1] = data[end:]
+                for raw in data[:end].splitlines():
+                    _process_line(raw.decode("utf-8", errors="replace").strip(), str(path))
+            time.sleep(POLL_INTERVAL)
+    except KeyboardInterrupt:
+        print("\n\nStopped watching.")
+
+
 def watch_session(session_file: Path):
     """Watch a session file and process new entries."""
     print(f"\n{'='*60}")
     print(f"Agent Office Watcher")
     print(f"{'='*60}")
     print(f"Watching: {session_file.name}")
-    print(f"Sending to: {GODOT_MCP_URL}")
+    print(f"Sending to: {office.endpoint}")
     print(f"{'='*60}\n")
     print("Waiting for new transcript entries...\n")
 
     try:
         for line in tail_file(session_file):
+            _process_line(line, str(session_file))
+    except KeyboardInterrupt:
+        print("\n\nStopped watching.")
+
+
+def replay_session(path: Path, speed: float = REPLAY_SPEED, offset: int = 0):
+    """Send a finished (possibly compressed) transcript through process_entry, paced by its timestamps."""
+    if not transcript_archive.readable(str(path)):
+        sys.exit(1)
+    print(f"\n{'='*60}")
+    print(f"Agent Office Watcher (replay)")
+    print(f"{'='*60}")
+    print(f"Replaying: {path.name}" + (f" from byte {offset}" if offset else ""))
+    print(f"Speed: {f'{speed:g}x' if speed > 0 else 'unpaced'}")
+    print(f"Sending to: {office.endpoint}")
+    print(f"{'='*60}\n")
+
+    started = time.perf_counter()
+    entries = 0
+    position = offset
+    previous = None  # Transcript time of the last paced entry
+    try:
+        # Start a byte early and drop the first line: it is empty when offset is
+        # a line start and the tail of a cut line otherwise
+        lines = transcript_archive.iter_lines(str(path), max(offset - 1, 0))
+        if offset:
+            next(lines, None)
+        while True:
+            with stage("read"):
+                item = next(lines, None)
+            if item is None:
+                break
+            raw, position = item
+            _count_read(len(raw))
+            line = raw.decode("utf-8", errors="replace").strip()
             if not line:
                 continue
             try:
-                entry = json.loads(line)
-                process_entry(entry)
+                with stage("parse"):
+                    entry = json.loads(line)
             except json.JSONDecodeError as e:
-                print(f"  [!] Invalid JSON: {e}")
+                print(f"  [!] Invalid JSON at byte {position}: {e}")
+                continue
+            stamp = _parse_time(entry.get("timestamp")) if speed > 0 else None
+            if stamp is not None:
+                if previous is not None and stamp > previous:
+                    time.sleep(min((stamp - previous) / speed, REPLAY_MAX_GAP))
+                previous = stamp
+            # The live file's path, so the office sees the same session id
+            with stage("process"):
+                process_entry(entry, transcript_archive.plain_path(str(path)))
+            if latency:
+                latency.maybe_report()
+            entries += 1
+    except transcript_archive.ArchiveError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
     except KeyboardInterrupt:
-        print("\n\nStopped watching.")
+        print("\n\nStopped replay.")
+    elapsed = time.perf_counter() - started
+    print(f"\nReplayed {entries} entries ({position - offset} bytes) in {elapsed:.1f}s; "
+          f"resume with --offset {position}")
 
 
 def main():
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "--list":
+    global office, profiler, latency, CLAUDE_PROJECTS_DIR
+    args = sys.argv[1:]
+    if "--stats" in args:
+        args.remove("--stats")
+        out_path = ""
+        if "--stats-out" in args:
+            idx = args.index("--stats-out")
+            if idx + 1 >= len(args):
+                print("Error: --stats-out requires a path")
+                sys.exit(1)
+            out_path = args[idx + 1]
+            del args[idx:idx + 2]
+        push = "--stats-push" in args
+        if push:
+            args.remove("--stats-push")
+        latency = ToolLatencyStats(out_path, push)
+    if "--profile" in args:
+        idx = args.index("--profile")
+        del args[idx]
+        path = f"watcher-profile-{os.getpid()}.txt"
+        if "--profile-out" in args:
+            idx = args.index("--profile-out")
+            if idx + 1 >= len(args):
+                print("Error: --profile-out requires a path")
+                sys.exit(1)
+            path = args[idx + 1]
+            del args[idx:idx + 2]
+        trace_memory = "--tracemalloc" in args
+        if trace_memory:
+            args.remove("--tracemalloc")
+        profiler = StageProfiler(path, trace_memory)
+        profiler.install()
+        print(f"Profiling to {path}" + (" (tracemalloc on)" if trace_memory else ""))
+    try:
+        _run(args)
+    finally:
+        if latency and latency.recorded:
+            latency.report()
+        if profiler:
+            profiler.write("exit")
+
+
+def _run(args: list):
+    global office, CLAUDE_PROJECTS_DIR
+    if "--socket" in args:
+        idx = args.index("--socket")
+        if idx + 1 >= len(args):
+            print("Error: --socket requires a path")
+            sys.exit(1)
+        office = OfficeClient(socket_path=args[idx + 1], timeout=2.0)
+        del args[idx:idx + 2]
+
+    if "--projects" in args:
+        idx = args.index("--projects")
+        if idx + 1 >= len(args):
+            print("Error: --projects requires a directory")
+            sys.exit(1)
+        CLAUDE_PROJECTS_DIR = Path(args[idx + 1])
+        del args[idx:idx + 2]
+
+    if "--all" in args:
+        watch_all_sessions()
+        return
+
+    if "--replay" in args:
+        idx = args.index("--replay")
+        if idx + 1 >= len(args):
+            print("Error: --replay requires a session id or transcript path")
+            sys.exit(1)
+        target = args[idx + 1]
+        del args[idx:idx + 2]
+        speed = _option(args, "--speed", float, REPLAY_SPEED)
+        offset = _option(args, "--offset", int, 0)
+        path = Path(target) if os.path.exists(target) else find_session_file(target)
+        if not path:
+            print(f"Error: No transcript found for {target}")
+            sys.exit(1)
+        replay_session(path, speed, offset)
+        return
+
+    if args:
+        if args[0] == "--list":
             list_sessions()
             return
-        session_id = sys.argv[1]
+        session_id = args[0]
     else:
         session_id = None
 
@@ -276,10 +838,34 @@ def main():
         print("  python watcher.py              # Auto-detect latest session")
         print("  python watcher.py <session_id> # Watch specific session")
         print("  python watcher.py --list       # List available sessions")
+        print("  python watcher.py --replay ID  # Re-send a finished or archived session")
+        print("  python watcher.py --all        # Follow every active session")
+        print("  python watcher.py --socket PATH  # Use the office's Unix domain socket")
+        print("  python watcher.py --profile    # Time read/parse/process/send stages")
+        print("  python watcher.py --stats      # Per-tool latency quantiles")
+        sys.exit(1)
+
+    if transcript_archive.is_compressed(session_file.name):
+        print(f"{session_file.name} is archived and won't change; replay it with:")
+        print(f"  python watcher.py --replay {session_id}")
         sys.exit(1)
 
     watch_session(session_file)
 
 
+def _option(args: list, flag: str, convert, default):
+    """Remove `flag VALUE` from args and return the converted value."""
+    if flag not in args:
+        return default
+    idx = args.index(flag)
+    try:
+        value = convert(args[idx + 1])
+    except (IndexError, ValueError):
+        print(f"Error: {flag} requires a number")
+        sys.exit(1)
+    del args[idx:idx + 2]
+    return value
+
+
 if __name__ == "__main__":
     main()